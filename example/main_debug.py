@@ -23,9 +23,12 @@ directory may be imported after the sys.path.import call.
 import sys
 sys.path.insert(0, "/var/nortxe/uf/admin/modules/")
 
+# Enable the debug decorator before importing the modules to debug
+from utilityFunctions import debug, SetDebug
+SetDebug(True)
+
 # Import GUIController
 from uofi_gui import GUIController
-from utilityFunctions import debug
 
 # System configuration modules (GS Modules)
 import settings
@@ -43,6 +43,21 @@ techMatrixSize = (8,4)        # (inputs, outputs) - size of the virtual matrix t
 camSwitcher = 'DEC001'        # ID of hardware device to switch between cameras
 primaryDSP = 'DSP001'         # Primary DSP for audio control
 
+# Structured Log - optional, remove to disable
+#  Path          - log file path on the processor file system
+#  MaxBytes      - size at which the log file is rotated
+#  Backups       - number of rotated files to keep
+#  BufferBytes   - buffered bytes before records are written
+#  FlushInterval - max seconds records are buffered before being written
+structuredLog = \
+   {
+      'Path': '/logs/uofi_gui.log',
+      'MaxBytes': 262144,
+      'Backups': 3,
+      'BufferBytes': 8192,
+      'FlushInterval': 60
+   }
+
 # Icon Map
 #     0 - no source
 #     1 - HDMI
@@ -168,6 +183,47 @@ destinations = \
       }
    ]
    
+# Routing Presets
+#  video       - destination id: source id (None to untie)
+#  audioFollow - destination id for system audio, 'none' to clear, omit to leave unchanged
+#  displays    - destination id: {'power': 'On'/'Off', 'input': True to select the display input}
+#  screens     - destination id: 'up'/'down', proj+scn destinations only
+#  activity    - optional activity (share, adv_share, group_work) to recall this preset on
+routingPresets = \
+   [
+      {
+         'id': 'lecture',
+         'name': 'Lecture',
+         'video': {
+            'MON003': 'PC001',
+            'PRJ001': 'PC001',
+            'MON001': 'PC001',
+            'MON002': 'PC001'
+         },
+         'audioFollow': 'PRJ001',
+         'displays': {
+            'PRJ001': {'power': 'On', 'input': True},
+            'MON001': {'power': 'On', 'input': True}
+         },
+         'screens': {
+            'PRJ001': 'down'
+         }
+      },
+      {
+         'id': 'discussion',
+         'name': 'Discussion',
+         'video': {
+            'PRJ001': 'WPD001',
+            'MON001': 'WPD002',
+            'MON002': 'WPD003'
+         },
+         'audioFollow': 'PRJ001',
+         'displays': {
+            'MON001': {'power': 'On', 'input': True}
+         }
+      }
+   ]
+   
 cameras = \
    [
       {
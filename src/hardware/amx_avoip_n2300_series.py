@@ -3,20 +3,24 @@ if TYPE_CHECKING: # pragma: no cover
     from uofi_gui import GUIController
 
 from extronlib.interface import SerialInterface, EthernetClientInterface
-import re
 from extronlib.system import Wait, ProgramLog
 
+from uofi_gui.driverReceive import FrameReceiver, BlockMatcher, SharedPattern
+from uofi_gui.driverStatus import StatusStore, CommandMethods, AliasCommand
+
+@CommandMethods
 class DeviceClass:
     def __init__(self):
 
         self.Unidirectional = 'False'
         self.connectionCounter = 15
         self.DefaultResponseTimeout = 0.3
-        self.Subscription = {}
         self.ReceiveData = self.__ReceiveData
-        self.__receiveBuffer = b''
         self.__maxBufferSize = 4096
-        self.__matchStringDict = {}
+        # status lines end in CR and each status block starts with an SVSI_
+        # header line, status blocks are read as key:value fields
+        self.__matchBlocks = BlockMatcher(b'SVSI_', self.__maxBufferSize)
+        self.__receiveFrames = FrameReceiver(b'\r', self.__matchBlocks.Line, self.__maxBufferSize)
         self.counter = 0
         self.connectionFlag = True
         self.initializationChk = True
@@ -42,21 +46,24 @@ class DeviceClass:
             'SerialConfig': {'Parameters': ['Baud', 'DataBits', 'Parity', 'Stop'], 'Status': {}},
             'HDMIStatus': {'Status': {}},
             }  
+        self.StatusStore = StatusStore(self.Commands)
         
         if self.Unidirectional == 'False':
             pass
         
-        # Add match strings for callbacks
-        self.AddMatchString(re.compile(b'SVSI_NETSTATS:.+\\rchassisID:(.+)\\rsysName:(.+)\\rsysDescr:(.+)\\rportID:(.+)\\rportDescr:(.+)\\r'), self.__CallbackNetStatus, None)
-        self.AddMatchString(re.compile(b'(?:SVSI_.+)MUTE:(\d)\\r'), self.__CallbackMute, None)
-        self.AddMatchString(re.compile(b'(?:SVSI_.+)PLAYLIST:([0-7])\\r(?:.+)PLAYMODE:(live|local|off)\\r'), self.__CallbackLiveLocal, None)
-        self.AddMatchString(re.compile(b'(?:SVSI_.+)BAUD:(\d+)\\rSNUMB:(7|8)\\rSPAR:(even|odd|none)\\rSP2S:(1|2)\\r'), self.__CallbackSerialConfig, None)
-        self.AddMatchString(re.compile(b'(?:SVSI_.+)DVI(?:STATUS|INPUT):(connected|disconnected)\\r'), self.__CallbackHDMIStatus, None)
+        # Add status fields for callbacks
+        anyValue = SharedPattern(b'.+')
+        self.AddStatusFields(((b'chassisID', anyValue), (b'sysName', anyValue), (b'sysDescr', anyValue), (b'portID', anyValue), (b'portDescr', anyValue)), self.__CallbackNetStatus, None)
+        self.AddStatusFields(((b'MUTE', SharedPattern(b'\\d')),), self.__CallbackMute, None)
+        self.AddStatusFields(((b'PLAYLIST', SharedPattern(b'[0-7]')), (b'PLAYMODE', SharedPattern(b'live|local|off'))), self.__CallbackLiveLocal, None)
+        self.AddStatusFields(((b'BAUD', SharedPattern(b'\\d+')), (b'SNUMB', SharedPattern(b'7|8')), (b'SPAR', SharedPattern(b'even|odd|none')), (b'SP2S', SharedPattern(b'1|2'))), self.__CallbackSerialConfig, None)
+        self.AddStatusFields(((b'DVISTATUS', SharedPattern(b'connected|disconnected')),), self.__CallbackHDMIStatus, b'DVISTATUS')
+        self.AddStatusFields(((b'DVIINPUT', SharedPattern(b'connected|disconnected')),), self.__CallbackHDMIStatus, b'DVIINPUT')
         
-        self.UpdateMute = self.UpdateDeviceStatus
-        self.UpdateLiveLocal = self.UpdateDeviceStatus
-        self.UpdateSerialConfig = self.UpdateDeviceStatus
-        self.UpdateHDMIStatus = self.UpdateDeviceStatus
+        AliasCommand(self, 'Update', 'Mute', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'LiveLocal', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'SerialConfig', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'HDMIStatus', 'DeviceStatus')
         
         
 
@@ -66,7 +73,17 @@ class DeviceClass:
 
     def amx_svsi_n2300_enc(self):
         self.EndpointType = 'ENC'
-        self.AddMatchString(re.compile(b'SVSI_TXGEN2:(\w+)\\rNAME:(.+)\\rMAC:([0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2})\\rIP:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\\rNM:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\\rGW:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\\rIPTRIAL:(0|1)\\rIPMODE:(.+)\\rID:(.+)\\rrel:(.+)\\rSWVER:(.+)\\rWEBVER:(.+)\\rUPDATE:(.+)\\rUPDTRY:(.+)\\rUPDFAILED:(.+)\\rMEDIAPORT0:(on|off)\\rMEDIAPORT1:(on|off)\\rDIVASEN:(.+)\\rDIVASIP:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})(?:\\r.+\\r)PORTSD1:(yes|no)\\rDVICEVTDLY:(\d{1,5})\\rDVIDEVTDLY:(\d{1,5})\\rUSERMCMODE:(on|off)\\rUSERMCIP:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})(?:\\r.+\\r)STREAM:(\d{1,4})\\rSAMPLE:(\d+)\\rHDMIAUDIO:(auto|on|off)\\rvidDetectMode:(auto|digital|analog)(?:\\r.+\\r)DVIINPUT:(connected|disconnected)\\rMODE:(.*?)\\rLINEINVOL_L:(\d{1,3})\\rLINEINVOL_R:(\d{1,3})\\rLIVEAUDIOHP:(on|off)\\r'), self.__CallbackDeviceStatus_Enc, None)
+        onOff = SharedPattern(b'on|off')
+        self.AddStatusFields(self.__DeviceStatusFields(b'SVSI_TXGEN2') +
+                             ((b'STREAM', SharedPattern(b'\\d{1,4}')),
+                              (b'SAMPLE', SharedPattern(b'\\d+')),
+                              (b'HDMIAUDIO', SharedPattern(b'auto|on|off')),
+                              (b'vidDetectMode', SharedPattern(b'auto|digital|analog')),
+                              (b'MODE', None),
+                              (b'LINEINVOL_L', SharedPattern(b'\\d{1,3}')),
+                              (b'LINEINVOL_R', SharedPattern(b'\\d{1,3}')),
+                              (b'LIVEAUDIOHP', onOff)),
+                             self.__CallbackDeviceStatus_Enc, None)
 
         enc_commands = \
             {
@@ -80,12 +97,19 @@ class DeviceClass:
         # Tx is set for encoders in __CallbackLiveLocal
         # VidSource status is not provided by N2300 encoders, so the status is emulated in SetVidSource
         
-        self.UpdateTx = self.UpdateDeviceStatus
-        self.UpdateVidSource = self.UpdateDeviceStatus
+        AliasCommand(self, 'Update', 'Tx', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'VidSource', 'DeviceStatus')
 
     def amx_svsi_n2300_dec(self):
         self.EndpointType = 'DEC'
-        self.AddMatchString(re.compile(b'SVSI_RXGEN2:(\w+)\\rNAME:(.+)\\rMAC:([0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2})\\rIP:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\\rNM:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\\rGW:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\\rIPTRIAL:(0|1)\\rIPMODE:(.+)\\rID:(.+)\\rrel:(.+)\\rSWVER:(.+)\\rWEBVER:(.+)\\rUPDATE:(.+)\\rUPDTRY:(.+)\\rUPDFAILED:(.+)\\rMEDIAPORT0:(on|off)\\rMEDIAPORT1:(on|off)\\rDIVASEN:(.+)\\rDIVASIP:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})(?:\\r.+\\r)PORTSD1:(yes|no)\\rDVICEVTDLY:(\d{1,5})\\rDVIDEVTDLY:(\d{1,5})\\rUSERMCMODE:(on|off)\\rUSERMCIP:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})(?:\\r.+\\r)FCPC:(\w+)(?:\\r.+\\r)LIVEAUDIOLP:(on|off)\\rYUVOUT:(on|off)\\rFRAMEHOLD:(on|off)\\rVIDOFFNOSTRM:(on|off)(?:\\r.+\\r)MODE:(.*?)\\r'), self.__CallbackDeviceStatus_Dec, None)
+        onOff = SharedPattern(b'on|off')
+        self.AddStatusFields(self.__DeviceStatusFields(b'SVSI_RXGEN2') +
+                             ((b'LIVEAUDIOLP', onOff),
+                              (b'YUVOUT', onOff),
+                              (b'FRAMEHOLD', onOff),
+                              (b'VIDOFFNOSTRM', onOff),
+                              (b'MODE', None)),
+                             self.__CallbackDeviceStatus_Dec, None)
 
         dec_commands = \
             {
@@ -111,35 +135,35 @@ class DeviceClass:
         
         self.Commands.update(dec_commands)
         
-        self.AddMatchString(re.compile(b'(?:SVSI_.+)STREAM:(\d{1,4})\\r'), self.__CallbackStream, None)
-        self.AddMatchString(re.compile(b'(?:SVSI_.+)STREAMAUDIO:(\d{1,4})\\r'), self.__CallbackAudioStream, None)
-        self.AddMatchString(re.compile(b'(?:SVSI_.+)KVMMasterIP:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\\r'), self.__CallbackKVMMasterIP, None)
-        self.AddMatchString(re.compile(b'(?:SVSI_.+)LINEOUTVOL_L:(\d{1,3})\\rLINEOUTVOL_R:(\d{1,3})\\r'), self.__CallbackVolume, None)
-        self.AddMatchString(re.compile(b'(?:SVSI_.+)DVIOFF:(0|1)\\r'), self.__CallbackHDMIOutput, None)
-        self.AddMatchString(re.compile(b'(?:SVSI_.+)MODE:(auto|1080p59\.94|1080p60|720p60|4K30|4K25)\\r'), self.__CallbackScalerMode, None)
-        self.AddMatchString(re.compile(b'(?:SVSI_.+)SCALERBYPASS:(on|off)\\r'), self.__CallbackScaler, None)
-        self.AddMatchString(re.compile(b'(?:SVSI_.+)wallEnable:(0|1)\\r'), self.__CallbackVideoWall, None)
-        self.AddMatchString(re.compile(b'(?:SVSI_.+)wallHorMons:(\d{1,2})\\r'), self.__CallbackVideoWall_HorMons, None)
-        self.AddMatchString(re.compile(b'(?:SVSI_.+)wallVerMons:(\d{1})\\r'), self.__CallbackVideoWall_VerMons, None)
-        self.AddMatchString(re.compile(b'(?:SVSI_.+)wallMonPosH:(\d{1,2})\\r'), self.__CallbackVideoWall_PosHor, None)
-        self.AddMatchString(re.compile(b'(?:SVSI_.+)wallMonPosV:(\d{1})\\r'), self.__CallbackVideoWall_PosVer, None)
-        self.AddMatchString(re.compile(b'(?:SVSI_.+)wallStretch:(.+?)\\r'), self.__CallbackVideoWall_Stretch, None)
+        self.AddStatusFields(((b'STREAM', SharedPattern(b'\\d{1,4}')),), self.__CallbackStream, None)
+        self.AddStatusFields(((b'STREAMAUDIO', SharedPattern(b'\\d{1,4}')),), self.__CallbackAudioStream, None)
+        self.AddStatusFields(((b'KVMMasterIP', SharedPattern(b'\\d{1,3}\\.\\d{1,3}\\.\\d{1,3}\\.\\d{1,3}')),), self.__CallbackKVMMasterIP, None)
+        self.AddStatusFields(((b'LINEOUTVOL_L', SharedPattern(b'\\d{1,3}')), (b'LINEOUTVOL_R', SharedPattern(b'\\d{1,3}'))), self.__CallbackVolume, None)
+        self.AddStatusFields(((b'DVIOFF', SharedPattern(b'0|1')),), self.__CallbackHDMIOutput, None)
+        self.AddStatusFields(((b'MODE', SharedPattern(b'auto|1080p59\\.94|1080p60|720p60|4K30|4K25')),), self.__CallbackScalerMode, None)
+        self.AddStatusFields(((b'SCALERBYPASS', onOff),), self.__CallbackScaler, None)
+        self.AddStatusFields(((b'wallEnable', SharedPattern(b'0|1')),), self.__CallbackVideoWall, None)
+        self.AddStatusFields(((b'wallHorMons', SharedPattern(b'\\d{1,2}')),), self.__CallbackVideoWall_HorMons, None)
+        self.AddStatusFields(((b'wallVerMons', SharedPattern(b'\\d{1}')),), self.__CallbackVideoWall_VerMons, None)
+        self.AddStatusFields(((b'wallMonPosH', SharedPattern(b'\\d{1,2}')),), self.__CallbackVideoWall_PosHor, None)
+        self.AddStatusFields(((b'wallMonPosV', SharedPattern(b'\\d{1}')),), self.__CallbackVideoWall_PosVer, None)
+        self.AddStatusFields(((b'wallStretch', SharedPattern(b'.+')),), self.__CallbackVideoWall_Stretch, None)
         
-        self.UpdateStream = self.UpdateDeviceStatus
-        self.UpdateAudioStream = self.UpdateDeviceStatus
-        self.UpdateKVMMasterIP = self.UpdateDeviceStatus
-        self.UpdateVolume = self.UpdateDeviceStatus
-        self.UpdateHDMIOutput = self.UpdateDeviceStatus
-        self.UpdateScaler = self.UpdateDeviceStatus
-        self.UpdateScalerMode = self.UpdateDeviceStatus
-        self.UpdateIRPassthrough = self.UpdateDeviceStatus
-        self.UpdateIRDestination = self.UpdateDeviceStatus
-        self.UpdateVideoWall = self.UpdateDeviceStatus
-        self.UpdateVideoWall_HorMons = self.UpdateDeviceStatus
-        self.UpdateVideoWall_VerMons = self.UpdateDeviceStatus
-        self.UpdateVideoWall_PosHor = self.UpdateDeviceStatus
-        self.UpdateVideoWall_PosVer = self.UpdateDeviceStatus
-        self.UpdateVideoWall_Strech = self.UpdateDeviceStatus
+        AliasCommand(self, 'Update', 'Stream', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'AudioStream', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'KVMMasterIP', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'Volume', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'HDMIOutput', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'Scaler', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'ScalerMode', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'IRPassthrough', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'IRDestination', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'VideoWall', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'VideoWall_HorMons', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'VideoWall_VerMons', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'VideoWall_PosHor', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'VideoWall_PosVer', 'DeviceStatus')
+        AliasCommand(self, 'Update', 'VideoWall_Strech', 'DeviceStatus')
 
 ## -----------------------------------------------------------------------------
 ## End Model Definitions
@@ -150,170 +174,111 @@ class DeviceClass:
     def UpdateDeviceStatus(self, value, qualifier):
         self.__UpdateHelper('DeviceStatus', 'getStatus{}'.format(self.__lineEnding), value, qualifier)
     
-    def __CallbackDeviceStatus_Dec(self, match, tag):
-        #1# SVSI_RXGEN2:(\w+)
-        #2# NAME:(.+)
-        #3# MAC:([0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2})
-        #4# IP:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})
-        #5# NM:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})
-        #6# GW:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})
-        #7# IPTRIAL:(0|1)
-        #8# IPMODE:(.+)
-        #9# ID:(.+)
-        #10# rel:(.+)
-        #11# SWVER:(.+)
-        #12# WEBVER:(.+)
-        #13# UPDATE:(.+)
-        #14# UPDTRY:(.+)
-        #15# UPDFAILED:(.+)
-        #16# MEDIAPORT0:(on|off)
-        #17# MEDIAPORT1:(on|off)
-        #18# DIVASEN:(.+) - ignored
-        #19# DIVASIP:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}) - ignored
-        #20# PORTSD1:(yes|no)
-        #21# DVICEVTDLY:(\d{1,5})
-        #22# DVIDEVTDLY:(\d{1,5})
-        #23# USERMCMODE:(on|off)
-        #24# USERMCIP:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})
-        #25# FCPC:(\w+) - ignored
-        #26# LIVEAUDIOLP:(on|off)
-        #27# YUVOUT:(on|off)
-        #28# FRAMEHOLD:(on|off)
-        #29# VIDOFFNOSTRM:(on|off)
-        #30# MODE:(.*?)
-        statusDict = {
-            'Name': str(match.group(2), 'UTF-8'),
-            'SerialNumber': str(match.group(1), 'UTF-8'),
+    def __DeviceStatusFields(self, header):
+        # fields common to encoder and decoder getStatus blocks, DIVASEN,
+        # DIVASIP and unknown keys are ignored
+        onOff = SharedPattern(b'on|off')
+        anyValue = SharedPattern(b'.+')
+        number = SharedPattern(b'\\d+')
+        ipAddress = SharedPattern(b'\\d{1,3}\\.\\d{1,3}\\.\\d{1,3}\\.\\d{1,3}')
+        return ((header, SharedPattern(b'\\w+')),
+                (b'NAME', anyValue),
+                (b'MAC', SharedPattern(b'[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}')),
+                (b'IP', ipAddress),
+                (b'NM', ipAddress),
+                (b'GW', ipAddress),
+                (b'IPTRIAL', SharedPattern(b'0|1')),
+                (b'IPMODE', anyValue),
+                (b'ID', anyValue),
+                (b'rel', anyValue),
+                (b'SWVER', anyValue),
+                (b'WEBVER', anyValue),
+                (b'UPDATE', number),
+                (b'UPDTRY', number),
+                (b'UPDFAILED', number),
+                (b'MEDIAPORT0', onOff),
+                (b'MEDIAPORT1', onOff),
+                (b'PORTSD1', SharedPattern(b'yes|no')),
+                (b'DVICEVTDLY', SharedPattern(b'\\d{1,5}')),
+                (b'DVIDEVTDLY', SharedPattern(b'\\d{1,5}')),
+                (b'USERMCMODE', onOff),
+                (b'USERMCIP', ipAddress))
+
+    def __DeviceStatusDict(self, fields, header):
+        return {
+            'Name': str(fields[b'NAME'], 'UTF-8'),
+            'SerialNumber': str(fields[header], 'UTF-8'),
             'DeviceNetwork': {
-                'MAC': str(match.group(3), 'UTF-8'),
-                'IP': str(match.group(4), 'UTF-8'),
-                'Netmask': str(match.group(5), 'UTF-8'),
-                'Gateway': str(match.group(6), 'UTF-8'),
-                'IPMode': str(match.group(8), 'UTF-8'),
-                'IPTrailMode': bool(int(match.group(7)))
+                'MAC': str(fields[b'MAC'], 'UTF-8'),
+                'IP': str(fields[b'IP'], 'UTF-8'),
+                'Netmask': str(fields[b'NM'], 'UTF-8'),
+                'Gateway': str(fields[b'GW'], 'UTF-8'),
+                'IPMode': str(fields[b'IPMODE'], 'UTF-8'),
+                'IPTrailMode': bool(int(fields[b'IPTRIAL']))
             },
-            'ID': str(match.group(9), 'UTF-8'),
+            'ID': str(fields[b'ID'], 'UTF-8'),
             'Firmware': {
-                'Version': str(match.group(10), 'UTF-8'),
-                'Date': str(match.group(11), 'UTF-8'),
-                'WebVersion': str(match.group(12), 'UTF-8'),
+                'Version': str(fields[b'rel'], 'UTF-8'),
+                'Date': str(fields[b'SWVER'], 'UTF-8'),
+                'WebVersion': str(fields[b'WEBVER'], 'UTF-8'),
                 'Update': {
-                    'Updating': bool(int(match.group(13))),
-                    'Tries': int(match.group(14)),
-                    'Fails': int(match.group(15))
+                    'Updating': bool(int(fields[b'UPDATE'])),
+                    'Tries': int(fields[b'UPDTRY']),
+                    'Fails': int(fields[b'UPDFAILED'])
                 }
             },
             'MulticastTraffic': (
-                (True if str(match.group(16), 'UTF-8') == 'on' else False),
-                (True if str(match.group(17), 'UTF-8') == 'on' else False)
+                (fields[b'MEDIAPORT0'] == b'on'),
+                (fields[b'MEDIAPORT1'] == b'on')
             ),
-            "P1Disabled": (False if str(match.group(20), 'UTF-8') == 'yes' else True),
+            "P1Disabled": (fields[b'PORTSD1'] != b'yes'),
             'NActEventDelay': {
-                'connect': int(match.group(21)),
-                'disconnect': int(match.group(22))
+                'connect': int(fields[b'DVICEVTDLY']),
+                'disconnect': int(fields[b'DVIDEVTDLY'])
             },
-            'UserMulticast': (True if str(match.group(23), 'UTF-8') == 'on' else False),
-            'UserMulticastAddr': str(match.group(24), 'UTF-8'),
-            'LiveAudioInLocalPlay': (True if str(match.group(26), 'UTF-8') == 'on' else False),
-            'YUVOut': (True if str(match.group(27), 'UTF-8') == 'on' else False),
-            'FrameHold': (True if str(match.group(28), 'UTF-8') == 'on' else False),
-            'VidOffOnNoStream': (True if str(match.group(29), 'UTF-8') == 'on' else False),
-            'Mode': str(match.group(30), 'UTF-8')
+            'UserMulticast': (fields[b'USERMCMODE'] == b'on'),
+            'UserMulticastAddr': str(fields[b'USERMCIP'], 'UTF-8')
         }
+
+    def __CallbackDeviceStatus_Dec(self, fields, tag):
+        statusDict = self.__DeviceStatusDict(fields, b'SVSI_RXGEN2')
+        statusDict.update({
+            'LiveAudioInLocalPlay': (fields[b'LIVEAUDIOLP'] == b'on'),
+            'YUVOut': (fields[b'YUVOUT'] == b'on'),
+            'FrameHold': (fields[b'FRAMEHOLD'] == b'on'),
+            'VidOffOnNoStream': (fields[b'VIDOFFNOSTRM'] == b'on'),
+            'Mode': str(fields[b'MODE'], 'UTF-8')
+        })
         self.WriteStatus('DeviceStatus', statusDict)
     
-    def __CallbackDeviceStatus_Enc(self, match, tag):
-        #1# SVSI_TXGEN2:(\w+)
-        #2# NAME:(.+)
-        #3# MAC:([0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2})
-        #4# IP:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})
-        #5# NM:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})
-        #6# GW:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})
-        #7# IPTRIAL:(0|1)
-        #8# IPMODE:(.+)
-        #9# ID:(.+)
-        #10# rel:(.+)
-        #11# SWVER:(.+)
-        #12# WEBVER:(.+)
-        #13# UPDATE:(.+)
-        #14# UPDTRY:(.+)
-        #15# UPDFAILED:(.+)
-        #16# MEDIAPORT0:(on|off)
-        #17# MEDIAPORT1:(on|off)
-        #18# DIVASEN:(.+) - ignored
-        #19# DIVASIP:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}) - ignored
-        #20# PORTSD1:(yes|no)
-        #21# DVICEVTDLY:(\d{1,5})
-        #22# DVIDEVTDLY:(\d{1,5})
-        #23# USERMCMODE:(on|off)
-        #24# USERMCIP:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})
-        #25# STREAM:(\d{1,4})
-        #26# SAMPLE:(\d+)
-        #27# HDMIAUDIO:(auto|on|off)
-        #28# vidDetectMode:(auto|digital|analog)
-        #29# DVIINPUT:(connected|disconnected)
-        #30# MODE:(.*?)
-        #31# LINEINVOL_L:(\d{1,3})
-        #32# LINEINVOL_R:(\d{1,3})
-        #33# LIVEAUDIOHP:(on|off)
-        statusDict = {
-            'Name': str(match.group(2), 'UTF-8'),
-            'SerialNumber': str(match.group(1), 'UTF-8'),
-            'DeviceNetwork': {
-                'MAC': str(match.group(3), 'UTF-8'),
-                'IP': str(match.group(4), 'UTF-8'),
-                'Netmask': str(match.group(5), 'UTF-8'),
-                'Gateway': str(match.group(6), 'UTF-8'),
-                'IPMode': str(match.group(8), 'UTF-8'),
-                'IPTrailMode': bool(int(match.group(7)))
-            },
-            'ID': str(match.group(9), 'UTF-8'),
-            'Firmware': {
-                'Version': str(match.group(10), 'UTF-8'),
-                'Date': str(match.group(11), 'UTF-8'),
-                'WebVersion': str(match.group(12), 'UTF-8'),
-                'Update': {
-                    'Updating': bool(int(match.group(13))),
-                    'Tries': int(match.group(14)),
-                    'Fails': int(match.group(15))
-                }
-            },
-            'MulticastTraffic': (
-                (True if str(match.group(16), 'UTF-8') == 'on' else False),
-                (True if str(match.group(17), 'UTF-8') == 'on' else False)
-            ),
-            "P1Disabled": (False if str(match.group(20), 'UTF-8') == 'yes' else True),
-            'NActEventDelay': {
-                'connect': int(match.group(21)),
-                'disconnect': int(match.group(22))
-            },
-            'UserMulticast': (True if str(match.group(23), 'UTF-8') == 'on' else False),
-            'UserMulticastAddr': str(match.group(24), 'UTF-8'),
-            'Stream': int(match.group(25)),
-            'AudioSampleRate': int(match.group(26)),
-            'HDMIAudioMode': str(match.group(27), 'UTF-8'),
-            'VideoDetectionMode': str(match.group(28), 'UTF-8'),
-            'Mode': str(match.group(30), 'UTF-8'),
-            'LineInVol': (int(match.group(31)), int(match.group(32))),
-            'LiveAudioInHostPlay': (True if str(match.group(33), 'UTF-8') == 'on' else False)
-        }
+    def __CallbackDeviceStatus_Enc(self, fields, tag):
+        statusDict = self.__DeviceStatusDict(fields, b'SVSI_TXGEN2')
+        statusDict.update({
+            'Stream': int(fields[b'STREAM']),
+            'AudioSampleRate': int(fields[b'SAMPLE']),
+            'HDMIAudioMode': str(fields[b'HDMIAUDIO'], 'UTF-8'),
+            'VideoDetectionMode': str(fields[b'vidDetectMode'], 'UTF-8'),
+            'Mode': str(fields[b'MODE'], 'UTF-8'),
+            'LineInVol': (int(fields[b'LINEINVOL_L']), int(fields[b'LINEINVOL_R'])),
+            'LiveAudioInHostPlay': (fields[b'LIVEAUDIOHP'] == b'on')
+        })
         self.WriteStatus('DeviceStatus', statusDict)
     
     def UpdateNetStatus(self, value, qualifier):
         self.__UpdateHelper('NetStatus', 'getNetStatus{}'.format(self.__lineEnding), value, qualifier)
     
-    def __CallbackNetStatus(self, match, tag):
+    def __CallbackNetStatus(self, fields, tag):
         # chassisID:(.+)
         # sysName:(.+)
         # sysDescr:(.+)
         # portID:(.+)
         # portDescr:(.+)
         netStatusDict = {
-            'ChassisId': str(match.group(1), 'UTF-8'),
-            'SystemName': str(match.group(2), 'UTF-8'),
-            'SystemDescription': str(match.group(3), 'UTF-8'),
-            'PortId': str(match.group(4), 'UTF-8'),
-            'PortDescription': str(match.group(5), 'UTF-8')
+            'ChassisId': str(fields[b'chassisID'], 'UTF-8'),
+            'SystemName': str(fields[b'sysName'], 'UTF-8'),
+            'SystemDescription': str(fields[b'sysDescr'], 'UTF-8'),
+            'PortId': str(fields[b'portID'], 'UTF-8'),
+            'PortDescription': str(fields[b'portDescr'], 'UTF-8')
         }
         self.WriteStatus('NetStatus', netStatusDict)
     
@@ -323,9 +288,9 @@ class DeviceClass:
         elif value == False or value == 0 or value == 'off':
             self.__SetHelper('Mute', 'unmute{}'.format(self.__lineEnding), value, qualifier)
     
-    def __CallbackMute(self, match, tag):
+    def __CallbackMute(self, fields, tag):
         # MUTE:(\d)
-        dataVal = bool(int(match.group(1)))
+        dataVal = bool(int(fields[b'MUTE']))
         self.WriteStatus('Mute', dataVal)
     
     def SetLiveLocal(self, value, qualifier):
@@ -334,16 +299,16 @@ class DeviceClass:
         elif type(value) == int and value >= 0 and value <= 7:
             self.__SetHelper('LiveLocal', 'local:{}{}'.format(value, self.__lineEnding), value, qualifier)
     
-    def __CallbackLiveLocal(self, match, tag):
+    def __CallbackLiveLocal(self, fields, tag):
         # PLAYLIST:([0-7])\\r(?:.+)PLAYMODE:(live|local|off)
         dataVal = {
-            'Mode': str(match.group(2), 'UTF-8'),
-            'Playlist': int(match.group(1))
+            'Mode': str(fields[b'PLAYMODE'], 'UTF-8'),
+            'Playlist': int(fields[b'PLAYLIST'])
         }
         self.WriteStatus('LiveLocal', dataVal)
         
         if self.EndpointType == 'ENC':
-            if str(match.group(2), 'UTF-8') == 'off':
+            if str(fields[b'PLAYMODE'], 'UTF-8') == 'off':
                 txVal = False
             else:
                 txVal = True
@@ -368,13 +333,13 @@ class DeviceClass:
                          value,
                          qualifier)
     
-    def __CallbackSerialConfig(self, match, tag):
+    def __CallbackSerialConfig(self, fields, tag):
         # BAUD:(\d+)\\rSNUMB:(7|8)\\rSPAR:(even|odd|none)\\rSP2S:(1|2)
         dataVal = {
-            'Baud': int(match.group(1)),
-            'DataBits': int(match.group(2)),
-            'Parady': str(match.group(3), 'UTF-8'),
-            'Stop': int(match.group(4))
+            'Baud': int(fields[b'BAUD']),
+            'DataBits': int(fields[b'SNUMB']),
+            'Parady': str(fields[b'SPAR'], 'UTF-8'),
+            'Stop': int(fields[b'SP2S'])
         }
         self.WriteStatus('SerialConfig', dataVal)
     
@@ -397,17 +362,17 @@ class DeviceClass:
     def SetStream(self, value, qualifier):
         self.__SetHelper('Stream', 'set:{}{}'.format(value, self.__lineEnding), value, qualifier)
     
-    def __CallbackStream(self, match, tag):
+    def __CallbackStream(self, fields, tag):
         # STREAM:(\d{1,4})
-        dataVal = int(match.group(1))
+        dataVal = int(fields[b'STREAM'])
         self.WriteStatus('Stream', dataVal)
     
     def SetAudioStream(self, value, qualifier):
         self.__SetHelper('Stream', 'seta:{}{}'.format(value, self.__lineEnding), value, qualifier)
     
-    def __CallbackAudioStream(self, match, tag):
+    def __CallbackAudioStream(self, fields, tag):
         # STREAMAUDIO:(\d{1,4})
-        dataVal = int(match.group(1))
+        dataVal = int(fields[b'STREAMAUDIO'])
         self.WriteStatus('AudioStream', dataVal)
     
     def SetKVMMasterIP(self, value, qualifier):
@@ -425,20 +390,20 @@ class DeviceClass:
                          value,
                          qualifier)
     
-    def __CallbackKVMMasterIP(self, match, tag):
+    def __CallbackKVMMasterIP(self, fields, tag):
         # KVMMasterIP:(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})
-        dataVal = str(match.group(1), 'UTF-8')
+        dataVal = str(fields[b'KVMMasterIP'], 'UTF-8')
         self.WriteStatus('KVMMasterIP', dataVal)
     
     def SetVolume(self, value, qualifier):
         self.__SetHelper('Volume', 'lovol:{}{}'.format(value, self.__lineEnding), value, qualifier)
     
-    def __CallbackVolume(self, match, tag):
+    def __CallbackVolume(self, fields, tag):
         # LINEOUTVOL_L:(\d{1,3})\\rLINEOUTVOL_R:(\d{1,3})
-        if match.group(1) == match.group(2):
-            dataVal = int(match.group(1))
+        if fields[b'LINEOUTVOL_L'] == fields[b'LINEOUTVOL_R']:
+            dataVal = int(fields[b'LINEOUTVOL_L'])
         else:
-            dataVal = (int(match.group(1)), int(match.group(2)))
+            dataVal = (int(fields[b'LINEOUTVOL_L']), int(fields[b'LINEOUTVOL_R']))
         self.WriteStatus('Volume', dataVal)
     
     def SetHDMIOutput(self, value, qualifier):
@@ -447,16 +412,16 @@ class DeviceClass:
         elif value == False or value == 0 or value == 'off':
             self.__SetHelper('HDMIOutput', 'hdmiOff{}'.format(self.__lineEnding), value, qualifier)
     
-    def __CallbackHDMIOutput(self, match, tag):
+    def __CallbackHDMIOutput(self, fields, tag):
         # DVIOFF:(0|1)
         # Documentation seems to be wrong, DVI is used instead of HDMI
-        dataVal = not bool(int(match.group(1)))
+        dataVal = not bool(int(fields[b'DVIOFF']))
         self.WriteStatus('HDMIOutput', dataVal)
     
-    def __CallbackHDMIStatus(self, match, tag):
+    def __CallbackHDMIStatus(self, fields, tag):
         # DVI(?:STATUS|INPUT):(connected|disconnected)
         # Documentation seems to be wrong, DVI is used instead of HDMI
-        dataVal = str(match.group(1), 'UTF-8')
+        dataVal = str(fields[tag], 'UTF-8')
         self.WriteStatus('HDMIStatus', dataVal)
     
     def SetScaler(self, value, qualifier):
@@ -465,9 +430,9 @@ class DeviceClass:
         elif value == False or value == 0 or value == 'off':
             self.__SetHelper('Scaler', 'scalerdisable{}'.format(self.__lineEnding), value, qualifier)
     
-    def __CallbackScaler(self, match, tag):
+    def __CallbackScaler(self, fields, tag):
         # SCALERBYPASS:(on|off)
-        dataVal = True if str(match.group(1), 'UTF-8') == 'off' else False
+        dataVal = True if str(fields[b'SCALERBYPASS'], 'UTF-8') == 'off' else False
         self.WriteStatus('Scaler', dataVal)
     
     def SetScalerMode(self, value, qualifier):
@@ -476,9 +441,9 @@ class DeviceClass:
         else:
             self.__SetHelper('ScalerMode', 'modeset:auto{}'.format(self.__lineEnding), 'auto', qualifier)
     
-    def __CallbackScalerMode(self, match, tag):
+    def __CallbackScalerMode(self, fields, tag):
         # MODE:(auto|1080p59\.94|1080p60|720p60|4K30|4K25)
-        dataVal = str(match.group(1), 'UTF-8')
+        dataVal = str(fields[b'MODE'], 'UTF-8')
         self.WriteStatus('ScalerMode', dataVal)
     
     def SetIRPassthrough(self, value, qualifier):
@@ -496,9 +461,9 @@ class DeviceClass:
         elif value == False or value == 0 or value == 'off':
             self.__SetHelper('VideoWall', 'setSettings:wallEnable:off{}'.format(self.__lineEnding), value, qualifier)
     
-    def __CallbackVideoWall(self, match, tag):
+    def __CallbackVideoWall(self, fields, tag):
         # wallEnable:(0|1)
-        dataVal = bool(int(match.group(1)))
+        dataVal = bool(int(fields[b'wallEnable']))
         self.WriteStatus('VideoWall', dataVal)
     
     def SetVideoWall_HorMons(self, value, qualifier):
@@ -507,9 +472,9 @@ class DeviceClass:
                          value, 
                          qualifier)
     
-    def __CallbackVideoWall_HorMons(self, match, tag):
+    def __CallbackVideoWall_HorMons(self, fields, tag):
         # wallHorMons:(\d{1,2})
-        dataVal = int(match.group(1))
+        dataVal = int(fields[b'wallHorMons'])
         self.WriteStatus('VideoWall_HorMons', dataVal)
     
     def SetVideoWall_VerMons(self, value, qualifier):
@@ -518,9 +483,9 @@ class DeviceClass:
                          value, 
                          qualifier)
     
-    def __CallbackVideoWall_VerMons(self, match, tag):
+    def __CallbackVideoWall_VerMons(self, fields, tag):
         # wallVerMons:(\d{1})
-        dataVal = int(match.group(1))
+        dataVal = int(fields[b'wallVerMons'])
         self.WriteStatus('VideoWall_VerMons', dataVal)
     
     def SetVideoWall_PosHor(self, value, qualifier):
@@ -529,9 +494,9 @@ class DeviceClass:
                          value, 
                          qualifier)
     
-    def __CallbackVideoWall_PosHor(self, match, tag):
+    def __CallbackVideoWall_PosHor(self, fields, tag):
         # wallMonPosH:(\d{1,2})
-        dataVal = int(match.group(1))
+        dataVal = int(fields[b'wallMonPosH'])
         self.WriteStatus('VideoWall_PosHor', dataVal)
     
     def SetVideoWall_PosVer(self, value, qualifier):
@@ -540,8 +505,8 @@ class DeviceClass:
                          value, 
                          qualifier)
     
-    def __CallbackVideoWall_PosVer(self, match, tag):
-        dataVal = int(match.group(1))
+    def __CallbackVideoWall_PosVer(self, fields, tag):
+        dataVal = int(fields[b'wallMonPosV'])
         self.WriteStatus('VideoWall_PosVer', dataVal)
     
     def SetVideoWall_Stretch(self, value, qualifier):
@@ -550,10 +515,10 @@ class DeviceClass:
                          value, 
                          qualifier)
     
-    def __CallbackVideoWall_Stretch(self, match, tag):
+    def __CallbackVideoWall_Stretch(self, fields, tag):
         # wallStretch:(.+)
         # documentation and realworld testing do not match
-        dataVal = str(match.group(1), 'UTF-8')
+        dataVal = str(fields[b'wallStretch'], 'UTF-8')
         self.WriteStatus('VideoWall_Stretch', dataVal)
     
     def SetVideoWall_HShift(self, value, qualifier):
@@ -620,6 +585,8 @@ class DeviceClass:
         # ProgramLog('On Disconnect: Counter {}, ConnCount {}, ConnFlag {}'.format(self.counter, self.connectionCounter, self.connectionFlag))
         self.WriteStatus('ConnectionStatus', 'Disconnected')
         self.connectionFlag = False
+        # unchanged status must still be written to reconnect
+        self.__matchBlocks.Refresh()
 
     ######################################################    
     # RECOMMENDED not to modify the code below this point
@@ -627,17 +594,19 @@ class DeviceClass:
 
     # Send Control Commands
     def Set(self, command, value, qualifier=None):
-        method = getattr(self, 'Set%s' % command, None)
-        if method is not None and callable(method):
-            method(value, qualifier)
+        method = self.SetMethods.get(command, None)
+        if method is not None:
+            if not self.StatusStore.Validate(command, qualifier):
+                raise KeyError('Invalid qualifier for Set ' + command)
+            method(self, value, qualifier)
         else:
             raise AttributeError(command + 'does not support Set.')
 
     # Send Update Commands
     def Update(self, command, qualifier=None):
-        method = getattr(self, 'Update%s' % command, None)
-        if method is not None and callable(method):
-            method(None, qualifier)
+        method = self.UpdateMethods.get(command, None)
+        if method is not None:
+            method(self, None, qualifier)
         else:
             raise AttributeError(command + 'does not support Update.')
 
@@ -648,117 +617,46 @@ class DeviceClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command, None)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method':{}}
-        
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-        
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-        
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier    
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             raise KeyError('Invalid command for SubscribeStatus ' + command)
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription :
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)  
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
         self.counter = 0
         if not self.connectionFlag:
             self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return  
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
+        if self.StatusStore.Write(command, value, qualifier):
             self.NewStatus(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
         Command = self.Commands.get(command, None)
         if Command:
-            Status = Command['Status']
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Status = Status[qualifier[Parameter]]
-                    except KeyError:
-                        return None
-            try:
-                return Status['Live']
-            except:
-                return None
+            return self.StatusStore.Read(command, qualifier)
         else:
             raise KeyError('Invalid command for ReadStatus: ' + command)
 
     def __ReceiveData(self, interface, data):
         self.counter = 0
-        # Handle incoming data
-        self.__receiveBuffer += data
-        index = 0    # Start of possible good data
-        
-        #check incoming data if it matched any expected data from device module
-        for regexString, CurrentMatch in self.__matchStringDict.items():
-            result = re.search(regexString, self.__receiveBuffer)
-            #ProgramLog("Regex String: {}".format(regexString))
-            if result:
-                #ProgramLog("Callback: {}".format(CurrentMatch['callback']))
-                if result.end() > index:
-                    index = result.end() # increase index to track the end of the further match
-                CurrentMatch['callback'](result, CurrentMatch['para'])
-            else:
-                #ProgramLog('Regex String Mismatch:\n  {}\n  {}'.format(regexString, self.__receiveBuffer))
-                pass
-                    
-        if index: 
-            # Clear out any data that has already been matched.
-            self.__receiveBuffer = self.__receiveBuffer[index:]
-        else:
-            # In rare cases, the buffer could be filled with garbage quickly.
-            # Make sure the buffer is capped.  Max buffer size set in init.
-            self.__receiveBuffer = self.__receiveBuffer[-self.__maxBufferSize:]
+        # Handle incoming data, blocks completed by this read are matched
+        # as their next header arrives, the last block is matched here
+        if self.__receiveFrames.Receive(data) == 0:
+            return
+        self.__matchBlocks.Match()
 
     # Add regular expression so that it can be check on incoming data from device.
     def AddMatchString(self, regex_string, callback, arg):
-        if regex_string not in self.__matchStringDict:
-            self.__matchStringDict[regex_string] = {'callback': callback, 'para':arg}
+        self.__matchBlocks.Add(regex_string, callback, arg)
+
+    # Add status fields so that they can be read from incoming status blocks.
+    # The callback is only called when the field values change.
+    def AddStatusFields(self, fields, callback, arg):
+        self.__matchBlocks.AddFields(fields, callback, arg)
 
     def MissingCredentialsLog(self, credential_type):
         if isinstance(self, EthernetClientInterface):
@@ -24,14 +24,15 @@ from extronlib.system import ProgramLog
 
 from uofi_gui.systemHardware import VirtualDeviceInterface
 import utilityFunctions
+from uofi_gui.driverStatus import StatusStore, CommandMethods, AliasCommand
 
+@CommandMethods
 class DeviceClass:
     def __init__(self):
         
         self.Unidirectional = 'False'
         self.connectionCounter = 15
         # self.DefaultResponseTimeout = 5
-        self.Subscription = {}
         # self.ReceiveData = self.__ReceiveData
         # self.__receiveBuffer = b''
         # self.__maxBufferSize = 4096
@@ -58,9 +59,10 @@ class DeviceClass:
             'Standby': {'Parameters': ['Input'], 'Status': {}},
             'VideoMute': {'Parameters': ['Output'], 'Status': {}},
         }
+        self.StatusStore = StatusStore(self.Commands)
         
-        self.UpdateInputTieStatus = self.UpdateAllMatrixTie
-        self.UpdateOutputTieStatus = self.UpdateAllMatrixTie
+        AliasCommand(self, 'Update', 'InputTieStatus', 'AllMatrixTie')
+        AliasCommand(self, 'Update', 'OutputTieStatus', 'AllMatrixTie')
         
         if self.Unidirectional == 'False':
             pass
@@ -157,7 +159,7 @@ class DeviceClass:
             self.__ConnectHelper()
             
     def FeedbackInputSignalStatusHandler(self, command, value, qualifier, hardware=None):
-        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}'.format(hardware.Name, command, value, qualifier))
+        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}', args=(hardware.Name, command, value, qualifier))
         for TP in self.GUIHost.TPs:
             srcObj = TP.SrcCtl.GetSourceByInput(qualifier['Input'])
             if value == 'Active':
@@ -281,7 +283,7 @@ class DeviceClass:
         self.__ConnectHelper()
     
     def FeedbackOutputTieStatusHandler(self, command, value, qualifier, hardware=None):
-        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}'.format(hardware.Name, command, value, qualifier))
+        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}', args=(hardware.Name, command, value, qualifier))
         utilityFunctions.Log('Tie: {}\n    {} -> {}'.format(qualifier['Tie Type'], qualifier['Output'], value))
     
 ## -----------------------------------------------------------------------------
@@ -316,17 +318,19 @@ class DeviceClass:
 
     # Send Control Commands
     def Set(self, command, value, qualifier=None):
-        method = getattr(self, 'Set%s' % command, None)
-        if method is not None and callable(method):
-            method(value, qualifier)
+        method = self.SetMethods.get(command, None)
+        if method is not None:
+            if not self.StatusStore.Validate(command, qualifier):
+                raise KeyError('Invalid qualifier for Set ' + command)
+            method(self, value, qualifier)
         else:
             raise AttributeError(command + 'does not support Set.')
 
     # Send Update Commands
     def Update(self, command, qualifier=None):
-        method = getattr(self, 'Update%s' % command, None)
-        if method is not None and callable(method):
-            method(None, qualifier)
+        method = self.UpdateMethods.get(command, None)
+        if method is not None:
+            method(self, None, qualifier)
         else:
             raise AttributeError(command + 'does not support Update.')
 
@@ -337,42 +341,13 @@ class DeviceClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command, None)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method':{}}
-        
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-        
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-        
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier    
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             raise KeyError('Invalid command for SubscribeStatus ' + command)
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription :
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)  
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
@@ -380,41 +355,14 @@ class DeviceClass:
         self.counter = 0
         if not self.connectionFlag:
             self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return  
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
+        if self.StatusStore.Write(command, value, qualifier):
             self.NewStatus(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
         Command = self.Commands.get(command, None)
         if Command:
-            Status = Command['Status']
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Status = Status[qualifier[Parameter]]
-                    except KeyError:
-                        return None
-            try:
-                return Status['Live']
-            except:
-                return None
+            return self.StatusStore.Read(command, qualifier)
         else:
             raise KeyError('Invalid command for ReadStatus: ' + command)
 
@@ -6,20 +6,43 @@ from extronlib.interface import SerialInterface, EthernetClientInterface
 from re import compile, findall, search
 from extronlib.system import ProgramLog, Wait
 from decimal import Decimal, ROUND_HALF_UP
-import copy
 
 import utilityFunctions
+from uofi_gui.driverReceive import FrameReceiver, PrefixDispatcher
+from uofi_gui.driverStatus import StatusStore, CommandMethods
 
+@CommandMethods
 class DeviceClass:
     def __init__(self):
 
         self.Unidirectional = 'False'
         self.connectionCounter = 15
-        self.Subscription = {}
         self.ReceiveData = self.__ReceiveData
-        self.__receiveBuffer = b''
         self.__maxBufferSize = 4096
-        self.__matchStringDict = {}
+        # TTP lines end in CRLF, in verbose mode a response line is preceded
+        # by the echo of the command it answers
+        self.__receiveFrames = FrameReceiver(b'\r\n', self.__ReceiveLine, self.__maxBufferSize)
+        self.__echoLine = b''
+        self.__matchStrings = PrefixDispatcher()
+        self.__subscribeHandlers = {
+            'AECPhantomPower': self.__SubscribeChannelStates,
+            'LogicMeter': self.__SubscribeChannelStates,
+            'MuteControl': self.__SubscribeChannelStates,
+            'Bluetooth': self.__SubscribeBluetoothState,
+            'BluetoothDiscovery': self.__SubscribeBluetoothState,
+            'BluetoothUSBConnectionStatus': self.__SubscribeBluetoothState,
+            'BluetoothUSBStreamingStatus': self.__SubscribeBluetoothState,
+            'BluetoothConnectedDeviceName': self.__SubscribeBluetoothDeviceName,
+            'FineLevelControl': self.__SubscribeFineLevelControl,
+            'LevelControl': self.__SubscribeLevelControl,
+            'RoomCombinerOutputLevel': self.__SubscribeRoomCombinerOutputLevel,
+            'SignalPresentMeter': self.__SubscribeSignalPresentMeter,
+            'SourceSelectorSourceSelection': self.__SubscribeSourceSelection,
+            'TICallStatus': self.__SubscribeTICallStatus,
+            'TILineInUse': self.__SubscribeTILineInUse,
+            'VoIPCallStatus': self.__SubscribeVoIPCallStatus,
+            'VoIPLineInUse': self.__SubscribeVoIPLineInUse,
+        }
         self.counter = 0
         self.connectionFlag = True
         self.initializationChk = True
@@ -100,6 +123,7 @@ class DeviceClass:
             'VoIPTransmitLevel': {'Parameters': ['Instance Tag', 'Line'], 'Status': {}},
             'VoIPTransmitMute': {'Parameters': ['Instance Tag', 'Line'], 'Status': {}},
         }
+        self.StatusStore = StatusStore(self.Commands)
 
         self.InitialStatusList = []
         self.MatchstringList = []
@@ -124,22 +148,22 @@ class DeviceClass:
 ## -----------------------------------------------------------------------------
 
     def FeedbackMuteHandler(self, command, value, qualifier, hardware=None, tag=None):
-        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}; Tag: {}'.format(hardware.Name, command, value, qualifier, tag))
+        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}; Tag: {}', args=(hardware.Name, command, value, qualifier, tag))
         for TP in self.GUIHost.TPs:
             TP.AudioCtl.AudioMuteFeedback(tag, value)
         
     def FeedbackLevelHandler(self, command, value, qualifier, hardware=None, tag=None):
-        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}; Tag {}'.format(hardware.Name, command, value, qualifier, tag))
+        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}; Tag {}', args=(hardware.Name, command, value, qualifier, tag))
         for TP in self.GUIHost.TPs:
             TP.AudioCtl.AudioLevelFeedback(tag, value)
 
     def FeedbackGainHandler(self, command, value, qualifier, hardware=None, tag=None):
-        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}; Tag {}'.format(hardware.Name, command, value, qualifier, tag))
+        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}; Tag {}', args=(hardware.Name, command, value, qualifier, tag))
         for TP in self.GUIHost.TPs:
             TP.AudioCtl.AudioGainFeedback(qualifier, value)
             
     def FeedbackPhantomHandler(self, command, value, qualifier, hardware=None, tag=None):
-        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}; Tag {}'.format(hardware.Name, command, value, qualifier, tag))
+        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}; Tag {}', args=(hardware.Name, command, value, qualifier, tag))
         for TP in self.GUIHost.TPs:
             TP.AudioCtl.AudioPhantomFeedback(qualifier, value)
 ## -----------------------------------------------------------------------------
@@ -163,134 +187,129 @@ class DeviceClass:
             else:
                 self.WriteStatus('VerboseMode', 'False')
 
-    def __MatchAllSubscribe(self, match, tag):
-
-        StateValues = {
-            'true' : ['On',  'True',  'Connected',    'Signal Present',    'In Use'],
-            'false': ['Off', 'False', 'Disconnected', 'No Signal Present', 'Not in Use']
-        }
+    __StateValues = {
+        'true' : ['On',  'True',  'Connected',    'Signal Present',    'In Use'],
+        'false': ['Off', 'False', 'Disconnected', 'No Signal Present', 'Not in Use']
+    }
 
+    def __MatchAllSubscribe(self, match, tag):
+        # publish tokens are named <command>_<instance tag>[_<index>...], the
+        # command selects the handler which parses the value
         label = match.group(1).decode()
-        data = [label[:label.index('_')],label[label.index('_')+1:]]
-        paramsList = data[1].split('_')
-        if data[0] in ['AECPhantomPower','LogicMeter','MuteControl']:
-            stateIndex = 1 if data[0] == 'LogicMeter' else 0
-            chnl = 1
-            allValues = findall('false|true',match.group(2).decode())
-            for value in allValues:
-                self.WriteStatus(data[0], StateValues[value][stateIndex], {'Instance Tag': data[1], 'Channel': str(chnl)})
-                chnl += 1
-
-        elif data[0] in ['Bluetooth','BluetoothDiscovery','BluetoothUSBConnectionStatus','BluetoothUSBStreamingStatus']:
-            stateIndex = 2 if data[0] == 'BluetoothUSBConnectionStatus' else 0
-            value = StateValues[match.group(2).decode()][stateIndex]
-            self.WriteStatus(data[0], value, {'Instance Tag': data[1]})
-
-        elif data[0] == 'BluetoothConnectedDeviceName':
-            if match.group(2):
-                value = match.group(2).decode()
-            else:
-                value = ''
-            self.WriteStatus('BluetoothConnectedDeviceName', value, {'Instance Tag': data[1]})
-
-        elif data[0] == 'FineLevelControl':
-            chnl = 1
-            allValues = findall('(-?\d+\.\d+)', match.group(2).decode())
-            for value in allValues:
-                value = Decimal(float(value)).quantize(Decimal('.1'),rounding=ROUND_HALF_UP)
-                self.WriteStatus('FineLevelControl', value, {'Instance Tag': data[1], 'Channel': str(chnl)})
-                chnl += 1
-
-        elif data[0] == 'LevelControl':
-            chnl = 1
-            allValues = findall('(-?\d+)\.\d+', match.group(2).decode())
-            for value in allValues:
-                self.WriteStatus('LevelControl', int(value), {'Instance Tag': data[1], 'Channel': str(chnl)})
-                chnl += 1
-
-        elif data[0] == 'RoomCombinerOutputLevel':
-            value = int(float(match.group(2).decode()))
-            tag = '_'.join(paramsList[:len(paramsList)-1])
-            room = paramsList[-1]
-            self.WriteStatus('RoomCombinerOutputLevel', value, {'Instance Tag': tag, 'Room': room})
-
-        elif data[0] == 'SignalPresentMeter':
-            value = StateValues[match.group(2).decode()][3]
-            tag = '_'.join(paramsList[:len(paramsList)-2])
-            chnl = paramsList[-2]
-            mtrName = paramsList[-1]
-            self.WriteStatus('SignalPresentMeter', value, {'Instance Tag': tag, 'Channel': chnl, 'Meter Name': mtrName})
-
-        elif data[0] == 'SourceSelectorSourceSelection':
-            value = match.group(2).decode()
-            if value == '0':
-                self.WriteStatus('SourceSelectorSourceSelection', 'No Source', {'Instance Tag': data[1]})
-            elif 1 <= int(value) <= 32:
-                self.WriteStatus('SourceSelectorSourceSelection', value, {'Instance Tag': data[1]})
-
-        elif data[0] == 'TICallStatus':
-            res = match.group(2).decode()
-
-            stateValues = findall('\"state\":TI_CALL_STATE_(\w+) \"', res)
-            for val in stateValues:
-                value = val.replace('_', ' ').title()
-                self.WriteStatus('TICallStatus', value, {'Instance Tag': data[1]})
-
-            idValues = findall('"cid":"\x5C\x5C"(\d{8})\x5C\x5C"\x5C\x5C"(.*?)\x5C\x5C"\x5C\x5C"(.*?)\x5C\x5C""|"cid":""', res)
-            for id_ in idValues:
-                name = id_[2]
-                number = id_[1]
-                if number:
-                    if name:
-                        value = name + ' : ' + number
-                    else:
-                        value = number
+        command, _, instance = label.partition('_')
+        handler = self.__subscribeHandlers.get(command, None)
+        if handler is not None:
+            handler(command, instance, match.group(2))
+
+    def __SubscribeChannelStates(self, command, instance, value):
+        stateIndex = 1 if command == 'LogicMeter' else 0
+        chnl = 1
+        for state in findall('false|true', value.decode()):
+            self.WriteStatus(command, self.__StateValues[state][stateIndex], {'Instance Tag': instance, 'Channel': str(chnl)})
+            chnl += 1
+
+    def __SubscribeBluetoothState(self, command, instance, value):
+        stateIndex = 2 if command == 'BluetoothUSBConnectionStatus' else 0
+        self.WriteStatus(command, self.__StateValues[value.decode()][stateIndex], {'Instance Tag': instance})
+
+    def __SubscribeBluetoothDeviceName(self, command, instance, value):
+        self.WriteStatus('BluetoothConnectedDeviceName', value.decode() if value else '', {'Instance Tag': instance})
+
+    def __SubscribeFineLevelControl(self, command, instance, value):
+        chnl = 1
+        for level in findall('(-?\d+\.\d+)', value.decode()):
+            level = Decimal(float(level)).quantize(Decimal('.1'),rounding=ROUND_HALF_UP)
+            self.WriteStatus('FineLevelControl', level, {'Instance Tag': instance, 'Channel': str(chnl)})
+            chnl += 1
+
+    def __SubscribeLevelControl(self, command, instance, value):
+        chnl = 1
+        for level in findall('(-?\d+)\.\d+', value.decode()):
+            self.WriteStatus('LevelControl', int(level), {'Instance Tag': instance, 'Channel': str(chnl)})
+            chnl += 1
+
+    def __SubscribeRoomCombinerOutputLevel(self, command, instance, value):
+        paramsList = instance.split('_')
+        tag = '_'.join(paramsList[:len(paramsList)-1])
+        room = paramsList[-1]
+        self.WriteStatus('RoomCombinerOutputLevel', int(float(value.decode())), {'Instance Tag': tag, 'Room': room})
+
+    def __SubscribeSignalPresentMeter(self, command, instance, value):
+        paramsList = instance.split('_')
+        tag = '_'.join(paramsList[:len(paramsList)-2])
+        chnl = paramsList[-2]
+        mtrName = paramsList[-1]
+        self.WriteStatus('SignalPresentMeter', self.__StateValues[value.decode()][3], {'Instance Tag': tag, 'Channel': chnl, 'Meter Name': mtrName})
+
+    def __SubscribeSourceSelection(self, command, instance, value):
+        value = value.decode()
+        if value == '0':
+            self.WriteStatus('SourceSelectorSourceSelection', 'No Source', {'Instance Tag': instance})
+        elif 1 <= int(value) <= 32:
+            self.WriteStatus('SourceSelectorSourceSelection', value, {'Instance Tag': instance})
+
+    def __SubscribeTICallStatus(self, command, instance, value):
+        res = value.decode()
+
+        stateValues = findall('\"state\":TI_CALL_STATE_(\w+) \"', res)
+        for val in stateValues:
+            value = val.replace('_', ' ').title()
+            self.WriteStatus('TICallStatus', value, {'Instance Tag': instance})
+
+        idValues = findall('"cid":"\x5C\x5C"(\d{8})\x5C\x5C"\x5C\x5C"(.*?)\x5C\x5C"\x5C\x5C"(.*?)\x5C\x5C""|"cid":""', res)
+        for id_ in idValues:
+            name = id_[2]
+            number = id_[1]
+            if number:
+                if name:
+                    value = name + ' : ' + number
                 else:
-                    value = ''
-                self.WriteStatus('TICallerID', value, {'Instance Tag': data[1]})
-
-        elif data[0] == 'TILineInUse':
-            value = StateValues[match.group(2).decode()][4]
-            self.WriteStatus('TILineInUse', value, {'Instance Tag': data[1]})
-
-        elif data[0] == 'VoIPCallStatus':
-            line = 1
-            call = 1
-            res = match.group(2).decode()
-
-            stateValues = findall('\"state\":VOIP_CALL_STATE_(\w+) \"', res)
-            for val in stateValues:
-                value = val.replace('_', ' ').replace('XFER', 'Transfer').title()
-                self.WriteStatus('VoIPCallStatus', value, {'Instance Tag': data[1], 'Line': str(line), 'Call Appearance': str(call)})
-                if call >= 6:
-                    call = 0
-                    line += 1
-                call += 1
-
-            line = 1
-            call = 1
-            idValues = findall('"cid":"\x5C\x5C"(\d{8})\x5C\x5C"\x5C\x5C"(.*?)\x5C\x5C"\x5C\x5C"(.*?)\x5C\x5C""|"cid":""', res)
-            for id_ in idValues:
-                name = id_[2]
-                number = id_[1]
-                if number:
                     value = number
-                    if name:
-                        value = name + ' : ' + number
-                else:
-                    value = ''
-                self.WriteStatus('VoIPCallerID', value, {'Instance Tag': data[1], 'Line': str(line), 'Call Appearance': str(call)})
-                if call >= 6:
-                    call = 0
-                    line += 1
-                call += 1
-
-        elif data[0] == 'VoIPLineInUse':
-            value = StateValues[match.group(2).decode()][4]
-            tag = '_'.join(paramsList[:len(paramsList)-2])
-            line = paramsList[-2]
-            call = paramsList[-1]
-            self.WriteStatus('VoIPLineInUse', value, {'Instance Tag': tag, 'Line': line, 'Call Appearance': call})
+            else:
+                value = ''
+            self.WriteStatus('TICallerID', value, {'Instance Tag': instance})
+
+    def __SubscribeTILineInUse(self, command, instance, value):
+        self.WriteStatus('TILineInUse', self.__StateValues[value.decode()][4], {'Instance Tag': instance})
+
+    def __SubscribeVoIPCallStatus(self, command, instance, value):
+        line = 1
+        call = 1
+        res = value.decode()
+
+        stateValues = findall('\"state\":VOIP_CALL_STATE_(\w+) \"', res)
+        for val in stateValues:
+            value = val.replace('_', ' ').replace('XFER', 'Transfer').title()
+            self.WriteStatus('VoIPCallStatus', value, {'Instance Tag': instance, 'Line': str(line), 'Call Appearance': str(call)})
+            if call >= 6:
+                call = 0
+                line += 1
+            call += 1
+
+        line = 1
+        call = 1
+        idValues = findall('"cid":"\x5C\x5C"(\d{8})\x5C\x5C"\x5C\x5C"(.*?)\x5C\x5C"\x5C\x5C"(.*?)\x5C\x5C""|"cid":""', res)
+        for id_ in idValues:
+            name = id_[2]
+            number = id_[1]
+            if number:
+                value = number
+                if name:
+                    value = name + ' : ' + number
+            else:
+                value = ''
+            self.WriteStatus('VoIPCallerID', value, {'Instance Tag': instance, 'Line': str(line), 'Call Appearance': str(call)})
+            if call >= 6:
+                call = 0
+                line += 1
+            call += 1
+
+    def __SubscribeVoIPLineInUse(self, command, instance, value):
+        paramsList = instance.split('_')
+        tag = '_'.join(paramsList[:len(paramsList)-2])
+        line = paramsList[-2]
+        call = paramsList[-1]
+        self.WriteStatus('VoIPLineInUse', self.__StateValues[value.decode()][4], {'Instance Tag': tag, 'Line': line, 'Call Appearance': call})
 
     def SetAECEnable(self, value, qualifier):
 
@@ -2336,19 +2355,21 @@ class DeviceClass:
 
     # Send Control Commands
     def Set(self, command, value, qualifier=None):
-        method = getattr(self, 'Set%s' % command)
-        if method is not None and callable(method):
-            method(value, qualifier)
+        method = self.SetMethods.get(command, None)
+        if method is not None:
+            if not self.StatusStore.Validate(command, qualifier):
+                raise KeyError('Invalid qualifier for Set ' + command)
+            method(self, value, qualifier)
         else:
-            print(command, 'does not support Set.')
+            raise AttributeError(command + ' does not support Set.')
 
     # Send Update Commands
     def Update(self, command, qualifier=None):
-        method = getattr(self, 'Update%s' % command)
-        if method is not None and callable(method):
-            method(None, qualifier)
+        method = self.UpdateMethods.get(command, None)
+        if method is not None:
+            method(self, None, qualifier)
         else:
-            print(command, 'does not support Update.')
+            raise AttributeError(command + ' does not support Update.')
 
     # This method is to tie an specific command with a parameter to a call back method
     # when its value is updated. It sets how often the command will be query, if the command
@@ -2357,111 +2378,67 @@ class DeviceClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method': {}}
-
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             print(command, 'does not exist in the module')
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription:
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
         self.counter = 0
         if not self.connectionFlag and command != 'ConnectionStatus': 
             self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
+        if self.StatusStore.Write(command, value, qualifier):
             self.NewStatus(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    return None
-        try:
-            return Status['Live']
-        except:
-            return None
+        return self.StatusStore.Read(command, qualifier)
 
     def __ReceiveData(self, interface, data):
         # Handle incoming data
-        self.__receiveBuffer += data
-        index = 0    # Start of possible good data
-        # check incoming data if it matched any expected data from device module
-        tempList = copy.copy(self.__matchStringDict)
-        for regexString, CurrentMatch in tempList.items():
-            while True:
-                result = search(regexString, self.__receiveBuffer)
-                if result:
-                    index = result.start()
-                    CurrentMatch['callback'](result, CurrentMatch['para'])
-                    self.__receiveBuffer = self.__receiveBuffer[:result.start()] + self.__receiveBuffer[result.end():]
-                else:
-                    break
-                    
-        if index: 
-            # Clear out any junk data that came in before any good matches.
-            self.__receiveBuffer = self.__receiveBuffer[index:]
-        else:
-            # In rare cases, the buffer could be filled with garbage quickly.
-            # Make sure the buffer is capped.  Max buffer size set in init.
-            self.__receiveBuffer = self.__receiveBuffer[-self.__maxBufferSize:]
+        self.__receiveFrames.Receive(data)
+
+    def __ReceiveLine(self, line):
+        if line[:1] in [b'+', b'-']:
+            # a response completes the message started by its command echo
+            message = self.__echoLine + line
+            self.__echoLine = b''
+        elif line[:1] == b'!':
+            # published values are not preceded by an echo
+            message = line
+        else:
+            self.__echoLine = line
+            return
+
+        # check the complete message against the match strings for its key,
+        # callbacks may add match strings
+        self.__matchStrings.Dispatch(message, self.__MessageKey(message, line))
+
+    @staticmethod
+    def __MessageKey(message, line):
+        # published values, errors, or the attribute of the echoed command
+        if line[:1] in [b'!', b'-']:
+            return line[:1]
+        words = message[:len(message) - len(line)].split()
+        for index in range(1, len(words) - 1):
+            if words[index] in [b'get', b'set']:
+                return words[index + 1]
+        return None
 
     # Add regular expression so that it can be check on incoming data from device.
     def AddMatchString(self, regex_string, callback, arg):
-        if regex_string not in self.__matchStringDict:
-            self.__matchStringDict[regex_string] = {'callback': callback, 'para':arg}
+        if regex_string.pattern[:2] == b'\\!':
+            keys = [b'!']
+        elif regex_string.pattern[:1] == b'-':
+            keys = [b'-']
+        else:
+            attribute = search(b' (?:get|set) (\\w+)', regex_string.pattern)
+            keys = [attribute.group(1)] if attribute else None
+        self.__matchStrings.Add(regex_string, callback, arg, keys)
 
 class SerialClass(SerialInterface, DeviceClass):
     def __init__(self, Host, Port, Baud=115200, Data=8, Parity='None', Stop=1, FlowControl='Off', CharDelay=0, Mode='RS232', Model=None):
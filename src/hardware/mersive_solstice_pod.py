@@ -31,6 +31,7 @@ from extronlib.system import Wait, ProgramLog
 import traceback
 
 import utilityFunctions
+from uofi_gui.driverStatus import StatusStore, CommandMethods
 
 @utilityFunctions.debug
 def PodFeedbackHelper(touchpanel: 'ExUIDevice', hardware: str, blank_on_fail = True) -> None:
@@ -63,6 +64,7 @@ def PodFeedbackHelper(touchpanel: 'ExUIDevice', hardware: str, blank_on_fail = T
             # utilityFunctions.Log('Pod HW not found')
             podIdLabel.SetText('')
             podKeyLabel.SetText('')
+@CommandMethods
 class DeviceClass:
     def __init__(self, host, protocol, port, devicePassword=None):
 
@@ -85,7 +87,6 @@ class DeviceClass:
         elif protocol.lower() == 'https':
             self.Opener = request.build_opener(request.HTTPSHandler(context=self._ctx)) 
         
-        self.Subscription = {}
         self.counter = 0
         self.connectionFlag = True
         self.initializationChk = True
@@ -105,6 +106,7 @@ class DeviceClass:
             'Sleep': { 'Status': {}},
             'Wake': { 'Status': {}}
         }       
+        self.StatusStore = StatusStore(self.Commands)
         
         
 ## -----------------------------------------------------------------------------
@@ -173,7 +175,7 @@ class DeviceClass:
         self.__SetHelper('Wake', value, qualifier, url=api_path, method='GET', data=None)
         
     def FeedbackStatusHandler(self, command, value, qualifier, hardware=None):
-        utilityFunctions.Log('{} {} Callback - Value: {}; Qualifier: {}'.format(hardware.Name, command, value, qualifier))
+        utilityFunctions.Log('{} {} Callback - Value: {}; Qualifier: {}', args=(hardware.Name, command, value, qualifier))
 
         for TP in self.GUIHost.TPs:
             if self.GUIHost.ActCtl.CurrentActivity != 'adv_share':
@@ -309,17 +311,19 @@ class DeviceClass:
 
     # Send Control Commands
     def Set(self, command, value, qualifier=None):
-        method = getattr(self, 'Set%s' % command, None)
-        if method is not None and callable(method):
-            method(value, qualifier)
+        method = self.SetMethods.get(command, None)
+        if method is not None:
+            if not self.StatusStore.Validate(command, qualifier):
+                raise KeyError('Invalid qualifier for Set ' + command)
+            method(self, value, qualifier)
         else:
             raise AttributeError(command + 'does not support Set.')
 
     # Send Update Commands
     def Update(self, command, qualifier=None):
-        method = getattr(self, 'Update%s' % command, None)
-        if method is not None and callable(method):
-            method(None, qualifier)
+        method = self.UpdateMethods.get(command, None)
+        if method is not None:
+            method(self, None, qualifier)
         else:
             raise AttributeError(command + 'does not support Update.')
 
@@ -330,83 +334,27 @@ class DeviceClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command, None)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method':{}}
-        
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-        
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-        
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             raise KeyError('Invalid command for SubscribeStatus ' + command)
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription :
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)  
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
         self.counter = 0
         # if not self.connectionFlag:
         #     self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return  
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
+        if self.StatusStore.Write(command, value, qualifier):
             self.NewStatus(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
         Command = self.Commands.get(command, None)
         if Command:
-            Status = Command['Status']
-            if qualifier and 'Parameters' in Command: # "'Parameters' in Command" is used to prevent key errors for qualifiers other than command parameters
-                for Parameter in Command['Parameters']:
-                    try:
-                        Status = Status[qualifier[Parameter]]
-                    except KeyError:
-                        return None
-            try:
-                return Status['Live']
-            except:
-                return None
+            return self.StatusStore.Read(command, qualifier)
         else:
             raise KeyError('Invalid command for ReadStatus: ' + command)
 
@@ -7,1331 +7,113 @@ from struct import pack
 from binascii import hexlify
 
 import utilityFunctions
+from uofi_gui.driverStatus import StatusStore, CommandMethods
 
-class DeviceEthernetClass:
-
-    def __init__(self):
-
-        self.Unidirectional = 'False'
-        self.connectionCounter = 15
-        self.DefaultResponseTimeout = 0.3
-        self.Subscription = {}
-        self.counter = 0
-        self.connectionFlag = True
-        self.initializationChk = True
-        self.Debug = False
-        self._DeviceID = 0x41
-        self.Models = {}
-
-        self.Commands = {
-            'ConnectionStatus': {'Status': {}},
-            'AmbientBrightness': {'Parameters': ['Mode'], 'Status': {}},
-            'AmbientCurrentIlluminance': {'Status': {}},
-            'AmbientSensorRead': {'Status': {}},
-            'AspectRatio': {'Status': {}},
-            'AudioInput': {'Status': {}},
-            'AudioMute': {'Status': {}},
-            'AutoImage': {'Status': {}},
-            'Backlight': {'Status': {}},
-            'Brightness': {'Status': {}},
-            'ChannelNumber': {'Status': {}},
-            'ClosedCaption': {'Status': {}},
-            'Contrast': {'Status': {}},
-            'GammaCorrection': {'Status': {}},
-            'Input': {'Status': {}},
-            'OnScreenDisplay': {'Status': {}},
-            'Overscan': {'Status': {}},
-            'PictureMode': {'Status': {}},
-            'PIPInput': {'Status': {}},
-            'PIPMode': {'Status': {}},
-            'PIPSize': {'Status': {}},
-            'Power': {'Status': {}},
-            'PowerSave': {'Status': {}},
-            'TileHMonitor': {'Status': {}},
-            'TileMatrix': {'Status': {}},
-            'TileMatrixComp': {'Status': {}},
-            'TilePosition': {'Status': {}},
-            'TileVMonitor': {'Status': {}},
-            'TVChannelStep': {'Status': {}},
-            'VideoMute': {'Status': {}},
-            'Volume': {'Status': {}},
-        }
-
-
-    @property
-    def DeviceID(self):
-        return self._DeviceID
-
-    @DeviceID.setter
-    def DeviceID(self, value):
-        if 1 <= int(value) <= 100:
-            self.DeviceID = 0x40 + int(value)
-        else:
-            print('Invalid DeviceID parameter, range is from 1 to 100')
-
-## -----------------------------------------------------------------------------
-## Start Feedback Callback Functions
-## -----------------------------------------------------------------------------
-
-    def AudioMuteStatusHandler(self, command, value, qualifier, hardware=None):
-        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}'.format(hardware.Name, command, value, qualifier))
-        for TP in self.GUIHost.TPs:
-            TP.DispCtl.DisplayMuteFeedback(hardware.Id, value)
-        
-    def PowerStatusHandler(self, command, value, qualifier, hardware=None):
-        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}'.format(hardware.Name, command, value, qualifier))
-        for TP in self.GUIHost.TPs:
-            TP.DispCtl.DisplayPowerFeedback(hardware.Id, value)
-        
-    def VolumeStatusHandler(self, command, value, qualifier, hardware=None):
-        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}'.format(hardware.Name, command, value, qualifier))
-        for TP in self.GUIHost.TPs:
-            TP.DispCtl.DisplayVolumeFeedback(hardware.Id, value)
-
-## -----------------------------------------------------------------------------
-## End Feedback Callback Functions
-## -----------------------------------------------------------------------------
-
-    def SetAmbientBrightness(self, value, qualifier):
-
-        BrightnessStates = {
-            'Low' : b'0E0A\x02103300', 
-            'High' : b'0E0A\x02103400'
-        }
-
-        ValueConstraints = {
-            'Min' : 0,
-            'Max' : 100
-        }
-
-        if qualifier['Mode'] in BrightnessStates and ValueConstraints['Min'] <= value <= ValueConstraints['Max']:
-            result = hexlify(value.to_bytes(1,'big')).upper()
-            buffer = pack('>BB11s2ss', 0x30, self.DeviceID, BrightnessStates[qualifier['Mode']], result, b'\x03')
-
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            AmbientBrightnessCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('AmbientBrightness', AmbientBrightnessCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdateAmbientBrightness(self, value, qualifier):
-
-        BrightnessStates = {
-            'Low' : b'0C06\x021033\x03', 
-            'High' : b'0C06\x021034\x03'
-        }
-
-        if qualifier['Mode'] in BrightnessStates:
-            buffer = pack('>BB10s', 0x30, self.DeviceID, BrightnessStates[qualifier['Mode']])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            AmbientBrightnessCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('AmbientBrightness', AmbientBrightnessCmdString, value, qualifier)
-            if res:
-                try:
-                    value = int(res[22:24],16)
-                    self.WriteStatus('AmbientBrightness', value, qualifier)
-                except (KeyError, IndexError):
-                    self.Error(['Ambient Brightness: Invalid/unexpected response'])
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdateAmbientCurrentIlluminance(self, value, qualifier):
-
-        buffer = pack('>BB10s', 0x30, self.DeviceID, b'0C06\x0202B4\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-
-        AmbientCurrentIlluminanceCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('AmbientCurrentIlluminance', AmbientCurrentIlluminanceCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = int(res[22:24],16)
-                self.WriteStatus('AmbientCurrentIlluminance', value, qualifier)
-            except (ValueError, IndexError):
-                self.Error(['Ambient Current Illuminance: Invalid/unexpected response'])
-
-    def UpdateAmbientSensorRead(self, value, qualifier):
-
-        buffer = pack('>BB10s', 0x30, self.DeviceID, b'0C06\x0202B5\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-
-        AmbientSensorReadCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('AmbientSensorRead', AmbientSensorReadCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = int(res[22:24],16)
-                self.WriteStatus('AmbientSensorRead', value, qualifier)
-            except (ValueError, IndexError):
-                self.Error(['Ambient Sensor Read: Invalid/unexpected response'])
-
-    def SetAspectRatio(self, value, qualifier):
-
-        ValueStateValues = {
-            'Normal'    		: b'0E0A\x0202700001\x03', 
-            'Full'      		: b'0E0A\x0202700002\x03',
-            'Wide'      		: b'0E0A\x0202700003\x03', 
-            'Zoom'      		: b'0E0A\x0202700004\x03',
-            'Dynamic'   		: b'0E0A\x0202700006\x03', 
-            'Off (dot by dot)'	: b'0E0A\x0202700007\x03'
-        }
-
-        if value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            AspectRatioCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('AspectRatio', AspectRatioCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdateAspectRatio(self, value, qualifier):
-
-        ValueStateValues = {
-           b'1' : 'Normal', 
-           b'2' : 'Full',
-           b'3' : 'Wide',
-           b'4' : 'Zoom',
-           b'6' : 'Dynamic', 
-           b'7' : 'Off (dot by dot)'
-        }
-
-        buffer = pack('>BB10s', 0x30, self.DeviceID, b'0C06\x020270\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-        AspectRatioCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('AspectRatio', AspectRatioCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = ValueStateValues[res[23:24]]
-                self.WriteStatus('AspectRatio', value, qualifier)
-            except (KeyError, IndexError):
-                self.Error(['Aspect Ratio: Invalid/unexpected response'])
-
-    def SetAudioInput(self, value, qualifier):
-
-        ValueStateValues = {
-            'Audio 1(PC)'   : b'0E0A\x02022E0001\x03', 
-            'Audio 2'       : b'0E0A\x02022E0002\x03', 
-            'Audio 3'       : b'0E0A\x02022E0003\x03', 
-            'HDMI'          : b'0E0A\x02022E0004\x03', 
-            'TV/Option'     : b'0E0A\x02022E0006\x03',
-            'DisplayPort'  : b'0E0A\x02022E0007\x03'
-        }
-
-        if value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            AudioInputCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('AudioInput', AudioInputCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdateAudioInput(self, value, qualifier):
-
-        ValueStateValues = {
-            b'1' : 'Audio 1(PC)', 
-            b'2' : 'Audio 2', 
-            b'3' : 'Audio 3', 
-            b'4' : 'HDMI', 
-            b'6' : 'TV/Option',
-            b'7' : 'DisplayPort' 
-        }
-
-        buffer = pack('>BB10s', 0x30, self.DeviceID, b'0C06\x02022E\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-        AudioInputCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('AudioInput', AudioInputCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = ValueStateValues[res[23:24]]
-                self.WriteStatus('AudioInput', value, qualifier)
-            except (KeyError, IndexError):
-                self.Error(['Audio Input: Invalid/unexpected response'])
-
-    def SetAudioMute(self, value, qualifier):
-
-        ValueStateValues = {
-            'On'   : b'0E0A\x02008D0001\x03', 
-            'Off'  : b'0E0A\x02008D0000\x03'
-        }
-
-        if value in ValueStateValues:
-            buffer = pack('>BB14s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            AudioMuteCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('AudioMute', AudioMuteCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdateAudioMute(self, value, qualifier):
-
-        ValueStateValues = {
-            b'1' : 'On', 
-            b'2' : 'Off', 
-            b'0' : 'Off' 
-        }
-
-        buffer = pack('>BB10s', 0x30, self.DeviceID, b'0C06\x02008D\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-        AudioMuteCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('AudioMute', AudioMuteCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = ValueStateValues[res[23:24]]
-                self.WriteStatus('AudioMute', value, qualifier)
-            except (KeyError, IndexError):
-                self.Error(['Audio Mute: Invalid/unexpected response'])
-        else:
-            self.Discard('Invalid Command')
-
-    def SetAutoImage(self, value, qualifier):
-
-        buffer = pack('>BB14s', 0x30, self.DeviceID, b'0E0A\x02001E0001\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-        AutoImageCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-        self.__SetHelper('AutoImage', AutoImageCmdString, value, qualifier)
-
-    def SetBacklight(self, value, qualifier):
-
-        ValueConstraints = {
-            'Min' : 0,
-            'Max' : 100
-            }
-
-        if ValueConstraints['Min'] <= value <= ValueConstraints['Max']:
-            result = hexlify(value.to_bytes(1, 'big')).upper()
-            buffer = pack('>BB11s2ss', 0x30, self.DeviceID, b'0E0A\x02001000', result, b'\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-
-            BacklightCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('Backlight', BacklightCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdateBacklight(self, value, qualifier):
-
-        buffer = pack('>BB10s', 0x30, self.DeviceID, b'0C06\x020010\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-
-            
-        BacklightCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('Backlight', BacklightCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = int(res[22:24],16)
-                self.WriteStatus('Backlight', value, qualifier)
-            except (ValueError, IndexError):
-                self.Error(['Backlight: Invalid/unexpected response'])
-
-    def SetBrightness(self, value, qualifier):
-
-        ValueConstraints = {
-            'Min' : 0,
-            'Max' : 100
-            }
-
-        if ValueConstraints['Min'] <= value <= ValueConstraints['Max']:
-            result = hexlify(value.to_bytes(1, 'big')).upper()
-            buffer = pack('>BB11s2ss', 0x30, self.DeviceID, b'0E0A\x02009200', result, b'\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            BrightnessCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('Brightness', BrightnessCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdateBrightness(self, value, qualifier):
-
-        buffer = pack('>BB10s', 0x30, self.DeviceID, b'0C06\x020092\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-
-        BrightnessCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('Brightness', BrightnessCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = int(res[22:24],16)
-                self.WriteStatus('Brightness', value, qualifier)
-            except (ValueError, IndexError):
-                self.Error(['Brightness: Invalid/unexpected response'])
-
-    def SetChannelNumber(self, value, qualifier):
-
-        ValueStateValues = {
-            '1'         : b'0A0C\x02C210000801\x03', 
-            '2'         : b'0A0C\x02C210000901\x03',
-            '3'         : b'0A0C\x02C210000A01\x03',
-            '4'         : b'0A0C\x02C210000B01\x03',
-            '5'         : b'0A0C\x02C210000C01\x03',
-            '6'         : b'0A0C\x02C210000D01\x03',
-            '7'         : b'0A0C\x02C210000E01\x03',
-            '8'         : b'0A0C\x02C210000F01\x03',
-            '9'         : b'0A0C\x02C210001001\x03',
-            '0'         : b'0A0C\x02C210001201\x03',
-            '-'         : b'0A0C\x02C210004401\x03',
-            'Enter'     : b'0A0C\x02C210004501\x03',
-            'Exit'      : b'0A0C\x02C210001F01\x03',
-            'Return'    : b'0A0C\x02C210002A01\x03'
-        }
-
-        if value in ValueStateValues:
-            buffer = pack('>BB16s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            ChannelNumberCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('ChannelNumber', ChannelNumberCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def SetClosedCaption(self, value, qualifier):
-
-        ValueStateValues = {
-            'CC1'  : b'0E0A\x0210840002\x03', 
-            'CC2'  : b'0E0A\x0210840003\x03',
-            'CC3'  : b'0E0A\x0210840004\x03',
-            'CC4'  : b'0E0A\x0210840005\x03',
-            'TT1'  : b'0E0A\x0210840006\x03',
-            'TT2'  : b'0E0A\x0210840007\x03',
-            'TT3'  : b'0E0A\x0210840008\x03',
-            'TT4'  : b'0E0A\x0210840009\x03',
-            'Off'  : b'0E0A\x0210840001\x03'
-        }
-
-        if value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            ClosedCaptionCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('ClosedCaption', ClosedCaptionCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def SetContrast(self, value, qualifier):
-
-        ValueConstraints = {
-            'Min' : 0,
-            'Max' : 100
-            }
-
-        if ValueConstraints['Min'] <= value <= ValueConstraints['Max']:
-            result = hexlify(value.to_bytes(1,'big')).upper()
-            buffer = pack( '>BB11s2ss', 0x30, self.DeviceID, b'0E0A\x02001200', result, b'\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            ContrastCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('Contrast', ContrastCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdateContrast(self, value, qualifier):
-
-        buffer = pack( '>BB10s', 0x30, self.DeviceID, b'0C06\x020012\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-        ContrastCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('Contrast', ContrastCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = int(res[22:24],16)
-                self.WriteStatus('Contrast', value, qualifier)
-            except (ValueError, IndexError):
-                self.Error(['Contrast: Invalid/unexpected response'])
-
-    def SetGammaCorrection(self, value, qualifier):
-
-        ValueStateValues = {
-            'Native Gamma'  : b'0E0A\x0202680001\x03', 
-            'Gamma=2.2'     : b'0E0A\x0202680004\x03', 
-            'Gamma=2.4'     : b'0E0A\x0202680008\x03', 
-            'S Gamma'       : b'0E0A\x0202680007\x03', 
-            'DICOM SIM'     : b'0E0A\x0202680005\x03',
-            'Programmable'  : b'0E0A\x0202680006\x03'
-            }
-
-        if value in ValueStateValues:
-            buffer = pack('>BB14s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-
-            GammaCorrectionCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('GammaCorrection', GammaCorrectionCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdateGammaCorrection(self, value, qualifier):
-
-        ValueStateValues = {
-            b'01' : 'Native Gamma', 
-            b'04' : 'Gamma=2.2', 
-            b'08' : 'Gamma=2.4', 
-            b'07' : 'S Gamma', 
-            b'05' : 'DICOM SIM',
-            b'06' : 'Programmable'
-        }
-
-        buffer = pack( '>BB10s', 0x30, self.DeviceID, b'0C06\x020268\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-
-        GammaCorrectionCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('GammaCorrection', GammaCorrectionCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = ValueStateValues[res[22:24]]
-                self.WriteStatus('GammaCorrection', value, qualifier)
-            except (KeyError, IndexError):
-                self.Error(['Gamma Correction: Invalid/unexpected response'])
-
-    def SetInput(self, value, qualifier):
-
-        ValueStateValues = {
-            'VGA'           : b'0E0A\x0200600001\x03', 
-            'RGB/HV'        : b'0E0A\x0200600002\x03',
-            'DVI'           : b'0E0A\x0200600003\x03',
-            'Video1'        : b'0E0A\x0200600005\x03',
-            'Video2'        : b'0E0A\x0200600006\x03',
-            'S-Video'       : b'0E0A\x0200600007\x03',
-            'TV'            : b'0E0A\x020060000A\x03',
-            'DVD/HD1'       : b'0E0A\x020060000C\x03',
-            'Option'        : b'0E0A\x020060000D\x03',
-            'DVD/HD2'       : b'0E0A\x020060000E\x03',
-            'DisplayPort'  :  b'0E0A\x020060000F\x03',
-            'HDMI'          : b'0E0A\x0200600004\x03'
-        }
-
-        if value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            InputCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('Input', InputCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdateInput(self, value, qualifier):
-
-        ValueStateValues = {
-            b'01'  :'VGA',           
-            b'02'  : 'RGB/HV',        
-            b'03'  :'DVI',           
-            b'05'  :'Video1',           
-            b'06'  :'Video2',        
-            b'07'  :'S-Video',       
-            b'0A'  :'TV',
-            b'0C'  :'DVD/HD1',       
-            b'0D'  :'Option',        
-            b'0E'  :'DVD/HD2',       
-            b'0F'  :'DisplayPort',  
-            b'11'  :'HDMI'  
-        }
-
-        buffer = pack( '>BB10s', 0x30, self.DeviceID, b'0C06\x020060\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-        InputCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('Input', InputCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = ValueStateValues[res[22:24]]
-                self.WriteStatus('Input', value, qualifier)
-            except (KeyError, IndexError):
-                self.Error(['Input: Invalid/unexpected response'])
-
-    def SetOnScreenDisplay(self, value, qualifier):
-
-        ValueStateValues = {
-            'On'  : b'0E0A\x0202EA0002\x03', 
-            'Off' : b'0E0A\x0202EA0001\x03'
-        }
-
-        if value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            OnScreenDisplayCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('OnScreenDisplay', OnScreenDisplayCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdateOnScreenDisplay(self, value, qualifier):
-
-        ValueStateValues = {
-            b'2' : 'On', 
-            b'1' : 'Off' 
-        }
-
-        buffer = pack( '>BB10s', 0x30, self.DeviceID, b'0C06\x0202EA\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-        OnScreenDisplayCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('OnScreenDisplay', OnScreenDisplayCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = ValueStateValues[res[23:24]]
-                self.WriteStatus('OnScreenDisplay', value, qualifier)
-            except (KeyError, IndexError):
-                self.Error(['On Screen Display: Invalid/unexpected response'])
-
-    def SetOverscan(self, value, qualifier):
-
-        ValueStateValues = {
-            'On'  : b'0E0A\x0202E30002\x03',
-            'Off' : b'0E0A\x0202E30001\x03'
-        }
-
-        if value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            OverscanCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('Overscan', OverscanCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdateOverscan(self, value, qualifier):
-
-        ValueStateValues = {
-            b'2' : 'On', 
-            b'1' : 'Off'
-        }
-
-        buffer = pack( '>BB10s', 0x30, self.DeviceID, b'0C06\x0202E3\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-        OverscanCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('Overscan', OverscanCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = ValueStateValues[res[23:24]]
-                self.WriteStatus('Overscan', value, qualifier)
-            except (KeyError, IndexError):
-                self.Error(['Overscan: Invalid/unexpected response'])
-
-    def SetPictureMode(self, value, qualifier):
-
-        ValueStateValues = {
-            'sRGB'      : b'0E0A\x02021A0001\x03', 
-            'Hi-Bright' : b'0E0A\x02021A0003\x03',
-            'Standard'  : b'0E0A\x02021A0004\x03',
-            'Cinema'    : b'0E0A\x02021A0005\x03', 
-            'ISF-Day'   : b'0E0A\x02021A0006\x03', 
-            'ISF-Night' : b'0E0A\x02021A0007\x03',
-            'Ambient-1' : b'0E0A\x02021A000B\x03', 
-            'Ambient-2' : b'0E0A\x02021A000C\x03'
-        }
-
-        if value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-
-            PictureModeCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('PictureMode', PictureModeCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdatePictureMode(self, value, qualifier):
-
-        ValueStateValues = {
-            b'01' : 'sRGB', 
-            b'03' : 'Hi-Bright', 
-            b'04' : 'Standard', 
-            b'05' : 'Cinema', 
-            b'06' : 'ISF-Day', 
-            b'07' : 'ISF-Night', 
-            b'0B' : 'Ambient-1', 
-            b'0C' : 'Ambient-2'
-        }
-
-        buffer = pack( '>BB10s', 0x30, self.DeviceID, b'0C06\x02021A\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-
-        PictureModeCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('PictureMode', PictureModeCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = ValueStateValues[res[22:24]]
-                self.WriteStatus('PictureMode', value, qualifier)
-            except (KeyError, IndexError):
-                self.Error(['Picture Mode: Invalid/unexpected response'])
-
-    def SetPIPInput(self, value, qualifier):
-
-        ValueStateValues = {
-            'VGA'           : b'0E0A\x0202730001\x03', 
-            'RGB/HV'        : b'0E0A\x0202730002\x03',            
-            'DVI'           : b'0E0A\x0202730003\x03', 
-            'Video1'        : b'0E0A\x0202730005\x03',
-            'Video2'        : b'0E0A\x0202730006\x03', 
-            'S-Video'       : b'0E0A\x0202730007\x03',
-            'DVD/HD1'       : b'0E0A\x020273000C\x03', 
-            'Option'        : b'0E0A\x020273000D\x03',
-            'DVD/HD2'       : b'0E0A\x020273000E\x03', 
-            'DisplayPort'   : b'0E0A\x020273000F\x03',
-            'HDMI'          : b'0E0A\x0202730004\x03', 
-            'TV'            : b'0E0A\x020273000A\x03'
-        }
-
-        if value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            PIPInputCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('PIPInput', PIPInputCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdatePIPInput(self, value, qualifier):
-
-        ValueStateValues = {
-            b'01'  :'VGA',           
-            b'02'  :'RGB/HV',        
-            b'03'  :'DVI',           
-            b'05'  :'Video1',           
-            b'06'  :'Video2',        
-            b'07'  :'S-Video',       
-            b'0A'  :'TV',
-            b'0C'  :'DVD/HD1',       
-            b'0D'  :'Option',        
-            b'0E'  :'DVD/HD2',       
-            b'0F'  :'DisplayPort',  
-            b'11'  :'HDMI' 
-        }
-
-        buffer = pack( '>BB10s', 0x30, self.DeviceID, b'0C06\x020273\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-        PIPInputCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('PIPInput', PIPInputCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = ValueStateValues[res[22:24]]
-                self.WriteStatus('PIPInput', value, qualifier)
-            except (KeyError, IndexError):
-                self.Error(['PIP Input: Invalid/unexpected response'])
-
-    def SetPIPMode(self, value, qualifier):
-
-        ValueStateValues = {
-            'PIP'                   : b'0E0A\x0202720002\x03', 
-            'POP'                   : b'0E0A\x0202720003\x03',            
-            'Still'                 : b'0E0A\x0202720004\x03', 
-            'Side by side (Aspect)' : b'0E0A\x0202720005\x03',
-            'Side by side (Full)'   : b'0E0A\x0202720006\x03', 
-            'Off'                   : b'0E0A\x0202720001\x03'
-        }
-
-        if value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            PIPModeCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('PIPMode', PIPModeCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdatePIPMode(self, value, qualifier):
-
-        ValueStateValues = {
-            b'1'  :'Off',
-            b'2'  :'PIP',           
-            b'3'  :'POP',        
-            b'4'  :'Still',           
-            b'5'  :'Side by side (Aspect)',           
-            b'6'  :'Side by side (Full)'     
-        }
-
-        buffer = pack( '>BB10s', 0x30, self.DeviceID, b'0C06\x020272\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-        PIPModeCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('PIPMode', PIPModeCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = ValueStateValues[res[23:24]]
-                self.WriteStatus('PIPMode', value, qualifier)
-            except (KeyError, IndexError):
-                self.Error(['PIP Mode: Invalid/unexpected response'])
-
-    def SetPIPSize(self, value, qualifier):
-
-        ValueStateValues = {
-            'Small'     : b'0E0A\x0202710001\x03',
-            'Middle'    : b'0E0A\x0202710002\x03',   
-            'Large'     : b'0E0A\x0202710003\x03'
-        }
-
-        if value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            PIPSizeCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('PIPSize', PIPSizeCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdatePIPSize(self, value, qualifier):
-
-        ValueStateValues = {
-            b'1'  :'Small',           
-            b'2'  :'Middle',        
-            b'3'  :'Large'
-        }
-
-        buffer = pack( '>BB10s', 0x30, self.DeviceID, b'0C06\x020271\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-        PIPSizeCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('PIPSize', PIPSizeCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = ValueStateValues[res[23:24]]
-                self.WriteStatus('PIPSize', value, qualifier)
-            except (KeyError, IndexError):
-                self.Error(['PIP Size: Invalid/unexpected response'])
-
-    def SetPower(self, value, qualifier):
-
-        ValueStateValues = {
-            'On'     : b'0A0C\x02C203D60001\x03', 
-            'Off'    : b'0A0C\x02C203D60004\x03' 
-        }
-
-        if value in ValueStateValues:
-            buffer = pack( '>BB16s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            PowerCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('Power', PowerCmdString, value, qualifier)
-
-    def UpdatePower(self, value, qualifier):
-
-        ValueStateValues = {
-            b'1'  :'On',           
-            b'2'  :'Standby (Power Save)',
-            b'3'  :'Suspend (Power Save)',
-            b'4'  :'Off'
-        }
-
-        buffer = pack( '>BB10s', 0x30, self.DeviceID, b'0A06\x0201D6\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-        PowerCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('Power', PowerCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = ValueStateValues[res[23:24]]
-                self.WriteStatus('Power', value, qualifier)
-            except (KeyError, IndexError):
-                self.Error(['Power: Invalid/unexpected response'])
-
-    def SetPowerSave(self, value, qualifier):
-
-        ValueStateValues = {
-            'On':   b'0E0A\x0200E10001\x03',
-            'Off':  b'0E0A\x0200E10000\x03'
-        }
-
-        if value in ValueStateValues:
-            buffer = pack('>BB14s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            PowerSaveCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('PowerSave', PowerSaveCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdatePowerSave(self, value, qualifier):
-
-        ValueStateValues = {
-            b'1': 'On',
-            b'0': 'Off'
-        }
-
-        buffer = pack('>BB10s', 0x30, self.DeviceID, b'0C06\x0200E1\x03')
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-        PowerSaveCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('PowerSave', PowerSaveCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = ValueStateValues[res[23:24]]
-                self.WriteStatus('PowerSave', value, qualifier)
-            except (KeyError, IndexError):
-                self.Error(['Power Save: Invalid/unexpected response'])
-
-    def SetTileHMonitor(self, value, qualifier):
-
-        value = int(value)
-        if 1 <= value <= 10:
-            result = hexlify(value.to_bytes(1,'big')).upper()
-            buffer = pack( '>BB11s2ss', 0x30, self.DeviceID, b'0E0A\x0202D000', result, b'\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            TileHMonitorCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('TileHMonitor', TileHMonitorCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def SetTileMatrix(self, value, qualifier):
-
-        ValueStateValues = {
-            'On'            : b'0E0A\x0202D30002\x03', 
-            'Off'           : b'0E0A\x0202D30003\x03',
-            'Off W/ Frame'  : b'0E0A\x0202D30001\x03'
-        }
-
-        if value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            TileMatrixCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('TileMatrix', TileMatrixCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdateTileMatrix(self, value, qualifier):
-
-        ValueStateValues = {
-            b'2'  :'On',           
-            b'1'  :'Off',
-            b'3'  :'Off'
-        }
-
-        buffer = pack( '>BB10s', 0x30, self.DeviceID, b'0C06\x0202D3\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-        TileMatrixCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('TileMatrix', TileMatrixCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = ValueStateValues[res[23:24]]
-                self.WriteStatus('TileMatrix', value, qualifier)
-            except (KeyError, IndexError):
-                self.Error(['Tile Matrix: Invalid/unexpected response'])
-       
-    def SetTileMatrixComp(self, value, qualifier):
-
-        ValueStateValues = {
-            'Enable'         : b'0E0A\x0202D50002\x03', 
-            'Disable'        : b'0E0A\x0202D50001\x03'
-        }
-
-        if value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            TileMatrixCompCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('TileMatrixComp', TileMatrixCompCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def SetTilePosition(self, value, qualifier):
-
-        value = int(value)
-        if 1 <= value <= 100:
-            result = hexlify(value.to_bytes(1,'big')).upper()
-            buffer = pack( '>BB11s2ss', 0x30, self.DeviceID, b'0E0A\x0202D200', result, b'\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            TilePositionCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('TilePosition', TilePositionCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def SetTileVMonitor(self, value, qualifier):
-
-        value = int(value)
-        if 1 <= value <= 10:
-            result = hexlify(value.to_bytes(1,'big')).upper()
-            buffer = pack( '>BB11s2ss', 0x30, self.DeviceID, b'0E0A\x0202D100', result, b'\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            TileVMonitorCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('TileVMonitor', TileVMonitorCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def SetTVChannelStep(self, value, qualifier):
-
-        ValueStateValues = {
-            'Up'    : b'0E0A\x02008B0001\x03', 
-            'Down'  : b'0E0A\x02008B0002\x03'
-        }
-
-        if value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            TVChannelStepCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('TVChannelStep', TVChannelStepCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def SetVideoMute(self, value, qualifier):
-
-        ValueStateValues = {
-            'On'   : b'0E0A\x0210B60001\x03', 
-            'Off'  : b'0E0A\x0210B60002\x03'
-        }
-
-        if value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, self.DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            MuteCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('VideoMute', MuteCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdateVideoMute(self, value, qualifier):
-
-        ValueStateValues = {
-            b'1' : 'On', 
-            b'2' : 'Off', 
-            b'0' : 'No Signal' 
-        }
-
-        buffer = pack( '>BB10s', 0x30, self.DeviceID, b'0C06\x0210B6\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-        MuteCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('VideoMute', MuteCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = ValueStateValues[res[23:24]]
-                self.WriteStatus('VideoMute', value, qualifier)
-            except (KeyError, IndexError):
-                self.Error(['Video Mute: Invalid/unexpected response'])
-
-    def SetVolume(self, value, qualifier):
-
-        ValueConstraints = {
-            'Min' : 0,
-            'Max' : 100
-            }
-
-        if ValueConstraints['Min'] <= value <= ValueConstraints['Max']:
-            result = hexlify(value.to_bytes(1,'big')).upper()
-            buffer = pack( '>BB11s2ss', 0x30, self.DeviceID, b'0E0A\x02006200', result, b'\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            VolumeCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('Volume', VolumeCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-    def UpdateVolume(self, value, qualifier):
-
-        buffer = pack( '>BB10s', 0x30, self.DeviceID, b'0C06\x020062\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-        VolumeCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('Volume', VolumeCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = int(res[22:24],16)
-                self.WriteStatus('Volume', value, qualifier)
-            except (ValueError, IndexError):
-                self.Error(['Volume: Invalid/unexpected response'])
-
-    def __CheckResponseForErrors(self, sourceCmdName, response):
-
-        if response:
-            if response[8:10].decode() == '01':
-                self.Error(['{0}: An Error Occurred'.format(sourceCmdName)])
-                response = ''
-        return response
-
-    def __SetHelper(self, command, commandstring, value, qualifier):
-        self.Debug = True
-
-        if self.Unidirectional == 'True':
-            self.Send(commandstring)
-        else:
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\r')
-            if not res:
-                self.Error(['{0} : Invalid/Unexpected Response'.format(command)])
-            else:
-                res = self.__CheckResponseForErrors(command, res)
-    
-    def __UpdateHelper(self, command, commandstring, value, qualifier):
-        if self.Unidirectional == 'True':
-            self.Discard('Inappropriate Command ' + command)
-            return ''
-        else:
-            if self.initializationChk:
-                self.OnConnected()
-                self.initializationChk = False
-
-            self.counter = self.counter + 1
-            if self.counter > self.connectionCounter and self.connectionFlag:
-                self.OnDisconnected()
-
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\r')
-            if not res:
-                return ''
-            else:
-                return self.__CheckResponseForErrors(command, res)
-
-    def OnConnected(self):
-        self.connectionFlag = True
-        self.WriteStatus('ConnectionStatus', 'Connected')
-        self.counter = 0
-
-
-    def OnDisconnected(self):
-        self.WriteStatus('ConnectionStatus', 'Disconnected')
-        self.connectionFlag = False
-
-
-    ######################################################
-    # RECOMMENDED not to modify the code below this point
-    ######################################################
-
-    # Send Control Commands
-    def Set(self, command, value, qualifier=None):
-        method = getattr(self, 'Set%s' % command, None)
-        if method is not None and callable(method):
-            method(value, qualifier)
-        else:
-            raise AttributeError(command, 'does not support Set.')
-
-    # Send Update Commands
-    def Update(self, command, qualifier=None):
-        method = getattr(self, 'Update%s' % command, None)
-        if method is not None and callable(method):
-            method(None, qualifier)
-        else:
-            raise AttributeError(command, 'does not support Update.')
-
-    # This method is to tie an specific command with a parameter to a call back method
-    # when its value is updated. It sets how often the command will be query, if the command
-    # have the update method.
-    # If the command doesn't have the update feature then that command is only used for feedback
-    def SubscribeStatus(self, command, qualifier, callback):
-        Command = self.Commands.get(command, None)
-        if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method':{}}
-
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier
-        else:
-            raise KeyError('Invalid command for SubscribeStatus ', command)
-
-    # This method is to check the command with new status have a callback method then trigger the callback
-    def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription :
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)
-
-    # Save new status to the command
-    def WriteStatus(self, command, value, qualifier=None):
-        self.counter = 0
-        if not self.connectionFlag:
-            self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
-            self.NewStatus(command, value, qualifier)
-
-    # Read the value from a command.
-    def ReadStatus(self, command, qualifier=None):
-        Command = self.Commands.get(command, None)
-        if Command:
-            Status = Command['Status']
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Status = Status[qualifier[Parameter]]
-                    except KeyError:
-                        return None
-            try:
-                return Status['Live']
-            except:
-                return None
-        else:
-            raise KeyError('Invalid command for ReadStatus: ', command)
+## -----------------------------------------------------------------------------
+## Start Protocol Core
+## -----------------------------------------------------------------------------
+# Shared by DeviceEthernetClass and DeviceSerialClass through DeviceClass. A
+# command is framed as
+# SOH, reserved '0', destination ID, message (STX ... ETX), block check
+# character, CR. The block check character is the XOR of every byte from the
+# reserved '0' through ETX.
+
+PowerStates = {
+    'On'     : b'0A0C\x02C203D60001\x03',
+    'Off'    : b'0A0C\x02C203D60004\x03'
+}
+
+InputStates = {
+    'VGA'           : b'0E0A\x0200600001\x03',
+    'RGB/HV'        : b'0E0A\x0200600002\x03',
+    'DVI'           : b'0E0A\x0200600003\x03',
+    'Video1'        : b'0E0A\x0200600005\x03',
+    'Video2'        : b'0E0A\x0200600006\x03',
+    'S-Video'       : b'0E0A\x0200600007\x03',
+    'TV'            : b'0E0A\x020060000A\x03',
+    'DVD/HD1'       : b'0E0A\x020060000C\x03',
+    'Option'        : b'0E0A\x020060000D\x03',
+    'DVD/HD2'       : b'0E0A\x020060000E\x03',
+    'DisplayPort'   : b'0E0A\x020060000F\x03',
+    'HDMI'          : b'0E0A\x0200600004\x03'
+}
+
+AudioMuteStates = {
+    'On'   : b'0E0A\x02008D0001\x03',
+    'Off'  : b'0E0A\x02008D0000\x03'
+}
+
+VideoMuteStates = {
+    'On'   : b'0E0A\x0210B60001\x03',
+    'Off'  : b'0E0A\x0210B60002\x03'
+}
+
+VolumePrefix = b'0E0A\x02006200'
+
+BroadcastID = 0x2A
+
+# frames by (destination ID, message), filled with the fixed commands for the
+# default and broadcast IDs at import and with other IDs as they are used
+_Frames = {}
+# block check of each message prefix a variable value is framed with
+_PrefixChecks = {}
+
+def NECBlockCheck(data: bytes, check: int=0) -> int:
+    for i in data:
+        check = check ^ i
+    return check
+
+def NECFrame(DeviceID: int, Message: bytes) -> bytes:
+    """Returns the frame for a fixed message. Frames are built once per
+    destination ID."""
+    key = (DeviceID, Message)
+    frame = _Frames.get(key, None)
+    if frame is None:
+        check = NECBlockCheck(Message, 0x30 ^ DeviceID)
+        frame = _Frames[key] = b'\x01' + pack('>BB', 0x30, DeviceID) + Message + pack('>B', check) + b'\r'
+    return frame
+
+def NECValueFrame(DeviceID: int, Prefix: bytes, Value: bytes) -> bytes:
+    """Returns the frame for a message of a fixed prefix, a variable value and
+    ETX. Only the value is added to the block check."""
+    prefixCheck = _PrefixChecks.get(Prefix, None)
+    if prefixCheck is None:
+        prefixCheck = _PrefixChecks[Prefix] = NECBlockCheck(Prefix, 0x30 ^ 0x03)
+    message = Prefix + Value + b'\x03'
+    frame = _Frames.get((DeviceID, message), None)
+    if frame is None:
+        check = NECBlockCheck(Value, prefixCheck ^ DeviceID)
+        frame = b'\x01' + pack('>BB', 0x30, DeviceID) + message + pack('>B', check) + b'\r'
+    return frame
+
+def NECHexValue(value: int) -> bytes:
+    return hexlify(value.to_bytes(1,'big')).upper()
+
+def _PrecomputeFrames() -> None:
+    for DeviceID in (0x41, BroadcastID):
+        for states in (PowerStates, InputStates, AudioMuteStates, VideoMuteStates):
+            for message in states.values():
+                NECFrame(DeviceID, message)
+        for volume in range(0, 101):
+            NECFrame(DeviceID, VolumePrefix + NECHexValue(volume) + b'\x03')
+
+_PrecomputeFrames()
 
-class DeviceSerialClass:
+## -----------------------------------------------------------------------------
+## End Protocol Core
+## -----------------------------------------------------------------------------
 
+class DeviceClass:
+    """Commands shared by DeviceEthernetClass and DeviceSerialClass. Each
+    message is framed for the destination ID _DestinationID returns for the
+    command's qualifier, a destination ID of 0 is an invalid command.
+    """
 
     def __init__(self):
 
         self.Unidirectional = 'False'
         self.connectionCounter = 15
         self.DefaultResponseTimeout = 0.3
-        self.Subscription = {}
         self.counter = 0
         self.connectionFlag = True
         self.initializationChk = True
@@ -1339,41 +121,6 @@ class DeviceSerialClass:
         self._DeviceID = 0x41
         self.Models = {}
 
-        self.Commands = {
-            'ConnectionStatus': {'Status': {}},
-            'AmbientBrightness': {'Parameters': ['Device ID', 'Mode'], 'Status': {}},
-            'AmbientCurrentIlluminance': {'Parameters': ['Device ID'], 'Status': {}},
-            'AmbientSensorRead': {'Parameters': ['Device ID'], 'Status': {}},
-            'AspectRatio': {'Parameters': ['Device ID'], 'Status': {}},
-            'AudioInput': {'Parameters': ['Device ID'], 'Status': {}},
-            'AudioMute': {'Parameters': ['Device ID'], 'Status': {}},
-            'AutoImage': {'Parameters': ['Device ID'], 'Status': {}},
-            'Backlight': {'Parameters': ['Device ID'], 'Status': {}},
-            'Brightness': {'Parameters': ['Device ID'], 'Status': {}},
-            'ChannelNumber': {'Parameters': ['Device ID'], 'Status': {}},
-            'ClosedCaption': {'Parameters': ['Device ID'], 'Status': {}},
-            'Contrast': {'Parameters': ['Device ID'], 'Status': {}},
-            'GammaCorrection': {'Parameters': ['Device ID'], 'Status': {}},
-            'Input': {'Parameters': ['Device ID'], 'Status': {}},
-            'MasterPower': { 'Status': {}},
-            'OnScreenDisplay': {'Parameters': ['Device ID'], 'Status': {}},
-            'Overscan': {'Parameters': ['Device ID'], 'Status': {}},
-            'PictureMode': {'Parameters': ['Device ID'], 'Status': {}},
-            'PIPInput': {'Parameters': ['Device ID'], 'Status': {}},
-            'PIPMode': {'Parameters': ['Device ID'], 'Status': {}},
-            'PIPSize': {'Parameters': ['Device ID'], 'Status': {}},
-            'Power': {'Parameters': ['Device ID'], 'Status': {}},
-            'PowerSave': {'Parameters': ['Device ID'], 'Status': {}},
-            'TileHMonitor': {'Parameters': ['Device ID'], 'Status': {}},
-            'TileMatrix': {'Parameters': ['Device ID'], 'Status': {}},
-            'TileMatrixComp': {'Parameters': ['Device ID'], 'Status': {}},
-            'TilePosition': {'Parameters': ['Device ID'], 'Status': {}},
-            'TileVMonitor': {'Parameters': ['Device ID'], 'Status': {}},
-            'TVChannelStep': {'Parameters': ['Device ID'], 'Status': {}},
-            'VideoMute': {'Parameters': ['Device ID'], 'Status': {}},
-            'Volume': {'Parameters': ['Device ID'], 'Status': {}},
-        }
-
     @property
     def DeviceID(self):
         return self._DeviceID
@@ -1381,21 +128,16 @@ class DeviceSerialClass:
     @DeviceID.setter
     def DeviceID(self, value):
         if 1 <= int(value) <= 100:
-            self.DeviceID = 0x40 + int(value)
+            self._DeviceID = 0x40 + int(value)
         else:
             print('Invalid DeviceID parameter, range is from 1 to 100')
 
-    def SetQualifierDeviceID(self, value):
-        if value == 'Broadcast':
-            return 0x2A
-        elif 1 <= int(value) <= 100:
-            return 0x40 + int(value)
-        else:
-            return 0
+    def _DestinationID(self, qualifier):
+        return self._DeviceID
 
     def SetAmbientBrightness(self, value, qualifier):
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
 
         BrightnessStates = {
             'Low' : b'0E0A\x02103300', 
@@ -1408,21 +150,15 @@ class DeviceSerialClass:
         }
 
         if DeviceID != 0 and qualifier['Mode'] in BrightnessStates and ValueConstraints['Min'] <= value <= ValueConstraints['Max']:
-            result = hexlify(value.to_bytes(1,'big')).upper()
-            buffer = pack('>BB11s2ss', 0x30, DeviceID, BrightnessStates[qualifier['Mode']], result, b'\x03')
-
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            AmbientBrightnessCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('AmbientBrightness', AmbientBrightnessCmdString, value, qualifier)
+            result = NECHexValue(value)
+            AmbientBrightnessCmdString = NECValueFrame(DeviceID, BrightnessStates[qualifier['Mode']], result)
+            self._SetHelper('AmbientBrightness', AmbientBrightnessCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
     def UpdateAmbientBrightness(self, value, qualifier):
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
 
         BrightnessStates = {
             'Low' : b'0C06\x021033\x03', 
@@ -1430,13 +166,8 @@ class DeviceSerialClass:
         }
 
         if DeviceID != 0 and qualifier['Mode'] in BrightnessStates:
-            buffer = pack('>BB10s', 0x30, DeviceID, BrightnessStates[qualifier['Mode']])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            AmbientBrightnessCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('AmbientBrightness', AmbientBrightnessCmdString, value, qualifier)
+            AmbientBrightnessCmdString = NECFrame(DeviceID, BrightnessStates[qualifier['Mode']])
+            res = self._UpdateHelper('AmbientBrightness', AmbientBrightnessCmdString, value, qualifier)
 
             if res:
                 try:
@@ -1449,17 +180,11 @@ class DeviceSerialClass:
 
     def UpdateAmbientCurrentIlluminance(self, value, qualifier):
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
 
         if DeviceID != 0:
-            buffer = pack('>BB10s', 0x30, DeviceID, b'0C06\x0202B4\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-
-            AmbientCurrentIlluminanceCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('AmbientCurrentIlluminance', AmbientCurrentIlluminanceCmdString, value, qualifier)
+            AmbientCurrentIlluminanceCmdString = NECFrame(DeviceID, b'0C06\x0202B4\x03')
+            res = self._UpdateHelper('AmbientCurrentIlluminance', AmbientCurrentIlluminanceCmdString, value, qualifier)
 
             if res:
                 try:
@@ -1472,17 +197,11 @@ class DeviceSerialClass:
 
     def UpdateAmbientSensorRead(self, value, qualifier):
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
 
         if DeviceID != 0:
-            buffer = pack('>BB10s', 0x30, DeviceID, b'0C06\x0202B5\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-
-            AmbientSensorReadCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('AmbientSensorRead', AmbientSensorReadCmdString, value, qualifier)
+            AmbientSensorReadCmdString = NECFrame(DeviceID, b'0C06\x0202B5\x03')
+            res = self._UpdateHelper('AmbientSensorRead', AmbientSensorReadCmdString, value, qualifier)
 
             if res:
                 try:
@@ -1504,19 +223,13 @@ class DeviceSerialClass:
             'Off (dot by dot)'	: b'0E0A\x0202700007\x03'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            AspectRatioCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r' 
-            self.__SetHelper('AspectRatio', AspectRatioCmdString, value, qualifier)
+            AspectRatioCmdString = NECFrame(DeviceID, ValueStateValues[value])
+            self._SetHelper('AspectRatio', AspectRatioCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def UpdateAspectRatio(self, value, qualifier):
 
         ValueStateValues = {
@@ -1528,15 +241,10 @@ class DeviceSerialClass:
            b'7' : 'Off (dot by dot)'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x020270\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            AspectRatioCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'        
-            res = self.__UpdateHelper('AspectRatio', AspectRatioCmdString, value, qualifier)
+            AspectRatioCmdString = NECFrame(DeviceID, b'0C06\x020270\x03')
+            res = self._UpdateHelper('AspectRatio', AspectRatioCmdString, value, qualifier)
 
             if res:
                 try:
@@ -1558,19 +266,13 @@ class DeviceSerialClass:
             'DisplayPort'   : b'0E0A\x02022E0007\x03'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            AudioInputCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('AudioInput', AudioInputCmdString, value, qualifier)
+            AudioInputCmdString = NECFrame(DeviceID, ValueStateValues[value])
+            self._SetHelper('AudioInput', AudioInputCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def UpdateAudioInput(self, value, qualifier):
 
         ValueStateValues = {
@@ -1582,15 +284,10 @@ class DeviceSerialClass:
             b'7' : 'DisplayPort' 
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x02022E\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            AudioInputCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('AudioInput', AudioInputCmdString, value, qualifier)
+            AudioInputCmdString = NECFrame(DeviceID, b'0C06\x02022E\x03')
+            res = self._UpdateHelper('AudioInput', AudioInputCmdString, value, qualifier)
 
             if res:
                 try:
@@ -1603,24 +300,13 @@ class DeviceSerialClass:
 
     def SetAudioMute(self, value, qualifier):
 
-        ValueStateValues = {
-            'On'   : b'0E0A\x02008D0001\x03', 
-            'Off'  : b'0E0A\x02008D0000\x03'
-        }
-
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
-        if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            AudioMuteCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('AudioMute', AudioMuteCmdString, value, qualifier)
+        DeviceID = self._DestinationID(qualifier)
+        if DeviceID != 0 and value in AudioMuteStates:
+            AudioMuteCmdString = NECFrame(DeviceID, AudioMuteStates[value])
+            self._SetHelper('AudioMute', AudioMuteCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def UpdateAudioMute(self, value, qualifier):
 
         ValueStateValues = {
@@ -1629,15 +315,10 @@ class DeviceSerialClass:
             b'0' : 'Off' 
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x02008D\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            AudioMuteCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('AudioMute', AudioMuteCmdString, value, qualifier)
+            AudioMuteCmdString = NECFrame(DeviceID, b'0C06\x02008D\x03')
+            res = self._UpdateHelper('AudioMute', AudioMuteCmdString, value, qualifier)
 
             if res:
                 try:
@@ -1650,16 +331,10 @@ class DeviceSerialClass:
 
     def SetAutoImage(self, value, qualifier):
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack( '>BB14s', 0x30, DeviceID, b'0E0A\x02001E0001\x03')
-
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            AutoImageCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('AutoImage', AutoImageCmdString, value, qualifier)
+            AutoImageCmdString = NECFrame(DeviceID, b'0E0A\x02001E0001\x03')
+            self._SetHelper('AutoImage', AutoImageCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
@@ -1670,33 +345,20 @@ class DeviceSerialClass:
             'Max' : 100
             }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and ValueConstraints['Min'] <= value <= ValueConstraints['Max']:
-            result = hexlify(value.to_bytes(1,'big')).upper()
-            buffer = pack( '>BB11s2ss', 0x30, DeviceID, b'0E0A\x02001000', result, b'\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-
-            BacklightCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('Backlight', BacklightCmdString, value, qualifier)
+            result = NECHexValue(value)
+            BacklightCmdString = NECValueFrame(DeviceID, b'0E0A\x02001000', result)
+            self._SetHelper('Backlight', BacklightCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def UpdateBacklight(self, value, qualifier):
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x020010\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            
-            BacklightCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('Backlight', BacklightCmdString, value, qualifier)
+            BacklightCmdString = NECFrame(DeviceID, b'0C06\x020010\x03')
+            res = self._UpdateHelper('Backlight', BacklightCmdString, value, qualifier)
 
             if res:
                 try:
@@ -1714,32 +376,21 @@ class DeviceSerialClass:
             'Max' : 100
             }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and ValueConstraints['Min'] <= value <= ValueConstraints['Max']:
-            result = hexlify(value.to_bytes(1,'big')).upper()
-            buffer = pack( '>BB11s2ss', 0x30, DeviceID, b'0E0A\x02009200', result, b'\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            BrightnessCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('Brightness', BrightnessCmdString, value, qualifier)
+            result = NECHexValue(value)
+            BrightnessCmdString = NECValueFrame(DeviceID, b'0E0A\x02009200', result)
+            self._SetHelper('Brightness', BrightnessCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
     def UpdateBrightness(self, value, qualifier):
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
 
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x020092\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-
-            BrightnessCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('Brightness', BrightnessCmdString, value, qualifier)
+            BrightnessCmdString = NECFrame(DeviceID, b'0C06\x020092\x03')
+            res = self._UpdateHelper('Brightness', BrightnessCmdString, value, qualifier)
 
             if res:
                 try:
@@ -1769,19 +420,13 @@ class DeviceSerialClass:
             'Return'    : b'0A0C\x02C210002A01\x03'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack( '>BB16s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            ChannelNumberCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('ChannelNumber', ChannelNumberCmdString, value, qualifier)
+            ChannelNumberCmdString = NECFrame(DeviceID, ValueStateValues[value])
+            self._SetHelper('ChannelNumber', ChannelNumberCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def SetClosedCaption(self, value, qualifier):
 
         ValueStateValues = {
@@ -1796,49 +441,10 @@ class DeviceSerialClass:
             'Off'  : b'0E0A\x0210840001\x03'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            ClosedCaptionCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('ClosedCaption', ClosedCaptionCmdString, value, qualifier)
-        else:
-            self.Discard('Invalid Command')
-
-
-    def UpdateClosedCaption(self, value, qualifier):
-
-        ValueStateValues = {
-            b'1' : 'Off', 
-            b'2' : 'CC1', 
-            b'3' : 'CC2',
-            b'4' : 'CC3',
-            b'5' : 'CC4',
-            b'6' : 'TT1',
-            b'7' : 'TT2',
-            b'8' : 'TT3',
-            b'9' : 'TT4' 
-        }
-
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
-        if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x021084\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            ClosedCaptionCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('ClosedCaption', ClosedCaptionCmdString, value, qualifier)
-
-            if res:
-                try:
-                    value = ValueStateValues[res[23:24]]
-                    self.WriteStatus('ClosedCaption', value, qualifier)
-                except (KeyError, IndexError):
-                    self.Error(['Closed Caption: Invalid/unexpected response'])
+            ClosedCaptionCmdString = NECFrame(DeviceID, ValueStateValues[value])
+            self._SetHelper('ClosedCaption', ClosedCaptionCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
@@ -1849,30 +455,20 @@ class DeviceSerialClass:
             'Max' : 100
             }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and ValueConstraints['Min'] <= value <= ValueConstraints['Max']:
-            result = hexlify(value.to_bytes(1,'big')).upper()
-            buffer = pack( '>BB11s2ss', 0x30, DeviceID, b'0E0A\x02001200', result, b'\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            ContrastCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('Contrast', ContrastCmdString, value, qualifier)
+            result = NECHexValue(value)
+            ContrastCmdString = NECValueFrame(DeviceID, b'0E0A\x02001200', result)
+            self._SetHelper('Contrast', ContrastCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
     def UpdateContrast(self, value, qualifier):
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x020012\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            ContrastCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('Contrast', ContrastCmdString, value, qualifier)
+            ContrastCmdString = NECFrame(DeviceID, b'0C06\x020012\x03')
+            res = self._UpdateHelper('Contrast', ContrastCmdString, value, qualifier)
 
             if res:
                 try:
@@ -1885,7 +481,7 @@ class DeviceSerialClass:
 
     def SetGammaCorrection(self, value, qualifier):
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
 
         ValueStateValues = {
             'Native Gamma'  : b'0E0A\x0202680001\x03', 
@@ -1897,21 +493,14 @@ class DeviceSerialClass:
         }
 
         if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack('>BB14s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-
-            GammaCorrectionCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('GammaCorrection', GammaCorrectionCmdString, value, qualifier)
+            GammaCorrectionCmdString = NECFrame(DeviceID, ValueStateValues[value])
+            self._SetHelper('GammaCorrection', GammaCorrectionCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def UpdateGammaCorrection(self, value, qualifier):
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
 
         ValueStateValues = {
             b'01' : 'Native Gamma', 
@@ -1923,14 +512,8 @@ class DeviceSerialClass:
         }
 
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x020268\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-
-            GammaCorrectionCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('GammaCorrection', GammaCorrectionCmdString, value, qualifier)
+            GammaCorrectionCmdString = NECFrame(DeviceID, b'0C06\x020268\x03')
+            res = self._UpdateHelper('GammaCorrection', GammaCorrectionCmdString, value, qualifier)
 
             if res:
                 try:
@@ -1943,34 +526,13 @@ class DeviceSerialClass:
 
     def SetInput(self, value, qualifier):
 
-        ValueStateValues = {
-            'VGA'           : b'0E0A\x0200600001\x03', 
-            'RGB/HV'        : b'0E0A\x0200600002\x03',
-            'DVI'           : b'0E0A\x0200600003\x03',
-            'Video1'        : b'0E0A\x0200600005\x03',
-            'Video2'        : b'0E0A\x0200600006\x03',
-            'S-Video'       : b'0E0A\x0200600007\x03',
-            'TV'            : b'0E0A\x020060000A\x03',
-            'DVD/HD1'       : b'0E0A\x020060000C\x03',
-            'Option'        : b'0E0A\x020060000D\x03',
-            'DVD/HD2'       : b'0E0A\x020060000E\x03',
-            'DisplayPort'   : b'0E0A\x020060000F\x03',
-            'HDMI'          : b'0E0A\x0200600004\x03'
-        }
-
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
-        if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            InputCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('Input', InputCmdString, value, qualifier)
+        DeviceID = self._DestinationID(qualifier)
+        if DeviceID != 0 and value in InputStates:
+            InputCmdString = NECFrame(DeviceID, InputStates[value])
+            self._SetHelper('Input', InputCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def UpdateInput(self, value, qualifier):
 
         ValueStateValues = {
@@ -1988,15 +550,10 @@ class DeviceSerialClass:
             b'11'  :'HDMI'  
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x020060\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            InputCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('Input', InputCmdString, value, qualifier)
+            InputCmdString = NECFrame(DeviceID, b'0C06\x020060\x03')
+            res = self._UpdateHelper('Input', InputCmdString, value, qualifier)
 
             if res:
                 try:
@@ -2007,31 +564,6 @@ class DeviceSerialClass:
         else:
             self.Discard('Invalid Command')
 
-    def UpdateMasterPower(self, value, qualifier):
-
-        ValueStateValues = {
-            b'1'  :'On',
-            b'2'  :'Standby (Power Save)',
-            b'3'  :'Suspend (Power Save)',
-            b'4'  :'Off'
-        }
-
-        buffer = pack( '>BB10s', 0x30, self._DeviceID, b'0A06\x0201D6\x03')
-
-        checksum = 0
-        for i in buffer:
-            checksum = checksum ^ i
-        MasterPowerCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-        res = self.__UpdateHelper('MasterPower', MasterPowerCmdString, value, qualifier)
-
-        if res:
-            try:
-                value = ValueStateValues[res[23:24]]
-                self.WriteStatus('Power', value, {'Device ID': str(self.DeviceID - 0x40)})
-            except (KeyError, IndexError):
-                self.Error(['Master Power: Invalid/unexpected response'])
-
-
     def SetOnScreenDisplay(self, value, qualifier):
 
         ValueStateValues = {
@@ -2039,19 +571,13 @@ class DeviceSerialClass:
             'Off' : b'0E0A\x0202EA0001\x03'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            OnScreenDisplayCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('OnScreenDisplay', OnScreenDisplayCmdString, value, qualifier)
+            OnScreenDisplayCmdString = NECFrame(DeviceID, ValueStateValues[value])
+            self._SetHelper('OnScreenDisplay', OnScreenDisplayCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def UpdateOnScreenDisplay(self, value, qualifier):
 
         ValueStateValues = {
@@ -2059,15 +585,10 @@ class DeviceSerialClass:
             b'1' : 'Off' 
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x0202EA\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            OnScreenDisplayCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('OnScreenDisplay', OnScreenDisplayCmdString, value, qualifier)
+            OnScreenDisplayCmdString = NECFrame(DeviceID, b'0C06\x0202EA\x03')
+            res = self._UpdateHelper('OnScreenDisplay', OnScreenDisplayCmdString, value, qualifier)
 
             if res:
                 try:
@@ -2085,19 +606,13 @@ class DeviceSerialClass:
             'Off' : b'0E0A\x0202E30001\x03'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            OverscanCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('Overscan', OverscanCmdString, value, qualifier)
+            OverscanCmdString = NECFrame(DeviceID, ValueStateValues[value])
+            self._SetHelper('Overscan', OverscanCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def UpdateOverscan(self, value, qualifier):
 
         ValueStateValues = {
@@ -2105,15 +620,10 @@ class DeviceSerialClass:
             b'1' : 'Off'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x0202E3\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            OverscanCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('Overscan', OverscanCmdString, value, qualifier)
+            OverscanCmdString = NECFrame(DeviceID, b'0C06\x0202E3\x03')
+            res = self._UpdateHelper('Overscan', OverscanCmdString, value, qualifier)
 
             if res:
                 try:
@@ -2126,7 +636,7 @@ class DeviceSerialClass:
 
     def SetPictureMode(self, value, qualifier):
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
 
         ValueStateValues = {
             'sRGB'      : b'0E0A\x02021A0001\x03', 
@@ -2140,18 +650,11 @@ class DeviceSerialClass:
         }
 
         if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-
-            PictureModeCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('PictureMode', PictureModeCmdString, value, qualifier)
+            PictureModeCmdString = NECFrame(DeviceID, ValueStateValues[value])
+            self._SetHelper('PictureMode', PictureModeCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def UpdatePictureMode(self, value, qualifier):
 
         ValueStateValues = {
@@ -2165,16 +668,10 @@ class DeviceSerialClass:
             b'0C' : 'Ambient-2'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x02021A\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-
-            PictureModeCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('PictureMode', PictureModeCmdString, value, qualifier)
+            PictureModeCmdString = NECFrame(DeviceID, b'0C06\x02021A\x03')
+            res = self._UpdateHelper('PictureMode', PictureModeCmdString, value, qualifier)
 
             if res:
                 try:
@@ -2202,19 +699,13 @@ class DeviceSerialClass:
             'TV'            : b'0E0A\x020273000A\x03'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            PIPInputCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('PIPInput', PIPInputCmdString, value, qualifier)
+            PIPInputCmdString = NECFrame(DeviceID, ValueStateValues[value])
+            self._SetHelper('PIPInput', PIPInputCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def UpdatePIPInput(self, value, qualifier):
 
         ValueStateValues = {
@@ -2233,15 +724,10 @@ class DeviceSerialClass:
         }
 
         
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x020273\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            PIPInputCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('PIPInput', PIPInputCmdString, value, qualifier)
+            PIPInputCmdString = NECFrame(DeviceID, b'0C06\x020273\x03')
+            res = self._UpdateHelper('PIPInput', PIPInputCmdString, value, qualifier)
 
             if res:
                 try:
@@ -2263,19 +749,13 @@ class DeviceSerialClass:
             'Off'                   : b'0E0A\x0202720001\x03'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            PIPModeCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('PIPMode', PIPModeCmdString, value, qualifier)
+            PIPModeCmdString = NECFrame(DeviceID, ValueStateValues[value])
+            self._SetHelper('PIPMode', PIPModeCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def UpdatePIPMode(self, value, qualifier):
 
         ValueStateValues = {
@@ -2287,15 +767,10 @@ class DeviceSerialClass:
             b'6'  :'Side by side (Full)'     
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x020272\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            PIPModeCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('PIPMode', PIPModeCmdString, value, qualifier)
+            PIPModeCmdString = NECFrame(DeviceID, b'0C06\x020272\x03')
+            res = self._UpdateHelper('PIPMode', PIPModeCmdString, value, qualifier)
 
             if res:
                 try:
@@ -2314,19 +789,13 @@ class DeviceSerialClass:
             'Large'     : b'0E0A\x0202710003\x03'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            PIPSizeCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('PIPSize', PIPSizeCmdString, value, qualifier)
+            PIPSizeCmdString = NECFrame(DeviceID, ValueStateValues[value])
+            self._SetHelper('PIPSize', PIPSizeCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def UpdatePIPSize(self, value, qualifier):
 
         ValueStateValues = {
@@ -2335,15 +804,10 @@ class DeviceSerialClass:
             b'3'  :'Large'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x020271\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            PIPSizeCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('PIPSize', PIPSizeCmdString, value, qualifier)
+            PIPSizeCmdString = NECFrame(DeviceID, b'0C06\x020271\x03')
+            res = self._UpdateHelper('PIPSize', PIPSizeCmdString, value, qualifier)
 
             if res:
                 try:
@@ -2356,24 +820,13 @@ class DeviceSerialClass:
 
     def SetPower(self, value, qualifier):
 
-        ValueStateValues = {
-            'On'     : b'0A0C\x02C203D60001\x03', 
-            'Off'    : b'0A0C\x02C203D60004\x03' 
-        }
-
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
-        if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack( '>BB16s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            PowerCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('Power', PowerCmdString, value, qualifier)
+        DeviceID = self._DestinationID(qualifier)
+        if DeviceID != 0 and value in PowerStates:
+            PowerCmdString = NECFrame(DeviceID, PowerStates[value])
+            self._SetHelper('Power', PowerCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def UpdatePower(self, value, qualifier):
 
         ValueStateValues = {
@@ -2383,15 +836,10 @@ class DeviceSerialClass:
             b'4'  :'Off'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0A06\x0201D6\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            PowerCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('Power', PowerCmdString, value, qualifier)
+            PowerCmdString = NECFrame(DeviceID, b'0A06\x0201D6\x03')
+            res = self._UpdateHelper('Power', PowerCmdString, value, qualifier)
 
             if res:
                 try:
@@ -2409,19 +857,13 @@ class DeviceSerialClass:
             'Off':  b'0E0A\x0200E10000\x03'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack('>BB14s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            PowerSaveCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('PowerSave', PowerSaveCmdString, value, qualifier)
+            PowerSaveCmdString = NECFrame(DeviceID, ValueStateValues[value])
+            self._SetHelper('PowerSave', PowerSaveCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def UpdatePowerSave(self, value, qualifier):
 
         ValueStateValues = {
@@ -2429,15 +871,10 @@ class DeviceSerialClass:
             b'0': 'Off'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack('>BB10s', 0x30, DeviceID, b'0C06\x0200E1\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            PowerSaveCmdString = b'\x01' + buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('PowerSave', PowerSaveCmdString, value, qualifier)
+            PowerSaveCmdString = NECFrame(DeviceID, b'0C06\x0200E1\x03')
+            res = self._UpdateHelper('PowerSave', PowerSaveCmdString, value, qualifier)
 
             if res:
                 try:
@@ -2450,21 +887,15 @@ class DeviceSerialClass:
 
     def SetTileHMonitor(self, value, qualifier):
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         value = int(value)
         if DeviceID != 0 and 1 <= value <= 10:
-            result = hexlify(value.to_bytes(1,'big')).upper()
-            buffer = pack( '>BB11s2ss', 0x30, DeviceID, b'0E0A\x0202D000', result, b'\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            TileHMonitorCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('TileHMonitor', TileHMonitorCmdString, value, qualifier)
+            result = NECHexValue(value)
+            TileHMonitorCmdString = NECValueFrame(DeviceID, b'0E0A\x0202D000', result)
+            self._SetHelper('TileHMonitor', TileHMonitorCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def SetTileMatrix(self, value, qualifier):
 
         ValueStateValues = {
@@ -2473,19 +904,13 @@ class DeviceSerialClass:
             'Off W/ Frame'  : b'0E0A\x0202D30001\x03'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            TileMatrixCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('TileMatrix', TileMatrixCmdString, value, qualifier)
+            TileMatrixCmdString = NECFrame(DeviceID, ValueStateValues[value])
+            self._SetHelper('TileMatrix', TileMatrixCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def UpdateTileMatrix(self, value, qualifier):
 
         ValueStateValues = {
@@ -2494,15 +919,10 @@ class DeviceSerialClass:
             b'3'  :'Off'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x0202D3\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            TileMatrixCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('TileMatrix', TileMatrixCmdString, value, qualifier)
+            TileMatrixCmdString = NECFrame(DeviceID, b'0C06\x0202D3\x03')
+            res = self._UpdateHelper('TileMatrix', TileMatrixCmdString, value, qualifier)
 
             if res:
                 try:
@@ -2520,51 +940,35 @@ class DeviceSerialClass:
             'Disable'        : b'0E0A\x0202D50001\x03'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            TileMatrixCompCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('TileMatrixComp', TileMatrixCompCmdString, value, qualifier)
+            TileMatrixCompCmdString = NECFrame(DeviceID, ValueStateValues[value])
+            self._SetHelper('TileMatrixComp', TileMatrixCompCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
     def SetTilePosition(self, value, qualifier):
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         value = int(value)
         if DeviceID != 0 and 1 <= value <= 100:
-            result = hexlify(value.to_bytes(1,'big')).upper()
-            buffer = pack( '>BB11s2ss', 0x30, DeviceID, b'0E0A\x0202D200', result, b'\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            TilePositionCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('TilePosition', TilePositionCmdString, value, qualifier)
+            result = NECHexValue(value)
+            TilePositionCmdString = NECValueFrame(DeviceID, b'0E0A\x0202D200', result)
+            self._SetHelper('TilePosition', TilePositionCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
     def SetTileVMonitor(self, value, qualifier):
 
         value = int(value)
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and 1 <= value <= 10:
-            result = hexlify(value.to_bytes(1,'big')).upper()
-            buffer = pack( '>BB11s2ss', 0x30, DeviceID, b'0E0A\x0202D100', result, b'\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            TileVMonitorCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('TileVMonitor', TileVMonitorCmdString, value, qualifier)
+            result = NECHexValue(value)
+            TileVMonitorCmdString = NECValueFrame(DeviceID, b'0E0A\x0202D100', result)
+            self._SetHelper('TileVMonitor', TileVMonitorCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def SetTVChannelStep(self, value, qualifier):
 
         ValueStateValues = {
@@ -2572,38 +976,22 @@ class DeviceSerialClass:
             'Down'  : b'0E0A\x02008B0002\x03'
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            TVChannelStepCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('TVChannelStep', TVChannelStepCmdString, value, qualifier)
+            TVChannelStepCmdString = NECFrame(DeviceID, ValueStateValues[value])
+            self._SetHelper('TVChannelStep', TVChannelStepCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
     def SetVideoMute(self, value, qualifier):
 
-        ValueStateValues = {
-            'On'   : b'0E0A\x0210B60001\x03', 
-            'Off'  : b'0E0A\x0210B60002\x03'
-        }
-
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
-        if DeviceID != 0 and value in ValueStateValues:
-            buffer = pack( '>BB14s', 0x30, DeviceID, ValueStateValues[value])
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            MuteCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('VideoMute', MuteCmdString, value, qualifier)
+        DeviceID = self._DestinationID(qualifier)
+        if DeviceID != 0 and value in VideoMuteStates:
+            MuteCmdString = NECFrame(DeviceID, VideoMuteStates[value])
+            self._SetHelper('VideoMute', MuteCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def UpdateVideoMute(self, value, qualifier):
 
         ValueStateValues = {
@@ -2612,15 +1000,10 @@ class DeviceSerialClass:
             b'0' : 'No Signal' 
         }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x0210B6\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            MuteCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('VideoMute', MuteCmdString, value, qualifier)
+            MuteCmdString = NECFrame(DeviceID, b'0C06\x0210B6\x03')
+            res = self._UpdateHelper('VideoMute', MuteCmdString, value, qualifier)
 
             if res:
                 try:
@@ -2638,31 +1021,20 @@ class DeviceSerialClass:
             'Max' : 100
             }
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0 and ValueConstraints['Min'] <= value <= ValueConstraints['Max']:
-            result = hexlify(value.to_bytes(1,'big')).upper()
-            buffer = pack( '>BB11s2ss', 0x30, DeviceID, b'0E0A\x02006200', result, b'\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            VolumeCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            self.__SetHelper('Volume', VolumeCmdString, value, qualifier)
+            result = NECHexValue(value)
+            VolumeCmdString = NECValueFrame(DeviceID, VolumePrefix, result)
+            self._SetHelper('Volume', VolumeCmdString, value, qualifier)
         else:
             self.Discard('Invalid Command')
 
-
     def UpdateVolume(self, value, qualifier):
 
-        DeviceID = self.SetQualifierDeviceID(qualifier['Device ID'])
+        DeviceID = self._DestinationID(qualifier)
         if DeviceID != 0:
-            buffer = pack( '>BB10s', 0x30, DeviceID, b'0C06\x020062\x03')
-
-            checksum = 0
-            for i in buffer:
-                checksum = checksum ^ i
-            VolumeCmdString = b'\x01'+ buffer + pack('>B', checksum) + b'\r'
-            res = self.__UpdateHelper('Volume', VolumeCmdString, value, qualifier)
+            VolumeCmdString = NECFrame(DeviceID, b'0C06\x020062\x03')
+            res = self._UpdateHelper('Volume', VolumeCmdString, value, qualifier)
 
             if res:
                 try:
@@ -2681,9 +1053,10 @@ class DeviceSerialClass:
                 response = ''
         return response
 
-    def __SetHelper(self, command, commandstring, value, qualifier):
+    def _SetHelper(self, command, commandstring, value, qualifier):
 
-        if self.Unidirectional == 'True' or 'Broadcast' in [qualifier['Device ID']]:
+        # broadcasts are not answered, the third byte of a frame is its destination ID
+        if self.Unidirectional == 'True' or commandstring[2] == BroadcastID:
             self.Send(commandstring)
         else:
             res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\r')
@@ -2691,10 +1064,11 @@ class DeviceSerialClass:
                 self.Error(['{0} : Invalid/Unexpected Response'.format(command)])
             else:
                 res = self.__CheckResponseForErrors(command, res)
-    
-    def __UpdateHelper(self, command, commandstring, value, qualifier):
 
-        if self.Unidirectional == 'True' or 'Broadcast' in qualifier['Device ID']:
+    def _UpdateHelper(self, command, commandstring, value, qualifier):
+
+        # broadcasts are not answered, the third byte of a frame is its destination ID
+        if self.Unidirectional == 'True' or commandstring[2] == BroadcastID:
             self.Discard('Inappropriate Command ' + command)
             return ''
         else:
@@ -2717,7 +1091,6 @@ class DeviceSerialClass:
         self.WriteStatus('ConnectionStatus', 'Connected')
         self.counter = 0
 
-
     def OnDisconnected(self):
         self.WriteStatus('ConnectionStatus', 'Disconnected')
         self.connectionFlag = False
@@ -2728,18 +1101,19 @@ class DeviceSerialClass:
 
     # Send Control Commands
     def Set(self, command, value, qualifier=None):
-        method = getattr(self, 'Set%s' % command, None)
-        if method is not None and callable(method):
-            method(value, qualifier)
+        method = self.SetMethods.get(command, None)
+        if method is not None:
+            if not self.StatusStore.Validate(command, qualifier):
+                raise KeyError('Invalid qualifier for Set ' + command)
+            method(self, value, qualifier)
         else:
             raise AttributeError(command, 'does not support Set.')
 
-
     # Send Update Commands
     def Update(self, command, qualifier=None):
-        method = getattr(self, 'Update%s' % command, None)
-        if method is not None and callable(method):
-            method(None, qualifier)
+        method = self.UpdateMethods.get(command, None)
+        if method is not None:
+            method(self, None, qualifier)
         else:
             raise AttributeError(command, 'does not support Update.')
 
@@ -2750,86 +1124,194 @@ class DeviceSerialClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command, None)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method':{}}
-
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             raise KeyError('Invalid command for SubscribeStatus ', command)
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription :
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
         self.counter = 0
         if not self.connectionFlag:
             self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
+        if self.StatusStore.Write(command, value, qualifier):
             self.NewStatus(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
         Command = self.Commands.get(command, None)
         if Command:
-            Status = Command['Status']
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Status = Status[qualifier[Parameter]]
-                    except KeyError:
-                        return None
-            try:
-                return Status['Live']
-            except:
-                return None
+            return self.StatusStore.Read(command, qualifier)
         else:
             raise KeyError('Invalid command for ReadStatus: ', command)
 
+@CommandMethods
+class DeviceEthernetClass(DeviceClass):
+
+    def __init__(self):
+        DeviceClass.__init__(self)
+
+        self.Commands = {
+            'ConnectionStatus': {'Status': {}},
+            'AmbientBrightness': {'Parameters': ['Mode'], 'Status': {}},
+            'AmbientCurrentIlluminance': {'Status': {}},
+            'AmbientSensorRead': {'Status': {}},
+            'AspectRatio': {'Status': {}},
+            'AudioInput': {'Status': {}},
+            'AudioMute': {'Status': {}},
+            'AutoImage': {'Status': {}},
+            'Backlight': {'Status': {}},
+            'Brightness': {'Status': {}},
+            'ChannelNumber': {'Status': {}},
+            'ClosedCaption': {'Status': {}},
+            'Contrast': {'Status': {}},
+            'GammaCorrection': {'Status': {}},
+            'Input': {'Status': {}},
+            'OnScreenDisplay': {'Status': {}},
+            'Overscan': {'Status': {}},
+            'PictureMode': {'Status': {}},
+            'PIPInput': {'Status': {}},
+            'PIPMode': {'Status': {}},
+            'PIPSize': {'Status': {}},
+            'Power': {'Status': {}},
+            'PowerSave': {'Status': {}},
+            'TileHMonitor': {'Status': {}},
+            'TileMatrix': {'Status': {}},
+            'TileMatrixComp': {'Status': {}},
+            'TilePosition': {'Status': {}},
+            'TileVMonitor': {'Status': {}},
+            'TVChannelStep': {'Status': {}},
+            'VideoMute': {'Status': {}},
+            'Volume': {'Status': {}},
+        }
+        self.StatusStore = StatusStore(self.Commands)
+
+## -----------------------------------------------------------------------------
+## Start Feedback Callback Functions
+## -----------------------------------------------------------------------------
+
+    def AudioMuteStatusHandler(self, command, value, qualifier, hardware=None):
+        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}', args=(hardware.Name, command, value, qualifier))
+        for TP in self.GUIHost.TPs:
+            TP.DispCtl.DisplayMuteFeedback(hardware.Id, value)
+        
+    def PowerStatusHandler(self, command, value, qualifier, hardware=None):
+        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}', args=(hardware.Name, command, value, qualifier))
+        for TP in self.GUIHost.TPs:
+            TP.DispCtl.DisplayPowerFeedback(hardware.Id, value)
+        
+    def VolumeStatusHandler(self, command, value, qualifier, hardware=None):
+        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}', args=(hardware.Name, command, value, qualifier))
+        for TP in self.GUIHost.TPs:
+            TP.DispCtl.DisplayVolumeFeedback(hardware.Id, value)
+
+## -----------------------------------------------------------------------------
+## End Feedback Callback Functions
+## -----------------------------------------------------------------------------
+
+@CommandMethods
+class DeviceSerialClass(DeviceClass):
+
+    def __init__(self):
+        DeviceClass.__init__(self)
+
+        self.Commands = {
+            'ConnectionStatus': {'Status': {}},
+            'AmbientBrightness': {'Parameters': ['Device ID', 'Mode'], 'Status': {}},
+            'AmbientCurrentIlluminance': {'Parameters': ['Device ID'], 'Status': {}},
+            'AmbientSensorRead': {'Parameters': ['Device ID'], 'Status': {}},
+            'AspectRatio': {'Parameters': ['Device ID'], 'Status': {}},
+            'AudioInput': {'Parameters': ['Device ID'], 'Status': {}},
+            'AudioMute': {'Parameters': ['Device ID'], 'Status': {}},
+            'AutoImage': {'Parameters': ['Device ID'], 'Status': {}},
+            'Backlight': {'Parameters': ['Device ID'], 'Status': {}},
+            'Brightness': {'Parameters': ['Device ID'], 'Status': {}},
+            'ChannelNumber': {'Parameters': ['Device ID'], 'Status': {}},
+            'ClosedCaption': {'Parameters': ['Device ID'], 'Status': {}},
+            'Contrast': {'Parameters': ['Device ID'], 'Status': {}},
+            'GammaCorrection': {'Parameters': ['Device ID'], 'Status': {}},
+            'Input': {'Parameters': ['Device ID'], 'Status': {}},
+            'MasterPower': { 'Status': {}},
+            'OnScreenDisplay': {'Parameters': ['Device ID'], 'Status': {}},
+            'Overscan': {'Parameters': ['Device ID'], 'Status': {}},
+            'PictureMode': {'Parameters': ['Device ID'], 'Status': {}},
+            'PIPInput': {'Parameters': ['Device ID'], 'Status': {}},
+            'PIPMode': {'Parameters': ['Device ID'], 'Status': {}},
+            'PIPSize': {'Parameters': ['Device ID'], 'Status': {}},
+            'Power': {'Parameters': ['Device ID'], 'Status': {}},
+            'PowerSave': {'Parameters': ['Device ID'], 'Status': {}},
+            'TileHMonitor': {'Parameters': ['Device ID'], 'Status': {}},
+            'TileMatrix': {'Parameters': ['Device ID'], 'Status': {}},
+            'TileMatrixComp': {'Parameters': ['Device ID'], 'Status': {}},
+            'TilePosition': {'Parameters': ['Device ID'], 'Status': {}},
+            'TileVMonitor': {'Parameters': ['Device ID'], 'Status': {}},
+            'TVChannelStep': {'Parameters': ['Device ID'], 'Status': {}},
+            'VideoMute': {'Parameters': ['Device ID'], 'Status': {}},
+            'Volume': {'Parameters': ['Device ID'], 'Status': {}},
+        }
+        self.StatusStore = StatusStore(self.Commands)
+
+    def SetQualifierDeviceID(self, value):
+        if value == 'Broadcast':
+            return BroadcastID
+        elif 1 <= int(value) <= 100:
+            return 0x40 + int(value)
+        else:
+            return 0
+
+    def _DestinationID(self, qualifier):
+        return self.SetQualifierDeviceID(qualifier['Device ID'])
+
+    def UpdateClosedCaption(self, value, qualifier):
+
+        ValueStateValues = {
+            b'1' : 'Off', 
+            b'2' : 'CC1', 
+            b'3' : 'CC2',
+            b'4' : 'CC3',
+            b'5' : 'CC4',
+            b'6' : 'TT1',
+            b'7' : 'TT2',
+            b'8' : 'TT3',
+            b'9' : 'TT4' 
+        }
+
+        DeviceID = self._DestinationID(qualifier)
+        if DeviceID != 0:
+            ClosedCaptionCmdString = NECFrame(DeviceID, b'0C06\x021084\x03')
+            res = self._UpdateHelper('ClosedCaption', ClosedCaptionCmdString, value, qualifier)
+
+            if res:
+                try:
+                    value = ValueStateValues[res[23:24]]
+                    self.WriteStatus('ClosedCaption', value, qualifier)
+                except (KeyError, IndexError):
+                    self.Error(['Closed Caption: Invalid/unexpected response'])
+        else:
+            self.Discard('Invalid Command')
+
+    def UpdateMasterPower(self, value, qualifier):
+
+        ValueStateValues = {
+            b'1'  :'On',
+            b'2'  :'Standby (Power Save)',
+            b'3'  :'Suspend (Power Save)',
+            b'4'  :'Off'
+        }
+
+        MasterPowerCmdString = NECFrame(self._DeviceID, b'0A06\x0201D6\x03')
+        res = self._UpdateHelper('MasterPower', MasterPowerCmdString, value, qualifier)
+
+        if res:
+            try:
+                value = ValueStateValues[res[23:24]]
+                self.WriteStatus('Power', value, {'Device ID': str(self.DeviceID - 0x40)})
+            except (KeyError, IndexError):
+                self.Error(['Master Power: Invalid/unexpected response'])
+
 class SerialClass(SerialInterface, DeviceSerialClass):
 
     def __init__(self, Host, Port, Baud=9600, Data=8, Parity='None', Stop=1, FlowControl='Off', CharDelay=0, Mode='RS232', Model =None):
@@ -5,6 +5,9 @@ if TYPE_CHECKING: # pragma: no cover
 from extronlib.interface import SerialInterface, EthernetClientInterface
 from struct import pack
 
+from uofi_gui.driverStatus import StatusStore, CommandMethods
+
+@CommandMethods
 class DeviceClass:
 
     def __init__(self):
@@ -13,7 +16,6 @@ class DeviceClass:
         self.connectionCounter = 15
         self.DefaultResponseTimeout = 0.3
         self._compile_list = {}
-        self.Subscription = {}
         self.counter = 0
         self.connectionFlag = True
         self.initializationChk = True
@@ -34,6 +36,7 @@ class DeviceClass:
             'PresetSave': {'Status': {}},
             'Zoom': {'Parameters': ['Zoom Speed'], 'Status': {}}
         }
+        self.StatusStore = StatusStore(self.Commands)
 
     @property
     def DeviceID(self):
@@ -302,16 +305,18 @@ class DeviceClass:
     ######################################################
     # Send Control Commands
     def Set(self, command, value, qualifier=None):
-        method = 'Set%s' % command
-        if hasattr(self, method) and callable(getattr(self, method)):
-            getattr(self, method)(value, qualifier)
+        method = self.SetMethods.get(command, None)
+        if method is not None:
+            if not self.StatusStore.Validate(command, qualifier):
+                raise KeyError('Invalid qualifier for Set ' + command)
+            method(self, value, qualifier)
         else:
             print(command, 'does not support Set.')
     # Send Update Commands
     def Update(self, command, qualifier=None):
-        method = 'Update%s' % command
-        if hasattr(self, method) and callable(getattr(self, method)):
-            getattr(self, method)(None, qualifier)
+        method = self.UpdateMethods.get(command, None)
+        if method is not None:
+            method(self, None, qualifier)
         else:
             print(command, 'does not support Update.') 
 
@@ -322,82 +327,25 @@ class DeviceClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method':{}}
-        
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-        
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-        
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier    
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             print(command, 'does not exist in the module')
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription :
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)  
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
         self.counter = 0
         if not self.connectionFlag:
             self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return  
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
-            self.NewStatus(command, value, qualifier)            
+        if self.StatusStore.Write(command, value, qualifier):
+            self.NewStatus(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    return None
-        try:
-            return Status['Live']
-        except:
-            return None
+        return self.StatusStore.Read(command, qualifier)
 class SerialClass(SerialInterface, DeviceClass):
 
     def __init__(self, Host, Port, Baud=9600, Data=8, Parity='None', Stop=1, FlowControl='Off', CharDelay=0, Model=None):
@@ -7,18 +7,23 @@ import re
 from extronlib.system import Wait, ProgramLog
 
 import utilityFunctions
+from uofi_gui.driverReceive import FrameReceiver, PrefixDispatcher, SharedPattern
+from uofi_gui.driverStatus import StatusStore, CommandMethods
 
+@CommandMethods
 class DeviceClass:
+    __matchStringKeys = {}
+
     def __init__(self):
 
         self.Unidirectional = 'False'
         self.connectionCounter = 15
         self.DefaultResponseTimeout = 0.3
-        self.Subscription = {}
         self.ReceiveData = self.__ReceiveData
-        self.__receiveBuffer = b''
         self.__maxBufferSize = 2048
-        self.__matchStringDict = {}
+        # Shure command strings are framed by '< ' and ' >'
+        self.__receiveFrames = FrameReceiver(b'>', self.__ReceiveFrame, self.__maxBufferSize)
+        self.__matchStrings = PrefixDispatcher(self.__MessageKey)
         self.counter = 0
         self.connectionFlag = True
         self.initializationChk = True
@@ -55,37 +60,38 @@ class DeviceClass:
             'RingLEDPower': { 'Status': {}},
             'SegmentLEDPower': {'Parameters':['Channel'], 'Status': {}},
         }       
+        self.StatusStore = StatusStore(self.Commands)
         
         if self.Unidirectional == 'False':
-            self.AddMatchString(re.compile(b'< REP NUM_ACTIVE_MICS ([1-8]) >'), self.__MatchActiveMicChannels, None)
-            self.AddMatchString(re.compile(b'< REP ([1-9]) AUDIO_GAIN_HI_RES (\d{4}) >'), self.__MatchAudioGain, None)
-            self.AddMatchString(re.compile(b'< REP ([1-9]) AUDIO_IN_PEAK_LVL (\d{3}) >'), self.__MatchAudioPeakLevelStatus, None)
-            self.AddMatchString(re.compile(b'< REP ([1-9]) AUDIO_IN_RMS_LVL (\d{3}) >'), self.__MatchAudioRMSLevelStatus, None)
-            self.AddMatchString(re.compile(b'< REP ([1-9]) BEAM_Z (\d{1,3}) >'), self.__MatchBeamLobeHeight, None)
-            self.AddMatchString(re.compile(b'< REP ([1-9]) BEAM_(X|Y) (\d{1,4}) >'), self.__MatchBeamLobeSteering, None)
-            self.AddMatchString(re.compile(b'< REP ([1-9]) BEAM_W (WIDE|MEDIUM|NARROW) >'), self.__MatchBeamLobeWidth, None)
-            self.AddMatchString(re.compile(b'< REP ([1-9]) AUDIO_MUTE (ON|OFF) >'), self.__MatchChannelAudioMute, None)
-            self.AddMatchString(re.compile(b'< REP DEVICE_AUDIO_MUTE (ON|OFF) >'), self.__MatchDeviceAudioMute, None)
-            self.AddMatchString(re.compile(b'< REP FLASH (ON|OFF) >'), self.__MatchIdentifyMicrophone, None)
-            self.AddMatchString(re.compile(b'< REP ([0-9]) AUTOMIX_GATE_OUT_EXT_SIG (ON|OFF) >'), self.__MatchGateOutStatus, None)
-            self.AddMatchString(re.compile(b'< REP LED_BRIGHTNESS ([0-5]) >'), self.__MatchLEDBrightness, None)
-            self.AddMatchString(re.compile(b'< REP LED_COLOR_(UNMUTED|MUTED) (RED|GREEN|BLUE|PINK|PURPLE|YELLOW|ORANGE|WHITE|GOLD|YELLOWGREEN|TURQUOISE|POWDERBLUE|CYAN|SKYBLUE|LIGHTPURPLE|VIOLET|ORCHID) >'), self.__MatchLEDMuteColor, None)
-            self.AddMatchString(re.compile(b'< REP LED_STATE_(UNMUTED|MUTED) (ON|OFF|FLASHING) >'), self.__MatchLEDMuteFlashing, None)
-            self.AddMatchString(re.compile(b'< REP ([0-9]) AUDIO_OUT_CLIP_INDICATOR (ON|OFF) >'), self.__MatchOutputClipStatus, None)
-            self.AddMatchString(re.compile(b'< REP PRESET (\d{2}) >'), self.__MatchRecallPreset, None)
-            self.AddMatchString(re.compile(b'< REP EXT_SWITCH_OUT_STATE (ON|OFF) >'), self.__MatchExternalSwitchOutState, None)
-            self.AddMatchString(re.compile(b'< REP DEV_LED_IN_STATE (ON|OFF) >'), self.__MatchLEDPower, None)
-            self.AddMatchString(re.compile(b'< REP ([1-4]) CHAN_LED_IN_STATE (ON|OFF) >'), self.__MatchSegmentLEDPower, None)
-            self.AddMatchString(re.compile(b'< REP MUTE_BUTTON_LED_STATE (ON|OFF) >'), self.__MatchMuteButtonLEDState, None)
-            self.AddMatchString(re.compile(b'< REP MUTE_BUTTON_STATUS (ON|OFF) >'), self.__MatchMuteButtonStatus, None)
-            self.AddMatchString(re.compile(b'< REP ERR >'), self.__MatchError, None)
+            self.AddMatchString(SharedPattern(b'< REP NUM_ACTIVE_MICS ([1-8]) >'), self.__MatchActiveMicChannels, None)
+            self.AddMatchString(SharedPattern(b'< REP ([1-9]) AUDIO_GAIN_HI_RES (\d{4}) >'), self.__MatchAudioGain, None)
+            self.AddMatchString(SharedPattern(b'< REP ([1-9]) AUDIO_IN_PEAK_LVL (\d{3}) >'), self.__MatchAudioPeakLevelStatus, None)
+            self.AddMatchString(SharedPattern(b'< REP ([1-9]) AUDIO_IN_RMS_LVL (\d{3}) >'), self.__MatchAudioRMSLevelStatus, None)
+            self.AddMatchString(SharedPattern(b'< REP ([1-9]) BEAM_Z (\d{1,3}) >'), self.__MatchBeamLobeHeight, None)
+            self.AddMatchString(SharedPattern(b'< REP ([1-9]) BEAM_(X|Y) (\d{1,4}) >'), self.__MatchBeamLobeSteering, None)
+            self.AddMatchString(SharedPattern(b'< REP ([1-9]) BEAM_W (WIDE|MEDIUM|NARROW) >'), self.__MatchBeamLobeWidth, None)
+            self.AddMatchString(SharedPattern(b'< REP ([1-9]) AUDIO_MUTE (ON|OFF) >'), self.__MatchChannelAudioMute, None)
+            self.AddMatchString(SharedPattern(b'< REP DEVICE_AUDIO_MUTE (ON|OFF) >'), self.__MatchDeviceAudioMute, None)
+            self.AddMatchString(SharedPattern(b'< REP FLASH (ON|OFF) >'), self.__MatchIdentifyMicrophone, None)
+            self.AddMatchString(SharedPattern(b'< REP ([0-9]) AUTOMIX_GATE_OUT_EXT_SIG (ON|OFF) >'), self.__MatchGateOutStatus, None)
+            self.AddMatchString(SharedPattern(b'< REP LED_BRIGHTNESS ([0-5]) >'), self.__MatchLEDBrightness, None)
+            self.AddMatchString(SharedPattern(b'< REP LED_COLOR_(UNMUTED|MUTED) (RED|GREEN|BLUE|PINK|PURPLE|YELLOW|ORANGE|WHITE|GOLD|YELLOWGREEN|TURQUOISE|POWDERBLUE|CYAN|SKYBLUE|LIGHTPURPLE|VIOLET|ORCHID) >'), self.__MatchLEDMuteColor, None)
+            self.AddMatchString(SharedPattern(b'< REP LED_STATE_(UNMUTED|MUTED) (ON|OFF|FLASHING) >'), self.__MatchLEDMuteFlashing, None)
+            self.AddMatchString(SharedPattern(b'< REP ([0-9]) AUDIO_OUT_CLIP_INDICATOR (ON|OFF) >'), self.__MatchOutputClipStatus, None)
+            self.AddMatchString(SharedPattern(b'< REP PRESET (\d{2}) >'), self.__MatchRecallPreset, None)
+            self.AddMatchString(SharedPattern(b'< REP EXT_SWITCH_OUT_STATE (ON|OFF) >'), self.__MatchExternalSwitchOutState, None)
+            self.AddMatchString(SharedPattern(b'< REP DEV_LED_IN_STATE (ON|OFF) >'), self.__MatchLEDPower, None)
+            self.AddMatchString(SharedPattern(b'< REP ([1-4]) CHAN_LED_IN_STATE (ON|OFF) >'), self.__MatchSegmentLEDPower, None)
+            self.AddMatchString(SharedPattern(b'< REP MUTE_BUTTON_LED_STATE (ON|OFF) >'), self.__MatchMuteButtonLEDState, None)
+            self.AddMatchString(SharedPattern(b'< REP MUTE_BUTTON_STATUS (ON|OFF) >'), self.__MatchMuteButtonStatus, None)
+            self.AddMatchString(SharedPattern(b'< REP ERR >'), self.__MatchError, None)
 
 ## -----------------------------------------------------------------------------
 ## Start Feedback Callback Functions
 ## -----------------------------------------------------------------------------
 
     def FeedbackMuteHandler(self, command, value, qualifier, hardware=None, tag=None):
-        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}; Tag: {}'.format(hardware.Name, command, value, qualifier, tag))
+        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}; Tag: {}', args=(hardware.Name, command, value, qualifier, tag))
         for TP in self.GUIHost.TPs:
             TP.AudioCtl.AudioMuteFeedback(tag, value)
 
@@ -870,17 +876,19 @@ class DeviceClass:
 
     # Send Control Commands
     def Set(self, command, value, qualifier=None):
-        method = getattr(self, 'Set%s' % command, None)
-        if method is not None and callable(method):
-            method(value, qualifier)
+        method = self.SetMethods.get(command, None)
+        if method is not None:
+            if not self.StatusStore.Validate(command, qualifier):
+                raise KeyError('Invalid qualifier for Set ' + command)
+            method(self, value, qualifier)
         else:
             raise AttributeError(command + 'does not support Set.')
 
     # Send Update Commands
     def Update(self, command, qualifier=None):
-        method = getattr(self, 'Update%s' % command, None)
-        if method is not None and callable(method):
-            method(None, qualifier)
+        method = self.UpdateMethods.get(command, None)
+        if method is not None:
+            method(self, None, qualifier)
         else:
             raise AttributeError(command + 'does not support Update.')
 
@@ -891,114 +899,61 @@ class DeviceClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command, None)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method':{}}
-        
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-        
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-        
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier    
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             raise KeyError('Invalid command for SubscribeStatus ' + command)
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription :
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)  
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
         self.counter = 0
         if not self.connectionFlag:
             self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return  
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
+        if self.StatusStore.Write(command, value, qualifier):
             self.NewStatus(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
         Command = self.Commands.get(command, None)
         if Command:
-            Status = Command['Status']
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Status = Status[qualifier[Parameter]]
-                    except KeyError:
-                        return None
-            try:
-                return Status['Live']
-            except:
-                return None
+            return self.StatusStore.Read(command, qualifier)
         else:
             raise KeyError('Invalid command for ReadStatus: ' + command)
 
     def __ReceiveData(self, interface, data):
         # Handle incoming data
-        self.__receiveBuffer += data
-        index = 0    # Start of possible good data
-        
-        #check incoming data if it matched any expected data from device module
-        for regexString, CurrentMatch in self.__matchStringDict.items():
-            while True:
-                result = re.search(regexString, self.__receiveBuffer)
-                if result:
-                    index = result.start()
-                    CurrentMatch['callback'](result, CurrentMatch['para'])
-                    self.__receiveBuffer = self.__receiveBuffer[:result.start()] + self.__receiveBuffer[result.end():]
-                else:
-                    break
-                    
-        if index: 
-            # Clear out any junk data that came in before any good matches.
-            self.__receiveBuffer = self.__receiveBuffer[index:]
-        else:
-            # In rare cases, the buffer could be filled with garbage quickly.
-            # Make sure the buffer is capped.  Max buffer size set in init.
-            self.__receiveBuffer = self.__receiveBuffer[-self.__maxBufferSize:]
+        self.__receiveFrames.Receive(data)
+
+    def __ReceiveFrame(self, frame):
+        # check each complete frame against the expected data from device module
+        self.__matchStrings.Dispatch(frame)
+
+    @staticmethod
+    def __MessageKey(frame):
+        # < REP [index] PARAM value >
+        parts = frame[frame.find(b'<'):].split(None, 4)
+        if len(parts) < 4:
+            return None
+        return parts[3] if parts[2].isdigit() else parts[2]
 
     # Add regular expression so that it can be check on incoming data from device.
     def AddMatchString(self, regex_string, callback, arg):
-        if regex_string not in self.__matchStringDict:
-            self.__matchStringDict[regex_string] = {'callback': callback, 'para':arg}
+        # the PARAM of the match string is its message key, a PARAM ending in
+        # a group of alternatives is registered under each alternative. Keys
+        # are shared by all instances, like the match strings
+        if regex_string not in DeviceClass.__matchStringKeys:
+            keys = None
+            param = re.match(rb'< REP (?:\(\S+?\) )?([A-Z_]+)(?:\(([A-Z|]+)\))?', regex_string.pattern)
+            if param:
+                if param.group(2):
+                    keys = [param.group(1) + alt for alt in param.group(2).split(b'|')]
+                else:
+                    keys = [param.group(1)]
+            DeviceClass.__matchStringKeys[regex_string] = keys
+        self.__matchStrings.Add(regex_string, callback, arg, DeviceClass.__matchStringKeys[regex_string])
 
 class EthernetClass(EthernetClientInterface, DeviceClass):
 
@@ -23,7 +23,6 @@ if TYPE_CHECKING: # pragma: no cover
 ## Begin ControlScript Import --------------------------------------------------
 from extronlib import event
 from extronlib.ui import Button
-from extronlib.system import Timer
 
 ## End ControlScript Import ----------------------------------------------------
 ##
@@ -34,6 +33,7 @@ from extronlib.system import Timer
 ## Begin User Import -----------------------------------------------------------
 #### Custom Code Modules
 from utilityFunctions import Log, RunAsync, TimeIntToStr, debug
+from uofi_gui.timerService import ServiceTimer
 #### Extron Global Scripter Modules
 
 ## End User Import -------------------------------------------------------------
@@ -108,19 +108,19 @@ class ActivityController:
             tp.ShowPopup('Menu-Activity-{}'.format(self.GUIHost.ActivityMode))
             tp.ShowPopup('Menu-Activity-open-{}'.format(self.GUIHost.ActivityMode))
         
-        self.__ConfirmationTimer = Timer(1, self.__ConfirmationHandler)
+        self.__ConfirmationTimer = ServiceTimer(1, self.__ConfirmationHandler)
         self.__ConfirmationTimer.Stop()
         
-        self.__SwitchTimer = Timer(1, self.__SwitchTimerHandler)
+        self.__SwitchTimer = ServiceTimer(1, self.__SwitchTimerHandler)
         self.__SwitchTimer.Stop()
         
-        self.__StartTimer = Timer(1, self.__StartUpTimerHandler)
+        self.__StartTimer = ServiceTimer(1, self.__StartUpTimerHandler)
         self.__StartTimer.Stop()
         
-        self.__ShutdownTimer = Timer(1, self.__ShutdownTimerHandler)
+        self.__ShutdownTimer = ServiceTimer(1, self.__ShutdownTimerHandler)
         self.__ShutdownTimer.Stop()
         
-        self.__InitPageTimer = Timer(60, self.__InitPageTimerHandler)
+        self.__InitPageTimer = ServiceTimer(60, self.__InitPageTimerHandler)
         self.__InitPageTimer.TriggerTime = self.GUIHost.Timers['initPage']
         self.__InitPageTimer.LastInactivity = {}
         self.__InitPageTimer.PanelInactivity = {}
@@ -131,11 +131,11 @@ class ActivityController:
         
         self.__ActivitySplashTimerList = []
         for i in range(len(self.GUIHost.TPs)):
-            self.__ActivitySplashTimerList.insert(i, Timer(1, self.__ActivitySplashWaitHandler))
+            self.__ActivitySplashTimerList.insert(i, ServiceTimer(1, self.__ActivitySplashWaitHandler))
             self.__ActivitySplashTimerList[i].TPIndex = i
             self.__ActivitySplashTimerList[i].Stop()
         
-        self.__StatusTimer = Timer(5, self.__StatusTimerHandler)
+        self.__StatusTimer = ServiceTimer(5, self.__StatusTimerHandler)
         self.__StatusTimer.Stop()
         
         for set in self.__ActivityBtns['select']:
@@ -151,9 +151,7 @@ class ActivityController:
         def CancelShutdown(button: 'Button', action: str):
             self.__CancelShutdown(button, action)
         
-        @event(self.__SwitchTimer, 'StateChanged') # pragma: no cover
-        def SwitchTimerStateHandler(timer: 'Timer', state: str):
-            self.__SwitchTimerStateHandler(timer, state)
+        self.__SwitchTimer.StateChanged = self.__SwitchTimerStateHandler
 
         @event(self.__AllSplashBtns, 'Pressed') # pragma: no cover
         def SplashScreenHandler(button: 'Button', action: str):
@@ -210,7 +208,7 @@ class ActivityController:
         for tp in self.GUIHost.TPs:
             tp.HidePopup("Shutdown-Confirmation")
     
-    def __SwitchTimerStateHandler(self, timer: 'Timer', state: str):
+    def __SwitchTimerStateHandler(self, timer: 'ServiceTimer', state: str):
         if state == 'Stopped':
             if self.CurrentActivity == 'share' or self.CurrentActivity == 'group_work':
                 for timer in self.__ActivitySplashTimerList:
@@ -220,14 +218,14 @@ class ActivityController:
         for tp in self.GUIHost.TPs:
             tp.ShowPage('Opening')
         
-    def __CloseTipHandler(self, timer: Timer):
+    def __CloseTipHandler(self, timer: ServiceTimer):
         timer.Stop()
         page = self.GUIHost.TPs[timer.TPIndex].SrcCtl.SelectedSource.SourceControlPage 
         if page == 'PC':
             page = '{p}_{c}'.format(p=page, c=len(self.GUIHost.Cameras))
         self.GUIHost.TPs[timer.TPIndex].ShowPopup("Source-Control-{}".format(page))
     
-    def __StatusTimerHandler(self, timer: Timer, count: int):
+    def __StatusTimerHandler(self, timer: ServiceTimer, count: int):
         if self.CurrentActivity == 'share':
             for tp in self.GUIHost.TPs:
                 tp.SrcCtl.SourceAlertHandler()
@@ -239,14 +237,14 @@ class ActivityController:
             for tp in self.GUIHost.TPs:
                 tp.SrcCtl.SourceAlertHandler()
     
-    def __ActivitySplashWaitHandler(self, timer: Timer, count: int):
+    def __ActivitySplashWaitHandler(self, timer: ServiceTimer, count: int):
         timeTillClose = self.__SplashTime - count
         self.GUIHost.TPs[timer.TPIndex].Btns['Activity-Splash-Close'].SetText('Close Tip ({})'.format(timeTillClose))
         
         if count > self.__SplashTime:
             self.__CloseTipHandler(timer)
     
-    def __ConfirmationHandler(self, timer: Timer, count: int) -> None:
+    def __ConfirmationHandler(self, timer: ServiceTimer, count: int) -> None:
         timeTillShutdown = self.__ConfirmationTime - count
 
         for i in range(len(self.GUIHost.TPs)):
@@ -256,7 +254,7 @@ class ActivityController:
             timer.Stop()
             self.SystemShutdown()
     
-    def __StartUpTimerHandler(self, timer: Timer, count: int) -> None:
+    def __StartUpTimerHandler(self, timer: ServiceTimer, count: int) -> None:
         timeRemaining = self.__StartupTime - count
 
         for i in range(len(self.GUIHost.TPs)):
@@ -273,7 +271,7 @@ class ActivityController:
             # Log('System started in {} mode'.format(self.CurrentActivity))
             self.SystemSwitch(self.CurrentActivity)
                 
-    def __SwitchTimerHandler(self, timer: Timer, count: int) -> None:
+    def __SwitchTimerHandler(self, timer: ServiceTimer, count: int) -> None:
         timeRemaining = self.__SwitchTime - count
 
         for i in range(len(self.GUIHost.TPs)):
@@ -291,7 +289,7 @@ class ActivityController:
                 tp.HidePopup('Power-Transition')
             # Log('System configured in {} mode'.format(self.CurrentActivity))
     
-    def __ShutdownTimerHandler(self, timer: Timer, count: int) -> None:
+    def __ShutdownTimerHandler(self, timer: ServiceTimer, count: int) -> None:
         timeRemaining = self.__ShutdownTime - count
 
         for i in range(len(self.GUIHost.TPs)):
@@ -309,7 +307,7 @@ class ActivityController:
                 tp.HidePopup('Power-Transition')
             # Log('System shutdown')
     
-    def __InitPageTimerHandler(self, timer: Timer, count: int) -> None:
+    def __InitPageTimerHandler(self, timer: ServiceTimer, count: int) -> None:
         for tp in self.GUIHost.TPs:
             if self.CurrentActivity == 'off':
                 if tp.InactivityTime > timer.LastInactivity[tp.Id]:
@@ -329,8 +327,15 @@ class ActivityController:
     def __ActivitySwitchTPConfiguration(self, activity, touchPanel: 'ExUIDevice'):
         index = self.GUIHost.TPs.index(touchPanel)
         
-        # update system audio destination
-        touchPanel.SrcCtl.SystemAudioFollowDestination = touchPanel.SrcCtl.PrimaryDestination
+        # routing presets tagged with this activity replace the default routing
+        preset = touchPanel.SrcCtl.PresetCtl.GetPresetByActivity(activity)
+        
+        if preset is None:
+            # update system audio destination
+            touchPanel.SrcCtl.SystemAudioFollowDestination = touchPanel.SrcCtl.PrimaryDestination
+        else:
+            # the preset is recalled once by SystemSwitch, only this panel's UI is updated here
+            touchPanel.SrcCtl.ShowPreset(preset)
         
         if activity == "share":
             self.__ActivityBtns['select'][index].SetCurrent(1)
@@ -354,7 +359,8 @@ class ActivityController:
                 touchPanel.SrcCtl.Privacy = 'on'
             
             # update source selection to match primaryDestination
-            touchPanel.SrcCtl.SwitchSources(curSrc, 'All')
+            if preset is None:
+                touchPanel.SrcCtl.SwitchSources(curSrc, 'All')
             
             # show activity splash screen, will be updated config.activitySplash
             # seconds after the activity switch timer stops
@@ -394,7 +400,8 @@ class ActivityController:
             touchPanel.SrcCtl.SelectSource(touchPanel.SrcCtl.PrimaryDestination.GroupWorkSource)
             for dest in touchPanel.SrcCtl.Destinations:
                 dest = cast('Destination', dest)
-                touchPanel.SrcCtl.SwitchSources(dest.GroupWorkSource, [dest])
+                if preset is None:
+                    touchPanel.SrcCtl.SwitchSources(dest.GroupWorkSource, [dest])
                 if dest.Type == 'mon' and dest is not touchPanel.SrcCtl.SystemAudioFollowDestination:
                     dest.DestAudioFeedbackHandler(2)
             touchPanel.SrcCtl.Privacy = 'off'
@@ -465,6 +472,11 @@ class ActivityController:
         
         for tp in self.GUIHost.TPs:
             self.__ActivitySwitchTPConfiguration(activity, tp)
+        
+        # routing presets are sent to the room once, not once per panel
+        preset = self.GUIHost.SrcCtl.PresetCtl.GetPresetByActivity(activity)
+        if preset is not None:
+            self.GUIHost.SrcCtl.RecallPreset(preset)
 
         self.__Transition['switch']['init']()
 
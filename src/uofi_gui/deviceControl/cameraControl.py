@@ -24,14 +24,12 @@ if TYPE_CHECKING: # pragma: no cover
     
 ## Begin ControlScript Import --------------------------------------------------
 from extronlib import event
-from extronlib.system import File
 
 ## End ControlScript Import ----------------------------------------------------
 ##
 ## Begin Python Imports --------------------------------------------------------
 import re
 import functools
-import json
 
 ## End Python Imports ----------------------------------------------------------
 ##
@@ -39,6 +37,7 @@ import json
 #### Custom Code Modules
 from uofi_gui.systemHardware import SystemHardwareController
 from utilityFunctions import DictValueSearchByKey, Log, RunAsync, debug
+from uofi_gui.stateStore import States
 
 ## End User Import -------------------------------------------------------------
 ##
@@ -272,59 +271,23 @@ class CameraController:
 
     def SavePresetStates(self):
         # only need to save the preset names, presets are stored presistently on camera
-        if File.Exists(self.__PresetsFilePath):
-            # file exists -> read file to object, modify object, save object to file
-            #### read file to object
-            presetsFile = File(self.__PresetsFilePath, 'rt')
-            presetString = presetsFile.read()
-            presetObj = json.loads(presetString)
-            presetsFile.close()
-            
-            #### modify object
-            for cam in self.Cameras.values():
-                if cam['Id'] not in presetObj:
-                    presetObj[cam['Id']] = {}
-                    
-                for i in range(1, 4): # Preset 0 is home, Presets 1-3 are displayed buttons
-                    if i in cam['Hw'].Presets:
-                        presetObj[cam['Id']][i] = cam['Hw'].Presets[i]
-                    else:
-                        presetObj[cam['Id']][i] = None
-            
-            #### save object to file
-            presetsFile = File(self.__PresetsFilePath, 'wt')
-            presetsFile.write(json.dumps(presetObj))
-            presetsFile.close()
-        else:
-            # file does not exist -> create object, save object to file
-            #### create object
-            presetObj = {}
-            
-            for cam in self.Cameras.values():
-                # Log('Cam Info: {}'.format(cam))
-                presetObj[cam['Id']] = {}
-                
-                for i in range(1, 4): # Preset 0 is home, Presets 1-3 are displayed buttons
-                    if i in cam['Hw'].Presets:
-                        presetObj[cam['Id']][i] = cam['Hw'].Presets[i]
-                    else:
-                        presetObj[cam['Id']][i] = None
-            
-            #### save object to file
-            presetsFile = File(self.__PresetsFilePath, 'xt')
-            presetsFile.write(json.dumps(presetObj))
-            presetsFile.close()
+        presetObj = {}
+        for cam in self.Cameras.values():
+            presetObj[cam['Id']] = {}
+            for i in range(1, 4): # Preset 0 is home, Presets 1-3 are displayed buttons
+                if i in cam['Hw'].Presets:
+                    presetObj[cam['Id']][i] = cam['Hw'].Presets[i]
+                else:
+                    presetObj[cam['Id']][i] = None
+        
+        # merged into the shared presets document, which is written to file
+        # once editing settles
+        States.Update(self.__PresetsFilePath, presetObj)
     
     def LoadPresetStates(self):
         # only need to load the preset names, presets are stored presistently on camera
-        if File.Exists(self.__PresetsFilePath):
-            #### read file to object
-            presetsFile = File(self.__PresetsFilePath, 'rt')
-            presetString = presetsFile.read()
-            presetObj = json.loads(presetString)
-            # Log('JSON Obj: {}'.format(presetObj))
-            presetsFile.close()
-            
+        presetObj = States.Get(self.__PresetsFilePath)
+        if presetObj is not None:
             #### iterate over objects and load presets
             for cam in self.Cameras.values():
                 if cam['Id'] in presetObj:
@@ -341,6 +304,8 @@ class CameraController:
         NameBtn.SetText(PresetName)
     
     def UpdatePresetButtons(self):
+        if self.__SelectBtns.GetCurrent() is None:
+            return
         camHW = self.__SelectBtns.GetCurrent().camera['Hw']
         for presetBtn in self.__PresetBtns:
             PresetName = presetBtn.defaultText
@@ -78,6 +78,7 @@ class DisplayController:
                     self.__ControlList.append(ctl)
         
         self.Destinations = {}
+        self.ScreenPosition = {}
         conf_assign = 1
         mon_assign = 1
         proj_assign = 1
@@ -143,6 +144,7 @@ class DisplayController:
                         
                     # instanciate projector screen relay control
                     self.Destinations[dest['id']]['Scn'] = {}
+                    self.ScreenPosition[dest['id']] = None # relays provide no feedback, position unknown until sent
                     if type(self.Destinations[dest['id']]['rly'][0]) is int:
                         self.Destinations[dest['id']]['Scn']['up'] = RelayInterface(self.GUIHost.CtlProc_Main, 'RLY{}'.format(self.Destinations[dest['id']]['rly'][0]))
                         self.Destinations[dest['id']]['Scn']['up'].SetState('Open')
@@ -283,6 +285,7 @@ class DisplayController:
             elif control.CtlType == 'Up':
                 # send screen up
                 self.Destinations[control.DestID]['Scn']['up'].Pulse(2)
+                self.ScreenPosition[control.DestID] = 'up'
                 # Log('Pulse Up Relay')
                 @Wait(3) # pragma: no cover
                 def delayFeedbackHandler():
@@ -290,6 +293,7 @@ class DisplayController:
             elif control.CtlType == 'Dn':
                 # send screen down
                 self.Destinations[control.DestID]['Scn']['dn'].Pulse(2)
+                self.ScreenPosition[control.DestID] = 'down'
                 # Log('Pulse Down Relay')
                 @Wait(3) # pragma: no cover
                 def delayFeedbackHandler():
@@ -299,6 +303,7 @@ class DisplayController:
                 # This assumes that the screen stop command is to close both the up and down contact closures
                 self.Destinations[control.DestID]['Scn']['up'].Pulse(2)
                 self.Destinations[control.DestID]['Scn']['dn'].Pulse(2)
+                self.ScreenPosition[control.DestID] = None
                 # Log('Pulse Up & Down Relays')
                 @Wait(3) # pragma: no cover
                 def delayFeedbackHandler():
@@ -316,8 +321,75 @@ class DisplayController:
     
     # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
+    def __GetDestHardware(self, dest: Union[str, 'Destination']):
+        if type(dest) is str:
+            return self.Destinations[dest]['hw']
+        elif type(dest) is Destination:
+            return self.Destinations[dest.Id]['hw']
+        else:
+            raise TypeError("Dest must either by a string destination ID or a Destination object")
+    
     # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
+    def GetDisplayPower(self, dest: Union[str, 'Destination']) -> str:
+        """Get the last confirmed power state of a display.
+
+        Args:
+            dest (Union[str, Destination]): Destination Id or Destination object
+
+        Returns:
+            str: 'On', 'Off', or None if the display has not reported a state
+        """        
+        Hw = self.__GetDestHardware(dest)
+        
+        if Hw is None or not hasattr(Hw, 'PowerCommand'):
+            return None
+        
+        state = Hw.interface.ReadStatus(Hw.PowerCommand['command'], Hw.PowerCommand.get('qualifier', None))
+        if state in ['On', 'on', 'Power On', 'Warming', 'Warming up']:
+            return 'On'
+        elif state in ['Off', 'off', 'Power Off', 'Standby (Power Save)', 'Suspend (Power Save)', 'Cooling', 'Cooling down']:
+            return 'Off'
+        return None
+    
+    def GetDisplaySourceConfirmed(self, dest: Union[str, 'Destination']) -> bool:
+        """Check if a display has confirmed it is set to its default input.
+
+        Args:
+            dest (Union[str, Destination]): Destination Id or Destination object
+
+        Returns:
+            bool: True if the display reports its configured input
+        """        
+        Hw = self.__GetDestHardware(dest)
+        
+        if Hw is None or not hasattr(Hw, 'SourceCommand') or 'value' not in Hw.SourceCommand:
+            return False
+        
+        state = Hw.interface.ReadStatus(Hw.SourceCommand['command'], Hw.SourceCommand.get('qualifier', None))
+        return state == Hw.SourceCommand['value']
+    
+    def SetScreenPosition(self, dest: Union[str, 'Destination'], position: str) -> None:
+        if type(dest) is str:
+            destId = dest
+        elif type(dest) is Destination:
+            destId = dest.Id
+        else:
+            raise TypeError("Dest must either by a string destination ID or a Destination object")
+        
+        if 'Scn' not in self.Destinations[destId]:
+            raise LookupError('Destination ({}) has no screen control'.format(destId))
+        
+        if position == 'up':
+            self.Destinations[destId]['Scn']['up'].Pulse(2)
+        elif position == 'down':
+            self.Destinations[destId]['Scn']['dn'].Pulse(2)
+        else:
+            raise ValueError("Screen position must be 'up' or 'down'")
+        
+        self.ScreenPosition[destId] = position
+    
+    
     def SetDisplayPower(self, dest: Union[str, 'Destination'], state: str='On'):
         if type(dest) is str:
             Hw = self.Destinations[dest]['hw']
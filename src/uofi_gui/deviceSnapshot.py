@@ -0,0 +1,166 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import TYPE_CHECKING, Dict, Tuple, List, Union, Callable
+if TYPE_CHECKING: # pragma: no cover
+    from uofi_gui import GUIController
+
+## Begin ControlScript Import --------------------------------------------------
+
+## End ControlScript Import ----------------------------------------------------
+##
+## Begin Python Imports --------------------------------------------------------
+import time
+
+## End Python Imports ----------------------------------------------------------
+##
+## Begin User Import -----------------------------------------------------------
+#### Custom Code Modules
+from utilityFunctions import Log
+from uofi_gui.stateStore import States
+from uofi_gui.timerService import ServiceTimer
+
+#### Extron Global Scripter Modules
+
+## End User Import -------------------------------------------------------------
+##
+## Begin Class Definitions -----------------------------------------------------
+
+class DeviceSnapshot:
+    """Warm-start snapshot of the last known device status.
+
+    Every Interval seconds the status table of each hardware driver with
+    changes in the status journal is compared with the last snapshot and
+    changed tables are saved to /user/states. At boot the snapshot is
+    restored as provisional status, marked stale until the device confirms
+    it, so the UI renders the last known state before the first poll
+    completes, and the startup poll skips status the devices have already
+    confirmed.
+    """
+    def __init__(self, GUIHost: 'GUIController', Interval: int=300, Path: str='/user/states/device_snapshot.json') -> None:
+        self.GUIHost = GUIHost
+        self.Interval = Interval
+        self.Path = Path
+
+        self.__Last = {}
+        self.__Interfaces = {}
+        self.__JournalSeq = 0
+
+        self.__SnapshotTimer = ServiceTimer(self.Interval, self.__SnapshotHandler)
+        self.__SnapshotTimer.Stop()
+
+        self.Snapshots = 0
+        self.Restored = 0
+
+    # Event Handlers +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __SnapshotHandler(self, timer: 'ServiceTimer', count: int) -> None:
+        self.Snapshot()
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Start(self) -> None:
+        self.__SnapshotTimer.Restart()
+
+    def Stop(self) -> None:
+        self.__SnapshotTimer.Stop()
+
+    def Snapshot(self) -> int:
+        """Saves the status tables which changed since the last snapshot.
+
+        Returns:
+            int: number of hardware status tables saved
+        """
+        # only hardware with journaled changes is read, unless the journal
+        # no longer holds every change since the last snapshot
+        seq, entries, tables = self.GUIHost.Journal.Changes(self.__JournalSeq)
+        self.__JournalSeq = seq
+        if tables is None:
+            tables = {}
+            for hwId in dict.fromkeys([entry.HardwareId for entry in entries]):
+                hw = self.GUIHost.Hardware.get(hwId, None)
+                if hw is None:
+                    continue
+                try:
+                    tables[hwId] = hw.StatusTable()
+                except Exception as inst:
+                    Log('Status table for {} could not be read ({}: {})', 'warning',
+                        args=(hwId, type(inst), inst), hardwareId=hwId)
+
+        changed = {}
+        for hwId, table in tables.items():
+            if table != self.__Last.get(hwId, None):
+                self.__Last[hwId] = table
+                changed[hwId] = table
+
+        if len(changed) > 0:
+            States.Update(self.Path, {'time': time.time(), 'hardware': changed})
+            self.Snapshots += 1
+        return len(changed)
+
+    def Restore(self) -> int:
+        """Restores the saved snapshot as provisional status.
+
+        Returns:
+            int: number of status entries restored
+        """
+        snapshot = States.Get(self.Path, {})
+        restored = 0
+        for hwId, table in snapshot.get('hardware', {}).items():
+            if hwId not in self.GUIHost.Hardware:
+                continue
+            hw = self.GUIHost.Hardware[hwId]
+            hw.RestoreStatus(table)
+            restored += len(hw.ProvisionalStatus)
+            # the restored table is the baseline for the next snapshot
+            self.__Last[hwId] = table
+
+        self.Restored = restored
+        if restored > 0:
+            Log('Restored {} provisional status entries from snapshot ({:.0f} s old)',
+                args=(restored, time.time() - snapshot.get('time', time.time())))
+        return restored
+
+    def PollPriority(self, poll: Dict) -> int:
+        """Sort key for SystemPollingController.PollEverything. Commands with no
+        known status are polled first, followed by commands showing stale
+        provisional status, followed by everything else.
+        """
+        hw = self.__Interfaces.get(id(poll['interface']), None)
+        if hw is None:
+            self.__Interfaces = {id(hw.interface): hw for hw in self.GUIHost.Hardware.values()}
+            hw = self.__Interfaces.get(id(poll['interface']), None)
+            if hw is None:
+                return 0
+        
+        if hw.IsStale(poll['command'], poll['qualifier']):
+            return 1
+        if hw.GetStatus(poll['command'], poll['qualifier']) is None:
+            return 0
+        return 2
+
+    def NeedsPoll(self, poll: Dict) -> bool:
+        """Filter for SystemPollingController.PollEverything. Only commands
+        with no known status or with stale provisional status need the
+        startup poll, confirmed status is kept current by regular polling.
+        """
+        return self.PollPriority(poll) < 2
+
+## End Class Definitions -------------------------------------------------------
+##
+## Begin Function Definitions --------------------------------------------------
+
+## End Function Definitions ----------------------------------------------------
@@ -0,0 +1,370 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import TYPE_CHECKING, Dict, Tuple, List, Union, Callable
+
+## Begin ControlScript Import --------------------------------------------------
+
+## End ControlScript Import ----------------------------------------------------
+##
+## Begin Python Imports --------------------------------------------------------
+import re
+
+## End Python Imports ----------------------------------------------------------
+##
+## Begin User Import -----------------------------------------------------------
+#### Custom Code Modules
+
+#### Extron Global Scripter Modules
+
+## End User Import -------------------------------------------------------------
+##
+## Begin Class Definitions -----------------------------------------------------
+
+class FrameReceiver:
+    """Incremental receive buffer for delimiter-terminated device protocols.
+
+    Received bytes are appended to a bytearray and each complete frame,
+    including its delimiter, is passed to Callback in the order received.
+    Only bytes which have not been searched before are searched for the
+    delimiter, so a frame split across many reads is not re-scanned. A
+    partial frame longer than MaxFrameSize is discarded.
+    """
+    def __init__(self, Delimiter: bytes, Callback: Callable[[bytes], None], MaxFrameSize: int=4096) -> None:
+        if type(Delimiter) is not bytes or len(Delimiter) == 0:
+            raise ValueError('Delimiter must be a non-empty bytes object')
+
+        self.Delimiter = Delimiter
+        self.Callback = Callback
+        self.MaxFrameSize = MaxFrameSize
+
+        self.__Buffer = bytearray()
+        self.__Searched = 0
+
+        self.Frames = 0
+        self.Overflows = 0
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Receive(self, data: bytes) -> int:
+        """Adds received data to the buffer and passes on every completed frame.
+
+        Args:
+            data (bytes): data received from the device
+
+        Returns:
+            int: number of frames completed
+        """
+        buffer = self.__Buffer
+        buffer.extend(data)
+
+        # a delimiter may have been split across reads
+        frames = []
+        start = 0
+        pos = buffer.find(self.Delimiter, max(self.__Searched - len(self.Delimiter) + 1, 0))
+        while pos != -1:
+            end = pos + len(self.Delimiter)
+            frames.append(bytes(buffer[start:end]))
+            start = end
+            pos = buffer.find(self.Delimiter, start)
+
+        if start > 0:
+            del buffer[:start]
+        if len(buffer) > self.MaxFrameSize:
+            buffer.clear()
+            self.Overflows += 1
+        self.__Searched = len(buffer)
+
+        # the buffer is settled before callbacks run, so a callback may
+        # safely raise or feed more data
+        self.Frames += len(frames)
+        for frame in frames:
+            self.Callback(frame)
+        return len(frames)
+
+    def Pending(self) -> bytes:
+        """Returns the partial frame waiting for its delimiter."""
+        return bytes(self.__Buffer)
+
+    def Reset(self) -> None:
+        self.__Buffer.clear()
+        self.__Searched = 0
+
+class PrefixDispatcher:
+    """Routes complete frames to match strings by a fixed message key.
+
+    Each match string is registered under the keys of the messages it can
+    match, usually the command or parameter name at a fixed position in the
+    message. A frame is only tried against the match strings registered
+    under its key. Match strings registered without keys, and frames whose
+    key has no match, fall back to trying every unkeyed match string.
+    """
+    def __init__(self, MessageKey: Callable[[bytes], bytes]=None) -> None:
+        self.MessageKey = MessageKey
+
+        self.__Keyed = {}
+        self.__Fallback = []
+        self.__Patterns = set()
+
+        self.Keyed = 0
+        self.Fallbacks = 0
+        self.Unmatched = 0
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    @staticmethod
+    def __Try(entries: List[Tuple], frame: bytes) -> bool:
+        for pattern, callback, arg in entries:
+            result = pattern.search(frame)
+            if result:
+                callback(result, arg)
+                return True
+        return False
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Add(self, Pattern, Callback: Callable, Arg=None, Keys: List[bytes]=None) -> bool:
+        """Registers a compiled match string. A match string is only
+        registered once.
+
+        Args:
+            Pattern (Pattern): compiled regular expression
+            Callback (Callable): called with the match object and Arg
+            Arg (Any, optional): passed to Callback. Defaults to None.
+            Keys (List[bytes], optional): message keys the match string
+                applies to. Defaults to None, tried for every frame.
+
+        Returns:
+            bool: False if the match string was already registered
+        """
+        if Pattern in self.__Patterns:
+            return False
+        self.__Patterns.add(Pattern)
+
+        entry = (Pattern, Callback, Arg)
+        if Keys:
+            for key in Keys:
+                self.__Keyed.setdefault(key, []).append(entry)
+        else:
+            self.__Fallback.append(entry)
+        return True
+
+    def Dispatch(self, Frame: bytes, Key: bytes=None) -> bool:
+        """Passes the first match for a frame to its callback.
+
+        Args:
+            Frame (bytes): complete frame
+            Key (bytes, optional): message key. Defaults to MessageKey(Frame).
+
+        Returns:
+            bool: True if a match string matched the frame
+        """
+        if Key is None and self.MessageKey is not None:
+            Key = self.MessageKey(Frame)
+
+        entries = self.__Keyed.get(Key, None)
+        if entries is not None and self.__Try(entries, Frame):
+            self.Keyed += 1
+            return True
+        if self.__Try(self.__Fallback, Frame):
+            self.Fallbacks += 1
+            return True
+        self.Unmatched += 1
+        return False
+
+class BlockMatcher:
+    """Matches match strings against multi-line message blocks.
+
+    Some devices answer a status request with a block of lines, starting
+    with a header line, which match strings span. Complete lines are added
+    to the open block and a line starting with Header closes it, so every
+    block in a read is matched on its own and none hide behind another.
+    The open block may be matched as lines arrive; each match string only
+    calls back again for a block when its matched values change.
+
+    Blocks of "key<Separator>value" lines may instead be read as fields.
+    Each line is split once as it arrives into the block's record, unknown
+    keys included, and a field set calls back only when all of its keys
+    are present and its values differ from the last values it was called
+    back with, in this or any earlier block.
+    """
+    def __init__(self, Header: bytes, MaxBlockSize: int=4096, Separator: bytes=b':') -> None:
+        if type(Header) is not bytes or len(Header) == 0:
+            raise ValueError('Header must be a non-empty bytes object')
+
+        self.Header = Header
+        self.MaxBlockSize = MaxBlockSize
+        self.Separator = Separator
+
+        self.__MatchStrings = []
+        self.__Patterns = set()
+        self.__Block = bytearray()
+        self.__Matched = {}
+        self.__FieldSets = []
+        self.__Record = {}
+
+        self.Blocks = 0
+        self.Matches = 0
+        self.Overflows = 0
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __Close(self) -> None:
+        self.Match()
+        self.__Clear()
+        self.Blocks += 1
+
+    def __Clear(self) -> None:
+        self.__Block.clear()
+        self.__Matched.clear()
+        self.__Record.clear()
+
+    def __MatchFields(self) -> int:
+        record = self.__Record
+        count = 0
+        for fieldSet in self.__FieldSets:
+            fields, callback, arg, last = fieldSet
+            values = []
+            for key, pattern in fields:
+                value = record.get(key, None)
+                if value is None or (pattern is not None and pattern.fullmatch(value) is None):
+                    break
+                values.append(value)
+            else:
+                values = tuple(values)
+                if values != last:
+                    fieldSet[3] = values
+                    callback({key: value for (key, _), value in zip(fields, values)}, arg)
+                    count += 1
+        return count
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Add(self, Pattern, Callback: Callable, Arg=None) -> bool:
+        """Registers a compiled match string. A match string is only
+        registered once.
+
+        Args:
+            Pattern (Pattern): compiled regular expression
+            Callback (Callable): called with the match object and Arg
+            Arg (Any, optional): passed to Callback. Defaults to None.
+
+        Returns:
+            bool: False if the match string was already registered
+        """
+        if Pattern in self.__Patterns:
+            return False
+        self.__Patterns.add(Pattern)
+        self.__MatchStrings.append((Pattern, Callback, Arg))
+        return True
+
+    def AddFields(self, Fields: Tuple[Tuple], Callback: Callable, Arg=None) -> None:
+        """Registers a field set.
+
+        Args:
+            Fields (Tuple[Tuple]): (key, Pattern) pairs, a field only counts as
+                present if Pattern fully matches its value. Pattern may be
+                None to accept any value.
+            Callback (Callable): called with a dict of the field values by key
+                and Arg
+            Arg (Any, optional): passed to Callback. Defaults to None.
+        """
+        self.__FieldSets.append([tuple(Fields), Callback, Arg, None])
+
+    def Line(self, Line: bytes) -> None:
+        """Adds a complete line to the open block. A header line first
+        closes the open block, matching anything not yet matched.
+
+        Args:
+            Line (bytes): complete line, including its terminator
+        """
+        if Line.startswith(self.Header) and len(self.__Block) > 0:
+            self.__Close()
+
+        self.__Block.extend(Line)
+        if len(self.__Block) > self.MaxBlockSize:
+            self.__Clear()
+            self.Overflows += 1
+        elif len(self.__FieldSets) > 0:
+            key, sep, value = Line.rstrip(b'\r\n').partition(self.Separator)
+            if sep:
+                self.__Record[key] = value
+
+    def Match(self) -> int:
+        """Matches the open block, calling back for each match string and
+        field set whose values changed.
+
+        Returns:
+            int: number of callbacks called
+        """
+        if len(self.__Block) == 0:
+            return 0
+
+        count = self.__MatchFields()
+        block = bytes(self.__Block) if len(self.__MatchStrings) > 0 else b''
+        for pattern, callback, arg in self.__MatchStrings:
+            result = pattern.search(block)
+            if result is None:
+                continue
+            values = result.groups()
+            if self.__Matched.get(pattern, None) == values:
+                continue
+            self.__Matched[pattern] = values
+            callback(result, arg)
+            count += 1
+
+        self.Matches += count
+        return count
+
+    def Pending(self) -> bytes:
+        """Returns the open block."""
+        return bytes(self.__Block)
+
+    def Reset(self) -> None:
+        self.__Clear()
+
+    def Refresh(self) -> None:
+        """Forgets the values field sets were last called back with, so each
+        calls back again with its next values."""
+        for fieldSet in self.__FieldSets:
+            fieldSet[3] = None
+
+## End Class Definitions -------------------------------------------------------
+##
+## Begin Function Definitions --------------------------------------------------
+
+_PatternCache = {}
+
+def SharedPattern(Pattern: bytes, Flags: int=0):
+    """Returns the compiled match string for a pattern, compiling it the first
+    time it is asked for. Every driver instance shares the one compiled
+    object, independent of the size of the re module cache.
+
+    Args:
+        Pattern (bytes): regular expression
+        Flags (int, optional): re flags. Defaults to 0.
+
+    Returns:
+        Pattern: compiled regular expression
+    """
+    key = (Pattern, Flags)
+    compiled = _PatternCache.get(key, None)
+    if compiled is None:
+        compiled = re.compile(Pattern, Flags)
+        _PatternCache[key] = compiled
+    return compiled
+
+## End Function Definitions ----------------------------------------------------
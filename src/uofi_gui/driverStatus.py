@@ -0,0 +1,300 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import TYPE_CHECKING, Dict, Tuple, List, Union, Callable
+
+## Begin ControlScript Import --------------------------------------------------
+
+## End ControlScript Import ----------------------------------------------------
+##
+## Begin Python Imports --------------------------------------------------------
+from operator import itemgetter
+
+## End Python Imports ----------------------------------------------------------
+##
+## Begin User Import -----------------------------------------------------------
+#### Custom Code Modules
+
+#### Extron Global Scripter Modules
+
+## End User Import -------------------------------------------------------------
+##
+## Begin Class Definitions -----------------------------------------------------
+
+# marks a status value which has never been written, and is the key of a
+# status written without a qualifier. None is a valid value and key.
+_Missing = object()
+
+class StatusStore:
+    """Flat, versioned store of a driver's status and status subscriptions.
+
+    Each command has one flat table of status values, keyed by the qualifier
+    value of its single parameter, or a tuple of the qualifier values in
+    Parameters order, replacing the nested Commands[command]['Status'] dicts
+    which were walked one parameter at a time. Every write which changes a
+    value is given the next version number. Subscriptions follow the driver
+    convention: a status change notifies the callback of the most specific
+    subscribed qualifier along its path, or of the nearest subscribed
+    ancestor if there is none. ChangeHook, if set, is called with
+    the command, qualifier, old and new value of every change.
+    """
+    def __init__(self, Commands: Dict) -> None:
+        self.Commands = Commands
+
+        # command: (key getter, status table, versions, callback targets, parameters)
+        self.__Entries = {}
+        self.__Callbacks = {}
+        self.__Nodes = set()
+
+        self.LastVersion = 0
+        self.ChangeHook = None
+
+        for command in Commands:
+            self.__AddCommand(command)
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __AddCommand(self, command: str) -> Tuple:
+        # raises KeyError for a command the driver does not have, as reading
+        # the nested status dicts did
+        cmdDict = self.Commands[command]
+        params = tuple(cmdDict.get('Parameters', [])) if type(cmdDict) is dict else ()
+        if len(params) == 0:
+            # qualifiers of commands without parameters are ignored
+            getter = lambda qualifier: _Missing
+        else:
+            getter = itemgetter(*params)
+        entry = self.__Entries[command] = (getter, {}, {}, {}, params)
+        return entry
+
+    def __Path(self, command: str, qualifier: Dict) -> Tuple:
+        return (command,) + tuple([qualifier[param] for param in self.__Entries[command][4]])
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Key(self, command: str, qualifier: Dict=None):
+        """Returns the key of a status value in its command's table, or None
+        if the qualifier is missing one of the command's parameters.
+        """
+        entry = self.__Entries.get(command, None) or self.__AddCommand(command)
+        if not qualifier:
+            return _Missing
+        try:
+            return entry[0](qualifier)
+        except KeyError:
+            return None
+
+    def Write(self, command: str, value, qualifier: Dict=None) -> bool:
+        """Saves a status value.
+
+        Returns:
+            bool: True if the value changed, the caller should then notify
+                subscribers
+        """
+        # Key() is inlined, this runs for every status message a driver receives
+        try:
+            entry = self.__Entries[command]
+        except KeyError:
+            entry = self.__AddCommand(command)
+        table = entry[1]
+        if qualifier:
+            try:
+                key = entry[0](qualifier)
+            except KeyError:
+                return False
+        else:
+            key = _Missing
+        old = table.get(key, _Missing)
+        if old == value:
+            return False
+        table[key] = value
+        entry[2][key] = self.LastVersion = self.LastVersion + 1
+        if self.ChangeHook is not None:
+            self.ChangeHook(command, qualifier, None if old is _Missing else old, value)
+        return True
+
+    def Read(self, command: str, qualifier: Dict=None):
+        """Returns a status value, or None if it is not known."""
+        try:
+            entry = self.__Entries[command]
+        except KeyError:
+            entry = self.__AddCommand(command)
+        if qualifier:
+            try:
+                return entry[1].get(entry[0](qualifier), None)
+            except KeyError:
+                return None
+        return entry[1].get(_Missing, None)
+
+    def Items(self) -> List[Tuple[str, Dict, object]]:
+        """Returns (command, qualifier, value) for every status value. Safe to
+        call from any thread, each table is copied before it is read.
+        """
+        items = []
+        for command, (getter, table, versions, targets, params) in list(self.__Entries.items()):
+            if len(table) == 0:
+                continue
+            # dict.copy() runs without releasing the GIL, so a driver thread
+            # writing meanwhile cannot change the table while it is iterated
+            for key, value in table.copy().items():
+                if key is _Missing:
+                    items.append((command, None, value))
+                elif len(params) == 1:
+                    items.append((command, {params[0]: key}, value))
+                else:
+                    items.append((command, dict(zip(params, key)), value))
+        return items
+
+    def Validate(self, command: str, qualifier: Dict=None) -> bool:
+        """Returns False if a qualifier is given which is missing one of the
+        command's parameters. No qualifier is valid, drivers act on every
+        input or output, or use defaults, without one. Commands the driver
+        does not list in Commands take any qualifier.
+        """
+        if not qualifier:
+            return True
+        # Set validates every call, so the key getter is tried first
+        try:
+            self.__Entries[command][0](qualifier)
+        except KeyError:
+            if command in self.__Entries:
+                return False
+            if command not in self.Commands:
+                return True
+            self.__AddCommand(command)
+            return self.Validate(command, qualifier)
+        return True
+
+    def Version(self, command: str, qualifier: Dict=None) -> int:
+        """Returns the version of the last change to a status value, 0 if it
+        has not been written. Versions only increase, so a value changed
+        since version v if Version() > v.
+        """
+        key = self.Key(command, qualifier)
+        return self.__Entries[command][2].get(key, 0)
+
+    def Subscribe(self, command: str, qualifier: Dict, callback: Callable) -> bool:
+        """Sets the callback for a command and qualifier, replacing any
+        earlier callback for the same qualifier.
+
+        Returns:
+            bool: False if the qualifier is missing one of the command's
+                parameters
+        """
+        key = self.Key(command, qualifier)
+        if key is None:
+            return False
+        # the qualifier values along the path to the callback, one per parameter
+        path = (command,) if key is _Missing else self.__Path(command, qualifier)
+        for i in range(1, len(path) + 1):
+            self.__Nodes.add(path[:i])
+        self.__Callbacks[path] = callback
+        for entry in self.__Entries.values():
+            entry[3].clear()
+        return True
+
+    def Target(self, command: str, qualifier: Dict=None) -> Callable:
+        """Returns the callback a status change would be sent to, or None.
+
+        This is the callback of the most specific subscribed qualifier along
+        the status change's path, falling back to the nearest subscribed
+        ancestor, so a subscription to one qualifier does not hide the
+        changes of its siblings from a subscription without a qualifier.
+        """
+        node = (command,)
+        if node not in self.__Nodes:
+            return None
+        callback = self.__Callbacks.get(node, None)
+        if qualifier:
+            for param in self.__Entries[command][4]:
+                if param not in qualifier:
+                    break
+                node = node + (qualifier[param],)
+                if node not in self.__Nodes:
+                    break
+                callback = self.__Callbacks.get(node, callback)
+        return callback
+
+    def Notify(self, command: str, value, qualifier: Dict=None) -> None:
+        """Calls the subscribed callback for a status change."""
+        # the callback of each status key is resolved once, until the next
+        # Subscribe. Key() is inlined as in Write.
+        try:
+            entry = self.__Entries[command]
+        except KeyError:
+            entry = self.__AddCommand(command)
+        targets = entry[3]
+        if qualifier:
+            try:
+                key = entry[0](qualifier)
+            except KeyError:
+                # incomplete qualifiers are not cached
+                callback = self.Target(command, qualifier)
+                if callback:
+                    callback(command, value, qualifier)
+                return
+        else:
+            key = _Missing
+        callback = targets.get(key, _Missing)
+        if callback is _Missing:
+            callback = targets[key] = self.Target(command, qualifier)
+        if callback:
+            callback(command, value, qualifier)
+
+## End Class Definitions -------------------------------------------------------
+##
+## Begin Function Definitions --------------------------------------------------
+
+def CommandMethods(Class: type) -> type:
+    """Driver class decorator, builds the class's SetMethods and UpdateMethods
+    tables once, when the class is created. Each maps a command name to the
+    Set<command> or Update<command> function, so Set() and Update() do not
+    format and resolve the method name on every call.
+    """
+    Class.SetMethods = _MethodTable(Class, 'Set')
+    Class.UpdateMethods = _MethodTable(Class, 'Update')
+    return Class
+
+def AliasCommand(Instance, Prefix: str, Command: str, Target: str) -> None:
+    """Points one driver instance's Set or Update method of Command at the
+    method of Target, as models which update several commands from one
+    status query do. The instance is given its own copy of the class table
+    the first time it is aliased.
+
+    Args:
+        Instance (Any): driver instance
+        Prefix (str): 'Set' or 'Update'
+        Command (str): command to alias
+        Target (str): command whose method Command uses
+    """
+    name = Prefix + 'Methods'
+    table = Instance.__dict__.get(name, None)
+    if table is None:
+        table = dict(getattr(type(Instance), name))
+        setattr(Instance, name, table)
+    table[Command] = table[Target]
+    setattr(Instance, Prefix + Command, getattr(Instance, Prefix + Target))
+
+def _MethodTable(Class: type, Prefix: str) -> Dict[str, Callable]:
+    table = {}
+    # base classes first, so subclass methods override theirs
+    for cls in reversed(Class.__mro__):
+        for name, attr in vars(cls).items():
+            if name.startswith(Prefix) and len(name) > len(Prefix) and callable(attr):
+                table[name[len(Prefix):]] = attr
+    return table
+
+## End Function Definitions ----------------------------------------------------
@@ -20,12 +20,17 @@ from extronlib.device import ProcessorDevice
 
 from typing import Dict, Tuple, List, Callable, Union
 
-from utilityFunctions import Log, RunAsync, debug
+from utilityFunctions import Log, RunAsync, debug, LogBuffer, StructuredLogSink
 
 from uofi_gui.uiObjects import ExUIDevice
 from uofi_gui.activityControls import ActivityController
+from uofi_gui.scheduleControls import ScheduleEngine
+from uofi_gui.deviceSnapshot import DeviceSnapshot
+from uofi_gui.statusJournal import StatusJournal
+from uofi_gui.settingsModel import CompileSettings, DiffSettings, SettingsDiff
 from uofi_gui.systemHardware import (SystemHardwareController,
                                      SystemPollingController, 
+                                     SubscriptionRegistry,
                                      VirtualDeviceInterface)
 
 class ExProcessorDevice(ProcessorDevice):
@@ -50,36 +55,40 @@ class GUIController:
         Log('CtlProcs: {}'.format(CtlProcs))
         Log('TouchPanels: {}'.format(TouchPanels))
         
-        self.CtlJSON = Settings.ctlJSON
-        self.RoomName = Settings.roomName
-        self.ActivityMode = Settings.activityMode
-        self.Timers = \
-            {
-                'startup': Settings.startupTimer,
-                'switch': Settings.switchTimer,
-                'shutdown': Settings.shutdownTimer,
-                'shutdownConf': Settings.shutdownConfTimer,
-                'activitySplash': Settings.activitySplashTimer,
-                'initPage': Settings.initPageTimer
-            }
+        # settings are validated and indexed up front, every error is reported
+        # together before any device is connected
+        self.Config = CompileSettings(Settings)
+        
+        self.CtlJSON = self.Config.CtlJSON
+        self.RoomName = self.Config.RoomName
+        self.ActivityMode = self.Config.ActivityMode
+        self.Timers = dict(self.Config.Timers)
             
-        self.TechMatrixSize = Settings.techMatrixSize
-        self.TechPIN = Settings.techPIN
+        self.TechMatrixSize = self.Config.TechMatrixSize
+        self.TechPIN = self.Config.TechPIN
         
-        self.CameraSwitcherId = Settings.camSwitcher
+        self.CameraSwitcherId = self.Config.CameraSwitcherId
             
-        self.Sources = Settings.sources
-        self.Destinations = Settings.destinations
-        self.Cameras = Settings.cameras
-        self.Microphones = Settings.microphones
-        self.Lights = Settings.lights
+        self.Sources = list(self.Config.Sources)
+        self.Destinations = list(self.Config.Destinations)
+        self.Cameras = list(self.Config.Cameras)
+        self.Microphones = list(self.Config.Microphones)
+        self.Lights = list(self.Config.Lights)
+        
+        self.DefaultSourceId = self.Config.DefaultSourceId
+        self.DefaultCameraId = self.Config.DefaultCameraId
         
-        self.DefaultSourceId = Settings.defaultSource
-        self.DefaultCameraId = Settings.defaultCamera
+        self.PrimaryDestinationId = self.Config.PrimaryDestinationId
+        self.PrimarySwitcherId = self.Config.PrimarySwitcherId
+        self.PrimaryDSPId = self.Config.PrimaryDSPId
         
-        self.PrimaryDestinationId = Settings.primaryDestination
-        self.PrimarySwitcherId = Settings.primarySwitcher
-        self.PrimaryDSPId = Settings.primaryDSP
+        self.RoutingPresets = list(self.Config.RoutingPresets)
+        
+        if hasattr(Settings, 'structuredLog'):
+            self.StructuredLog = StructuredLogSink(**Settings.structuredLog)
+            LogBuffer.AddSink(self.StructuredLog, Name='StructuredLog')
+        else:
+            self.StructuredLog = None
         
         # Additional settings go here
 
@@ -100,18 +109,21 @@ class GUIController:
 
         if len(self.CtlProcs) == 0:
             raise ValueError(type(self).GetErrorStr('E2'))
-        elif hasattr(Settings, 'primaryProcessor'):
-            self.CtlProc_Main = [proc for proc in self.CtlProcs if proc.Id == Settings.primaryProcessor][0]
+        elif self.Config.PrimaryProcessor is not None:
+            self.CtlProc_Main = [proc for proc in self.CtlProcs if proc.Id == self.Config.PrimaryProcessor][0]
         else:
             self.CtlProc_Main = self.CtlProcs[0]
         
-        ## Poll Control Module - needs to exist before creating hardware controllers
+        ## Poll Control, Subscription & Journal Modules - need to exist before creating hardware controllers
         self.PollCtl = SystemPollingController()
+        self.SubscriptionCtl = SubscriptionRegistry()
+        self.Journal = StatusJournal(self)
 
         ## Create Hardware interfaces ------------------------------------------
         self.Hardware = {}
-        for hw in Settings.hardware:
+        for hw in self.Config.Hardware:
             self.Hardware[hw['Id']] = SystemHardwareController(self, **hw)
+        self.Snapshot = DeviceSnapshot(self)
         
         ## Touch Panel Definition ----------------------------------------------
         
@@ -135,9 +147,9 @@ class GUIController:
         if len(self.TPs) == 0:
             Log('No touch panels designated')
             self.TP_Main = None
-        elif hasattr(Settings, 'primaryTouchPanel'):
+        elif self.Config.PrimaryTouchPanel is not None:
             Log('Set TP_Main by settings.primaryTouchPanel')
-            self.TP_Main = [panel for panel in self.TPs if panel.Id == Settings.primaryTouchPanel][0]
+            self.TP_Main = [panel for panel in self.TPs if panel.Id == self.Config.PrimaryTouchPanel][0]
         else:
             Log('Set TP_Main by index')
             self.TP_Main = self.TPs[0]
@@ -221,6 +233,7 @@ class GUIController:
         ## Create Controllers --------------------------------------------------
         # Log(['Button: {} ({}, {})'.format(btn.Name, btn.ID, btn) for btn in self.TPs[0].Btn_Grps['Activity-Select'].Objects])
         self.ActCtl = ActivityController(self)
+        self.SchedEngine = ScheduleEngine(self)
         
         for tp in self.TPs:
             tp.InitializeUIControllers()
@@ -244,9 +257,11 @@ class GUIController:
                 Hw.interface.FindAssociatedHardware()
                 # Log('Hardware Found for {}. New IO Size: {}'.format(Hw.Name, Hw.interface.MatrixSize))
         
-        #### Start Polling
-        self.PollCtl.PollEverything()
+        #### Restore last known device status, then start polling
+        self.Snapshot.Restore()
+        self.PollCtl.PollEverything(Priority=self.Snapshot.PollPriority, Filter=self.Snapshot.NeedsPoll)
         self.PollCtl.StartPolling()
+        self.Snapshot.Start()
         
         print('System Initialized')
         Log('System Initialized')
@@ -254,6 +269,81 @@ class GUIController:
             tp.BlinkLights(Rate='Fast', StateList=['Green', 'Red'], Timeout=2.5)
             tp.Click(5, 0.2)
             
+    def ReloadSettings(self, Settings: object) -> SettingsDiff:
+        """Applies changed settings without restarting the program. New
+        settings are compiled first, so invalid settings raise SettingsError
+        before anything changes. Hardware is added, removed or replaced,
+        polling intervals and hardware options are updated in place, and
+        sources are relabeled. Unchanged hardware keeps its connection and
+        status. Changes which need a restart are logged and returned in
+        RestartRequired.
+
+        Args:
+            Settings (object): the new settings module
+
+        Returns:
+            SettingsDiff: the changes found
+        """
+        newConfig = CompileSettings(Settings)
+        diff = DiffSettings(self.Config, newConfig)
+        
+        ## Hardware ------------------------------------------------------------
+        for hwId in diff.HardwareRemoved + diff.HardwareReplaced:
+            self.Hardware.pop(hwId).Release()
+        
+        newHw = []
+        for hwId in diff.HardwareAdded + diff.HardwareReplaced:
+            self.Hardware[hwId] = SystemHardwareController(self, **newConfig.HardwareById[hwId])
+            newHw.append(self.Hardware[hwId])
+        
+        retuned = 0
+        for hwId in diff.HardwareUpdated:
+            hwSettings = newConfig.HardwareById[hwId]
+            hw = self.Hardware[hwId]
+            hw.Name = hwSettings['Name']
+            hw.ApplyOptions(hwSettings.get('Options', {}))
+            retuned += hw.RetunePolling(hwSettings.get('Polling', []))
+        
+        # virtual devices find their hardware through the new matrix assignments
+        self.Config = newConfig
+        
+        if len(diff.HardwareAdded + diff.HardwareRemoved + diff.HardwareReplaced + diff.HardwareUpdated) > 0:
+            for hw in self.Hardware.values():
+                if issubclass(type(hw.interface), VirtualDeviceInterface):
+                    hw.interface.FindAssociatedHardware()
+            for tp in self.TPs:
+                tp.StatusCtl.UpdateHardware()
+        
+        if any([cam['Id'] in diff.HardwareUpdated for cam in self.Cameras]):
+            # camera preset names from settings, overlaid by names saved from the panel
+            for tp in self.TPs:
+                if hasattr(tp, 'CamCtl'):
+                    tp.CamCtl.LoadPresetStates()
+                    tp.CamCtl.UpdatePresetButtons()
+        
+        for hw in newHw:
+            self.PollCtl.PollEverything(Interface=hw.interface)
+        
+        ## Sources & Labels ----------------------------------------------------
+        for srcId, name in diff.SourceNames.items():
+            for tp in self.TPs:
+                tp.SrcCtl.RelabelSource(srcId, name)
+        if len(diff.SourceNames) > 0:
+            self.Sources = list(newConfig.Sources)
+        
+        if diff.RoomName is not None:
+            self.RoomName = diff.RoomName
+            for tp in self.TPs:
+                tp.Btns['Room-Label'].SetText(self.RoomName)
+        
+        Log('Settings reloaded. Hardware added: {}, removed: {}, replaced: {}, updated: {} ({} polling entries retuned); sources relabeled: {}',
+            args=(diff.HardwareAdded, diff.HardwareRemoved, diff.HardwareReplaced,
+                  diff.HardwareUpdated, retuned, list(diff.SourceNames.keys())))
+        if len(diff.RestartRequired) > 0:
+            Log('Settings changes not applied until restart: {}', 'warning', args=(diff.RestartRequired,))
+        
+        return diff
+            
     @classmethod
     def GetErrorStr(cls, Error: str, *args, **kwargs):
         return cls.errorMap[Error].format(*args, **kwargs)
\ No newline at end of file
@@ -22,7 +22,6 @@ if TYPE_CHECKING: # pragma: no cover
 
 ## Begin ControlScript Import --------------------------------------------------
 from extronlib import event
-from extronlib.system import Timer
 
 ## End ControlScript Import ----------------------------------------------------
 ##
@@ -33,6 +32,7 @@ from extronlib.system import Timer
 ## Begin User Import -----------------------------------------------------------
 #### Custom Code Modules
 from utilityFunctions import DictValueSearchByKey, Log, RunAsync, debug
+from uofi_gui.timerService import ServiceTimer
 
 #### Extron Global Scripter Modules
 
@@ -123,7 +123,7 @@ class KeyboardController:
         
         self.__Cursor = ('\u2502','\u2588')
         self.__Pos = 0
-        self.__CursorTimer = Timer(0.5, self.__CursorTimerHandler)
+        self.__CursorTimer = ServiceTimer(0.5, self.__CursorTimerHandler)
         self.__CursorTimer.Stop()
         
         @event(self.__CharBtns, ['Pressed', 'Released']) # pragma: no cover
@@ -245,7 +245,7 @@ class KeyboardController:
             button.SetState(0)
             self.Close()
     
-    def __CursorTimerHandler(self, timer: 'Timer', count: int):
+    def __CursorTimerHandler(self, timer: 'ServiceTimer', count: int):
         self.__TextLbl.SetText(self.__CursorString(count % 2))
     
     # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -23,12 +23,15 @@ if TYPE_CHECKING: # pragma: no cover
 
 ## Begin ControlScript Import --------------------------------------------------
 from extronlib import event
-from extronlib.system import Clock, File
+from extronlib.system import Clock
 
 ## End ControlScript Import ----------------------------------------------------
 ##
 ## Begin Python Imports --------------------------------------------------------
-import json
+from bisect import bisect_right
+from collections import namedtuple
+from copy import deepcopy
+from datetime import date, datetime
 import re
 
 ## End Python Imports ----------------------------------------------------------
@@ -36,6 +39,7 @@ import re
 ## Begin User Import -----------------------------------------------------------
 #### Custom Code Modules
 from utilityFunctions import DictValueSearchByKey, Log, RunAsync, debug, SortKeys
+from uofi_gui.stateStore import States
 
 #### Extron Global Scripter Modules
 
@@ -43,25 +47,148 @@ from utilityFunctions import DictValueSearchByKey, Log, RunAsync, debug, SortKey
 ##
 ## Begin Class Definitions -----------------------------------------------------
 
-class AutoScheduleController:
-    def __init__(self, UIHost: 'ExUIDevice') -> None:
-        self.UIHost = UIHost
-        self.GUIHost = self.UIHost.GUIHost
+CalendarException = namedtuple('CalendarException', ['Start', 'End', 'Type', 'Name'])
+
+class ExceptionCalendar:
+    """Date exceptions to the weekly auto schedule.
+
+    Each exception covers a single date or an inclusive range of dates.
+    'closed' exceptions (holidays, breaks) skip the scheduled start, 'open'
+    exceptions (one-off events) start the room on a day outside the weekly
+    pattern. Where exceptions overlap, 'closed' takes precedence.
+
+    Exceptions are indexed as sorted, non-overlapping date segments so Lookup
+    is a binary search.
+    """
+    Types = ['closed', 'open']
+    DateFormat = '%Y-%m-%d'
+
+    def __init__(self, Exceptions: List[Dict]=None) -> None:
+        self.Exceptions = []
+        self.__Starts = []
+        self.__Segments = []
+        if Exceptions is not None:
+            self.Load(Exceptions)
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __ToDate(self, value: Union[str, date]) -> date:
+        if type(value) is datetime:
+            return value.date()
+        elif type(value) is date:
+            return value
+        elif type(value) is str:
+            return datetime.strptime(value, self.DateFormat).date()
+        else:
+            raise TypeError('Exception dates must be date objects or "YYYY-MM-DD" strings')
+
+    def __BuildIndex(self) -> None:
+        # split the exceptions at every boundary so each segment is covered by
+        # the same set of exceptions, then keep the highest precedence one
+        points = sorted(set([e.Start.toordinal() for e in self.Exceptions] +
+                            [e.End.toordinal() + 1 for e in self.Exceptions]))
+        segments = []
+        for i in range(len(points) - 1):
+            first = points[i]
+            last = points[i + 1] - 1
+            covering = [e for e in self.Exceptions
+                        if e.Start.toordinal() <= first and e.End.toordinal() >= last]
+            if len(covering) == 0:
+                continue
+            winner = min(covering, key=lambda e: self.Types.index(e.Type))
+            if len(segments) > 0 and segments[-1][2] is winner and segments[-1][1] == first - 1:
+                segments[-1] = (segments[-1][0], last, winner)
+            else:
+                segments.append((first, last, winner))
+
+        self.__Segments = segments
+        self.__Starts = [seg[0] for seg in segments]
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Load(self, Exceptions: List[Dict]) -> None:
+        self.Exceptions = []
+        for exc in Exceptions:
+            self.Add(exc['start'], exc.get('end', None), exc.get('type', 'closed'), exc.get('name', None), Index=False)
+        self.__BuildIndex()
+
+    def Add(self, Start: Union[str, date], End: Union[str, date]=None, Type: str='closed', Name: str=None, Index: bool=True) -> CalendarException:
+        """Adds a date exception.
+
+        Args:
+            Start (Union[str, date]): first date of the exception
+            End (Union[str, date], optional): last date of the exception. Defaults to Start.
+            Type (str, optional): 'closed' or 'open'. Defaults to 'closed'.
+            Name (str, optional): Description of the exception. Defaults to None.
+            Index (bool, optional): Rebuild the lookup index. Defaults to True.
+
+        Returns:
+            CalendarException: the added exception
+        """
+        if Type not in self.Types:
+            raise ValueError('Exception Type must be one of {}'.format(self.Types))
+        startDate = self.__ToDate(Start)
+        endDate = self.__ToDate(End) if End is not None else startDate
+        if endDate < startDate:
+            raise ValueError('Exception End ({}) is before Start ({})'.format(endDate, startDate))
+
+        exc = CalendarException(Start=startDate, End=endDate, Type=Type, Name=Name)
+        self.Exceptions.append(exc)
+        if Index:
+            self.__BuildIndex()
+        return exc
+
+    def Remove(self, Start: Union[str, date]) -> None:
+        startDate = self.__ToDate(Start)
+        self.Exceptions = [e for e in self.Exceptions if e.Start != startDate]
+        self.__BuildIndex()
+
+    def Prune(self, Before: Union[str, date]) -> None:
+        """Removes exceptions which ended before a date."""
+        beforeDate = self.__ToDate(Before)
+        self.Exceptions = [e for e in self.Exceptions if e.End >= beforeDate]
+        self.__BuildIndex()
+
+    def Lookup(self, Day: Union[str, date]) -> CalendarException:
+        """Returns the exception in effect on a date, or None."""
+        ordinal = self.__ToDate(Day).toordinal()
+        i = bisect_right(self.__Starts, ordinal) - 1
+        if i >= 0 and self.__Segments[i][1] >= ordinal:
+            return self.__Segments[i][2]
+        return None
+
+    def Export(self) -> List[Dict]:
+        return [{'start': e.Start.strftime(self.DateFormat),
+                 'end': e.End.strftime(self.DateFormat),
+                 'type': e.Type,
+                 'name': e.Name}
+                for e in sorted(self.Exceptions, key=lambda e: (e.Start, e.End))]
+
+class ScheduleEngine:
+    """Room-level auto schedule.
+
+    Owns the schedule state, the start and shutdown clocks, and the system
+    inactivity timeout for every panel in the room. The AutoScheduleController
+    on each panel is a view of this engine, so scheduled actions fire once per
+    room regardless of the number of panels.
+
+    The clocks fire daily at the scheduled times, the weekly patterns and the
+    exception calendar decide whether the scheduled action runs that day.
+    """
+    SystemInactivityTime = 10800
+    DaysOfWeek = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+    def __init__(self, GUIHost: 'GUIController') -> None:
+        self.GUIHost = GUIHost
         self.AutoStart = False
         self.AutoShutdown = False
-        
-        self.__inactivityHandlers = \
-            {
-                180: self.__PopoverInactivityHandler,
-                300: self.__TechPageInactivityHandler,
-                10800: self.__SystemInactivityHandler
-            }
-            
-        self.UIHost.SetInactivityTime(list(self.__inactivityHandlers.keys()))
-        @event(self.UIHost, 'InactivityChanged') # pragma: no cover
-        def InactivityMethodHandler(tlp: Union['UIDevice', 'ExUIDevice'], time):
-            self.__InactivityMethodHandler(tlp, time)
-        
+        self.StartPattern = None
+        self.StartActivity = 'share'
+        self.ShutdownPattern = None
+        self.Calendar = ExceptionCalendar()
+
+        self.Views = []
+
         self.__default_pattern = \
             {
                 'Days': 
@@ -79,6 +206,197 @@ class AutoScheduleController:
                 }
             }
         self.__scheduleFilePath = '/user/states/room_schedule.json'
+
+        self.__PanelInactivity = {}
+        self.__ShutdownPrompted = False
+
+        self.__AutoStartClock = Clock(['12:00:00'], self.DaysOfWeek, self.__ScheduleStartHandler)
+        self.__AutoShutdownClock = Clock(['12:00:00'], self.DaysOfWeek, self.__ScheduleShutdownHandler)
+
+        self.LoadSchedule()
+
+    # Event Handlers +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __ScheduleShutdownHandler(self, Clock, Time):
+        day = self.__ClockDate(Time)
+        if not self.IsScheduledDay(self.ShutdownPattern, day) and self.Calendar.Lookup(day) is None:
+            return
+        
+        if self.GUIHost.ActCtl.CurrentActivity != 'off':
+            self.GUIHost.ActCtl.SystemShutdown()
+        else:
+            Log('System already off at scheduled shutdown.')
+        
+    def __ScheduleStartHandler(self, Clock, Time):
+        day = self.__ClockDate(Time)
+        if not self.IsScheduledDay(self.StartPattern, day):
+            exc = self.Calendar.Lookup(day)
+            if exc is not None:
+                # polling stays in inactive mode as the system is not started
+                Log('Scheduled start skipped for {} ({})'.format(day, exc.Name))
+            return
+        
+        if self.GUIHost.ActCtl.CurrentActivity == 'off':
+            self.GUIHost.ActCtl.SystemStart(self.StartActivity)
+        elif self.GUIHost.ActCtl.CurrentActivity != self.StartActivity:
+            self.GUIHost.ActCtl.SystemSwitch(self.StartActivity)
+        else:
+            pass # The system is already configured in the desired state
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __ClockDate(self, Time) -> date:
+        if isinstance(Time, datetime):
+            return Time.date()
+        return date.today()
+
+    def __ClockTime(self, Time: Dict):
+        if Time['ampm'] == 'PM':
+            if int(Time['hr']) == 12:
+                hrs = 12
+            else:
+                hrs = int(Time['hr']) + 12
+        else:
+            if int(Time['hr']) == 12:
+                hrs = 0
+            else:
+                hrs = int(Time['hr'])
+        
+        return '{:02d}:{}:00'.format(hrs, Time['min'])
+
+    def __UpdateClocks(self):
+        if self.AutoStart:
+            self.__AutoStartClock.Enable()
+        else:
+            self.__AutoStartClock.Disable()
+        self.__AutoStartClock.SetTimes([self.__ClockTime(self.StartPattern['Time'])])
+
+        if self.AutoShutdown:
+            self.__AutoShutdownClock.Enable()
+        else:
+            self.__AutoShutdownClock.Disable()
+        self.__AutoShutdownClock.SetTimes([self.__ClockTime(self.ShutdownPattern['Time'])])
+
+    def __UpdateViews(self):
+        for view in self.Views:
+            view.UpdateView()
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def AddView(self, View: 'AutoScheduleController') -> None:
+        if View not in self.Views:
+            self.Views.append(View)
+
+    def IsScheduledDay(self, Pattern: Dict, Day: date=None) -> bool:
+        """Checks whether a weekly pattern applies on a date, taking the
+        exception calendar into account.
+
+        Args:
+            Pattern (Dict): schedule pattern
+            Day (date, optional): Date to check. Defaults to today.
+        """
+        if Day is None:
+            Day = date.today()
+        exc = self.Calendar.Lookup(Day)
+        if exc is not None:
+            return exc.Type == 'open'
+        return self.DaysOfWeek[Day.weekday()] in Pattern['Days']
+
+    def AddException(self, Start: Union[str, date], End: Union[str, date]=None, Type: str='closed', Name: str=None) -> None:
+        """Adds a date exception to the room schedule and saves it.
+        See ExceptionCalendar.Add for arguments.
+        """
+        self.Calendar.Add(Start, End, Type, Name)
+        self.SaveSchedule()
+
+    def RemoveException(self, Start: Union[str, date]) -> None:
+        self.Calendar.Remove(Start)
+        self.SaveSchedule()
+
+    def PanelInactivity(self, UIHost: 'ExUIDevice', Time: int) -> None:
+        """Records a panel inactivity event. The shutdown confirmation is
+        started once, when every panel in the room has been inactive for
+        SystemInactivityTime seconds. A panel which has not reported yet has
+        not been used since startup and counts as inactive.
+
+        Args:
+            UIHost (ExUIDevice): the panel reporting inactivity
+            Time (int): seconds the panel has been inactive
+        """
+        self.__PanelInactivity[UIHost] = Time
+        if Time < self.SystemInactivityTime:
+            # the panel has been used since it last reported
+            self.__ShutdownPrompted = False
+            return
+
+        for view in self.Views:
+            if self.__PanelInactivity.get(view.UIHost, self.SystemInactivityTime) < self.SystemInactivityTime:
+                return
+        if not self.__ShutdownPrompted:
+            self.__ShutdownPrompted = True
+            self.GUIHost.ActCtl.StartShutdownConfirmation(click=True)
+
+    def SaveSchedule(self):
+        # changes are merged into the shared room schedule document, which is
+        # written to file once editing settles
+        self.Calendar.Prune(date.today())
+        States.Update(self.__scheduleFilePath,
+                      {
+                          'auto_start': 
+                              {
+                                  'enabled': int(self.AutoStart),
+                                  'pattern': self.StartPattern,
+                                  'mode': self.StartActivity
+                              },
+                          'auto_shutdown':
+                              {
+                                  'enabled': int(self.AutoShutdown),
+                                  'pattern': self.ShutdownPattern
+                              },
+                          'exceptions': self.Calendar.Export()
+                      })
+        self.__UpdateClocks()
+        self.__UpdateViews()
+
+    def LoadSchedule(self):
+        scheduleObj = States.Get(self.__scheduleFilePath)
+        if scheduleObj is not None:
+            self.AutoStart = bool(scheduleObj['auto_start']['enabled'])
+            self.StartPattern = scheduleObj['auto_start']['pattern']
+            self.StartActivity = scheduleObj['auto_start']['mode']
+            self.AutoShutdown =  bool(scheduleObj['auto_shutdown']['enabled'])
+            self.ShutdownPattern = scheduleObj['auto_shutdown']['pattern']
+            self.Calendar.Load(scheduleObj.get('exceptions', []))
+        else:
+            Log('No schedule file exists')
+            
+            # load defaults
+            self.AutoStart = False
+            self.StartPattern = deepcopy(self.__default_pattern)
+            self.StartActivity = 'share'
+            self.AutoShutdown =  False
+            self.ShutdownPattern = deepcopy(self.__default_pattern)
+            self.Calendar.Load([])
+
+        self.__UpdateClocks()
+        self.__UpdateViews()
+
+class AutoScheduleController:
+    def __init__(self, UIHost: 'ExUIDevice') -> None:
+        self.UIHost = UIHost
+        self.GUIHost = self.UIHost.GUIHost
+        self.Engine = self.GUIHost.SchedEngine
+        
+        self.__inactivityHandlers = \
+            {
+                180: self.__PopoverInactivityHandler,
+                300: self.__TechPageInactivityHandler
+            }
+            
+        self.UIHost.SetInactivityTime(list(self.__inactivityHandlers.keys()) + [self.Engine.SystemInactivityTime])
+        @event(self.UIHost, 'InactivityChanged') # pragma: no cover
+        def InactivityMethodHandler(tlp: Union['UIDevice', 'ExUIDevice'], time):
+            self.__InactivityMethodHandler(tlp, time)
         
         self.__toggle_start = self.UIHost.Btns['Schedule-Start-Toggle']
         self.__toggle_start.Value = 'start'
@@ -146,10 +464,8 @@ class AutoScheduleController:
         self.__editor_pattern.Mode = None
         self.__editor_pattern.Pattern = None
         
-        self.__AutoStartClock = Clock(['12:00:00'], None, self.__ScheduleStartHandler)
-        self.__AutoShutdownClock = Clock(['12:00:00'], None, self.__ScheduleShutdownHandler)
-        
-        self.LoadSchedule()
+        self.Engine.AddView(self)
+        self.UpdateView()
         
         @event([self.__toggle_start, self.__toggle_shutdown], ['Released']) # pragma: no cover
         def ToggleHandler(button: 'Button', action: str):
@@ -191,8 +507,25 @@ class AutoScheduleController:
         def EditorCancelHandler(button: 'Button', action: str):
             self.__EditorCancelHandler(button, action)
             
+    @property
+    def AutoStart(self) -> bool:
+        return self.Engine.AutoStart
+    
+    @AutoStart.setter
+    def AutoStart(self, value: bool) -> None:
+        self.Engine.AutoStart = value
+    
+    @property
+    def AutoShutdown(self) -> bool:
+        return self.Engine.AutoShutdown
+    
+    @AutoShutdown.setter
+    def AutoShutdown(self, value: bool) -> None:
+        self.Engine.AutoShutdown = value
+    
     ## Event Handlers (Private) ------------------------------------------------
     def __InactivityMethodHandler(self, tlp: Union['UIDevice', 'ExUIDevice'], time):
+        self.Engine.PanelInactivity(self.UIHost, time)
         if time in self.__inactivityHandlers:
             self.__inactivityHandlers[time]()
     
@@ -216,8 +549,8 @@ class AutoScheduleController:
             button.SetState(1)
         elif action == 'Released':
             self.__editor_pattern.Mode = button.Value
-            self.__editor_pattern.Pattern = button.Pattern
-            self.__UpdateEditor(button.Pattern)
+            self.__editor_pattern.Pattern = deepcopy(button.Pattern)
+            self.__UpdateEditor(self.__editor_pattern.Pattern)
             self.UIHost.ShowPopup(self.__edit_modal)
             button.SetState(0)
     
@@ -390,34 +723,6 @@ class AutoScheduleController:
         # Update Pattern
         self.__editor_pattern.SetText(self.__PatternToText(Pattern))
         
-    def __ScheduleShutdownHandler(self, Clock, Time):
-        if self.GUIHost.ActCtl.CurrentActivity != 'off':
-            self.GUIHost.ActCtl.SystemShutdown()
-        else:
-            Log('System already off at scheduled shutdown.')
-        
-    def __ScheduleStartHandler(self, Clock, Time):
-        if self.GUIHost.ActCtl.CurrentActivity == 'off':
-            self.GUIHost.ActCtl.SystemStart(self.__pattern_start.Activity)
-        elif self.GUIHost.ActCtl.CurrentActivity != self.__pattern_start.Activity:
-            self.GUIHost.ActCtl.SystemSwitch(self.__pattern_start.Activity)
-        else:
-            pass # The system is already configured in the desired state
-        
-    def __ClockTime(self, Time: Dict):
-        if Time['ampm'] == 'PM':
-            if int(Time['hr']) == 12:
-                hrs = 12
-            else:
-                hrs = int(Time['hr']) + 12
-        else:
-            if int(Time['hr']) == 12:
-                hrs = 0
-            else:
-                hrs = int(Time['hr'])
-        
-        return '{:02d}:{}:00'.format(hrs, Time['min'])
-    
     def __PopoverInactivityHandler(self):
         for p in self.UIHost.PopoverPageList:
             self.UIHost.HidePopup(p)
@@ -431,130 +736,30 @@ class AutoScheduleController:
     #         self.UIHost.Click()
     #         self.UIHost.ShowPage('Splash')
     
-    def __SystemInactivityHandler(self):
-        self.GUIHost.ActCtl.StartShutdownConfirmation(click=True)
-        
     ## Public Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
     def SaveSchedule(self):
-        # only need to save the preset names, presets are stored presistently on camera
-        if File.Exists(self.__scheduleFilePath):
-            # file exists -> read file to object, modify object, save object to file
-            #### read file to object
-            scheduleFile = File(self.__scheduleFilePath, 'rt')
-            scheduleString = scheduleFile.read()
-            scheduleObj = json.loads(scheduleString)
-            scheduleFile.close()
-            
-            #### modify object
-            scheduleObj['auto_start']['enabled'] = int(self.AutoStart)
-            scheduleObj['auto_start']['pattern'] = self.__pattern_start.Pattern
-            scheduleObj['auto_start']['mode'] = self.__pattern_start.Activity
-            scheduleObj['auto_shutdown']['enabled'] = int(self.AutoShutdown)
-            scheduleObj['auto_shutdown']['pattern'] = self.__pattern_shutdown.Pattern
-            
-            #### save object to file
-            scheduleFile = File(self.__scheduleFilePath, 'wt')
-            scheduleFile.write(json.dumps(scheduleObj))
-            scheduleFile.close()
-            
-        else:
-            # file does not exist -> create object, save object to file
-            #### create object
-            scheduleObj = \
-                {
-                    'auto_start': 
-                        {
-                            'enabled': 0,
-                            'pattern': {},
-                            'mode': ''
-                        },
-                    'auto_shutdown':
-                        {
-                            'enabled': 0,
-                            'pattern': {}
-                        }
-                }
-            scheduleObj['auto_start']['enabled'] = int(self.AutoStart)
-            scheduleObj['auto_start']['pattern'] = self.__pattern_start.Pattern
-            scheduleObj['auto_start']['mode'] = self.__pattern_start.Activity
-            scheduleObj['auto_shutdown']['enabled'] = int(self.AutoShutdown)
-            scheduleObj['auto_shutdown']['pattern'] = self.__pattern_shutdown.Pattern
-            
-            #### save object to file
-            scheduleFile = File(self.__scheduleFilePath, 'xt')
-            scheduleFile.write(json.dumps(scheduleObj))
-            scheduleFile.close()
-            
-        if bool(scheduleObj['auto_start']['enabled']):
-            self.__AutoStartClock.Enable()
-        else:
-            self.__AutoStartClock.Disable()
-            
-        self.__AutoStartClock.SetDays(scheduleObj['auto_start']['pattern']['Days'])
-        self.__AutoStartClock.SetTimes([self.__ClockTime(scheduleObj['auto_start']['pattern']['Time'])])
-        
-        if bool(scheduleObj['auto_shutdown']['enabled']):
-            self.__AutoShutdownClock.Enable()
-        else:
-            self.__AutoShutdownClock.Disable()
-            
-        self.__AutoShutdownClock.SetDays(scheduleObj['auto_shutdown']['pattern']['Days'])
-        self.__AutoShutdownClock.SetTimes([self.__ClockTime(scheduleObj['auto_shutdown']['pattern']['Time'])])
-        
-        # Propogate schedule to other UIHosts
-        for TP in self.GUIHost.TPs:
-            if TP is not self.UIHost:
-                TP.SchedCtl.LoadSchedule()
+        # the engine stores the schedule, updates the clocks, and refreshes
+        # every panel's view, including this one
+        self.Engine.StartPattern = self.__pattern_start.Pattern
+        self.Engine.StartActivity = self.__pattern_start.Activity
+        self.Engine.ShutdownPattern = self.__pattern_shutdown.Pattern
+        self.Engine.SaveSchedule()
     
     def LoadSchedule(self):
-        # only need to load the preset names, presets are stored presistently on camera
-        if File.Exists(self.__scheduleFilePath):
-            #### read file to object
-            scheduleFile = File(self.__scheduleFilePath, 'rt')
-            scheduleString = scheduleFile.read()
-            scheduleObj = json.loads(scheduleString)
-            # Log('JSON Obj: {}'.format(scheduleObj))
-            scheduleFile.close()
-            
-            #### iterate over objects and load presets
-            self.AutoStart = bool(scheduleObj['auto_start']['enabled'])
-            self.__pattern_start.Pattern = scheduleObj['auto_start']['pattern']
-            self.__pattern_start.Activity = scheduleObj['auto_start']['mode']
-            self.AutoShutdown =  bool(scheduleObj['auto_shutdown']['enabled'])
-            self.__pattern_shutdown.Pattern = scheduleObj['auto_shutdown']['pattern']
-
-        else:
-            Log('No presets file exists')
-            
-            # load defaults
-            self.AutoStart = False
-            self.__pattern_start.Pattern = self.__default_pattern
-            self.__pattern_start.Activity = 'share'
-            self.AutoShutdown =  False
-            self.__pattern_shutdown.Pattern = self.__default_pattern
-            
-        if self.AutoStart:
-            self.__toggle_start.SetState(1)
-            self.__AutoStartClock.Enable()
-        else:
-            self.__toggle_start.SetState(0)
-            self.__AutoStartClock.Disable()
-            
-        if self.AutoShutdown:
-            self.__toggle_shutdown.SetState(1)
-            self.__AutoShutdownClock.Enable()
-        else:
-            self.__toggle_shutdown.SetState(0)
-            self.__AutoShutdownClock.Disable()
+        self.Engine.LoadSchedule()
+    
+    def UpdateView(self):
+        # patterns are copied so the editor does not change the room schedule
+        # until it is saved
+        self.__pattern_start.Pattern = deepcopy(self.Engine.StartPattern)
+        self.__pattern_start.Activity = self.Engine.StartActivity
+        self.__pattern_shutdown.Pattern = deepcopy(self.Engine.ShutdownPattern)
         
-        self.__activity_start.SetCurrent(self.UIHost.Btns['Schedule-Start-Act-{}'.format(self.__pattern_start.Activity)])
+        self.__toggle_start.SetState(int(self.AutoStart))
+        self.__toggle_shutdown.SetState(int(self.AutoShutdown))
         
-        self.__AutoStartClock.SetDays(self.__pattern_start.Pattern['Days'])
-        self.__AutoStartClock.SetTimes([self.__ClockTime(self.__pattern_start.Pattern['Time'])])
-            
-        self.__AutoShutdownClock.SetDays(self.__pattern_shutdown.Pattern['Days'])
-        self.__AutoShutdownClock.SetTimes([self.__ClockTime(self.__pattern_shutdown.Pattern['Time'])])
+        self.__activity_start.SetCurrent(self.UIHost.Btns['Schedule-Start-Act-{}'.format(self.__pattern_start.Activity)])
         
         self.__UpdatePattern()
 
@@ -0,0 +1,430 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import TYPE_CHECKING, Dict, Tuple, List, Union, Callable
+
+## Begin ControlScript Import --------------------------------------------------
+
+## End ControlScript Import ----------------------------------------------------
+##
+## Begin Python Imports --------------------------------------------------------
+from collections import namedtuple
+from types import MappingProxyType
+
+## End Python Imports ----------------------------------------------------------
+##
+## Begin User Import -----------------------------------------------------------
+#### Custom Code Modules
+
+#### Extron Global Scripter Modules
+
+## End User Import -------------------------------------------------------------
+##
+## Begin Class Definitions -----------------------------------------------------
+
+class SettingsError(ValueError):
+    """Raised by CompileSettings with every problem found in the settings."""
+    def __init__(self, Errors: List[str]) -> None:
+        self.Errors = list(Errors)
+        super().__init__('{} settings error(s):\n    {}'.format(len(self.Errors), '\n    '.join(self.Errors)))
+
+SettingsDiff = namedtuple('SettingsDiff',
+                          ['HardwareAdded', 'HardwareRemoved', 'HardwareReplaced',
+                           'HardwareUpdated', 'SourceNames', 'RoomName', 'RestartRequired'])
+
+class CompiledSettings:
+    """Validated and indexed view of a settings module.
+
+    The lists from the settings module are kept as tuples in their original
+    order. Index attributes map Ids, matrix IO and matrix groups to the
+    settings dictionaries. Only the attributes, tuples and indexes are
+    read-only: the settings dictionaries themselves are shared with the
+    controllers, which annotate them (destination objects, GUIHost in the
+    interface configuration), so they are not frozen. Fingerprint holds a
+    detached, comparable copy of the settings taken at compile time, before
+    the controllers annotate them, and is used by DiffSettings.
+    """
+    Scalars = ['CtlJSON', 'RoomName', 'ActivityMode', 'Timers', 'TechMatrixSize',
+               'TechPIN', 'CameraSwitcherId', 'DefaultSourceId', 'DefaultCameraId',
+               'PrimaryDestinationId', 'PrimarySwitcherId', 'PrimaryDSPId',
+               'PrimaryTouchPanel', 'PrimaryProcessor']
+    Lists = ['Sources', 'Destinations', 'Cameras', 'Microphones', 'Lights', 'RoutingPresets']
+    Timers = ['startup', 'switch', 'shutdown', 'shutdownConf', 'activitySplash', 'initPage']
+    DestinationTypes = ['proj', 'proj+scn', 'mon', 'conf', 'c-conf']
+
+    def __init__(self, **kwargs) -> None:
+        for key, value in kwargs.items():
+            object.__setattr__(self, key, value)
+        object.__setattr__(self, '_CompiledSettings__Frozen', True)
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError('CompiledSettings is read-only')
+
+    def __delattr__(self, name) -> None:
+        raise AttributeError('CompiledSettings is read-only')
+
+    def __repr__(self) -> str:
+        return 'CompiledSettings({})'.format(self.RoomName)
+
+## End Class Definitions -------------------------------------------------------
+##
+## Begin Function Definitions --------------------------------------------------
+
+def _Index(items: List[Dict], key: str, kind: str, errors: List[str]) -> Dict:
+    index = {}
+    for item in items:
+        if type(item) is not dict:
+            errors.append('{} entry must be a dictionary ({})'.format(kind, item))
+            continue
+        if key not in item:
+            errors.append('{} entry missing "{}" ({})'.format(kind, key, item))
+            continue
+        if item[key] in index:
+            errors.append('Duplicate {} {} ({})'.format(kind, key, item[key]))
+            continue
+        index[item[key]] = item
+    return index
+
+def _PositiveInt(value) -> bool:
+    return type(value) is int and value > 0
+
+def _Fingerprint(value):
+    # GUIHost is added to the interface configuration by the hardware
+    # controller, callables compare by name so a reloaded settings module
+    # matches the running one
+    if isinstance(value, (dict, MappingProxyType)):
+        return {k: _Fingerprint(v) for k, v in value.items() if k != 'GUIHost'}
+    if isinstance(value, (list, tuple)):
+        return [_Fingerprint(v) for v in value]
+    if callable(value):
+        return '{}.{}'.format(getattr(value, '__module__', None), getattr(value, '__qualname__', repr(value)))
+    return value
+
+def _HeldHardware(Config: CompiledSettings) -> List[str]:
+    # hardware controllers the UI controllers keep references to
+    held = [Config.CameraSwitcherId, Config.PrimarySwitcherId, Config.PrimaryDSPId]
+    held.extend([cam['Id'] for cam in Config.Fingerprint['Cameras']])
+    held.extend([dest['id'] for dest in Config.Fingerprint['Destinations']])
+    for mic in Config.Fingerprint['Microphones']:
+        held.append(mic['Id'])
+        held.extend([ctl.get('HwId', None) for ctl in mic.get('Control', {}).values()])
+    return held
+
+def CompileSettings(Settings: object) -> CompiledSettings:
+    """Validates a settings module, resolves its cross-references and builds
+    the lookup indexes. Every problem found is collected and reported in a
+    single SettingsError.
+
+    Args:
+        Settings (object): the settings module
+
+    Raises:
+        SettingsError: raised if the settings are invalid
+
+    Returns:
+        CompiledSettings: the compiled settings
+    """
+    errors = []
+
+    def required(name: str, default=None, optional: bool=False):
+        if hasattr(Settings, name):
+            return getattr(Settings, name)
+        if not optional:
+            errors.append('Missing setting ({})'.format(name))
+        return default
+
+    ## Scalar settings ---------------------------------------------------------
+    activityMode = required('activityMode')
+    if activityMode is not None and activityMode not in [1, 2, 3]:
+        errors.append('activityMode must be 1, 2, or 3 ({})'.format(activityMode))
+
+    timers = {}
+    for timer in CompiledSettings.Timers:
+        value = required('{}Timer'.format(timer))
+        if value is not None and not _PositiveInt(value):
+            errors.append('{}Timer must be a positive integer ({})'.format(timer, value))
+        timers[timer] = value
+
+    techMatrixSize = required('techMatrixSize', (1, 1))
+    if type(techMatrixSize) is not tuple or len(techMatrixSize) != 2 or \
+        not all([_PositiveInt(v) for v in techMatrixSize]):
+        errors.append('techMatrixSize must be a tuple of (inputs, outputs) ({})'.format(techMatrixSize))
+
+    techPIN = required('techPIN')
+    if techPIN is not None and (type(techPIN) is not str or not techPIN.isdigit() or len(techPIN) >= 10):
+        errors.append('techPIN must be a string of fewer than 10 digits')
+
+    ## Lists -------------------------------------------------------------------
+    sources = required('sources', [])
+    destinations = required('destinations', [])
+    cameras = required('cameras', [])
+    microphones = required('microphones', [])
+    lights = required('lights', [])
+    hardware = required('hardware', [])
+    routingPresets = required('routingPresets', [], optional=True)
+
+    hardwareById = _Index(hardware, 'Id', 'Hardware', errors)
+    sourceById = _Index(sources, 'id', 'Source', errors)
+    destinationById = _Index(destinations, 'id', 'Destination', errors)
+    cameraById = _Index(cameras, 'Id', 'Camera', errors)
+    microphoneById = _Index(microphones, 'Id', 'Microphone', errors)
+    presetById = _Index(routingPresets, 'id', 'Routing Preset', errors)
+
+    ## Hardware ----------------------------------------------------------------
+    hardwareByGroup = {}
+    hardwareByMatrixIO = {}
+    subscriptionsByTag = {}
+    for hwId, hw in hardwareById.items():
+        for key in ['Name', 'Manufacturer', 'Model', 'Interface']:
+            if key not in hw:
+                errors.append('Hardware ({}) missing "{}"'.format(hwId, key))
+        interface = hw.get('Interface', {})
+        for key in ['module', 'interface_class', 'interface_configuration']:
+            if key not in interface:
+                errors.append('Hardware ({}) Interface missing "{}"'.format(hwId, key))
+        for poll in hw.get('Polling', []):
+            for key in ['active_int', 'inactive_int']:
+                if key in poll and not _PositiveInt(poll[key]):
+                    errors.append('Hardware ({}) polling {} {} must be a positive integer ({})'.format(hwId, poll.get('command'), key, poll[key]))
+        for sub in hw.get('Subscriptions', []) + hw.get('Polling', []):
+            if 'command' not in sub:
+                errors.append('Hardware ({}) subscription or polling entry missing "command"'.format(hwId))
+            if 'tag' in sub:
+                if type(sub['tag']) not in [str, tuple]:
+                    errors.append('Hardware ({}) {} tag must be a string or tuple'.format(hwId, sub.get('command')))
+                else:
+                    subscriptionsByTag.setdefault(sub['tag'], []).append((hwId, sub))
+
+        options = hw.get('Options', {})
+        if 'MatrixAssignment' in options:
+            group = options['MatrixAssignment']
+            if group not in hardwareById:
+                errors.append('Hardware ({}) MatrixAssignment refers to unknown hardware ({})'.format(hwId, group))
+            hardwareByGroup.setdefault(group, []).append(hw)
+            for io, key in [('Input', 'MatrixInput'), ('Output', 'MatrixOutput')]:
+                if key in options:
+                    ioKey = (group, io, options[key])
+                    if ioKey in hardwareByMatrixIO:
+                        errors.append('Hardware ({}) {} {} already assigned to {}'.format(hwId, key, options[key], hardwareByMatrixIO[ioKey]['Id']))
+                    hardwareByMatrixIO[ioKey] = hw
+
+    ## Sources & Destinations --------------------------------------------------
+    sourceByInput = {}
+    for srcId, src in sourceById.items():
+        srcInput = src.get('input', None)
+        if not _PositiveInt(srcInput):
+            errors.append('Source ({}) input must be a positive integer ({})'.format(srcId, srcInput))
+        elif srcInput in sourceByInput:
+            errors.append('Source ({}) input {} already assigned to {}'.format(srcId, srcInput, sourceByInput[srcInput]['id']))
+        else:
+            sourceByInput[srcInput] = src
+
+    destinationByOutput = {}
+    for destId, dest in destinationById.items():
+        output = dest.get('output', None)
+        if not _PositiveInt(output):
+            errors.append('Destination ({}) output must be a positive integer ({})'.format(destId, output))
+        elif output in destinationByOutput:
+            errors.append('Destination ({}) output {} already assigned to {}'.format(destId, output, destinationByOutput[output]['id']))
+        else:
+            destinationByOutput[output] = dest
+        if dest.get('type', None) not in CompiledSettings.DestinationTypes:
+            errors.append('Destination ({}) type must be one of {} ({})'.format(destId, CompiledSettings.DestinationTypes, dest.get('type', None)))
+        if dest.get('groupWrkSrc', None) is not None and dest['groupWrkSrc'] not in sourceById:
+            errors.append('Destination ({}) groupWrkSrc refers to unknown source ({})'.format(destId, dest['groupWrkSrc']))
+        if dest.get('confFollow', None) is not None and dest['confFollow'] not in destinationById:
+            errors.append('Destination ({}) confFollow refers to unknown destination ({})'.format(destId, dest['confFollow']))
+
+    ## Microphones -------------------------------------------------------------
+    microphoneByNumber = {}
+    for micId, mic in microphoneById.items():
+        if mic.get('Number', None) in microphoneByNumber:
+            errors.append('Microphone ({}) Number {} already assigned'.format(micId, mic.get('Number', None)))
+        microphoneByNumber[mic.get('Number', None)] = mic
+        for ctlName, ctl in mic.get('Control', {}).items():
+            if ctl.get('HwId', None) not in hardwareById:
+                errors.append('Microphone ({}) {} control refers to unknown hardware ({})'.format(micId, ctlName, ctl.get('HwId', None)))
+
+    # ('mics', Number) tags route hardware feedback to a microphone
+    for tag in subscriptionsByTag:
+        if type(tag) is tuple and len(tag) == 2 and tag[0] == 'mics' and \
+            tag[1] not in [str(n) for n in microphoneByNumber]:
+            errors.append('Hardware tag {} refers to unknown microphone Number ({})'.format(tag, tag[1]))
+
+    ## Routing Presets ---------------------------------------------------------
+    for presetId, preset in presetById.items():
+        for destId, srcId in preset.get('video', {}).items():
+            if destId not in destinationById:
+                errors.append('Routing Preset ({}) refers to unknown destination ({})'.format(presetId, destId))
+            if srcId is not None and srcId not in sourceById:
+                errors.append('Routing Preset ({}) refers to unknown source ({})'.format(presetId, srcId))
+        for key in ['displays', 'screens']:
+            for destId in preset.get(key, {}):
+                if destId not in destinationById:
+                    errors.append('Routing Preset ({}) refers to unknown destination ({})'.format(presetId, destId))
+
+    ## Cross References --------------------------------------------------------
+    references = \
+        [
+            ('defaultSource', sourceById, False),
+            ('primaryDestination', destinationById, False),
+            ('primarySwitcher', hardwareById, False),
+            ('primaryDSP', hardwareById, False),
+            ('camSwitcher', hardwareById, True),
+            ('defaultCamera', cameraById, True)
+        ]
+    values = {}
+    for name, index, allowNone in references:
+        if not hasattr(Settings, name):
+            required(name)
+            values[name] = None
+            continue
+        value = getattr(Settings, name)
+        values[name] = value
+        if value is None and allowNone:
+            continue
+        if value not in index:
+            errors.append('{} refers to an unknown Id ({})'.format(name, value))
+
+    if len(errors) > 0:
+        raise SettingsError(errors)
+
+    fingerprint = \
+        {
+            'Hardware': {hwId: _Fingerprint(hw) for hwId, hw in hardwareById.items()},
+            'Sources': _Fingerprint(sources),
+            'Destinations': _Fingerprint(destinations),
+            'Cameras': _Fingerprint(cameras),
+            'Microphones': _Fingerprint(microphones),
+            'Lights': _Fingerprint(lights),
+            'RoutingPresets': _Fingerprint(routingPresets)
+        }
+
+    return CompiledSettings(
+        Fingerprint=MappingProxyType(fingerprint),
+        CtlJSON=required('ctlJSON'),
+        RoomName=required('roomName'),
+        ActivityMode=activityMode,
+        Timers=MappingProxyType(timers),
+        TechMatrixSize=techMatrixSize,
+        TechPIN=techPIN,
+        CameraSwitcherId=values['camSwitcher'],
+        DefaultSourceId=values['defaultSource'],
+        DefaultCameraId=values['defaultCamera'],
+        PrimaryDestinationId=values['primaryDestination'],
+        PrimarySwitcherId=values['primarySwitcher'],
+        PrimaryDSPId=values['primaryDSP'],
+        PrimaryTouchPanel=required('primaryTouchPanel', optional=True),
+        PrimaryProcessor=required('primaryProcessor', optional=True),
+        Sources=tuple(sources),
+        Destinations=tuple(destinations),
+        Cameras=tuple(cameras),
+        Microphones=tuple(microphones),
+        Lights=tuple(lights),
+        Hardware=tuple(hardware),
+        RoutingPresets=tuple(routingPresets),
+        HardwareById=MappingProxyType(hardwareById),
+        HardwareByGroup=MappingProxyType({k: tuple(v) for k, v in hardwareByGroup.items()}),
+        HardwareByMatrixIO=MappingProxyType(hardwareByMatrixIO),
+        SourceById=MappingProxyType(sourceById),
+        SourceByInput=MappingProxyType(sourceByInput),
+        DestinationById=MappingProxyType(destinationById),
+        DestinationByOutput=MappingProxyType(destinationByOutput),
+        CameraById=MappingProxyType(cameraById),
+        MicrophoneById=MappingProxyType(microphoneById),
+        MicrophoneByNumber=MappingProxyType(microphoneByNumber),
+        RoutingPresetById=MappingProxyType(presetById),
+        SubscriptionsByTag=MappingProxyType({k: tuple(v) for k, v in subscriptionsByTag.items()})
+    )
+
+def DiffSettings(Running: CompiledSettings, New: CompiledSettings) -> SettingsDiff:
+    """Compares newly compiled settings with the running settings.
+
+    Hardware is added, removed, replaced when its interface, subscriptions or
+    polled commands change, or updated in place when only its name, options
+    or polling intervals change. Sources are relabeled when only their names
+    change. Every other change, and any replacement or removal of hardware
+    held by a UI controller, is listed in RestartRequired.
+
+    Args:
+        Running (CompiledSettings): the settings the system is running
+        New (CompiledSettings): the new settings
+
+    Returns:
+        SettingsDiff: the changes between the two settings
+    """
+    restart = []
+
+    ## Hardware ----------------------------------------------------------------
+    oldHw = Running.Fingerprint['Hardware']
+    newHw = New.Fingerprint['Hardware']
+    held = set(_HeldHardware(Running) + _HeldHardware(New))
+
+    added = [hwId for hwId in newHw if hwId not in oldHw]
+    removed = [hwId for hwId in oldHw if hwId not in newHw]
+    replaced = []
+    updated = []
+    for hwId in newHw:
+        if hwId not in oldHw or newHw[hwId] == oldHw[hwId]:
+            continue
+        old = oldHw[hwId]
+        new = newHw[hwId]
+        polls = [[{k: v for k, v in poll.items() if k not in ['active_int', 'inactive_int']}
+                  for poll in hw.get('Polling', [])] for hw in [old, new]]
+        if polls[0] != polls[1] or \
+            any([old.get(key, None) != new.get(key, None) for key in ['Manufacturer', 'Model', 'Interface', 'Subscriptions']]):
+            replaced.append(hwId)
+        else:
+            updated.append(hwId)
+
+    for hwId in removed + replaced:
+        if hwId in held:
+            restart.append('hardware ({})'.format(hwId))
+    removed = [hwId for hwId in removed if hwId not in held]
+    replaced = [hwId for hwId in replaced if hwId not in held]
+
+    ## Sources -----------------------------------------------------------------
+    sourceNames = {}
+    oldSrc = Running.Fingerprint['Sources']
+    newSrc = New.Fingerprint['Sources']
+    unnamed = [[{k: v for k, v in src.items() if k != 'name'} for src in srcs] for srcs in [oldSrc, newSrc]]
+    if unnamed[0] != unnamed[1]:
+        restart.append('sources')
+    else:
+        for old, new in zip(oldSrc, newSrc):
+            if old.get('name', None) != new.get('name', None):
+                sourceNames[new['id']] = new.get('name', None)
+
+    ## Everything else ---------------------------------------------------------
+    for name in CompiledSettings.Lists:
+        if name != 'Sources' and Running.Fingerprint[name] != New.Fingerprint[name]:
+            restart.append(name[0].lower() + name[1:])
+
+    for name in CompiledSettings.Scalars:
+        if name != 'RoomName' and _Fingerprint(getattr(Running, name)) != _Fingerprint(getattr(New, name)):
+            restart.append(name)
+
+    return SettingsDiff(
+        HardwareAdded=added,
+        HardwareRemoved=removed,
+        HardwareReplaced=replaced,
+        HardwareUpdated=updated,
+        SourceNames=sourceNames,
+        RoomName=New.RoomName if New.RoomName != Running.RoomName else None,
+        RestartRequired=restart
+    )
+
+## End Function Definitions ----------------------------------------------------
@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Dict, Tuple, List, Union, Callable, cast
 if TYPE_CHECKING: # pragma: no cover
     from uofi_gui import GUIController
     from uofi_gui.uiObjects import ExUIDevice
+    from uofi_gui.systemHardware import SystemHardwareController
 
 ## Begin ControlScript Import --------------------------------------------------
 from extronlib import event
@@ -27,6 +28,7 @@ from extronlib.system import Wait
 ##
 ## Begin Python Imports --------------------------------------------------------
 from collections import namedtuple
+from concurrent.futures import Future
 
 ## End Python Imports ----------------------------------------------------------
 ##
@@ -35,6 +37,7 @@ from collections import namedtuple
 from uofi_gui.sourceControls.destinations import Destination, Source, MatrixTuple
 # from uofi_gui.sourceControls.sources import Source
 from uofi_gui.sourceControls.matrix import MatrixController, MatrixRow
+from uofi_gui.sourceControls.presets import PresetController, RoutingPreset, PresetChangeTuple
 
 from hardware.mersive_solstice_pod import PodFeedbackHelper
 
@@ -58,9 +61,11 @@ class SourceController:
         self.UIHost.Lbls['SourceAlertLabel'].SetText('')
         
         self.Sources = []
+        self.__SourcesById = {}
         for src in self.GUIHost.Sources:
             srcObj = Source(self, **src)
             self.Sources.append(srcObj)
+            self.__SourcesById[srcObj.Id] = srcObj
             # if src.get('srcObj') is None:
             #     src['srcObj'] = {}
             # src['srcObj'][self.UIHost.Id] = srcObj
@@ -68,6 +73,7 @@ class SourceController:
         self.BlankSource = Source(self, 'none', 'None', 0, 0, None, None)
             
         self.Destinations = []
+        self.__DestinationsById = {}
         for dest in self.GUIHost.Destinations:
             if dest.get('rly', None) is not None:
                 dest['rly'] = RelayTuple(Up=dest['rly'][0], Down=dest['rly'][1])
@@ -82,6 +88,7 @@ class SourceController:
             
             destObj = Destination(self, **dest)
             self.Destinations.append(destObj)
+            self.__DestinationsById[destObj.Id] = destObj
             if dest.get('destObj') is None:
                 dest['destObj'] = {}
             dest['destObj'][self.UIHost.Id] = destObj
@@ -129,6 +136,8 @@ class SourceController:
             }
         self.__AdvRlyDest = None
         
+        self.PresetCtl = PresetController(self, self.GUIHost.RoutingPresets)
+        
         self.MatrixSwitch(0, 'All', 'untie')
         
         # Configure Source Selection Buttons
@@ -190,19 +199,15 @@ class SourceController:
                                                         'Output': audDest.Output,
                                                         'Tie Type': 'Audio'})
         
-        # Update destination buttons
-        if self.GUIHost.ActCtl.CurrentActivity == 'adv_share':
-            for d in self.Destinations:
-                d = cast('Destination', d)
-                if d is dest:
-                    d.DestAudioFeedbackHandler(0)
-                else:
-                    if d.Type == 'mon' \
-                        and self.GUIHost.ActCtl.CurrentActivity in ['adv_share', 'group_work'] \
-                        and d.SystemAudioState in [2, 3]: # pragma: no cover
-                            pass # no change required here
-                    else:
-                        d.DestAudioFeedbackHandler(1)
+        self.__SystemAudioFeedback(dest)
+    
+    @property
+    def SystemAudioOutputDestination(self) -> Destination:
+        return self.__SystemAudioOutputDestination
+    
+    @property
+    def MatrixHardware(self) -> 'SystemHardwareController':
+        return self.__Matrix.Hardware
     
     @property
     def Privacy(self) -> bool:
@@ -351,11 +356,14 @@ class SourceController:
             button.SetState(0)
             if button.Name.endswith('Up'):
                 self.UIHost.DispCtl.Destinations[self.__AdvRlyDest.Id]['Scn']['up'].Pulse(0.2)
+                self.UIHost.DispCtl.ScreenPosition[self.__AdvRlyDest.Id] = 'up'
             elif button.Name.endswith('Down'):
                 self.UIHost.DispCtl.Destinations[self.__AdvRlyDest.Id]['Scn']['dn'].Pulse(0.2)
+                self.UIHost.DispCtl.ScreenPosition[self.__AdvRlyDest.Id] = 'down'
             elif button.Name.endswith('Stop'):
                 self.UIHost.DispCtl.Destinations[self.__AdvRlyDest.Id]['Scn']['up'].Pulse(0.2)
                 self.UIHost.DispCtl.Destinations[self.__AdvRlyDest.Id]['Scn']['dn'].Pulse(0.2)
+                self.UIHost.DispCtl.ScreenPosition[self.__AdvRlyDest.Id] = None
                 
     # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
@@ -380,6 +388,28 @@ class SourceController:
         except:
             raise KeyError("At least one destination button not found.")
     
+    def __SystemAudioFeedback(self, dest: Destination) -> None:
+        # Update destination buttons
+        if self.GUIHost.ActCtl.CurrentActivity == 'adv_share':
+            for d in self.Destinations:
+                d = cast('Destination', d)
+                if d is dest:
+                    d.DestAudioFeedbackHandler(0)
+                else:
+                    if d.Type == 'mon' \
+                        and self.GUIHost.ActCtl.CurrentActivity in ['adv_share', 'group_work'] \
+                        and d.SystemAudioState in [2, 3]: # pragma: no cover
+                            pass # no change required here
+                    else:
+                        d.DestAudioFeedbackHandler(1)
+    
+    def __PresetAlertHandler(self, preset: RoutingPreset) -> None:
+        if self.GUIHost.ActCtl.CurrentActivity in ['adv_share']:
+            for dest in preset.Video:
+                dest.AdvSourceAlertHandler()
+        elif self.GUIHost.ActCtl.CurrentActivity in ['share', 'group_work']:
+            self.SourceAlertHandler()
+    
     def __GetSystemAudioInput(self) -> int:
         if self.SystemAudioFollowDestination is None:
             return 0
@@ -428,10 +458,8 @@ class SourceController:
     def GetDestination(self, id: str=None, name: str=None) -> Destination:
         if id == None and name == None:
             raise ValueError("Either Id or Name must be provided")
-        if id != None:
-            for dest in self.Destinations:
-                if dest.Id == id:
-                    return dest
+        if id != None and id in self.__DestinationsById:
+            return self.__DestinationsById[id]
         if name != None:
             for dest in self.Destinations:
                 if dest.Name == name:
@@ -439,9 +467,9 @@ class SourceController:
         raise LookupError('Provided Name ({}) or Id ({}) not found'.format(name, id))
                 
     def GetDestinationByOutput(self, outputNum: int) -> Destination:
-        for dest in self.Destinations:
-            if dest.Output == outputNum:
-                return dest
+        dest = self.GUIHost.Config.DestinationByOutput.get(outputNum, None)
+        if dest is not None:
+            return self.__DestinationsById[dest['id']]
         raise LookupError("Provided Output ({}) is not configured to a destination".format(outputNum))
     
     def GetDestinationIndexByID(self, id: str) -> int:
@@ -465,10 +493,8 @@ class SourceController:
     def GetSource(self, id: str=None, name: str=None) -> Source:
         if id == None and name == None:
             raise ValueError("Either Id or Name must be provided")
-        if id != None:
-            for src in self.Sources:
-                if src.Id == id:
-                    return src
+        if id != None and id in self.__SourcesById:
+            return self.__SourcesById[id]
         if name != None:
             for src in self.Sources:
                 if src.Name == name:
@@ -478,9 +504,9 @@ class SourceController:
     def GetSourceByInput(self, inputNum: int) -> Source:
         if inputNum == 0:
             return self.BlankSource
-        for src in self.Sources:
-            if src.Input == inputNum:
-                return src
+        src = self.GUIHost.Config.SourceByInput.get(inputNum, None)
+        if src is not None:
+            return self.__SourcesById[src['id']]
         raise LookupError("Provided Input ({}) is not configured to a source".format(inputNum))
     
     def GetSourceIndexByID(self, id: str) -> int:
@@ -593,6 +619,26 @@ class SourceController:
             self.__SourceBtns.SetCurrent(self.__SourceBtns.Objects[btnIndex])
             self.__SourceInds.SetCurrent(self.__SourceInds.Objects[btnIndex])
         
+    def RelabelSource(self, id: str, name: str) -> None:
+        """Renames a source and updates the labels showing it.
+
+        Args:
+            id (str): Source ID string
+            name (str): new source name
+        """
+        src = self.GetSource(id = id)
+        if src.Name == name:
+            return
+        src.Name = name
+        
+        for btn, dispSrc in zip(self.__SourceBtns.Objects, self.__DisplaySrcList[self.__Offset:]):
+            if dispSrc is src:
+                btn.SetText(str(name))
+        for dest in self.Destinations:
+            if dest.AssignedSource.Vid is src:
+                dest.UpdateAdvUI()
+        self.__Matrix.UpdateLabels()
+    
     def ShowSelectedSource(self) -> None:
         # Log('Show Selected Source', stack=True)
         if len(self.__DisplaySrcList) > 5 and self.SelectedSource is not None:
@@ -605,6 +651,80 @@ class SourceController:
             
         self.UpdateSourceMenu()
     
+    def TieDestination(self, src: Source, dest: Destination) -> None:
+        """Ties a source to a single destination, honoring the system audio
+        output and system audio follow destinations.
+
+        Args:
+            src (Source): Source to route
+            dest (Destination): Destination to receive the source
+        """        
+        if dest is self.__SystemAudioOutputDestination:
+            dest.AssignMatrixBySource(src, 'Vid')
+            # Assign Video normally
+            self.__Matrix.Hardware.interface.Set('MatrixTieCommand', 
+                                                 value=None,
+                                                 qualifier={'Input': src.Input, 
+                                                            'Output': dest.Output,
+                                                            'Tie Type': 'Video'})
+            # Don't assign audio
+        elif dest is self.__SystemAudioFollowDestination:
+            dest.AssignSource(src)
+            self.__Matrix.Hardware.interface.Set('MatrixTieCommand', 
+                                                 value=None,
+                                                 qualifier={'Input': src.Input, 
+                                                            'Output': dest.Output,
+                                                            'Tie Type': 'Audio/Video'})
+            
+            audInput = self.__GetSystemAudioInput()
+            self.__SystemAudioOutputDestination.AssignMatrixByInput(audInput, 'Aud')
+            # Assign Source Audio from SystemAudioFollowDestination to SystemAudioOutputDestination
+            self.__Matrix.Hardware.interface.Set('MatrixTieCommand', 
+                                                 value=None,
+                                                 qualifier={'Input': audInput, 
+                                                            'Output': dest.Output,
+                                                            'Tie Type': 'Audio'})
+        else: # no special case, assign as normal
+            dest.AssignSource(src)
+            self.__Matrix.Hardware.interface.Set('MatrixTieCommand', 
+                                                 value=None,
+                                                 qualifier={'Input': src.Input, 
+                                                            'Output': dest.Output,
+                                                            'Tie Type': 'Audio/Video'})
+    
+    @RunAsync
+    def RecallPreset(self, preset: Union[RoutingPreset, str]) -> Future:
+        """Recalls a routing preset, sending only the commands required to move
+        from the confirmed room state to the preset. Runs asynchronously, like
+        SwitchSources, so matrix and display commands do not block the caller.
+
+        Args:
+            preset (Union[RoutingPreset, str]): RoutingPreset object or preset Id or Name
+
+        Returns:
+            Future: resolves to the List[PresetChangeTuple] of changes which were sent
+        """        
+        changes = self.PresetCtl.RecallPreset(preset)
+        self.__PresetAlertHandler(self.PresetCtl.GetPreset(preset))
+        return changes
+    
+    def ShowPreset(self, preset: Union[RoutingPreset, str]) -> None:
+        """Updates this panel's routing UI to match a routing preset without
+        sending any commands. The commands are sent once for the room by
+        RecallPreset.
+
+        Args:
+            preset (Union[RoutingPreset, str]): RoutingPreset object or preset Id or Name
+        """
+        presetObj = self.PresetCtl.ApplyPreset(preset)
+        
+        if presetObj.ManageAudio:
+            self.__SystemAudioFollowDestination = presetObj.AudioFollow
+            self.__SystemAudioOutputDestination.AssignMatrixByInput(self.__GetSystemAudioInput(), 'Aud')
+            self.__SystemAudioFeedback(presetObj.AudioFollow)
+        
+        self.__PresetAlertHandler(presetObj)
+    
     @RunAsync # pragma: no cover
     def SwitchSources(self, src: Union[Source, str], dest: Union[str, List[Union[Destination, str]]]='All') -> None:
         
@@ -635,38 +755,7 @@ class SourceController:
             elif type(d) == str:
                 dObj = self.GetDestination(id = d, name = d)
 
-            if dObj is self.__SystemAudioOutputDestination:
-                dObj.AssignMatrixBySource(srcObj, 'Vid')
-                # Assign Video normally
-                self.__Matrix.Hardware.interface.Set('MatrixTieCommand', 
-                                                     value=None,
-                                                     qualifier={'Input': srcObj.Input, 
-                                                                'Output': dObj.Output,
-                                                                'Tie Type': 'Video'})
-                # Don't assign audio
-            elif dObj is self.__SystemAudioFollowDestination:
-                dObj.AssignSource(srcObj)
-                self.__Matrix.Hardware.interface.Set('MatrixTieCommand', 
-                                                     value=None,
-                                                     qualifier={'Input': srcObj.Input, 
-                                                                'Output': dObj.Output,
-                                                                'Tie Type': 'Audio/Video'})
-                
-                audInput = self.__GetSystemAudioInput()
-                self.__SystemAudioOutputDestination.AssignMatrixByInput(audInput, 'Aud')
-                # Assign Source Audio from SystemAudioFollowDestination to SystemAudioOutputDestination
-                self.__Matrix.Hardware.interface.Set('MatrixTieCommand', 
-                                                     value=None,
-                                                     qualifier={'Input': audInput, 
-                                                                'Output': dObj.Output,
-                                                                'Tie Type': 'Audio'})
-            else: # no special case, assign as normal
-                dObj.AssignSource(srcObj)
-                self.__Matrix.Hardware.interface.Set('MatrixTieCommand', 
-                                                     value=None,
-                                                     qualifier={'Input': srcObj.Input, 
-                                                                'Output': dObj.Output,
-                                                                'Tie Type': 'Audio/Video'})
+            self.TieDestination(srcObj, dObj)
             
             if self.GUIHost.ActCtl.CurrentActivity in ['adv_share']:
                 dObj.AdvSourceAlertHandler()
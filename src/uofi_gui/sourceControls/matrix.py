@@ -75,21 +75,7 @@ class MatrixController:
         
         self.__CtlsSet.SetCurrent(0)
         
-        for inLbl in self.__InputLbls:
-            inLbl.SetText('Not Connected')
-        for src in self.SourceController.Sources:
-            src = cast('Source', src)
-            for inLbl in self.__InputLbls:
-                if inLbl.Name.endswith(str(src.Input)):
-                    inLbl.SetText(src.Name)
-            
-        for outLbl in self.__OutputLbls:
-            outLbl.SetText('Not Connected')
-        for dest in self.SourceController.Destinations:
-            dest = cast('Destination', dest)
-            for outLbl in self.__OutputLbls:
-                if outLbl.Name.endswith(str(dest.Output)):
-                    outLbl.SetText(dest.Name)
+        self.UpdateLabels()
         
         @event(self.__CtlsSet.Objects, 'Pressed') # pragma: no cover
         def MatrixModeHandler(button: 'Button', action: str):
@@ -122,6 +108,25 @@ class MatrixController:
         elif button.Name.endswith('Untie'):
             self.Mode = 'untie'
 
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    
+    def UpdateLabels(self) -> None:
+        for inLbl in self.__InputLbls:
+            inLbl.SetText('Not Connected')
+        for src in self.SourceController.Sources:
+            src = cast('Source', src)
+            for inLbl in self.__InputLbls:
+                if inLbl.Name.endswith(str(src.Input)):
+                    inLbl.SetText(src.Name)
+            
+        for outLbl in self.__OutputLbls:
+            outLbl.SetText('Not Connected')
+        for dest in self.SourceController.Destinations:
+            dest = cast('Destination', dest)
+            for outLbl in self.__OutputLbls:
+                if outLbl.Name.endswith(str(dest.Output)):
+                    outLbl.SetText(dest.Name)
+
 class MatrixRow:
     def __init__(self,
                  Matrix: 'MatrixController',
@@ -0,0 +1,280 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import TYPE_CHECKING, Dict, Tuple, List, Union, Callable, cast
+if TYPE_CHECKING: # pragma: no cover
+    from uofi_gui.sourceControls import SourceController
+    from uofi_gui.sourceControls.destinations import Destination
+    from uofi_gui.sourceControls.sources import Source
+
+## Begin ControlScript Import --------------------------------------------------
+
+## End ControlScript Import ----------------------------------------------------
+##
+## Begin Python Imports --------------------------------------------------------
+from collections import namedtuple
+
+## End Python Imports ----------------------------------------------------------
+##
+## Begin User Import -----------------------------------------------------------
+#### Custom Code Modules
+from utilityFunctions import Log
+
+#### Extron Global Scripter Modules
+
+## End User Import -------------------------------------------------------------
+##
+## Begin Class Definitions -----------------------------------------------------
+PresetDisplayTuple = namedtuple('PresetDisplayTuple', ['Power', 'Input'])
+PresetChangeTuple = namedtuple('PresetChangeTuple', ['Type', 'Destination', 'Value'])
+
+class RoutingPreset:
+    ScreenPositions = ['up', 'down']
+
+    def __init__(self,
+                 SrcCtl: 'SourceController',
+                 id: str,
+                 name: str,
+                 video: Dict[str, str]=None,
+                 audioFollow: str=None,
+                 displays: Dict[str, Dict]=None,
+                 screens: Dict[str, str]=None,
+                 activity: str=None) -> None:
+
+        self.SourceController = SrcCtl
+        self.Id = id
+        self.Name = name
+        self.Activity = activity
+
+        # Resolve every reference up front so a bad preset definition is
+        # reported when the controller is built rather than on recall
+        self.Video = {}
+        if video is not None:
+            for destId, srcId in video.items():
+                dest = self.SourceController.GetDestination(id = destId)
+                if srcId is None:
+                    self.Video[dest] = self.SourceController.BlankSource
+                else:
+                    self.Video[dest] = self.SourceController.GetSource(id = srcId)
+
+        # audioFollow of None leaves system audio alone, 'none' clears the
+        # system audio follow destination
+        self.ManageAudio = audioFollow is not None
+        if audioFollow is None or audioFollow == 'none':
+            self.AudioFollow = None
+        else:
+            self.AudioFollow = self.SourceController.GetDestination(id = audioFollow)
+
+        self.Displays = {}
+        if displays is not None:
+            for destId, dispDict in displays.items():
+                dest = self.SourceController.GetDestination(id = destId)
+                power = dispDict.get('power', None)
+                if power not in [None, 'On', 'Off']:
+                    raise ValueError("Display power for preset ({}) must be 'On', 'Off', or None".format(self.Id))
+                self.Displays[dest] = PresetDisplayTuple(Power=power, Input=bool(dispDict.get('input', False)))
+
+        self.Screens = {}
+        if screens is not None:
+            for destId, position in screens.items():
+                dest = self.SourceController.GetDestination(id = destId)
+                if dest.Type != 'proj+scn':
+                    raise ValueError("Preset ({}) screen position provided for destination without a screen ({})".format(self.Id, destId))
+                if position not in self.ScreenPositions:
+                    raise ValueError("Screen position for preset ({}) must be one of {}".format(self.Id, self.ScreenPositions))
+                self.Screens[dest] = position
+
+    def __repr__(self) -> str:
+        return 'RoutingPreset({}, {})'.format(self.Id, self.Name)
+
+class PresetController:
+    def __init__(self, SrcCtl: 'SourceController', Presets: List[Dict]=None) -> None:
+        self.SourceController = SrcCtl
+        self.UIHost = self.SourceController.UIHost
+        self.GUIHost = self.SourceController.GUIHost
+
+        self.Presets = {}
+        if Presets is not None:
+            for preset in Presets:
+                presetObj = RoutingPreset(self.SourceController, **preset)
+                if presetObj.Id in self.Presets:
+                    raise ValueError('Duplicate routing preset Id ({})'.format(presetObj.Id))
+                self.Presets[presetObj.Id] = presetObj
+
+        self.LastPreset = None
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __ConfirmedTie(self, dest: 'Destination', tieType: str) -> int:
+        # Device feedback is the confirmed state, None means unknown and will
+        # always be treated as a change
+        return self.SourceController.MatrixHardware.interface.ReadStatus('OutputTieStatus',
+                                                                         {'Output': dest.Output,
+                                                                          'Tie Type': tieType})
+
+    def __VideoChanges(self, preset: RoutingPreset) -> List[PresetChangeTuple]:
+        changes = []
+        audOutDest = self.SourceController.SystemAudioOutputDestination
+        for dest, src in preset.Video.items():
+            curVid = self.__ConfirmedTie(dest, 'Video')
+            if dest is audOutDest:
+                # audio on this output follows the system audio destination
+                if curVid != src.Input:
+                    changes.append(PresetChangeTuple(Type='Video', Destination=dest, Value=src))
+            else:
+                curAud = self.__ConfirmedTie(dest, 'Audio')
+                if curVid != src.Input or curAud != src.Input:
+                    changes.append(PresetChangeTuple(Type='Audio/Video', Destination=dest, Value=src))
+        return changes
+
+    def __AudioChanges(self, preset: RoutingPreset) -> List[PresetChangeTuple]:
+        changes = []
+        audOutDest = self.SourceController.SystemAudioOutputDestination
+
+        if not preset.ManageAudio:
+            return changes
+        elif preset.AudioFollow is None:
+            audInput = 0
+        elif preset.AudioFollow in preset.Video:
+            audInput = preset.Video[preset.AudioFollow].Input
+        else:
+            audInput = preset.AudioFollow.AssignedSource.Vid.Input
+
+        if preset.AudioFollow is not self.SourceController.SystemAudioFollowDestination \
+            or self.__ConfirmedTie(audOutDest, 'Audio') != audInput:
+            changes.append(PresetChangeTuple(Type='Audio', Destination=preset.AudioFollow, Value=audInput))
+        return changes
+
+    def __DisplayChanges(self, preset: RoutingPreset) -> List[PresetChangeTuple]:
+        changes = []
+        dispCtl = self.UIHost.DispCtl
+        for dest, disp in preset.Displays.items():
+            if disp.Power is not None and dispCtl.GetDisplayPower(dest) != disp.Power:
+                changes.append(PresetChangeTuple(Type='Power', Destination=dest, Value=disp.Power))
+            if disp.Input and disp.Power != 'Off' and not dispCtl.GetDisplaySourceConfirmed(dest):
+                changes.append(PresetChangeTuple(Type='Input', Destination=dest, Value=True))
+        return changes
+
+    def __ScreenChanges(self, preset: RoutingPreset) -> List[PresetChangeTuple]:
+        changes = []
+        dispCtl = self.UIHost.DispCtl
+        for dest, position in preset.Screens.items():
+            if dispCtl.ScreenPosition.get(dest.Id, None) != position:
+                changes.append(PresetChangeTuple(Type='Screen', Destination=dest, Value=position))
+        return changes
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def GetPreset(self, preset: Union[RoutingPreset, str]) -> RoutingPreset:
+        if type(preset) is RoutingPreset:
+            return preset
+        elif type(preset) is str:
+            if preset in self.Presets:
+                return self.Presets[preset]
+            for presetObj in self.Presets.values():
+                if presetObj.Name == preset:
+                    return presetObj
+            raise LookupError('Provided Name or Id ({}) not found'.format(preset))
+        else:
+            raise TypeError('Preset must either be a RoutingPreset object or string Preset Id or Name')
+
+    def GetPresetByActivity(self, activity: str) -> RoutingPreset:
+        for presetObj in self.Presets.values():
+            if presetObj.Activity == activity:
+                return presetObj
+        return None
+
+    def Diff(self, preset: Union[RoutingPreset, str]) -> List[PresetChangeTuple]:
+        """Compare a preset against the confirmed room state.
+
+        Args:
+            preset (Union[RoutingPreset, str]): RoutingPreset object or preset Id or Name
+
+        Returns:
+            List[PresetChangeTuple]: The commands required to recall the preset,
+                ordered video, audio, display, then screen
+        """
+        presetObj = self.GetPreset(preset)
+
+        changes = []
+        changes.extend(self.__VideoChanges(presetObj))
+        changes.extend(self.__AudioChanges(presetObj))
+        changes.extend(self.__DisplayChanges(presetObj))
+        changes.extend(self.__ScreenChanges(presetObj))
+        return changes
+
+    def ApplyPreset(self, preset: Union[RoutingPreset, str]) -> RoutingPreset:
+        """Bring the destination UI model in line with a routing preset without
+        sending any commands.
+
+        Args:
+            preset (Union[RoutingPreset, str]): RoutingPreset object or preset Id or Name
+
+        Returns:
+            RoutingPreset: The preset which was applied
+        """
+        presetObj = self.GetPreset(preset)
+
+        srcCtl = self.SourceController
+        for dest, src in presetObj.Video.items():
+            if dest is srcCtl.SystemAudioOutputDestination:
+                if dest.AssignedSource.Vid is not src:
+                    dest.AssignMatrixBySource(src, 'Vid')
+            elif dest.AssignedSource != (src, src):
+                dest.AssignMatrixBySource(src, 'AV')
+        return presetObj
+
+    def RecallPreset(self, preset: Union[RoutingPreset, str]) -> List[PresetChangeTuple]:
+        """Recall a routing preset, sending only the commands that differ from
+        the confirmed room state.
+
+        Args:
+            preset (Union[RoutingPreset, str]): RoutingPreset object or preset Id or Name
+
+        Returns:
+            List[PresetChangeTuple]: The changes which were sent
+        """
+        presetObj = self.GetPreset(preset)
+        changes = self.Diff(presetObj)
+
+        Log('Recall Preset - {} ({} changes)'.format(presetObj.Name, len(changes)))
+
+        srcCtl = self.SourceController
+        dispCtl = self.UIHost.DispCtl
+        for change in changes:
+            if change.Type in ['Video', 'Audio/Video']:
+                srcCtl.TieDestination(change.Value, change.Destination)
+            elif change.Type == 'Audio':
+                srcCtl.SystemAudioFollowDestination = change.Destination
+            elif change.Type == 'Power':
+                dispCtl.SetDisplayPower(change.Destination, change.Value)
+            elif change.Type == 'Input':
+                dispCtl.SetDisplaySource(change.Destination)
+            elif change.Type == 'Screen':
+                dispCtl.SetScreenPosition(change.Destination, change.Value)
+
+        # Destinations whose tie was already correct still need the UI model
+        # brought in line with the preset
+        self.ApplyPreset(presetObj)
+
+        self.LastPreset = presetObj
+        return changes
+
+## End Class Definitions -------------------------------------------------------
+##
+## Begin Function Definitions --------------------------------------------------
+
+## End Function Definitions ----------------------------------------------------
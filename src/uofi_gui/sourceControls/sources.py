@@ -20,8 +20,79 @@ if TYPE_CHECKING: # pragma: no cover
     from uofi_gui.uiObjects import ExUIDevice
     from uofi_gui.sourceControls import SourceController
 
-from extronlib.system import Timer, Wait
+from extronlib.system import Wait
 from utilityFunctions import Log, RunAsync, debug
+from uofi_gui.timerService import ServiceTimer
+
+import heapq
+import time
+from threading import Lock
+
+class AlertExpiryWheel:
+    """Shared expiry schedule for timed source alerts.
+
+    A single one-shot ServiceTimer is used for every Source. The timer is
+    stopped while no timed alerts are pending and is otherwise set to fire at
+    the next due expiry rather than ticking every second.
+    """
+    def __init__(self) -> None:
+        self.__Heap = []
+        self.__Seq = 0 # tie breaker, keeps heapq from comparing Sources
+        self.__Lock = Lock()
+        self.__Timer = None
+    
+    @property
+    def Pending(self) -> int:
+        return len(self.__Heap)
+    
+    # Event Handlers +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    
+    def __TimerHandler(self, timer: 'ServiceTimer', count: int) -> None:
+        self.Expire()
+    
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    
+    def __Schedule(self, now: float) -> None:
+        # must be called with __Lock held
+        if len(self.__Heap) == 0:
+            if self.__Timer is not None:
+                self.__Timer.Stop()
+            return
+        
+        delay = max(self.__Heap[0][0] - now, 0)
+        if self.__Timer is None:
+            self.__Timer = ServiceTimer(delay, self.__TimerHandler, OneShot=True)
+        else:
+            self.__Timer.Change(delay)
+            self.__Timer.Restart()
+    
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    
+    def Register(self, source: 'Source', msg: str, deadline: float) -> None:
+        with self.__Lock:
+            self.__Seq += 1
+            heapq.heappush(self.__Heap, (deadline, self.__Seq, source, msg))
+            if self.__Heap[0][1] == self.__Seq:
+                # new entry is the next due, reschedule the timer
+                self.__Schedule(time.monotonic())
+    
+    def Expire(self, now: float=None) -> int:
+        if now is None:
+            now = time.monotonic()
+        
+        due = []
+        with self.__Lock:
+            while len(self.__Heap) > 0 and self.__Heap[0][0] <= now:
+                due.append(heapq.heappop(self.__Heap))
+            self.__Schedule(now)
+        
+        expired = 0
+        for deadline, seq, source, msg in due:
+            if source.ExpireAlert(msg, deadline):
+                expired += 1
+        return expired
+
+AlertWheel = AlertExpiryWheel()
 
 class Source:
     def __init__(self,
@@ -42,20 +113,19 @@ class Source:
         self.SourceControlPage = srcCtl
         self.AdvSourceControlPage = advSrcCtl
         
-        self.__AlertText = {}
+        self.__AlertText = {} # msg: expiry deadline, None for no timeout
+        self.__AlertList = []
+        self.__AlertBlock = ''
         self.__AlertIndex = 0
         self.__OverrideAlert = None
         self.__OverrideState = False
         self.__DefaultAlert = alert
-        
-        self.__AlertTimer = Timer(1, self.__AlertTimerHandler)
-        self.__AlertTimer.Stop()
 
     @property
     def AlertText(self):
         if not self.__OverrideState:
-            if len(self.__AlertText) > 0:
-                txt =  list(self.__AlertText.keys())[self.__AlertIndex]
+            if len(self.__AlertList) > 0:
+                txt = self.__AlertList[self.__AlertIndex]
                 self.CycleAlert()
             else:
                 txt = ''
@@ -65,8 +135,7 @@ class Source:
     
     @property
     def AlertBlock(self):
-        block = '\n'.join(self.__AlertText)
-        block = block.strip()
+        block = self.__AlertBlock
         if self.__OverrideState:
             block = '{}\n{}'.format(self.__OverrideAlert, block)
         return block
@@ -91,21 +160,17 @@ class Source:
     
     # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
-    def __AlertTimerHandler(self, timer: 'Timer', count: int):
-        iterList = list(self.__AlertText.keys())
-        for msg in iterList:
-            if self.__AlertText[msg] > 0:
-                self.__AlertText[msg] -= 1
-            elif self.__AlertText[msg] == 0:
-                self.__AlertText.pop(msg)
-        if len(self.__AlertText) == 0:
-            timer.Stop()
+    def __UpdateAlerts(self) -> None:
+        self.__AlertList = list(self.__AlertText.keys())
+        self.__AlertBlock = '\n'.join(self.__AlertList).strip()
+        if self.__AlertIndex >= len(self.__AlertList):
+            self.__AlertIndex = 0
     
     # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
     def CycleAlert(self):
         self.__AlertIndex += 1
-        if self.__AlertIndex >= len(self.__AlertText):
+        if self.__AlertIndex >= len(self.__AlertList):
             self.__AlertIndex = 0
     
     def AppendAlert(self, msg: str=None, timeout: int=0) -> None:
@@ -113,12 +178,22 @@ class Source:
             msg = self.__DefaultAlert
             
         if timeout > 0:
-            self.__AlertText[msg] = timeout
+            deadline = time.monotonic() + timeout
+            self.__AlertText[msg] = deadline
+            AlertWheel.Register(self, msg, deadline)
         else: 
-            self.__AlertText[msg] = -1
+            self.__AlertText[msg] = None
         
-        if self.__AlertTimer.State in ['Paused', 'Stopped']:
-            self.__AlertTimer.Restart()
+        self.__UpdateAlerts()
+    
+    def ExpireAlert(self, msg: str, deadline: float) -> bool:
+        # Alerts which have been cleared or re-appended since registering with
+        # the AlertWheel will not match the deadline and are left alone
+        if msg in self.__AlertText and self.__AlertText[msg] == deadline:
+            self.__AlertText.pop(msg)
+            self.__UpdateAlerts()
+            return True
+        return False
         
     def OverrideAlert(self, msg: str, timeout: int=60) -> None:
         self.__OverrideAlert = msg
@@ -137,11 +212,9 @@ class Source:
             msg = self.__DefaultAlert
             
         self.__AlertText.pop(msg)
-        
-        if len(self.__AlertText) == 0:
-            self.__AlertTimer.Stop()
+        self.__UpdateAlerts()
     
     def ResetAlert(self) -> None:
         self.__AlertText = {}
-        self.__AlertTimer.Stop()
+        self.__UpdateAlerts()
         
\ No newline at end of file
@@ -0,0 +1,246 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import TYPE_CHECKING, Dict, Tuple, List, Union, Callable
+if TYPE_CHECKING: # pragma: no cover
+    from uofi_gui.timerService import ServiceTimer
+
+## Begin ControlScript Import --------------------------------------------------
+from extronlib.system import File
+
+## End ControlScript Import ----------------------------------------------------
+##
+## Begin Python Imports --------------------------------------------------------
+import atexit
+import json
+import time
+from threading import RLock
+
+## End Python Imports ----------------------------------------------------------
+##
+## Begin User Import -----------------------------------------------------------
+#### Custom Code Modules
+from utilityFunctions import Log
+from uofi_gui.timerService import ServiceTimer
+
+#### Extron Global Scripter Modules
+
+## End User Import -------------------------------------------------------------
+##
+## Begin Class Definitions -----------------------------------------------------
+
+class StateStore:
+    """Shared write-behind store for the JSON state files in /user/states.
+
+    Each file is read once and kept in memory. Updates from any panel are
+    merged into the in-memory document and written Debounce seconds after the
+    last update, or at most MaxDelay seconds after the first unwritten update.
+    Files are written to a temporary file which is then renamed over the
+    original, so an interrupted write leaves either the old or the new
+    document on disk. A failed write is retried Debounce seconds later.
+    """
+    def __init__(self, Debounce: float=5, MaxDelay: float=30) -> None:
+        self.Debounce = Debounce
+        self.MaxDelay = MaxDelay
+
+        self.__Lock = RLock()
+        self.__Documents = {}
+        self.__Dirty = {}
+
+        self.__FlushTimer = ServiceTimer(self.Debounce, self.__FlushHandler, OneShot=True)
+        self.__FlushTimer.Stop()
+
+        self.Updates = 0
+        self.Writes = 0
+        self.Failures = 0
+        self.Recoveries = 0
+
+    # Event Handlers +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __FlushHandler(self, timer: 'ServiceTimer', count: int) -> None:
+        self.Flush()
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    @staticmethod
+    def __Copy(value):
+        # a JSON round trip gives the in-memory document the same types as a
+        # document read from file (string keys) and detaches it from the caller
+        return json.loads(json.dumps(value))
+
+    @classmethod
+    def __Merge(cls, target: Dict, values: Dict) -> None:
+        for key, value in values.items():
+            if type(value) is dict and type(target.get(key, None)) is dict:
+                cls.__Merge(target[key], value)
+            else:
+                target[key] = value
+
+    def __ReadFile(self, path: str):
+        stateFile = File(path, 'rt')
+        stateString = stateFile.read()
+        stateFile.close()
+        return json.loads(stateString)
+
+    def __Load(self, path: str):
+        # must be called with __Lock held
+        if path in self.__Documents:
+            return self.__Documents[path]
+
+        tmpPath = '{}.tmp'.format(path)
+        document = None
+        if File.Exists(path):
+            try:
+                document = self.__ReadFile(path)
+            except ValueError:
+                Log('State file ({}) could not be read'.format(path), 'error')
+            if File.Exists(tmpPath):
+                # left over from an interrupted write, the original is intact
+                File.DeleteFile(tmpPath)
+        elif File.Exists(tmpPath):
+            # interrupted between removing the original and renaming the new
+            # document into place (only where the file system will not rename
+            # over a file), the temp file holds the complete new document
+            try:
+                document = self.__ReadFile(tmpPath)
+                File.RenameFile(tmpPath, path)
+                self.Recoveries += 1
+                Log('State file ({}) recovered from interrupted write'.format(path), 'warning')
+            except ValueError:
+                File.DeleteFile(tmpPath)
+
+        self.__Documents[path] = document
+        return document
+
+    def __Write(self, path: str, document) -> None:
+        tmpPath = '{}.tmp'.format(path)
+        tmpFile = File(tmpPath, 'wt')
+        tmpFile.write(json.dumps(document))
+        tmpFile.close()
+
+        try:
+            # replaces the original in a single step
+            File.RenameFile(tmpPath, path)
+        except OSError:
+            # file systems which will not rename over an existing file, an
+            # interruption here is recovered from the temp file by __Load
+            if not File.Exists(path):
+                raise
+            File.DeleteFile(path)
+            File.RenameFile(tmpPath, path)
+        self.Writes += 1
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Exists(self, path: str) -> bool:
+        with self.__Lock:
+            return self.__Load(path) is not None
+
+    def Get(self, path: str, default=None):
+        """Returns a copy of a state document.
+
+        Args:
+            path (str): state file path
+            default (Any, optional): Value returned if the document does not exist. Defaults to None.
+        """
+        with self.__Lock:
+            document = self.__Load(path)
+            if document is None:
+                return default
+            return self.__Copy(document)
+
+    def Update(self, path: str, values: Dict) -> None:
+        """Merges values into a state document and schedules it to be written.
+        Nested dictionaries are merged key by key, so updates of different keys
+        from different panels are all kept.
+
+        Args:
+            path (str): state file path
+            values (Dict): values to merge into the document
+        """
+        with self.__Lock:
+            document = self.__Load(path)
+            if document is None:
+                document = {}
+                self.__Documents[path] = document
+            self.__Merge(document, self.__Copy(values))
+            self.Updates += 1
+
+            now = time.monotonic()
+            if path not in self.__Dirty:
+                self.__Dirty[path] = now
+            firstDirty = min(self.__Dirty.values())
+            delay = max(min(self.Debounce, firstDirty + self.MaxDelay - now), 0)
+            self.__FlushTimer.Change(delay)
+            self.__FlushTimer.Restart()
+
+    def Flush(self, path: str=None) -> None:
+        """Writes pending documents.
+
+        Args:
+            path (str, optional): Only write this state file. Defaults to None.
+        """
+        with self.__Lock:
+            paths = list(self.__Dirty.keys()) if path is None else [p for p in [path] if p in self.__Dirty]
+            for p in paths:
+                try:
+                    self.__Write(p, self.__Documents[p])
+                    self.__Dirty.pop(p)
+                except Exception as inst:
+                    self.Failures += 1
+                    Log('State file ({}) could not be written ({}: {})'.format(p, type(inst), inst), 'error')
+            if len(self.__Dirty) == 0:
+                self.__FlushTimer.Stop()
+            elif len(paths) > 0:
+                # a write failed, documents stay pending and are retried
+                self.__FlushTimer.Change(self.Debounce)
+                self.__FlushTimer.Restart()
+
+    def Release(self, path: str=None) -> None:
+        """Writes pending documents and drops them from memory, the next Get
+        reads from file. Documents which could not be written are kept until
+        a later flush succeeds.
+
+        Args:
+            path (str, optional): Only release this state file. Defaults to None.
+        """
+        with self.__Lock:
+            self.Flush(path)
+            paths = list(self.__Documents.keys()) if path is None else [path]
+            for p in paths:
+                if p not in self.__Dirty:
+                    self.__Documents.pop(p, None)
+
+    def Stats(self) -> Dict[str, int]:
+        with self.__Lock:
+            return \
+                {
+                    'Documents': len(self.__Documents),
+                    'Pending': len(self.__Dirty),
+                    'Updates': self.Updates,
+                    'Writes': self.Writes,
+                    'Failures': self.Failures,
+                    'Recoveries': self.Recoveries
+                }
+
+States = StateStore()
+atexit.register(States.Flush)
+
+## End Class Definitions -------------------------------------------------------
+##
+## Begin Function Definitions --------------------------------------------------
+
+## End Function Definitions ----------------------------------------------------
@@ -0,0 +1,141 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import TYPE_CHECKING, Dict, Tuple, List, Union, Callable
+if TYPE_CHECKING: # pragma: no cover
+    from uofi_gui import GUIController
+
+## Begin ControlScript Import --------------------------------------------------
+
+## End ControlScript Import ----------------------------------------------------
+##
+## Begin Python Imports --------------------------------------------------------
+from collections import deque, namedtuple
+from itertools import islice
+from threading import Lock
+import time
+
+## End Python Imports ----------------------------------------------------------
+##
+## Begin User Import -----------------------------------------------------------
+#### Custom Code Modules
+from utilityFunctions import Log
+
+#### Extron Global Scripter Modules
+
+## End User Import -------------------------------------------------------------
+##
+## Begin Class Definitions -----------------------------------------------------
+
+JournalEntry = namedtuple('JournalEntry', ['Seq', 'Time', 'HardwareId', 'Command', 'Qualifier', 'Old', 'New'])
+
+class StatusJournal:
+    """Bounded journal of driver status changes across all hardware.
+
+    Each status change written by a driver is appended with the next
+    sequence number. Only the last Size changes are kept, so a consumer
+    which remembers the last sequence number it saw fetches just the
+    changes since then, or, once those have been dropped, a snapshot of
+    every hardware status table to start over from. Drivers record changes
+    from their own threads, so the journal is guarded by a lock.
+    """
+    def __init__(self, GUIHost: 'GUIController', Size: int=1024) -> None:
+        self.GUIHost = GUIHost
+        self.Size = Size
+
+        self.__Entries = deque(maxlen=Size)
+        self.__Lock = Lock()
+
+        self.LastSeq = 0
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __Since(self, Seq: int) -> List[JournalEntry]:
+        # caller holds the lock
+        count = self.LastSeq - Seq
+        if count <= 0:
+            return []
+        if count > len(self.__Entries):
+            return None
+        entries = list(islice(reversed(self.__Entries), count))
+        entries.reverse()
+        return entries
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Record(self, HardwareId: str, Command: str, Qualifier: Dict, Old, New) -> int:
+        """Appends a status change.
+
+        Returns:
+            int: sequence number of the change
+        """
+        qualifier = dict(Qualifier) if Qualifier else None
+        with self.__Lock:
+            self.LastSeq += 1
+            self.__Entries.append(JournalEntry(self.LastSeq,
+                                               time.time(),
+                                               HardwareId,
+                                               Command,
+                                               qualifier,
+                                               Old,
+                                               New))
+            return self.LastSeq
+
+    def Since(self, Seq: int) -> List[JournalEntry]:
+        """Returns the changes after sequence number Seq, oldest first, or
+        None if some of them are no longer held.
+        """
+        with self.__Lock:
+            return self.__Since(Seq)
+
+    def Snapshot(self) -> Tuple[int, Dict[str, List[List]]]:
+        """Returns the current sequence number and the status table of
+        every hardware, see SystemHardwareController.StatusTable. Changes
+        recorded while the tables are read are newer than the returned
+        sequence number, so they are also returned by the next Since().
+        """
+        with self.__Lock:
+            seq = self.LastSeq
+        tables = {}
+        for hw in self.GUIHost.Hardware.values():
+            try:
+                tables[hw.Id] = hw.StatusTable()
+            except Exception as inst:
+                Log('Status table for {} could not be read ({}: {})', 'warning',
+                    args=(hw.Id, type(inst), inst), hardwareId=hw.Id)
+        return (seq, tables)
+
+    def Changes(self, Seq: int) -> Tuple[int, List[JournalEntry], Dict[str, List[List]]]:
+        """Returns what changed after sequence number Seq.
+
+        Returns:
+            Tuple[int, List[JournalEntry], Dict]: the sequence number to ask
+                from next time, the changes, and None, or, if the changes
+                are no longer held, an empty list and a Snapshot() table
+        """
+        with self.__Lock:
+            entries = self.__Since(Seq)
+            seq = self.LastSeq
+        if entries is not None:
+            return (seq, entries, None)
+        seq, tables = self.Snapshot()
+        return (seq, [], tables)
+
+## End Class Definitions -------------------------------------------------------
+##
+## Begin Function Definitions --------------------------------------------------
+
+## End Function Definitions ----------------------------------------------------
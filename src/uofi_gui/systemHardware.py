@@ -40,6 +40,7 @@ import importlib
 import math
 import re
 import functools
+from threading import Lock
 
 ## End Python Imports ----------------------------------------------------------
 ##
@@ -47,7 +48,8 @@ import functools
 #### Custom Code Modules
 
 from ConnectionHandler import GetConnectionHandler
-from utilityFunctions import Log, RunAsync, debug, DictValueSearchByKey, SortKeys
+from utilityFunctions import Log, RunAsync, debug, DictValueSearchByKey, SortKeys, AsyncExecutor
+from uofi_gui.timerService import ServiceTimer
 
 #### Extron Global Scripter Modules
 
@@ -62,8 +64,16 @@ class VirtualDeviceInterface:
         self.__AssignmentDict = AssignmentDict
     
     def FindAssociatedHardware(self):
-        # iterate through self.GUIHost.Hardware and find devices with matching 'MatrixAssignment'
-        for Hw in self.GUIHost.Hardware.values(): # GUIHost attribute must exist in parent class
+        # hardware assigned by the 'MatrixAssignment' option is indexed by the
+        # compiled settings, other assignment attributes are searched for in
+        # self.GUIHost.Hardware
+        config = getattr(self.GUIHost, 'Config', None) # GUIHost attribute must exist in parent class
+        if self.__AssignmentAttribute == 'MatrixAssignment' and config is not None:
+            hardware = [self.GUIHost.Hardware[hw['Id']] for hw in config.HardwareByGroup.get(self.VirtualDeviceID, ())
+                        if hw['Id'] in self.GUIHost.Hardware]
+        else:
+            hardware = self.GUIHost.Hardware.values()
+        for Hw in hardware:
             if hasattr(Hw, self.__AssignmentAttribute) and getattr(Hw, self.__AssignmentAttribute) == self.VirtualDeviceID:
                 for key, value in self.__AssignmentDict.items():
                     if hasattr(Hw, key):
@@ -79,10 +89,19 @@ class SystemHardwareController:
         self.ConnectionStatus = 'Not Connected'
         self.LastStatusChange = None
         
+        # last known values restored from the warm-start snapshot, dropped as
+        # the device confirms them
+        self.ProvisionalStatus = {}
+        self.__Restoring = False
+        
+        # listeners live in the GUI host's subscription registry, the driver
+        # is subscribed once per command and qualifier
+        self.__Subscribed = set()
+        self.__Parameters = {}
+        
+        self.__OptionKeys = []
         if Options is not None:
-            for key in Options:
-                if not hasattr(self, key):
-                    setattr(self, key, Options[key])
+            self.ApplyOptions(Options)
         
         # interface = {
         #     "module": module_name,
@@ -109,6 +128,11 @@ class SystemHardwareController:
             self.interface = self.__Constructor(**Interface['interface_configuration'])
         
         self.interface.SubscribeStatus('ConnectionStatus', None, self.__ConnectionStatus)
+        
+        # status changes are journaled by drivers with a status store
+        statusStore = getattr(self.interface, 'StatusStore', None)
+        if statusStore is not None:
+            statusStore.ChangeHook = functools.partial(self.GUIHost.Journal.Record, self.Id)
 
         # subscriptions = [
         #     {
@@ -141,15 +165,7 @@ class SystemHardwareController:
         
         for poll in Polling:
             qualPoll = self.GetQualifierList(poll)
-            
-            if 'active_int' in poll:
-                actInt = poll['active_int']
-            else:
-                actInt = None
-            if 'inactive_int' in poll:
-                inactInt = poll['inactive_int']
-            else:
-                inactInt = None
+            actInt, inactInt = self.__PollIntervals(poll)
             
             for qp in qualPoll:
                 self.GUIHost.PollCtl.AddPolling(self.interface,
@@ -166,16 +182,98 @@ class SystemHardwareController:
                     
     # Event Handlers +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
+    def __StatusChanged(self, key: Tuple, command, value, qualifier):
+        if not self.__Restoring:
+            self.ConfirmStatus(command, qualifier)
+        if key is None:
+            key = self.QualifierKey(command, qualifier)
+        for callback, tag in self.GUIHost.SubscriptionCtl.Listeners(self.Id, command, key):
+            if tag is None:
+                callback(command, value, qualifier, hardware=self)
+            else:
+                callback(command, value, qualifier, hardware=self, tag=tag)
+    
     # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
+    @staticmethod
+    def __StatusKey(command: str, qualifier: Dict=None) -> Tuple:
+        if qualifier:
+            return (command, tuple(sorted(qualifier.items())))
+        return (command, None)
+    
+    @staticmethod
+    def __PollIntervals(poll: Dict) -> Tuple:
+        return (poll.get('active_int', None), poll.get('inactive_int', None))
+    
     def __ConnectionStatus(self, command, value, qualifier):
-        Log('{} {} Callback; Value: {}; Qualifier {}'.format(self.Name, command, value, qualifier))
+        Log('{} {} Callback; Value: {}; Qualifier {}', args=(self.Name, command, value, qualifier),
+            hardwareId=self.Id, event=command, fields={'value': value, 'qualifier': qualifier})
         if value != self.ConnectionStatus:
             self.ConnectionStatus = value
             self.LastStatusChange = datetime.now()
     
     # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
+    def ApplyOptions(self, Options: Dict) -> List[str]:
+        """Sets hardware options as attributes. Options never overwrite an
+        attribute of the controller which did not come from Options.
+        
+        Args:
+            Options (Dict): hardware options from settings
+        
+        Returns:
+            List[str]: the option keys which changed
+        """
+        changed = []
+        for key in Options:
+            if key in self.__OptionKeys:
+                if getattr(self, key) == Options[key]:
+                    continue
+            elif hasattr(self, key):
+                continue
+            else:
+                self.__OptionKeys.append(key)
+            setattr(self, key, Options[key])
+            changed.append(key)
+        return changed
+    
+    def RetunePolling(self, Polling: List[Dict]) -> int:
+        """Applies new polling intervals to this hardware's polling entries.
+        Intervals missing from settings return to the polling defaults.
+        
+        Args:
+            Polling (List[Dict]): polling list from settings
+        
+        Returns:
+            int: number of polling entries changed
+        """
+        count = 0
+        for poll in Polling:
+            actInt, inactInt = self.__PollIntervals(poll)
+            for qp in self.GetQualifierList(poll):
+                count += self.GUIHost.PollCtl.RetunePolling(self.interface,
+                                                            poll['command'],
+                                                            qualifier=qp,
+                                                            active_duration=actInt,
+                                                            inactive_duration=inactInt)
+        return count
+    
+    def Release(self) -> None:
+        """Removes this hardware's polling and closes its connection, used
+        when hardware is removed or replaced by a settings reload.
+        """
+        self.GUIHost.PollCtl.RemoveInterface(self.interface)
+        self.GUIHost.SubscriptionCtl.RemoveHardware(self.Id)
+        statusStore = getattr(self.interface, 'StatusStore', None)
+        if statusStore is not None:
+            statusStore.ChangeHook = None
+        if callable(getattr(self.interface, 'Disconnect', None)):
+            try:
+                self.interface.Disconnect()
+            except Exception as inst:
+                Log('{} could not be disconnected ({}: {})', 'warning',
+                    args=(self.Name, type(inst), inst), hardwareId=self.Id)
+    
     def GetQualifierList(self, subscription):
         qualList = [None]
         if 'qualifier' in subscription and subscription['qualifier'] is not None:
@@ -190,26 +288,194 @@ class SystemHardwareController:
                 raise TypeError('Qualifier must be a dictionary')
         return qualList
 
+    def QualifierKey(self, command: str, qualifier: Dict=None) -> Tuple:
+        """Returns the qualifier values in the driver's Parameters order, a
+        parameter missing from the qualifier is SubscriptionRegistry.Wildcard.
+        Qualifiers of drivers without Commands are ordered by parameter name.
+        """
+        params = self.__Parameters.get(command, None)
+        if params is None:
+            cmdDict = getattr(self.interface, 'Commands', {}).get(command, None)
+            if type(cmdDict) is not dict:
+                return tuple([qualifier[key] for key in sorted(qualifier)]) if qualifier else ()
+            params = self.__Parameters[command] = tuple(cmdDict.get('Parameters', []))
+        if not qualifier:
+            return (SubscriptionRegistry.Wildcard,) * len(params)
+        return tuple([qualifier.get(param, SubscriptionRegistry.Wildcard) for param in params])
+    
     def AddSubscription(self, subscription, qualifier):
         if callable(subscription['callback']):
-            if 'tag' in subscription:
-                callbackFn = functools.partial(subscription['callback'], hardware=self, tag=subscription['tag'])
-            else:
-                callbackFn = functools.partial(subscription['callback'], hardware=self)
+            callback = subscription['callback']
         elif type(subscription['callback']) is str and hasattr(self.interface, subscription['callback']):
-            if 'tag' in subscription:
-                callbackFn = functools.partial(getattr(self.interface, subscription['callback']), hardware=self, tag=subscription['tag'])
-            else:
-                callbackFn = functools.partial(getattr(self.interface, subscription['callback']), hardware=self)
+            callback = getattr(self.interface, subscription['callback'])
         else:
             raise TypeError('Callback must either be a callable or a string matching a name of an interface method.')
-                
-        self.interface.SubscribeStatus(subscription['command'],
-                                       qualifier,
-                                       callbackFn)
+        
+        command = subscription['command']
+        key = self.QualifierKey(command, qualifier)
+        self.GUIHost.SubscriptionCtl.Add(self.Id, command, key, callback, subscription.get('tag', None))
+        
+        # a wildcard listener needs every status change of the command, which
+        # the driver sends to a subscription without a qualifier, and each of
+        # those changes has to be keyed when it arrives
+        if SubscriptionRegistry.Wildcard in key:
+            qualifier = None
+            key = None
+        if (command, key) not in self.__Subscribed:
+            self.__Subscribed.add((command, key))
+            self.interface.SubscribeStatus(command, qualifier, functools.partial(self.__StatusChanged, key))
+    
+    def StatusTable(self) -> List[List]:
+        """Returns the driver's confirmed status, and any provisional status
+        not yet confirmed, as a list of [command, qualifier, value] entries.
+        """
+        entries = []
+        statusStore = getattr(self.interface, 'StatusStore', None)
+        if statusStore is not None:
+            for command, qualifier, value in statusStore.Items():
+                if command != 'ConnectionStatus' and type(value) in [str, int, float, bool]:
+                    entries.append([command, qualifier, value])
+        
+        confirmed = set([self.__StatusKey(e[0], e[1]) for e in entries])
+        # copied, as status confirmed by a driver thread removes entries
+        for key, entry in self.ProvisionalStatus.copy().items():
+            if key not in confirmed:
+                entries.append(list(entry))
+        return entries
+    
+    def RestoreStatus(self, entries: List[List]) -> None:
+        """Loads provisional status from a snapshot. Provisional values are
+        sent to status subscriptions so the UI reflects the last known state,
+        but are not written to the driver, which only holds confirmed status.
+        
+        Args:
+            entries (List[List]): [command, qualifier, value] entries from StatusTable
+        """
+        newStatus = getattr(self.interface, 'NewStatus', None)
+        commands = getattr(self.interface, 'Commands', {})
+        self.__Restoring = True
+        try:
+            for command, qualifier, value in entries:
+                if command not in commands or self.interface.ReadStatus(command, qualifier) is not None:
+                    continue
+                self.ProvisionalStatus[self.__StatusKey(command, qualifier)] = (command, qualifier, value)
+                if callable(newStatus):
+                    try:
+                        newStatus(command, value, qualifier)
+                    except Exception as inst:
+                        Log('{} provisional status could not be applied ({} {}: {})', 'warning',
+                            args=(self.Name, command, qualifier, inst), hardwareId=self.Id)
+        finally:
+            self.__Restoring = False
+    
+    def ConfirmStatus(self, command: str, qualifier: Dict=None) -> None:
+        if len(self.ProvisionalStatus) > 0:
+            self.ProvisionalStatus.pop(self.__StatusKey(command, qualifier), None)
+    
+    def IsStale(self, command: str=None, qualifier: Dict=None) -> bool:
+        """Checks for provisional status which has not been confirmed.
+        
+        Args:
+            command (str, optional): Command to check. Defaults to any command.
+            qualifier (Dict, optional): Qualifier to check. Defaults to None.
+        """
+        if command is None:
+            return len(self.ProvisionalStatus) > 0
+        return self.__StatusKey(command, qualifier) in self.ProvisionalStatus
+    
+    def GetStatus(self, command: str, qualifier: Dict=None):
+        """Returns the confirmed status if known, otherwise the provisional
+        status from the snapshot, otherwise None.
+        """
+        value = self.interface.ReadStatus(command, qualifier)
+        if value is not None:
+            self.ConfirmStatus(command, qualifier)
+            return value
+        entry = self.ProvisionalStatus.get(self.__StatusKey(command, qualifier), None)
+        return entry[2] if entry is not None else None
     
+class SubscriptionRegistry:
+    """Status listeners for all hardware, keyed by (hardware Id, command,
+    qualifier key). Qualifier keys are the qualifier values in the driver's
+    Parameters order; a Wildcard value matches any value of its parameter.
+
+    Listeners are (callback, tag) pairs and an identical listener is only
+    registered once per key. The listeners of every qualifier key seen are
+    merged once, exact listeners first, so finding the listeners for a status
+    change is a single dict lookup.
+    """
+    Wildcard = '*'
+
+    def __init__(self) -> None:
+        self.__Exact = {}
+        self.__Wildcards = {}
+        self.__Merged = {}
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __Merge(self, key: Tuple) -> Tuple:
+        listeners = list(self.__Exact.get(key, []))
+        for values, listener in self.__Wildcards.get(key[:2], []):
+            if listener in listeners or len(values) != len(key[2]):
+                continue
+            if all([v == self.Wildcard or v == k for v, k in zip(values, key[2])]):
+                listeners.append(listener)
+        merged = self.__Merged[key] = tuple(listeners)
+        return merged
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Add(self, HardwareId: str, Command: str, QualifierKey: Tuple, Callback: Callable, Tag=None) -> bool:
+        """Registers a listener.
+
+        Args:
+            HardwareId (str): hardware Id
+            Command (str): status command
+            QualifierKey (Tuple): qualifier values, may include Wildcard
+            Callback (Callable): called with command, value, qualifier,
+                hardware, and tag if Tag is not None
+            Tag (str|tuple, optional): subscription tag. Defaults to None.
+
+        Returns:
+            bool: False if the listener was already registered for the key
+        """
+        listener = (Callback, Tag)
+        if self.Wildcard in QualifierKey:
+            entries = self.__Wildcards.setdefault((HardwareId, Command), [])
+            if (QualifierKey, listener) in entries:
+                return False
+            entries.append((QualifierKey, listener))
+        else:
+            entries = self.__Exact.setdefault((HardwareId, Command, QualifierKey), [])
+            if listener in entries:
+                return False
+            entries.append(listener)
+        self.__Merged.clear()
+        return True
+
+    def Listeners(self, HardwareId: str, Command: str, QualifierKey: Tuple) -> Tuple:
+        """Returns the (callback, tag) listeners for a status change."""
+        key = (HardwareId, Command, QualifierKey)
+        merged = self.__Merged.get(key, None)
+        if merged is None:
+            merged = self.__Merge(key)
+        return merged
+
+    def RemoveHardware(self, HardwareId: str) -> int:
+        """Removes every listener of a hardware Id.
+
+        Returns:
+            int: number of listeners removed
+        """
+        count = 0
+        for listeners in (self.__Exact, self.__Wildcards):
+            for key in [key for key in listeners if key[0] == HardwareId]:
+                count += len(listeners.pop(key))
+        self.__Merged.clear()
+        return count
+
 class SystemPollingController:
-    def __init__(self, active_duration: int=5, inactive_duration: int=300) -> None:
+    def __init__(self, active_duration: int=5, inactive_duration: int=300, poll_workers: int=4) -> None:
         self.Polling = []
         
         self.__PollingState = 'stopped'
@@ -217,25 +483,56 @@ class SystemPollingController:
         self.__DefaultActiveDur = active_duration
         self.__DefaultInactiveDur = inactive_duration
         
-        self.__InactivePolling = Timer(1, self.__InactivePollingHandler)
+        # Driver Updates may block (SendAndWait, HTTP timeouts), so polls run
+        # on their own workers rather than on the shared timer thread or the
+        # RunAsync pool used by the UI
+        self.PollPool = AsyncExecutor(MaxWorkers=poll_workers)
+        self.__InFlight = set()
+        self.__InFlightLock = Lock()
+        self.Skipped = 0
+        
+        self.__InactivePolling = ServiceTimer(1, self.__InactivePollingHandler)
         self.__InactivePolling.Stop()
-        self.__ActivePolling = Timer(1, self.__ActivePollingHandler)
+        self.__ActivePolling = ServiceTimer(1, self.__ActivePollingHandler)
         self.__ActivePolling.Stop()
     
     # Event Handlers +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
-    def __ActivePollingHandler(self, timer: 'Timer', count: int):
-        for poll in self.Polling:
-            if (count % poll['active_duration']) == 0:
-                self.__PollInterface(poll['interface'], poll['command'], poll['qualifier'])
+    def __ActivePollingHandler(self, timer: 'ServiceTimer', count: int):
+        self.__Dispatch([poll for poll in self.Polling if (count % poll['active_duration']) == 0])
     
-    def __InactivePollingHandler(self, timer: 'Timer', count: int):
-        for poll in self.Polling:
-            if (count % poll['inactive_duration']) == 0:
-                self.__PollInterface(poll['interface'], poll['command'], poll['qualifier'])
+    def __InactivePollingHandler(self, timer: 'ServiceTimer', count: int):
+        self.__Dispatch([poll for poll in self.Polling if (count % poll['inactive_duration']) == 0])
     
     # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
+    def __Dispatch(self, polls: List[Dict]) -> int:
+        # one job per interface keeps each driver's polls in order and off
+        # concurrent threads. An interface still busy with its previous polls
+        # is skipped this interval, as a Timer skips an overrun interval.
+        byInterface = {}
+        for poll in polls:
+            byInterface.setdefault(id(poll['interface']), []).append(poll)
+        
+        submitted = 0
+        for key, interfacePolls in byInterface.items():
+            with self.__InFlightLock:
+                if key in self.__InFlight:
+                    self.Skipped += 1
+                    continue
+                self.__InFlight.add(key)
+            self.PollPool.Submit(self.__PollBatch, key, interfacePolls)
+            submitted += 1
+        return submitted
+    
+    def __PollBatch(self, key: int, polls: List[Dict]) -> None:
+        try:
+            for poll in polls:
+                self.__PollInterface(poll['interface'], poll['command'], poll['qualifier'])
+        finally:
+            with self.__InFlightLock:
+                self.__InFlight.discard(key)
+    
     def __PollInterface(self, interface, command, qualifier=None): # pragma: no cover
         try:
             interface.Update(command, qualifier=qualifier)
@@ -244,8 +541,23 @@ class SystemPollingController:
     
     # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
-    def PollEverything(self):
-        for poll in self.Polling:
+    def PollEverything(self, Priority: Callable=None, Interface=None, Filter: Callable=None):
+        """Polls every polling entry once.
+        
+        Args:
+            Priority (Callable, optional): sort key for the polling entries,
+                lower values are polled first. Defaults to None.
+            Interface (optional): only poll the entries of this interface.
+                Defaults to None.
+            Filter (Callable, optional): only poll the entries for which
+                Filter returns True. Defaults to None.
+        """
+        polls = self.Polling if Interface is None else [poll for poll in self.Polling if poll['interface'] is Interface]
+        if Filter is not None:
+            polls = [poll for poll in polls if Filter(poll)]
+        if Priority is not None:
+            polls = sorted(polls, key=Priority)
+        for poll in polls:
             self.__PollInterface(poll['interface'], poll['command'], poll['qualifier'])
             
     def StartPolling(self, mode: str='inactive'):
@@ -314,6 +626,30 @@ class SystemPollingController:
                 self.Polling.pop(i)
                 break
             
+    def RemoveInterface(self, interface) -> int:
+        count = len(self.Polling)
+        self.Polling = [poll for poll in self.Polling if poll['interface'] is not interface]
+        return count - len(self.Polling)
+    
+    def RetunePolling(self, interface, command, qualifier=None, active_duration: int=None, inactive_duration: int=None) -> int:
+        """Sets the intervals of the matching polling entries. Unlike
+        UpdatePolling, the qualifier must match and an interval of None
+        returns the entry to the default interval.
+        
+        Returns:
+            int: number of polling entries changed
+        """
+        actDur = active_duration if active_duration is not None else self.__DefaultActiveDur
+        inactDur = inactive_duration if inactive_duration is not None else self.__DefaultInactiveDur
+        count = 0
+        for poll in self.Polling:
+            if interface is poll['interface'] and command == poll['command'] and qualifier == poll['qualifier']:
+                if poll['active_duration'] != actDur or poll['inactive_duration'] != inactDur:
+                    poll['active_duration'] = actDur
+                    poll['inactive_duration'] = inactDur
+                    count += 1
+        return count
+    
     def UpdatePolling(self, interface, command, qualifier={}, active_duration: int=None, inactive_duration: int=None):
         for i in range(len(self.Polling)):
             if interface is self.Polling[i]['interface'] and command == self.Polling[i]['command']:
@@ -354,7 +690,7 @@ class SystemStatusController:
         
         self.__CurrentPageIndex = 0
         
-        self.UpdateTimer = Timer(15, self.__UpdateHandler)
+        self.UpdateTimer = ServiceTimer(15, self.__UpdateHandler)
         self.UpdateTimer.Stop()
         
         self.__ClearStatusIcons()
@@ -394,7 +730,7 @@ class SystemStatusController:
             self.__UpdatePagination()
             self.__ShowStatusIcons()
             
-    def __UpdateHandler(self, timer: 'Timer', count: int):
+    def __UpdateHandler(self, timer: 'ServiceTimer', count: int):
         self.UpdateStatusIcons()
 
     # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -513,6 +849,11 @@ class SystemStatusController:
     
     # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
+    def UpdateHardware(self):
+        self.Hardware = list(self.GUIHost.Hardware.values())
+        self.Hardware.sort(key=SortKeys.HardwareSort)
+        self.ResetPages()
+    
     def ResetPages(self):
         self.__CurrentPageIndex = 0
         self.__UpdatePagination()
@@ -26,7 +26,7 @@ if TYPE_CHECKING: # pragma: no cover
 
 ## Begin ControlScript Import --------------------------------------------------
 from extronlib import event
-from extronlib.system import MESet, Timer
+from extronlib.system import MESet
 
 ## End ControlScript Import ----------------------------------------------------
 ##
@@ -40,6 +40,7 @@ from math import floor as roundDown
 ## Begin User Import -----------------------------------------------------------
 #### Custom Code Modules
 from utilityFunctions import DictValueSearchByKey, Log, RunAsync, debug
+from uofi_gui.timerService import ServiceTimer
 
 #### Extron Global Scripter Modules
 
@@ -56,7 +57,7 @@ class TechMenuController:
         self.TechMenuOpen = False
         
         # Private Properties
-        self.__AboutUpdateTimer = Timer(5, self.__AboutUpdateHandler)
+        self.__AboutUpdateTimer = ServiceTimer(5, self.__AboutUpdateHandler)
         self.__AboutUpdateTimer.Stop()
         
         self.__AboutLabels = DictValueSearchByKey(self.UIHost.Lbls, r'Proc(?:Info|Status)Label-(\w+)', regex=True, capture_dict=True)
@@ -263,7 +264,7 @@ class TechMenuController:
         slider.SetFill(value)
         self.UIHost.SetVolume('Master', int(value))
     
-    def __AboutUpdateHandler(self, timer: Timer, count: int):
+    def __AboutUpdateHandler(self, timer: ServiceTimer, count: int):
         used = roundDown(self.GUIHost.CtlProc_Main.UserUsage[0]/1024)
         total = roundDown(self.GUIHost.CtlProc_Main.UserUsage[1]/1024)
         self.__AboutLabels['Storage'].SetText('{}/{} MB'.format(used, total))
@@ -0,0 +1,286 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import TYPE_CHECKING, Dict, Tuple, List, Union, Callable
+
+## Begin ControlScript Import --------------------------------------------------
+
+## End ControlScript Import ----------------------------------------------------
+##
+## Begin Python Imports --------------------------------------------------------
+import heapq
+import time
+import traceback
+from threading import Condition, Thread
+from weakref import WeakSet
+
+## End Python Imports ----------------------------------------------------------
+##
+## Begin User Import -----------------------------------------------------------
+#### Custom Code Modules
+from utilityFunctions import Log
+
+#### Extron Global Scripter Modules
+
+## End User Import -------------------------------------------------------------
+##
+## Begin Class Definitions -----------------------------------------------------
+
+class TimerService:
+    """Process-wide scheduler running every ServiceTimer from a single thread.
+
+    Timers are kept in a deadline queue and the scheduler thread sleeps until
+    the earliest deadline. Deadlines falling within Slack seconds of each other
+    are dispatched on the same wakeup.
+    """
+    Slack = 0.01
+
+    def __init__(self) -> None:
+        self.__Queue = []
+        self.__Stale = 0
+        self.__Seq = 0
+        self.__Condition = Condition()
+        self.__Thread = None
+        self.__Timers = WeakSet()
+        self.__StartTime = time.monotonic()
+
+        self.Wakeups = 0
+        self.Dispatched = 0
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __Run(self) -> None: # pragma: no cover
+        while True:
+            with self.__Condition:
+                while True:
+                    # cancelled and rescheduled entries are dropped lazily
+                    while len(self.__Queue) > 0 and self.__Queue[0][2].Token != self.__Queue[0][1]:
+                        heapq.heappop(self.__Queue)
+                        self.__Stale -= 1
+                    now = time.monotonic()
+                    if len(self.__Queue) == 0:
+                        self.__Condition.wait()
+                    elif self.__Queue[0][0] > now:
+                        self.__Condition.wait(self.__Queue[0][0] - now)
+                    else:
+                        break
+                due = self.__PopDue(now)
+                self.Wakeups += 1
+
+            self.__Dispatch(due)
+
+    def __PopDue(self, now: float) -> List[Tuple[float, int, 'ServiceTimer']]:
+        # must be called with __Condition held
+        due = []
+        while len(self.__Queue) > 0 and self.__Queue[0][0] <= now + self.Slack:
+            entry = heapq.heappop(self.__Queue)
+            if entry[2].Token == entry[1]:
+                due.append(entry)
+            else:
+                self.__Stale -= 1
+        return due
+
+    def __Invalidate(self, timer: 'ServiceTimer') -> None:
+        # must be called with __Condition held
+        if timer.Token is not None:
+            timer.Token = None
+            self.__Stale += 1
+            # stale entries hold references to their timers, rebuild the queue
+            # once they make up most of it
+            if self.__Stale > 64 and self.__Stale * 2 > len(self.__Queue):
+                self.__Queue = [e for e in self.__Queue if e[2].Token == e[1]]
+                heapq.heapify(self.__Queue)
+                self.__Stale = 0
+
+    def __Dispatch(self, due: List[Tuple[float, int, 'ServiceTimer']]) -> None:
+        for deadline, token, timer in due:
+            self.Dispatched += 1
+            try:
+                timer.Fire(deadline, token)
+            except Exception as inst:
+                Log('Timer handler raised an exception ({})\n    {}'.format(type(inst), traceback.format_exc()), 'error')
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Register(self, timer: 'ServiceTimer') -> None:
+        self.__Timers.add(timer)
+
+    def Schedule(self, timer: 'ServiceTimer', deadline: float, expected: int=None) -> bool:
+        """Add a timer to the deadline queue, replacing any pending deadline.
+
+        Args:
+            timer (ServiceTimer): the timer to schedule
+            deadline (float): time.monotonic() time to fire at
+            expected (int, optional): only schedule if the timer's current
+                Token matches. Used to reschedule from a handler without
+                overriding a Stop or Restart made during the handler.
+
+        Returns:
+            bool: True if the timer was scheduled
+        """
+        with self.__Condition:
+            if expected is not None and timer.Token != expected:
+                return False
+            self.__Invalidate(timer)
+            self.__Seq += 1
+            timer.Token = self.__Seq
+            heapq.heappush(self.__Queue, (deadline, self.__Seq, timer))
+
+            if self.__Thread is None:
+                self.__Thread = Thread(target=self.__Run, name='TimerService', daemon=True)
+                self.__Thread.start()
+            elif self.__Queue[0][1] == self.__Seq:
+                # new earliest deadline, wake the scheduler so it can resleep
+                self.__Condition.notify()
+            return True
+
+    def Cancel(self, timer: 'ServiceTimer') -> None:
+        with self.__Condition:
+            self.__Invalidate(timer)
+
+    def RunPending(self, now: float=None) -> int:
+        """Dispatch every due timer on the calling thread.
+
+        Args:
+            now (float, optional): time.monotonic() time to treat as now
+
+        Returns:
+            int: number of timers dispatched
+        """
+        if now is None:
+            now = time.monotonic()
+        with self.__Condition:
+            due = self.__PopDue(now)
+        self.__Dispatch(due)
+        return len(due)
+
+    def Stats(self) -> Dict[str, Union[int, float]]:
+        minutes = max((time.monotonic() - self.__StartTime) / 60, 1/60)
+        timers = list(self.__Timers)
+        return \
+            {
+                'Threads': 1 if self.__Thread is not None and self.__Thread.is_alive() else 0,
+                'Timers': len(timers),
+                'Running': len([t for t in timers if t.State == 'Running']),
+                'Queued': len(self.__Queue),
+                'Wakeups': self.Wakeups,
+                'WakeupsPerMinute': round(self.Wakeups / minutes, 2),
+                'Dispatched': self.Dispatched
+            }
+
+class ServiceTimer:
+    """Drop-in replacement for extronlib.system.Timer run by the TimerService.
+
+    The handler (Function) is called with the timer and the Count, as with
+    extronlib Timers. If a handler is still running when the next Interval
+    expires, that interval is skipped. OneShot timers stop after firing once.
+    StateChanged, if set, is called with the timer and the new state.
+    """
+    def __init__(self, Interval: float, Function: Callable=None, OneShot: bool=False, Service: TimerService=None) -> None:
+        self.Interval = Interval
+        self.Function = Function
+        self.OneShot = OneShot
+        self.Count = 0
+        self.State = 'Stopped'
+        self.StateChanged = None
+        self.Token = None
+
+        self.__Service = Service if Service is not None else Scheduler
+        self.__Deadline = None
+        self.__Remaining = None
+
+        self.__Service.Register(self)
+
+        # extronlib Timers start running on creation
+        self.Restart()
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __SetState(self, state: str) -> None:
+        if state != self.State:
+            self.State = state
+            if callable(self.StateChanged):
+                self.StateChanged(self, state)
+
+    def __Schedule(self, delay: float) -> None:
+        self.__Deadline = time.monotonic() + delay
+        self.__Service.Schedule(self, self.__Deadline)
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Fire(self, deadline: float, token: int) -> None:
+        if token != self.Token or self.State != 'Running':
+            return
+
+        self.Count += 1
+        if self.Function is not None:
+            self.Function(self, self.Count)
+
+        if self.OneShot:
+            if self.Token == token:
+                self.__Service.Cancel(self)
+                self.Count = 0
+                self.__SetState('Stopped')
+            return
+
+        now = time.monotonic()
+        nextDeadline = deadline + self.Interval
+        if nextDeadline <= now:
+            # handler overran one or more intervals, skip them
+            nextDeadline = now + self.Interval
+        if self.__Service.Schedule(self, nextDeadline, expected=token):
+            self.__Deadline = nextDeadline
+
+    def Change(self, Interval: float) -> None:
+        self.Interval = Interval
+        if self.State == 'Running':
+            self.__Schedule(self.Interval)
+
+    def Pause(self) -> None:
+        if self.State == 'Running':
+            self.__Service.Cancel(self)
+            self.__Remaining = max(self.__Deadline - time.monotonic(), 0)
+            self.__SetState('Paused')
+
+    def Resume(self) -> None:
+        if self.State == 'Running':
+            return
+        if self.State == 'Paused' and self.__Remaining is not None:
+            self.__Schedule(self.__Remaining)
+        else:
+            self.__Schedule(self.Interval)
+        self.__Remaining = None
+        self.__SetState('Running')
+
+    def Restart(self) -> None:
+        self.Count = 0
+        self.__Remaining = None
+        self.__Schedule(self.Interval)
+        self.__SetState('Running')
+
+    def Stop(self) -> None:
+        self.__Service.Cancel(self)
+        self.Count = 0
+        self.__Remaining = None
+        self.__SetState('Stopped')
+
+Scheduler = TimerService()
+
+## End Class Definitions -------------------------------------------------------
+##
+## Begin Function Definitions --------------------------------------------------
+
+## End Function Definitions ----------------------------------------------------
@@ -14,21 +14,27 @@
 # limitations under the License.
 ################################################################################
 
-from typing import TYPE_CHECKING, Dict, List, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple, Union
 if TYPE_CHECKING: # pragma: no cover
     from extronlib.ui import Button, Label
     from uofi_gui.systemHardware import SystemHardwareController
 
 ## Begin ControlScript Import --------------------------------------------------
-from extronlib.system import ProgramLog
-from extronlib.system import Wait
+from extronlib.system import ProgramLog, File
 ## End ControlScript Import ----------------------------------------------------
 ##
 ## Begin Python Imports --------------------------------------------------------
-import inspect
+import atexit
 import re
+import sys
 import functools
+import json
+import time
 import traceback
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, Future
+from datetime import datetime
+from threading import Condition, Lock, Thread, current_thread
 
 ## End Python Imports ----------------------------------------------------------
 ##
@@ -76,73 +82,688 @@ class SortKeys:
         elif sortItem == 'Sunday':
             return 6
 
+class AsyncExecutor:
+    """Bounded worker pool used by RunAsync.
+
+    Calls beyond MaxWorkers wait in the executor queue instead of each getting
+    a thread of their own. Submit returns a concurrent.futures.Future, so
+    callers may wait on the result, inspect the exception, cancel a call which
+    has not started, or chain on completion with add_done_callback.
+    """
+    def __init__(self, MaxWorkers: int=4) -> None:
+        self.MaxWorkers = MaxWorkers
+        self.__Executor = ThreadPoolExecutor(max_workers=MaxWorkers)
+        self.__Lock = Lock()
+
+        self.Submitted = 0
+        self.Completed = 0
+        self.Failed = 0
+        self.Cancelled = 0
+        self.Queued = 0
+        self.Running = 0
+        self.MaxQueueDepth = 0
+        self.TotalWait = 0.0
+        self.MaxWait = 0.0
+        self.TotalRun = 0.0
+        self.MaxRun = 0.0
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __Call(self, func, submitTime: float, args, kwargs):
+        startTime = time.monotonic()
+        with self.__Lock:
+            self.Queued -= 1
+            self.Running += 1
+            wait = startTime - submitTime
+            self.TotalWait += wait
+            self.MaxWait = max(self.MaxWait, wait)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self.__Lock:
+                self.Running -= 1
+                run = time.monotonic() - startTime
+                self.TotalRun += run
+                self.MaxRun = max(self.MaxRun, run)
+
+    def __Done(self, name: str, future: Future) -> None:
+        with self.__Lock:
+            if future.cancelled():
+                self.Queued -= 1
+                self.Cancelled += 1
+                return
+            elif future.exception() is not None:
+                self.Failed += 1
+            else:
+                self.Completed += 1
+
+        inst = future.exception()
+        if inst is not None:
+            tb = ''.join(traceback.format_exception(type(inst), inst, inst.__traceback__))
+            Log('An error occured in async function {}. Exception ({}):\n    {}\nTraceback:\n    {}'.format(name, type(inst), inst, tb), 'error')
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Submit(self, func, *args, **kwargs) -> Future:
+        with self.__Lock:
+            self.Submitted += 1
+            self.Queued += 1
+            self.MaxQueueDepth = max(self.MaxQueueDepth, self.Queued)
+        future = self.__Executor.submit(self.__Call, func, time.monotonic(), args, kwargs)
+        future.add_done_callback(functools.partial(self.__Done, getattr(func, '__qualname__', repr(func))))
+        return future
+
+    def Stats(self) -> Dict[str, Union[int, float]]:
+        with self.__Lock:
+            started = self.Submitted - self.Queued - self.Cancelled
+            finished = self.Completed + self.Failed
+            return \
+                {
+                    'MaxWorkers': self.MaxWorkers,
+                    'Submitted': self.Submitted,
+                    'Queued': self.Queued,
+                    'Running': self.Running,
+                    'MaxQueueDepth': self.MaxQueueDepth,
+                    'Completed': self.Completed,
+                    'Failed': self.Failed,
+                    'Cancelled': self.Cancelled,
+                    'AvgWait': round(self.TotalWait / started, 4) if started > 0 else 0,
+                    'MaxWait': round(self.MaxWait, 4),
+                    'AvgRun': round(self.TotalRun / finished, 4) if finished > 0 else 0,
+                    'MaxRun': round(self.MaxRun, 4)
+                }
+
+LogRecord = namedtuple('LogRecord', ['Time', 'Level', 'Message', 'Module', 'Content', 'HardwareId', 'Event', 'Fields'])
+LogRecord.__new__.__defaults__ = (None, None, None, None, None)
+
+class LogPipeline:
+    """Bounded ring buffer between Log and the log sinks.
+
+    Log pushes records without blocking on log I/O. A background drainer writes
+    records to ProgramLog and passes them in batches to any added sinks. When
+    the buffer is full the oldest record is dropped and counted, and a warning
+    with the drop count is written once the drainer catches up. The most
+    recently written records are kept in memory for post-mortem dumps.
+
+    Sinks which buffer their own writes may provide NextFlush, returning the
+    seconds until they want Flush called or None. The drainer flushes them
+    when that time comes while the buffer is idle.
+    """
+    def __init__(self, Capacity: int=1024, HistorySize: int=256, BatchSize: int=64) -> None:
+        self.Capacity = Capacity
+        self.BatchSize = BatchSize
+        self.Sinks = []
+        self.__NamedSinks = {}
+
+        self.__Buffer = deque()
+        self.__History = deque(maxlen=HistorySize)
+        self.__Condition = Condition()
+        self.__Thread = None
+        self.__Busy = False
+
+        self.Written = 0
+        self.Dropped = 0
+        self.__Unreported = 0
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __Run(self) -> None: # pragma: no cover
+        while True:
+            timeout = self.__IdleTimeout()
+            with self.__Condition:
+                if len(self.__Buffer) == 0:
+                    self.__Condition.wait(timeout)
+                batch = self.__TakeBatch() if len(self.__Buffer) > 0 else None
+            if batch is None:
+                self.FlushIdleSinks()
+            else:
+                self.__Write(batch)
+
+    def __IdleTimeout(self) -> float:
+        # seconds until the first sink wants flushing, None to wait for records
+        timeout = None
+        for sink in self.Sinks:
+            nextFlush = getattr(sink, 'NextFlush', None)
+            if callable(nextFlush):
+                due = nextFlush()
+                if due is not None and (timeout is None or due < timeout):
+                    timeout = max(due, 0)
+        return timeout
+
+    def __TakeBatch(self) -> List[LogRecord]:
+        # must be called with __Condition held
+        batch = []
+        while len(self.__Buffer) > 0 and len(batch) < self.BatchSize:
+            batch.append(self.__Buffer.popleft())
+        if self.__Unreported > 0:
+            batch.append(LogRecord(time.time(), 'warning',
+                                   'Log buffer overflow, {} messages dropped'.format(self.__Unreported)))
+            self.__Unreported = 0
+        self.__Busy = True
+        return batch
+
+    def __Write(self, batch: List[LogRecord]) -> None:
+        for record in batch:
+            try:
+                ProgramLog(record.Message, record.Level)
+            except Exception: # pragma: no cover
+                pass
+        for sink in self.Sinks:
+            try:
+                sink(batch)
+            except Exception: # pragma: no cover
+                pass
+        with self.__Condition:
+            self.Written += len(batch)
+            self.__History.extend(batch)
+            self.__Busy = False
+            self.__Condition.notify_all()
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Push(self, message: str, level: str, **structured) -> None:
+        with self.__Condition:
+            if len(self.__Buffer) >= self.Capacity:
+                self.__Buffer.popleft()
+                self.Dropped += 1
+                self.__Unreported += 1
+            self.__Buffer.append(LogRecord(time.time(), level, message, **structured))
+
+            if self.__Thread is None:
+                self.__Thread = Thread(target=self.__Run, name='LogPipeline', daemon=True)
+                self.__Thread.start()
+            self.__Condition.notify_all()
+
+    def AddSink(self, sink: Callable[[List[LogRecord]], None], Name: str=None) -> None:
+        """Adds a sink called from the drainer thread with each batch of
+        LogRecords written.
+
+        Args:
+            sink (Callable[[List[LogRecord]], None]): the sink
+            Name (str, optional): a sink added with the Name of an earlier
+                sink replaces it, after that sink is flushed. Defaults to None.
+        """
+        # the drainer iterates Sinks unlocked, so the list is replaced rather
+        # than changed in place
+        sinks = list(self.Sinks)
+        if Name is not None and Name in self.__NamedSinks:
+            old = self.__NamedSinks[Name]
+            if old in sinks:
+                sinks.remove(old)
+            if callable(getattr(old, 'Flush', None)):
+                old.Flush()
+        if Name is not None:
+            self.__NamedSinks[Name] = sink
+        if sink not in sinks:
+            sinks.append(sink)
+        self.Sinks = sinks
+
+    def FlushIdleSinks(self) -> int:
+        """Flushes the sinks whose NextFlush time has come.
+
+        Returns:
+            int: number of sinks flushed
+        """
+        count = 0
+        for sink in self.Sinks:
+            nextFlush = getattr(sink, 'NextFlush', None)
+            if callable(nextFlush):
+                due = nextFlush()
+                if due is not None and due <= 0:
+                    try:
+                        sink.Flush()
+                    except Exception: # pragma: no cover
+                        pass
+                    count += 1
+        return count
+
+    def Flush(self, timeout: float=5) -> bool:
+        """Waits for buffered records to be written to all sinks.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait. Defaults to 5.
+
+        Returns:
+            bool: True if the buffer was drained
+        """
+        if self.__Thread is None or self.__Thread is current_thread():
+            # nothing has been logged yet, or flushing from the drainer itself
+            while True:
+                with self.__Condition:
+                    if len(self.__Buffer) == 0 and self.__Unreported == 0:
+                        break
+                    batch = self.__TakeBatch()
+                self.__Write(batch)
+            drained = True
+        else:
+            with self.__Condition:
+                drained = self.__Condition.wait_for(lambda: len(self.__Buffer) == 0 and not self.__Busy, timeout)
+
+        # sinks which buffer their own writes are flushed as well
+        for sink in self.Sinks:
+            if callable(getattr(sink, 'Flush', None)):
+                sink.Flush()
+        return drained
+
+    def History(self) -> List[str]:
+        """Returns the most recently written records, oldest first, formatted
+        for a post-mortem dump.
+        """
+        with self.__Condition:
+            records = list(self.__History)
+        return ['[{}] {} - {}'.format(datetime.fromtimestamp(r.Time).isoformat(), r.Level.upper(), r.Message)
+                for r in records]
+
+    def Stats(self) -> Dict[str, int]:
+        with self.__Condition:
+            return \
+                {
+                    'Capacity': self.Capacity,
+                    'Queued': len(self.__Buffer),
+                    'Written': self.Written,
+                    'Dropped': self.Dropped
+                }
+
+class LogRateLimiter:
+    """Per call site rate limiting and repeat collapsing for Log.
+
+    Each Log call site may log Budget messages per Period seconds, further
+    messages are counted and reported once the period ends. Errors are not
+    rate limited. A message identical to the previous message from the same
+    call site is collapsed and reported as "Last message repeated N times" when
+    the call site logs something different or its period ends. Budget may be
+    set per module, a Budget of None disables rate limiting.
+    """
+    def __init__(self, Budget: int=30, Period: float=60) -> None:
+        self.Budget = Budget
+        self.Period = Period
+        self.ModuleBudgets = {}
+
+        self.__Lock = Lock()
+        self.__Sites = {}
+        self.__LastSweep = time.monotonic()
+
+        self.Suppressed = 0
+        self.Collapsed = 0
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __Summaries(self, site: Dict) -> List[str]:
+        # must be called with __Lock held
+        summaries = []
+        if site['repeats'] > 0:
+            summaries.append('Last message repeated {} times'.format(site['repeats']))
+            site['repeats'] = 0
+        if site['suppressed'] > 0:
+            summaries.append('{} messages suppressed by rate limit'.format(site['suppressed']))
+            site['suppressed'] = 0
+        return summaries
+
+    def __Roll(self, site: Dict, now: float) -> List[str]:
+        # must be called with __Lock held
+        if now - site['start'] < self.Period:
+            return []
+        site['start'] = now
+        site['count'] = 0
+        return self.__Summaries(site)
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def SetBudget(self, Budget: int, Period: float=None, Module: str=None) -> None:
+        """Sets the number of messages each call site may log per period.
+
+        Args:
+            Budget (int): Messages per period, None for no limit
+            Period (float, optional): Period in seconds. Defaults to None, leaving the period unchanged.
+            Module (str, optional): Only set the budget for call sites in this module. Defaults to None.
+        """
+        with self.__Lock:
+            if Period is not None:
+                self.Period = Period
+            if Module is None:
+                self.Budget = Budget
+            else:
+                self.ModuleBudgets[Module] = Budget
+            for site in self.__Sites.values():
+                site['budget'] = self.ModuleBudgets.get(site['header'][0], self.Budget)
+
+    def Admit(self, key, header: Tuple[str, str, int], level: str) -> Tuple[bool, List[str]]:
+        """Checks a message against the call site budget, before any message
+        formatting is done.
+
+        Returns:
+            Tuple[bool, List[str]]: Whether the message may be logged, and any
+                summaries due for the call site
+        """
+        now = time.monotonic()
+        with self.__Lock:
+            site = self.__Sites.get(key)
+            if site is None:
+                site = \
+                    {
+                        'header': header,
+                        'budget': self.ModuleBudgets.get(header[0], self.Budget),
+                        'start': now,
+                        'count': 0,
+                        'suppressed': 0,
+                        'last': None,
+                        'repeats': 0
+                    }
+                self.__Sites[key] = site
+            summaries = self.__Roll(site, now)
+
+            if level != 'error' and site['budget'] is not None and site['count'] >= site['budget']:
+                site['suppressed'] += 1
+                self.Suppressed += 1
+                return (False, summaries)
+            site['count'] += 1
+            return (True, summaries)
+
+    def Collapse(self, key, content: str) -> Tuple[bool, List[str]]:
+        """Checks a formatted message against the last message from the call site.
+
+        Returns:
+            Tuple[bool, List[str]]: Whether the message may be logged, and any
+                summaries due for the call site
+        """
+        with self.__Lock:
+            site = self.__Sites[key]
+            if content == site['last']:
+                site['repeats'] += 1
+                self.Collapsed += 1
+                return (False, [])
+            site['last'] = content
+            return (True, self.__Summaries(site))
+
+    def Sweep(self, force: bool=False) -> List[Tuple[Tuple[str, str, int], str]]:
+        """Collects summaries for call sites whose period has ended without
+        logging again. Runs at most once per Period unless forced.
+
+        Returns:
+            List[Tuple[Tuple[str, str, int], str]]: (module, function, line) and summary text
+        """
+        now = time.monotonic()
+        with self.__Lock:
+            if not force and now - self.__LastSweep < self.Period:
+                return []
+            self.__LastSweep = now
+            due = []
+            for site in self.__Sites.values():
+                if force:
+                    summaries = self.__Summaries(site)
+                else:
+                    summaries = self.__Roll(site, now)
+                for summary in summaries:
+                    due.append((site['header'], summary))
+            return due
+
+    def Stats(self) -> Dict[str, int]:
+        with self.__Lock:
+            return \
+                {
+                    'Sites': len(self.__Sites),
+                    'Suppressed': self.Suppressed,
+                    'Collapsed': self.Collapsed
+                }
+
+class StructuredLogSink:
+    """LogPipeline sink writing one compact JSON record per line to size
+    capped rotating files on the processor file system.
+
+    Records are buffered in memory and written when BufferBytes is reached,
+    when an error is logged, when Flush is called, or, through NextFlush, by
+    the LogPipeline drainer once FlushInterval seconds have passed since the
+    first record was buffered. When the log file reaches MaxBytes it
+    is rotated to Path.1 through Path.<Backups>, the oldest is deleted.
+    """
+    LevelCodes = {'info': 'I', 'warning': 'W', 'error': 'E'}
+
+    def __init__(self,
+                 Path: str='/logs/uofi_gui.log',
+                 MaxBytes: int=262144,
+                 Backups: int=3,
+                 BufferBytes: int=8192,
+                 FlushInterval: float=60) -> None:
+        self.Path = Path
+        self.MaxBytes = MaxBytes
+        self.Backups = Backups
+        self.BufferBytes = BufferBytes
+        self.FlushInterval = FlushInterval
+
+        self.__Lock = Lock()
+        self.__Pending = []
+        self.__PendingBytes = 0
+        self.__PendingSince = None
+
+        directory = self.Path.rsplit('/', 1)[0]
+        if directory != '' and not File.Exists(directory):
+            File.MakeDir(directory)
+
+        if File.Exists(self.Path):
+            logFile = File(self.Path, 'at')
+            logFile.seek(0, 2)
+            self.__Size = logFile.tell()
+            logFile.close()
+        else:
+            self.__Size = 0
+
+        self.Writes = 0
+        self.Rotations = 0
+
+    def __call__(self, batch: List[LogRecord]) -> None:
+        error = False
+        with self.__Lock:
+            if self.__PendingSince is None and len(batch) > 0:
+                self.__PendingSince = time.monotonic()
+            for record in batch:
+                line = self.FormatRecord(record)
+                self.__Pending.append(line)
+                self.__PendingBytes += len(line)
+                error = error or record.Level == 'error'
+            due = error \
+                  or self.__PendingBytes >= self.BufferBytes \
+                  or time.monotonic() - self.__PendingSince >= self.FlushInterval
+        if due:
+            self.Flush()
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __Rotate(self) -> None:
+        # must be called with __Lock held
+        oldest = '{}.{}'.format(self.Path, self.Backups)
+        if File.Exists(oldest):
+            File.DeleteFile(oldest)
+        for i in range(self.Backups - 1, 0, -1):
+            src = '{}.{}'.format(self.Path, i)
+            if File.Exists(src):
+                File.RenameFile(src, '{}.{}'.format(self.Path, i + 1))
+        if self.Backups > 0:
+            File.RenameFile(self.Path, '{}.1'.format(self.Path))
+        else:
+            File.DeleteFile(self.Path)
+        self.__Size = 0
+        self.Rotations += 1
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    @classmethod
+    def FormatRecord(cls, record: LogRecord) -> str:
+        entry = \
+            {
+                'ts': round(record.Time, 3),
+                'lvl': cls.LevelCodes.get(record.Level, record.Level),
+                'mod': record.Module,
+                'msg': record.Content if record.Content is not None else record.Message
+            }
+        if record.HardwareId is not None:
+            entry['hw'] = record.HardwareId
+        if record.Event is not None:
+            entry['evt'] = record.Event
+        if record.Fields is not None:
+            entry['f'] = record.Fields
+        return json.dumps(entry, separators=(',', ':'), default=str) + '\n'
+
+    def NextFlush(self) -> float:
+        """Returns the seconds until the buffered records are due to be
+        written, or None if nothing is buffered.
+        """
+        with self.__Lock:
+            if self.__PendingSince is None:
+                return None
+            return self.__PendingSince + self.FlushInterval - time.monotonic()
+
+    def Flush(self) -> None:
+        with self.__Lock:
+            if len(self.__Pending) == 0:
+                return
+            data = ''.join(self.__Pending)
+            self.__Pending = []
+            self.__PendingBytes = 0
+            self.__PendingSince = None
+
+            if self.__Size > 0 and self.__Size + len(data) > self.MaxBytes:
+                self.__Rotate()
+
+            logFile = File(self.Path, 'at')
+            logFile.write(data)
+            logFile.close()
+            self.__Size += len(data)
+            self.Writes += 1
+
 ## End Class Definitions -------------------------------------------------------
 ##
 ## Begin Function Definitions --------------------------------------------------
 
-def Log(content, level: str='info', stack: bool=False) -> None:
+LogLevels = {'info': 0, 'warning': 1, 'error': 2}
+_LogThreshold = 0
+_DebugEnabled = False
+_ModuleNames = {}
+_ModuleRegex = re.compile(r"^(?:\/var\/nortxe\/proj\/eup\/|\/var\/nortxe\/uf\/admin\/modules\/|\/usr\/lib\/python3.5\/)?(.+)\.py$")
+
+def SetLogLevel(level: str) -> None:
+    """Sets the minimum level written by Log. Messages below this level return
+    before any formatting is done.
+
+    Args:
+        level (str): Minimum log level. May be 'info', 'warning', or 'error'.
+    """
+    global _LogThreshold
+    if level not in LogLevels:
+        raise ValueError("Log level must be either 'error', 'warning', or 'info'")
+    _LogThreshold = LogLevels[level]
+
+def _ModuleName(fileName: str) -> str:
+    try:
+        return _ModuleNames[fileName]
+    except KeyError:
+        re_match = _ModuleRegex.match(fileName)
+        if re_match is None:
+            mod = fileName
+        else:
+            mod = re_match.group(1).replace('/', '.')
+        _ModuleNames[fileName] = mod
+        return mod
+
+def _LogSummary(header: Tuple[str, str, int], summary: str) -> None:
+    LogBuffer.Push('Logging from {} - {} ({})\n    {}'.format(header[0], header[1], header[2], summary),
+                   'info',
+                   Module=header[0],
+                   Content=summary,
+                   Event='LogSummary')
+
+def Log(content, level: str='info', stack: bool=False, args: tuple=None, hardwareId: str=None, event: str=None, fields: Dict=None) -> None:
     """Logs data with Extron ProgramLog. Included helpful troubleshooting log header.
+    Messages are rate limited and repeats collapsed per call site by LogLimiter.
 
     Args:
         content (Any): Content to log. Must be a string or printable as a string.
+            May be a callable returning the content, which is only called if the
+            message is logged.
         level (str, optional): Log level. May be 'info', 'warning', or 'error'. Defaults to 'info'.
         stack (bool, optional): Whether or not to print the function call stack. Defaults to False.
+        args (tuple, optional): Values passed to content.format(), only if the
+            message is logged. Defaults to None.
+        hardwareId (str, optional): Hardware Id for structured log sinks. Defaults to None.
+        event (str, optional): Event type for structured log sinks. Defaults to None.
+        fields (Dict, optional): Additional values for structured log sinks. Defaults to None.
     """    
     
-    curframe = inspect.currentframe()
-    calframe = inspect.getouterframes(curframe, 2)
+    if level not in LogLevels:
+        raise ValueError("Severity must be either 'error', 'warning', or 'info'")
+    if LogLevels[level] < _LogThreshold:
+        return
     
-    regex = r"^(?:\/var\/nortxe\/proj\/eup\/|\/var\/nortxe\/uf\/admin\/modules\/|\/usr\/lib\/python3.5\/)?(.+)\.py$"
-    
-    re_match = re.match(regex, calframe[1].filename)
-    fileName = re_match.group(1)
-    mod = fileName.replace('/', '.')
+    # only the caller's frame is needed, inspect.getouterframes would build
+    # frame records, with source context read from disk, for the whole stack
+    caller = sys._getframe(1)
+    mod = _ModuleName(caller.f_code.co_filename)
     ws = '    '
     
-    content = str(content).replace('\n', '\n{0}'.format(ws))
+    site = (caller.f_code, caller.f_lineno)
+    header = (mod, caller.f_code.co_name, caller.f_lineno)
+    admit, summaries = LogLimiter.Admit(site, header, level)
+    for summary in summaries:
+        _LogSummary(header, summary)
+    for sweepHeader, summary in LogLimiter.Sweep():
+        _LogSummary(sweepHeader, summary)
+    if not admit:
+        return
+    
+    if callable(content):
+        content = content()
+    if args is not None:
+        content = str(content).format(*args)
+    rawContent = str(content)
+    
+    admit, summaries = LogLimiter.Collapse(site, rawContent)
+    for summary in summaries:
+        _LogSummary(header, summary)
+    if not admit:
+        return
+    
+    content = rawContent.replace('\n', '\n{0}'.format(ws))
     
     if stack:
         # show call stack back to main
         message = 'Logging from {module} - {func} ({line})\n'.format(
                        module = mod,
-                       func = calframe[1].function,
-                       line = calframe[1].lineno
+                       func = caller.f_code.co_name,
+                       line = caller.f_lineno
                     )
         message = message + '{w}Stack:\n'.format(w=ws)
-        i = 2
-        while i < len(calframe):
-            parent = calframe[i]
-            loop_match = re.match(regex, parent.filename)
-            if loop_match == None:
-                parent_mod = parent.filename                                    # pragma: no cover
-            else:
-                parent_fn = loop_match.group(1)
-                parent_mod = parent_fn.replace('/','.')
+        parent = caller.f_back
+        while parent is not None:
+            parent_mod = _ModuleName(parent.f_code.co_filename)
             message = message + '{w}{module} - {func} ({line})\n'.format(
                 w = ws+ws,
                 module = parent_mod,
-                func = parent.function,
-                line = parent.lineno
+                func = parent.f_code.co_name,
+                line = parent.f_lineno
             )
-            i += 1
-            if ((parent_mod == 'main' and parent.function == '<module>')
-                 or (parent_mod == 'extronlib.system.Timer' and parent.function == '__callback')
-                 or (parent_mod == 'Extron.ButtonObject' and parent.function == '_handleMsgAcquired')):
+            if ((parent_mod == 'main' and parent.f_code.co_name == '<module>')
+                 or (parent_mod == 'extronlib.system.Timer' and parent.f_code.co_name == '__callback')
+                 or (parent_mod == 'Extron.ButtonObject' and parent.f_code.co_name == '_handleMsgAcquired')):
                 break                                                           # pragma: no cover
+            parent = parent.f_back
         
         message = message + '{w}{content}'.format(w = ws, content = content)
     else:
         message = ("Logging from {module} - {func} ({line})\n{w}{content}".
                    format(
                        module = mod,
-                       func = calframe[1].function,
-                       line = calframe[1].lineno,
+                       func = caller.f_code.co_name,
+                       line = caller.f_lineno,
                        w = ws,
                        content = content
                     )
                    )
     
-    ProgramLog(message, level)
+    LogBuffer.Push(message, level,
+                   Module=mod,
+                   Content=rawContent,
+                   HardwareId=hardwareId,
+                   Event=event,
+                   Fields=fields)
 
 def TimeIntToStr(time: int, units: bool = True) -> str:
     """Converts integer seconds to human readable string
@@ -257,39 +878,72 @@ def DictValueSearchByKey(dict: Dict, search_term: str, regex: bool=False, captur
     else:
         raise ValueError('regex must be true if capture_dict is true')
 
-def debug(func): # pragma: no cover
-    """Print the function signature and return value"""
+def SetDebug(enabled: bool) -> None:
+    """Enables or disables the debug decorator. debug is resolved when a
+    function is decorated, so this must be called before importing the modules
+    to debug.
+
+    Args:
+        enabled (bool): True to wrap debug decorated functions with call logging
+    """
+    global _DebugEnabled
+    _DebugEnabled = bool(enabled)
+    if _DebugEnabled:
+        # every debug record is logged from the same call site in this module
+        LogLimiter.SetBudget(None, Module=_ModuleName(__file__))
+
+def debug(func):
+    """Log the function signature, return value, and call duration.
+
+    When debugging is disabled (see SetDebug) the function is returned
+    undecorated. When enabled, arguments are only formatted with repr if the
+    record is logged.
+    """
+    if not _DebugEnabled:
+        return func
+    
     @functools.wraps(func)
     def wrapper_debug(*args, **kwargs):
-        args_repr = [repr(a) for a in args]
-        kwargs_repr = ["{}={!r}".format(k, v) for k, v in kwargs.items()]
-        signature = ", ".join(args_repr + kwargs_repr)
-        callStr = "Calling {}({})".format(func.__name__, signature)
-        print(callStr)
+        def Signature() -> str:
+            args_repr = [repr(a) for a in args]
+            kwargs_repr = ["{}={!r}".format(k, v) for k, v in kwargs.items()]
+            return ", ".join(args_repr + kwargs_repr)
+        
+        startTime = time.monotonic()
         try:
             value = func(*args, **kwargs)
-            rtnStr = "{!r} returned {!r}".format(func.__name__, value)
-            print(rtnStr)
-            Log('{}\n  {}'.format(callStr, rtnStr))
-            return value
         except Exception as inst:
             tb = traceback.format_exc()
-            print(tb)
-            Log('An error occured attempting to call function. {} ({})\n    Exception ({}):\n        {}\n    Traceback:\n        {}'.format(func.__name__, signature, type(inst), inst, tb), 'error')
+            Log(lambda: 'An error occured attempting to call function. {} ({})\n    Exception ({}):\n        {}\n    Traceback:\n        {}'.format(func.__name__, Signature(), type(inst), inst, tb), 'error')
+            return None
+        duration = time.monotonic() - startTime
+        Log(lambda: 'Calling {}({})\n  {!r} returned {!r} ({:.3f}ms)'.format(func.__name__, Signature(), func.__name__, value, duration * 1000))
+        return value
     return wrapper_debug
 
 def RunAsync(func, callback: callable=None):
-    """Run this function asynchronously"""
+    """Run this function asynchronously on the AsyncPool workers.
+
+    The wrapped function returns a Future for the call. If callback is supplied
+    and callable it is called with the function's return value once the call
+    completes successfully. Exceptions are logged and kept on the Future.
+    """
     @functools.wraps(func)
-    def wrapper_async(*args, **kwargs):
-        # using Extron wait of 10ms to make the wrapped function effectively asynchronous
-        @Wait(0.01)
-        def AsyncRun(): # pragma: no cover
-            value = func(*args, **kwargs)
-            if callable(callback): # run callback with function output if callback is supplied and callable
-                callback(value)
+    def wrapper_async(*args, **kwargs) -> Future:
+        future = AsyncPool.Submit(func, *args, **kwargs)
+        if callable(callback):
+            def AsyncCallback(fut: Future):
+                if not fut.cancelled() and fut.exception() is None:
+                    callback(fut.result())
+            future.add_done_callback(AsyncCallback)
+        return future
     return wrapper_async
 
+AsyncPool = AsyncExecutor()
+LogBuffer = LogPipeline()
+LogLimiter = LogRateLimiter()
+atexit.register(LogBuffer.Flush)
+
 ## End Function Definitions ----------------------------------------------------
 ##
 ## Begin Script Definition -----------------------------------------------------
@@ -31,6 +31,9 @@ import test_settings as settings
 
 from extronlib.ui import Button, Label, Level
 from extronlib.system import MESet, Clock, Timer
+from uofi_gui.timerService import ServiceTimer
+
+from unittest.mock import patch as mock_patch
 ## -----------------------------------------------------------------------------
 
 class ActivityController_TestClass(unittest.TestCase): # rename for module to be tested
@@ -161,30 +164,30 @@ class ActivityController_TestClass(unittest.TestCase): # rename for module to be
         
         # __ConfirmationTimer
         with self.subTest(param='__ConfirmationTimer'):
-            self.assertIsInstance(self.TestActivityController._ActivityController__ConfirmationTimer, Timer)
+            self.assertIsInstance(self.TestActivityController._ActivityController__ConfirmationTimer, ServiceTimer)
         
         # __SwitchTimer
         with self.subTest(param='__SwitchTimer'):
-            self.assertIsInstance(self.TestActivityController._ActivityController__SwitchTimer, Timer)
+            self.assertIsInstance(self.TestActivityController._ActivityController__SwitchTimer, ServiceTimer)
         
         # __StartTimer
         with self.subTest(param='__StartTimer'):
-            self.assertIsInstance(self.TestActivityController._ActivityController__StartTimer, Timer)
+            self.assertIsInstance(self.TestActivityController._ActivityController__StartTimer, ServiceTimer)
         
         # __ActivitySplashTimerList
         with self.subTest(param='__ActivitySplashTimerList'):
             self.assertIsInstance(self.TestActivityController._ActivityController__ActivitySplashTimerList, list)
             for item in self.TestActivityController._ActivityController__ActivitySplashTimerList:
                 with self.subTest(iter=item):
-                    self.assertIsInstance(item, Timer)
+                    self.assertIsInstance(item, ServiceTimer)
         
         # __StatusTimer
         with self.subTest(param='__StatusTimer'):
-            self.assertIsInstance(self.TestActivityController._ActivityController__StatusTimer, Timer)
+            self.assertIsInstance(self.TestActivityController._ActivityController__StatusTimer, ServiceTimer)
             
         # __InitPageTimer
         with self.subTest(param='__InitPageTimer'):
-            self.assertIsInstance(self.TestActivityController._ActivityController__InitPageTimer, Timer)
+            self.assertIsInstance(self.TestActivityController._ActivityController__InitPageTimer, ServiceTimer)
             self.assertIsInstance(self.TestActivityController._ActivityController__InitPageTimer.TriggerTime, int)
             self.assertIsInstance(self.TestActivityController._ActivityController__InitPageTimer.LastInactivity, dict)
             self.assertIsInstance(self.TestActivityController._ActivityController__InitPageTimer.PanelInactivity, dict)
@@ -408,6 +411,24 @@ class ActivityController_TestClass(unittest.TestCase): # rename for module to be
                 except Exception as inst:
                     self.fail('SystemSwitch raised {} unexpectedly!'.format(type(inst)))
     
+    def test_ActivityController_SystemSwitch_Preset(self):
+        settings.routingPresets[0]['activity'] = 'share'
+        self.TestGUIController = GUIController(settings, self.TestCtls, self.TestTPs)
+        self.init_ActCtl()
+        srcCtl = self.TestGUIController.SrcCtl
+        matrix = srcCtl.MatrixHardware.interface
+        
+        with mock_patch.object(srcCtl, 'RecallPreset') as recall, \
+             mock_patch.object(matrix, 'Set') as matrixSet:
+            self.TestActivityController.SystemSwitch('share')
+        
+        # the preset is sent once for the room, panels only update their UI
+        recall.assert_called_once_with(srcCtl.PresetCtl.Presets['lecture'])
+        self.assertIs(srcCtl.SystemAudioFollowDestination, srcCtl.GetDestination(id = 'PRJ001'))
+        audioTies = [call for call in matrixSet.call_args_list
+                     if call.args[0] == 'MatrixTieCommand' and call.kwargs['qualifier']['Tie Type'] == 'Audio']
+        self.assertEqual(audioTies, [])
+    
     def test_ActivityController_SystemShutdown(self):
         self.init_ActCtl()
         
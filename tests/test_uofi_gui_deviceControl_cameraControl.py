@@ -31,6 +31,7 @@ from uofi_gui.systemHardware import SystemHardwareController
 from uofi_gui.deviceControl import AudioController, CameraController, DisplayController
 from uofi_gui.sourceControls import Destination
 import test_settings as settings
+from uofi_gui.stateStore import States
 
 from extronlib.device import UIDevice
 from extronlib.ui import Button, Label, Level, Slider
@@ -49,6 +50,7 @@ class CameraController_TestClass(unittest.TestCase): # rename for module to be t
         return super().setUp()
     
     def tearDown(self):
+        States.Release()
         if os.path.exists('./tests/reqs/emFS/SFTP/user/states/camera_presets.json'):
             os.remove('./tests/reqs/emFS/SFTP/user/states/camera_presets.json')
     
@@ -264,6 +266,7 @@ class CameraController_TestClass(unittest.TestCase): # rename for module to be t
                 self.TestCamController.SavePresetStates()
             except Exception as inst:
                 self.fail("__SaveSchedule() raised {} unexpectedly!".format(type(inst)))
+            States.Release('/user/states/test_camera_presets_write.json')
             os.remove('./tests/reqs/emFS/SFTP/user/states/test_camera_presets_write.json')
         
         with self.subTest(condition='Save - Some Existing Presets'):
@@ -276,6 +279,7 @@ class CameraController_TestClass(unittest.TestCase): # rename for module to be t
                 self.TestCamController.SavePresetStates()
             except Exception as inst:
                 self.fail("__SaveSchedule() raised {} unexpectedly!".format(type(inst)))
+            States.Release('/user/states/test_camera_presets_write.json')
             os.remove('./tests/reqs/emFS/SFTP/user/states/test_camera_presets_write.json')
     
     def test_CameraController_LoadPresetStates_NoFile(self):
@@ -53,6 +53,8 @@ class DisplayController_TestClass(unittest.TestCase): # rename for module to be
     
     def test_DisplayController_InitOtherTypes(self):
         importlib.reload(settings)
+        # the test routing presets refer to the default destinations
+        settings.routingPresets = []
         settings.destinations = \
             [
                 {
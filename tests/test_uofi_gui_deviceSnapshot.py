@@ -0,0 +1,140 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+import importlib
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from uofi_gui import GUIController
+from uofi_gui.deviceSnapshot import DeviceSnapshot
+from uofi_gui.stateStore import States
+import test_settings as settings
+
+from extronlib.system import File
+
+from unittest.mock import patch as mock_patch
+## -----------------------------------------------------------------------------
+
+class DeviceSnapshot_TestClass(unittest.TestCase): # rename for module to be tested
+    def setUp(self) -> None:
+        self.TestCtls = ['CTL001']
+        self.TestTPs = ['TP001']
+        importlib.reload(settings)
+        self.TestGUIController = GUIController(settings, self.TestCtls, self.TestTPs)
+        self.TestGUIController.Initialize()
+        self.TestPath = '/user/states/test_device_snapshot.json'
+        self.TestSnapshot = DeviceSnapshot(self.TestGUIController, Path=self.TestPath)
+        return super().setUp()
+    
+    def tearDown(self) -> None:
+        self.TestSnapshot.Stop()
+        self.TestGUIController.Snapshot.Stop()
+        States.Release()
+        for path in [self.TestPath, '/user/states/device_snapshot.json']:
+            if File.Exists(path):
+                File.DeleteFile(path)
+        return super().tearDown()
+    
+    def test_DeviceSnapshot_Type(self):
+        self.assertIsInstance(self.TestSnapshot, DeviceSnapshot)
+        self.assertIsInstance(self.TestGUIController.Snapshot, DeviceSnapshot)
+    
+    def test_DeviceSnapshot_Snapshot(self):
+        hw = self.TestGUIController.Hardware['MON001']
+        hw.interface.StatusStore.Write('Power', 'On')
+        
+        self.assertGreater(self.TestSnapshot.Snapshot(), 0)
+        self.assertIn(['Power', None, 'On'], States.Get(self.TestPath)['hardware']['MON001'])
+        
+        # unchanged tables are not saved again
+        self.assertEqual(self.TestSnapshot.Snapshot(), 0)
+        hw.interface.StatusStore.Write('Power', 'Off')
+        self.assertEqual(self.TestSnapshot.Snapshot(), 1)
+    
+    def test_DeviceSnapshot_Snapshot_Journal(self):
+        hw = self.TestGUIController.Hardware['MON001']
+        other = self.TestGUIController.Hardware['DSP001']
+        self.TestSnapshot.Snapshot()
+        
+        # only hardware with journaled changes is read
+        with mock_patch.object(other, 'StatusTable', wraps=other.StatusTable) as statusTable:
+            hw.interface.StatusStore.Write('Power', 'On')
+            self.assertEqual(self.TestSnapshot.Snapshot(), 1)
+            statusTable.assert_not_called()
+            
+            # every table is read once the journal has dropped changes
+            for i in range(self.TestGUIController.Journal.Size + 1):
+                hw.interface.StatusStore.Write('Power', i % 2)
+            self.TestSnapshot.Snapshot()
+            statusTable.assert_called_once()
+    
+    def test_DeviceSnapshot_Restore(self):
+        States.Update(self.TestPath, {'hardware': {'MON001': [['Power', None, 'On']], 'NOTHW': [['Power', None, 'On']]}})
+        hw = self.TestGUIController.Hardware['MON001']
+        
+        self.assertEqual(self.TestSnapshot.Restore(), 1)
+        self.assertTrue(hw.IsStale('Power'))
+        self.assertEqual(hw.GetStatus('Power'), 'On')
+    
+    def test_DeviceSnapshot_PollPriority(self):
+        hw = self.TestGUIController.Hardware['MON001']
+        poll = {'interface': hw.interface, 'command': 'Power', 'qualifier': None}
+        
+        self.assertEqual(self.TestSnapshot.PollPriority(poll), 0)
+        hw.RestoreStatus([['Power', None, 'On']])
+        self.assertEqual(self.TestSnapshot.PollPriority(poll), 1)
+        hw.interface.StatusStore.Write('Power', 'On')
+        hw.ConfirmStatus('Power')
+        self.assertEqual(self.TestSnapshot.PollPriority(poll), 2)
+    
+    def test_DeviceSnapshot_NeedsPoll(self):
+        hw = self.TestGUIController.Hardware['MON001']
+        polls = [{'interface': hw.interface, 'command': 'Power', 'qualifier': None},
+                 {'interface': hw.interface, 'command': 'Input', 'qualifier': None},
+                 {'interface': hw.interface, 'command': 'AudioMute', 'qualifier': None}]
+        hw.RestoreStatus([['Input', None, 'HDMI 1']])
+        hw.interface.StatusStore.Write('AudioMute', 'Off')
+        
+        self.assertEqual([self.TestSnapshot.NeedsPoll(poll) for poll in polls], [True, True, False])
+        
+        polled = []
+        pollCtl = self.TestGUIController.PollCtl
+        pollCtl.Polling = polls
+        with mock_patch.object(pollCtl, '_SystemPollingController__PollInterface',
+                               side_effect=lambda interface, command, qualifier: polled.append(command)):
+            pollCtl.PollEverything(Priority=self.TestSnapshot.PollPriority, Filter=self.TestSnapshot.NeedsPoll)
+        self.assertEqual(polled, ['Power', 'Input'])
+    
+    def test_DeviceSnapshot_StatusTable_Confirming(self):
+        hw = self.TestGUIController.Hardware['MON001']
+        hw.RestoreStatus([['Input', None, 'HDMI 1'], ['Power', None, 'On']])
+        
+        # a driver thread confirming status while the live table is iterated
+        # would drop entries, or raise 'dictionary changed size during iteration'
+        class ConfirmingDict(dict):
+            def items(self):
+                hw.ConfirmStatus('Power')
+                return dict.items(self)
+        hw.ProvisionalStatus = ConfirmingDict(hw.ProvisionalStatus)
+        self.assertEqual(len(hw.StatusTable()), 2)
+    
+if __name__ == '__main__':
+    unittest.main()
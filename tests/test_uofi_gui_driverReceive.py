@@ -0,0 +1,437 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+import re
+import timeit
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from uofi_gui.driverReceive import FrameReceiver, PrefixDispatcher, BlockMatcher, SharedPattern
+from hardware.biam_dsp_TesiraSeries_uofi import SSHClass as TesiraClass, DeviceClass as TesiraDeviceClass
+from hardware.shur_dsp_MXA_Series_v1_3_0_0 import EthernetClass as ShureClass, DeviceClass as ShureDeviceClass
+from hardware.amx_avoip_n2300_series import EthernetClass as N2300Class
+
+from collections import Counter
+
+from unittest.mock import patch as mock_patch
+## -----------------------------------------------------------------------------
+
+class FrameReceiver_TestClass(unittest.TestCase): # rename for module to be tested
+    def setUp(self) -> None:
+        self.Frames = []
+        self.TestReceiver = FrameReceiver(b'\r\n', self.Frames.append, MaxFrameSize=32)
+        return super().setUp()
+
+    def test_FrameReceiver_BadDelimiter(self):
+        for delim in [b'', '\r\n', None]:
+            with self.subTest(delimiter=delim):
+                with self.assertRaises(ValueError):
+                    FrameReceiver(delim, self.Frames.append)
+
+    def test_FrameReceiver_MultipleFrames(self):
+        count = self.TestReceiver.Receive(b'+OK\r\n-ERR bad\r\n+OK "val')
+
+        self.assertEqual(count, 2)
+        self.assertEqual(self.Frames, [b'+OK\r\n', b'-ERR bad\r\n'])
+        self.assertEqual(self.TestReceiver.Pending(), b'+OK "val')
+
+    def test_FrameReceiver_SplitDelimiter(self):
+        for chunk in [b'+OK "value":1\r', b'\n! "publish', b'Token"', b':1\r\n']:
+            self.TestReceiver.Receive(chunk)
+
+        self.assertEqual(self.Frames, [b'+OK "value":1\r\n', b'! "publishToken":1\r\n'])
+        self.assertEqual(self.TestReceiver.Pending(), b'')
+        self.assertEqual(self.TestReceiver.Frames, 2)
+
+    def test_FrameReceiver_Overflow(self):
+        self.TestReceiver.Receive(b'x' * 40)
+        self.assertEqual(self.TestReceiver.Pending(), b'')
+        self.assertEqual(self.TestReceiver.Overflows, 1)
+
+        self.TestReceiver.Receive(b'+OK\r\n')
+        self.assertEqual(self.Frames, [b'+OK\r\n'])
+
+    def test_FrameReceiver_CallbackReceives(self):
+        # a callback feeding more data sees a settled buffer
+        def callback(frame):
+            self.Frames.append(frame)
+            if frame == b'a\r\n':
+                self.TestReceiver.Receive(b'c\r\n')
+        self.TestReceiver.Callback = callback
+
+        self.TestReceiver.Receive(b'a\r\nb\r\n')
+        self.assertEqual(self.Frames, [b'a\r\n', b'c\r\n', b'b\r\n'])
+
+    def test_FrameReceiver_Reset(self):
+        self.TestReceiver.Receive(b'+OK "val')
+        self.TestReceiver.Reset()
+        self.TestReceiver.Receive(b'ue":1\r\n')
+        self.assertEqual(self.Frames, [b'ue":1\r\n'])
+
+class PrefixDispatcher_TestClass(unittest.TestCase): # rename for module to be tested
+    def setUp(self) -> None:
+        self.Matches = []
+        self.TestDispatcher = PrefixDispatcher(lambda frame: frame.split()[2])
+        return super().setUp()
+
+    def Callback(self, match, arg):
+        self.Matches.append((match.group(1), arg))
+
+    def test_PrefixDispatcher_Keyed(self):
+        self.TestDispatcher.Add(re.compile(b'< REP MUTE (ON|OFF) >'), self.Callback, 'mute', [b'MUTE'])
+        self.TestDispatcher.Add(re.compile(b'< REP (?:MUTE|GAIN) (\\w+) >'), self.Callback, 'other', [b'GAIN'])
+
+        self.assertTrue(self.TestDispatcher.Dispatch(b'< REP MUTE ON >'))
+        self.assertTrue(self.TestDispatcher.Dispatch(b'< REP GAIN 10 >'))
+        self.assertEqual(self.Matches, [(b'ON', 'mute'), (b'10', 'other')])
+        self.assertEqual(self.TestDispatcher.Keyed, 2)
+
+    def test_PrefixDispatcher_Fallback(self):
+        self.TestDispatcher.Add(re.compile(b'< REP MUTE (ON|OFF) >'), self.Callback, 'mute', [b'MUTE'])
+        self.TestDispatcher.Add(re.compile(b'< REP \\w+ (ERR) >'), self.Callback, 'error')
+
+        self.assertTrue(self.TestDispatcher.Dispatch(b'< REP FLASH ERR >'))
+        # a keyed frame which does not match its keyed match strings
+        self.assertTrue(self.TestDispatcher.Dispatch(b'< REP MUTE ERR >'))
+        self.assertFalse(self.TestDispatcher.Dispatch(b'< REP FLASH ON >'))
+
+        self.assertEqual(self.Matches, [(b'ERR', 'error'), (b'ERR', 'error')])
+        self.assertEqual((self.TestDispatcher.Fallbacks, self.TestDispatcher.Unmatched), (2, 1))
+
+    def test_PrefixDispatcher_Key(self):
+        self.TestDispatcher.Add(re.compile(b'(ON|OFF)'), self.Callback, 'mute', [b'MUTE'])
+        self.assertTrue(self.TestDispatcher.Dispatch(b'ON', Key=b'MUTE'))
+
+    def test_PrefixDispatcher_AddOnce(self):
+        pattern = re.compile(b'< REP MUTE (ON|OFF) >')
+        self.assertTrue(self.TestDispatcher.Add(pattern, self.Callback, 'mute', [b'MUTE']))
+        self.assertFalse(self.TestDispatcher.Add(pattern, self.Callback, 'mute', [b'MUTE']))
+
+        self.TestDispatcher.Dispatch(b'< REP MUTE ON >')
+        self.assertEqual(len(self.Matches), 1)
+
+class BlockMatcher_TestClass(unittest.TestCase): # rename for module to be tested
+    def setUp(self) -> None:
+        self.Matches = []
+        self.TestMatcher = BlockMatcher(b'SVSI_', MaxBlockSize=256)
+        self.TestMatcher.Add(re.compile(b'(?:SVSI_.+)STREAM:(\\d+)\\r'), self.Callback, 'stream')
+        self.TestMatcher.Add(re.compile(b'(?:SVSI_.+)MUTE:(\\d)\\r'), self.Callback, 'mute')
+        self.TestMatcher.Add(re.compile(b'SVSI_NETSTATS:.+\\rsysName:(.+)\\r'), self.Callback, 'net')
+        self.TestReceiver = FrameReceiver(b'\r', self.TestMatcher.Line)
+        return super().setUp()
+
+    def Callback(self, match, arg):
+        self.Matches.append((arg, match.group(1)))
+
+    def Receive(self, data):
+        self.TestReceiver.Receive(data)
+        return self.TestMatcher.Match()
+
+    def test_BlockMatcher_MultipleBlocks(self):
+        # recorded read carrying a decoder dump, an encoder dump and net stats
+        self.Receive(b'SVSI_RXGEN2:RX1\rNAME:Dec\rSTREAM:12\rMUTE:0\r'
+                     b'SVSI_TXGEN2:TX1\rNAME:Enc\rSTREAM:5\rMUTE:1\r'
+                     b'SVSI_NETSTATS:1\rchassisID:aa\rsysName:sw1\r')
+
+        self.assertEqual(self.Matches, [('stream', b'12'), ('mute', b'0'),
+                                        ('stream', b'5'), ('mute', b'1'),
+                                        ('net', b'sw1')])
+        self.assertEqual(self.TestMatcher.Blocks, 2)
+        self.assertEqual(self.TestMatcher.Matches, 5)
+
+    def test_BlockMatcher_SplitBlock(self):
+        self.assertEqual(self.Receive(b'SVSI_RXGEN2:RX1\rNAME:Dec\rSTRE'), 0)
+        self.assertEqual(self.Receive(b'AM:12\r'), 1)
+        # matched values which did not change are not called back again
+        self.assertEqual(self.Receive(b'MUTE:0\r'), 1)
+        self.assertEqual(self.Receive(b'SVSI_RXGEN2:RX1\rSTREAM:12\r'), 1)
+
+        self.assertEqual(self.Matches, [('stream', b'12'), ('mute', b'0'), ('stream', b'12')])
+
+    def test_BlockMatcher_Overflow(self):
+        self.Receive(b'SVSI_RXGEN2:RX1\r' + b'x' * 300 + b'\rSTREAM:12\r')
+        self.assertEqual(self.TestMatcher.Overflows, 1)
+        self.assertEqual(self.Matches, [])
+
+        self.Receive(b'SVSI_RXGEN2:RX1\rSTREAM:12\r')
+        self.assertEqual(self.Matches, [('stream', b'12')])
+
+    def test_BlockMatcher_AddOnce(self):
+        pattern = re.compile(b'(?:SVSI_.+)STREAMAUDIO:(\\d+)\\r')
+        self.assertTrue(self.TestMatcher.Add(pattern, self.Callback, 'other'))
+        self.assertFalse(self.TestMatcher.Add(pattern, self.Callback, 'other'))
+
+class BlockMatcher_Fields_TestClass(unittest.TestCase): # rename for module to be tested
+    def setUp(self) -> None:
+        self.Fields = []
+        self.TestMatcher = BlockMatcher(b'SVSI_')
+        self.TestMatcher.AddFields(((b'STREAM', re.compile(b'\\d{1,4}')),), self.Callback, 'stream')
+        self.TestMatcher.AddFields(((b'LINEOUTVOL_L', None), (b'LINEOUTVOL_R', None)), self.Callback, 'volume')
+        self.TestReceiver = FrameReceiver(b'\r', self.TestMatcher.Line)
+        return super().setUp()
+
+    def Callback(self, fields, arg):
+        self.Fields.append((arg, fields))
+
+    def Receive(self, data):
+        self.TestReceiver.Receive(data)
+        return self.TestMatcher.Match()
+
+    def test_BlockMatcher_Fields_UnknownKeys(self):
+        # fields may be in any order among keys which are not registered
+        self.Receive(b'SVSI_RXGEN2:RX1\rNEWKEY:1\rLINEOUTVOL_R:40\rSTREAM:12\rLINEOUTVOL_L:50\r')
+
+        self.assertEqual(self.Fields, [('stream', {b'STREAM': b'12'}),
+                                       ('volume', {b'LINEOUTVOL_L': b'50', b'LINEOUTVOL_R': b'40'})])
+
+    def test_BlockMatcher_Fields_ChangedOnly(self):
+        self.Receive(b'SVSI_RXGEN2:RX1\rSTREAM:12\rLINEOUTVOL_L:50\rLINEOUTVOL_R:50\r')
+        self.Receive(b'SVSI_RXGEN2:RX1\rSTREAM:12\rLINEOUTVOL_L:50\rLINEOUTVOL_R:50\r')
+        self.assertEqual(len(self.Fields), 2)
+
+        self.assertEqual(self.Receive(b'SVSI_RXGEN2:RX1\rSTREAM:14\rLINEOUTVOL_L:50\rLINEOUTVOL_R:50\r'), 1)
+        self.assertEqual(self.Fields[-1], ('stream', {b'STREAM': b'14'}))
+
+    def test_BlockMatcher_Fields_Invalid(self):
+        self.Receive(b'SVSI_RXGEN2:RX1\rSTREAM:abc\rLINEOUTVOL_L:50\r')
+        self.assertEqual(self.Fields, [])
+
+    def test_BlockMatcher_Fields_Refresh(self):
+        self.Receive(b'SVSI_RXGEN2:RX1\rSTREAM:12\r')
+        self.TestMatcher.Refresh()
+        self.Receive(b'SVSI_RXGEN2:RX1\rSTREAM:12\r')
+
+        self.assertEqual(self.Fields, [('stream', {b'STREAM': b'12'}), ('stream', {b'STREAM': b'12'})])
+
+class SharedPattern_TestClass(unittest.TestCase): # rename for module to be tested
+    def test_SharedPattern_Shared(self):
+        pattern = SharedPattern(b'< REP SHARED_TEST (ON|OFF) >')
+        re.purge()
+        self.assertIs(SharedPattern(b'< REP SHARED_TEST (ON|OFF) >'), pattern)
+        self.assertIsNot(SharedPattern(b'< REP SHARED_TEST (ON|OFF) >', re.I), pattern)
+        self.assertEqual(pattern.search(b'< REP SHARED_TEST ON >').group(1), b'ON')
+
+class TesiraReceive_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.TestDriver = TesiraClass(None, '127.0.0.1', 22, Credentials=('admin', 'password'))
+        self.Qualifier = {'Instance Tag': 'Mic1', 'Channel': '1'}
+        self.TestDriver.UpdateAECEnable(None, self.Qualifier)
+        return super().setUp()
+
+    def test_TesiraReceive_EchoResponse(self):
+        # recorded verbose response, the echo and response split across reads
+        for chunk in [b'Mic1 get aecEn', b'able 1\r', b'\n+OK "value":tr', b'ue\r\n']:
+            self.TestDriver.ReceiveData(self.TestDriver, chunk)
+        self.assertEqual(self.TestDriver.ReadStatus('AECEnable', self.Qualifier), 'On')
+
+        # an error answers its echo, the next response is not joined to it
+        with mock_patch.object(self.TestDriver, 'Error') as error:
+            self.TestDriver.ReceiveData(self.TestDriver,
+                                        b'Mic1 get aecEnable 2\r\n-ERR address not found\r\n'
+                                        b'Mic1 get aecEnable 1\r\n+OK "value":false\r\n')
+        error.assert_called_once_with(['address not found'])
+        self.assertEqual(self.TestDriver.ReadStatus('AECEnable', self.Qualifier), 'Off')
+
+    def test_TesiraReceive_Publish(self):
+        calls = []
+        self.TestDriver.SubscribeStatus('LevelControl', None, lambda command, value, qualifier: calls.append((value, qualifier['Channel'])))
+
+        self.TestDriver.ReceiveData(self.TestDriver,
+                                    b'! "publishToken":"LevelControl_Prog" "value":{"levels":[-10.000000 -20.000000]}\r\n'
+                                    b'! "publishToken":"MuteControl_Prog" "value":{"mutes":[true false]}\r\n')
+        self.assertEqual(calls, [(-10, '1'), (-20, '2')])
+        self.assertEqual(self.TestDriver.ReadStatus('MuteControl', {'Instance Tag': 'Prog', 'Channel': '1'}), 'On')
+
+    def test_TesiraReceive_MessageKey(self):
+        key = TesiraDeviceClass._DeviceClass__MessageKey
+        self.assertEqual(key(b'Mic1 get aecEnable 1\r\n+OK "value":true\r\n', b'+OK "value":true\r\n'), b'aecEnable')
+        self.assertEqual(key(b'"Mic 1" set level 1 -10\r\n+OK\r\n', b'+OK\r\n'), b'level')
+        self.assertEqual(key(b'! "publishToken":"x" "value":1\r\n', b'! "publishToken":"x" "value":1\r\n'), b'!')
+        self.assertEqual(key(b'-ERR address not found\r\n', b'-ERR address not found\r\n'), b'-')
+        self.assertIsNone(key(b'+OK\r\n', b'+OK\r\n'))
+
+class ShureReceive_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.TestDriver = ShureClass(None, '127.0.0.1', 2202, Model='MXA910')
+        return super().setUp()
+
+    def test_ShureReceive_Frames(self):
+        # recorded reads, frames split across reads and several per read
+        for chunk in [b'< REP 2 AUDIO_MUTE ON >< REP DEVICE_AU', b'DIO_MUTE OFF >< REP 1 BEAM_X 0512 >',
+                      b'< REP LED_COLOR_MUTED RED >< REP PRESET 03 >']:
+            self.TestDriver.ReceiveData(self.TestDriver, chunk)
+
+        self.assertEqual(self.TestDriver.ReadStatus('ChannelAudioMute', {'Channel': '2'}), 'On')
+        self.assertEqual(self.TestDriver.ReadStatus('DeviceAudioMute'), 'Off')
+        dispatcher = self.TestDriver._DeviceClass__matchStrings
+        self.assertEqual((dispatcher.Keyed, dispatcher.Fallbacks, dispatcher.Unmatched), (5, 0, 0))
+
+    def test_ShureReceive_MatchStringKeys(self):
+        keys = ShureDeviceClass._DeviceClass__matchStringKeys
+        self.assertEqual(keys[SharedPattern(b'< REP ([1-9]) AUDIO_MUTE (ON|OFF) >')], [b'AUDIO_MUTE'])
+        self.assertEqual(keys[SharedPattern(b'< REP ([1-9]) BEAM_(X|Y) (\\d{1,4}) >')], [b'BEAM_X', b'BEAM_Y'])
+        self.assertEqual(keys[SharedPattern(b'< REP DEVICE_AUDIO_MUTE (ON|OFF) >')], [b'DEVICE_AUDIO_MUTE'])
+        self.assertEqual(keys[SharedPattern(b'< REP ERR >')], [b'ERR'])
+
+        key = ShureDeviceClass._DeviceClass__MessageKey
+        self.assertEqual(key(b'< REP 1 BEAM_Y 0100 >'), b'BEAM_Y')
+        self.assertEqual(key(b'< REP LED_BRIGHTNESS 3 >'), b'LED_BRIGHTNESS')
+        self.assertIsNone(key(b'< REP >'))
+
+class N2300Receive_TestClass(unittest.TestCase):
+    # recorded getStatus and getNetStatus reads
+    Network = (b'MAC:00:60:9F:A1:B2:C3\rIP:10.1.2.3\rNM:255.255.255.0\rGW:10.1.2.1\rIPTRIAL:0\rIPMODE:Static\rID:1\r'
+               b'rel:2023-01-05\rSWVER:01/05/2023\rWEBVER:1.2.3\rUPDATE:0\rUPDTRY:0\rUPDFAILED:0\rMEDIAPORT0:on\r'
+               b'MEDIAPORT1:off\rPORTSD1:no\rDVICEVTDLY:0\rDVIDEVTDLY:0\rUSERMCMODE:off\rUSERMCIP:0.0.0.0\r')
+    Decoder = (b'SVSI_RXGEN2:N2322A00012\rNAME:Decoder 1\r' + Network +
+               b'LIVEAUDIOLP:off\rYUVOUT:off\rFRAMEHOLD:off\rVIDOFFNOSTRM:on\rMODE:auto\rSTREAM:12\rSTREAMAUDIO:0\r'
+               b'MUTE:0\rPLAYLIST:1\rPLAYMODE:live\rDVISTATUS:connected\r')
+    Encoder = (b'SVSI_TXGEN2:N2312A00034\rNAME:Encoder 1\r' + Network +
+               b'STREAM:34\rSAMPLE:48000\rHDMIAUDIO:auto\rvidDetectMode:auto\rMODE:1080p60\rLINEINVOL_L:50\r'
+               b'LINEINVOL_R:50\rLIVEAUDIOHP:off\rMUTE:0\rPLAYLIST:1\rPLAYMODE:live\rDVIINPUT:connected\r')
+    NetStats = (b'SVSI_NETSTATS:\rchassisID:00:11:22:33:44:55\rsysName:sw-01\rsysDescr:core switch\r'
+                b'portID:ge-0/0/12\rportDescr:room 101\r')
+
+    def Driver(self, model):
+        driver = N2300Class(None, '127.0.0.1', 50002, Model=model)
+        calls = Counter()
+        for command in ['DeviceStatus', 'Stream', 'Mute', 'LiveLocal', 'HDMIStatus', 'NetStatus']:
+            if command in driver.Commands:
+                driver.SubscribeStatus(command, None, lambda command, value, qualifier: calls.update([command]))
+        return driver, calls
+
+    def test_N2300Receive_Decoder(self):
+        driver, calls = self.Driver('NMX-DEC-N2322')
+
+        # both blocks in one read
+        driver.ReceiveData(driver, self.Decoder + self.NetStats)
+        self.assertEqual(calls, Counter(['DeviceStatus', 'Stream', 'Mute', 'LiveLocal', 'HDMIStatus', 'NetStatus']))
+        self.assertEqual(driver.ReadStatus('Stream'), 12)
+        self.assertEqual(driver.ReadStatus('DeviceStatus')['SerialNumber'], 'N2322A00012')
+        self.assertEqual(driver.ReadStatus('NetStatus')['PortId'], 'ge-0/0/12')
+
+        # blocks split mid line across reads, only the changed stream calls back
+        data = self.Decoder.replace(b'STREAM:12', b'STREAM:13') + self.NetStats
+        for i in range(0, len(data), 100):
+            driver.ReceiveData(driver, data[i:i + 100])
+        self.assertEqual(calls['Stream'], 2)
+        self.assertEqual(sum(calls.values()), 7)
+        self.assertEqual(driver.ReadStatus('Stream'), 13)
+
+    def test_N2300Receive_Encoder(self):
+        driver, calls = self.Driver('NMX-ENC-N2312')
+
+        driver.ReceiveData(driver, self.Encoder + self.NetStats + self.Encoder.replace(b'MUTE:0', b'MUTE:1'))
+        self.assertEqual(calls, Counter(['DeviceStatus', 'LiveLocal', 'HDMIStatus', 'NetStatus', 'Mute', 'Mute']))
+        self.assertEqual(driver.ReadStatus('DeviceStatus')['Stream'], 34)
+        self.assertIs(driver.ReadStatus('Mute'), True)
+        self.assertIs(driver.ReadStatus('Tx'), True)
+
+class DriverReceive_Benchmark(unittest.TestCase):
+    # compares the per-message parse cost of dispatching recorded messages by
+    # message key against trying every match string in order, as the Shure
+    # and Tesira drivers did previously. Callbacks do nothing, so only the
+    # matching is timed.
+    Iterations = 500
+
+    def Noop(self, match, arg):
+        pass
+
+    def Dispatchers(self, create, MessageKey=None):
+        # a keyed and an unkeyed dispatcher holding every match string the
+        # driver registers
+        keyed = PrefixDispatcher(MessageKey)
+        unkeyed = PrefixDispatcher()
+        add = PrefixDispatcher.Add
+        def Add(dispatcher, Pattern, Callback, Arg=None, Keys=None):
+            add(keyed, Pattern, self.Noop, Arg, Keys)
+            add(unkeyed, Pattern, self.Noop, Arg)
+            return add(dispatcher, Pattern, Callback, Arg, Keys)
+        with mock_patch.object(PrefixDispatcher, 'Add', Add):
+            create()
+        return keyed, unkeyed
+
+    def test_DriverReceive_Benchmark_Shure(self):
+        keyed, unkeyed = self.Dispatchers(lambda: ShureClass(None, '127.0.0.1', 2202, Model='MXA910'),
+                                          ShureDeviceClass._DeviceClass__MessageKey)
+        # one recorded frame for each match string
+        frames = [b'< REP NUM_ACTIVE_MICS 4 >', b'< REP 3 AUDIO_GAIN_HI_RES 1100 >',
+                  b'< REP 4 AUDIO_IN_PEAK_LVL 052 >', b'< REP 4 AUDIO_IN_RMS_LVL 040 >',
+                  b'< REP 1 BEAM_Z 100 >', b'< REP 1 BEAM_X 0512 >', b'< REP 1 BEAM_W WIDE >',
+                  b'< REP 2 AUDIO_MUTE ON >', b'< REP DEVICE_AUDIO_MUTE OFF >', b'< REP FLASH OFF >',
+                  b'< REP 5 AUTOMIX_GATE_OUT_EXT_SIG ON >', b'< REP LED_BRIGHTNESS 3 >',
+                  b'< REP LED_COLOR_MUTED RED >', b'< REP LED_STATE_UNMUTED ON >',
+                  b'< REP 1 AUDIO_OUT_CLIP_INDICATOR OFF >', b'< REP PRESET 03 >',
+                  b'< REP EXT_SWITCH_OUT_STATE OFF >', b'< REP DEV_LED_IN_STATE ON >',
+                  b'< REP 2 CHAN_LED_IN_STATE ON >', b'< REP MUTE_BUTTON_LED_STATE ON >',
+                  b'< REP MUTE_BUTTON_STATUS OFF >']
+        def Keyed():
+            for frame in frames:
+                keyed.Dispatch(frame)
+        def Unkeyed():
+            for frame in frames:
+                unkeyed.Dispatch(frame)
+
+        old = min(timeit.repeat(Unkeyed, number=self.Iterations, repeat=3))
+        new = min(timeit.repeat(Keyed, number=self.Iterations, repeat=3))
+        self.assertEqual((keyed.Fallbacks, keyed.Unmatched, unkeyed.Unmatched), (0, 0, 0))
+        self.assertLess(new, old)
+        # generous bound, well under a millisecond per message
+        self.assertLess(new / (self.Iterations * len(frames)), 0.001)
+
+    def test_DriverReceive_Benchmark_Tesira(self):
+        def Create():
+            driver = TesiraClass(None, '127.0.0.1', 22, Credentials=('admin', 'password'))
+            for tag in ['Mic1', 'Mic2', 'Mic3', 'Mic4', 'Mic5', 'Mic6']:
+                driver.UpdateAECEnable(None, {'Instance Tag': tag, 'Channel': '1'})
+                driver.UpdateAECGain(None, {'Instance Tag': tag, 'Channel': '1'})
+                driver.UpdateLogicInputOutput(None, {'Instance Tag': tag, 'Channel': '1'})
+        keyed, unkeyed = self.Dispatchers(Create)
+        lines = [[b'Mic2 get aecEnable 1\r\n', b'+OK "value":true\r\n'],
+                 [b'Mic2 get gain 1\r\n', b'+OK "value":12.000000\r\n'],
+                 [b'Mic2 get invert 1\r\n', b'+OK "value":false\r\n'],
+                 [b'Mic5 get aecEnable 1\r\n', b'+OK "value":true\r\n'],
+                 [b'Mic5 get gain 1\r\n', b'+OK "value":12.000000\r\n'],
+                 [b'Mic5 get invert 1\r\n', b'+OK "value":false\r\n'],
+                 [b'SESSION get verbose\r\n', b'+OK "value":true\r\n'],
+                 [b'-ERR address not found\r\n'],
+                 [b'! "publishToken":"LevelControl_Prog" "value":{"levels":[-10.000000 -20.000000]}\r\n'],
+                 [b'! "publishToken":"MuteControl_Prog" "value":{"mutes":[true false]}\r\n']]
+        messages = [(b''.join(message), message[-1]) for message in lines]
+        key = TesiraDeviceClass._DeviceClass__MessageKey
+        def Keyed():
+            for message, line in messages:
+                keyed.Dispatch(message, key(message, line))
+        def Unkeyed():
+            for message, line in messages:
+                unkeyed.Dispatch(message)
+
+        old = min(timeit.repeat(Unkeyed, number=self.Iterations, repeat=3))
+        new = min(timeit.repeat(Keyed, number=self.Iterations, repeat=3))
+        self.assertEqual((keyed.Fallbacks, keyed.Unmatched, unkeyed.Unmatched), (0, 0, 0))
+        # with a few dozen match strings, finding the attribute in the echo
+        # costs about what trying the other match strings does, keyed
+        # dispatch must not cost more
+        self.assertLess(new, old * 1.5)
+        self.assertLess(new / (self.Iterations * len(messages)), 0.001)
+
+if __name__ == '__main__':
+    unittest.main()
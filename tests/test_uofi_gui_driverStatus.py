@@ -0,0 +1,263 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+import timeit
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from uofi_gui.driverStatus import StatusStore, CommandMethods, AliasCommand
+from hardware.biam_dsp_TesiraSeries_uofi import SSHClass as TesiraClass, DeviceClass as TesiraDeviceClass
+from hardware.shur_dsp_MXA_Series_v1_3_0_0 import EthernetClass as ShureClass
+from hardware.nec_display_P_V_X_Series_v1_4_1_0 import EthernetClass as NECClass, SerialOverEthernetClass as NECSerialClass, DeviceClass as NECDeviceClass
+from hardware.amx_avoip_n2300_series import EthernetClass as N2300Class, DeviceClass as N2300DeviceClass
+
+from unittest.mock import patch as mock_patch
+## -----------------------------------------------------------------------------
+
+class StatusStore_TestClass(unittest.TestCase): # rename for module to be tested
+    def setUp(self) -> None:
+        self.Commands = {
+            'Power': {'Status': {}},
+            'Gain': {'Parameters': ['Instance', 'Channel'], 'Status': {}},
+        }
+        self.Calls = []
+        self.TestStore = StatusStore(self.Commands)
+        return super().setUp()
+
+    def Callback(self, command, value, qualifier):
+        self.Calls.append((command, value, qualifier))
+
+    def test_StatusStore_Key(self):
+        self.assertIsNotNone(self.TestStore.Key('Power'))
+        self.assertEqual(self.TestStore.Key('Gain', {'Channel': 2, 'Instance': 'Mix', 'Other': 1}), ('Mix', 2))
+        self.assertIsNone(self.TestStore.Key('Gain', {'Channel': 2}))
+        with self.assertRaises(KeyError):
+            self.TestStore.Key('NotACommand', {'Channel': 2})
+
+    def test_StatusStore_WriteRead(self):
+        qual = {'Instance': 'Mix', 'Channel': 1}
+        self.assertTrue(self.TestStore.Write('Gain', -10, qual))
+        self.assertFalse(self.TestStore.Write('Gain', -10, qual))
+        self.assertFalse(self.TestStore.Write('Gain', -10, {'Channel': 1}))
+
+        self.assertEqual(self.TestStore.Read('Gain', qual), -10)
+        self.assertIsNone(self.TestStore.Read('Gain', {'Instance': 'Mix', 'Channel': 2}))
+        self.assertIsNone(self.TestStore.Read('Gain', {'Channel': 1}))
+
+        # None is a value like any other
+        self.assertTrue(self.TestStore.Write('Power', None))
+        self.assertFalse(self.TestStore.Write('Power', None))
+
+    def test_StatusStore_Items(self):
+        self.TestStore.Write('Power', 'On')
+        self.TestStore.Write('Gain', -10, {'Instance': 'Mix', 'Channel': 1})
+        self.TestStore.Write('Gain', -5, {'Instance': 'Mix', 'Channel': 2})
+
+        self.assertEqual(sorted(self.TestStore.Items(), key=repr),
+                         sorted([('Power', None, 'On'),
+                                 ('Gain', {'Instance': 'Mix', 'Channel': 1}, -10),
+                                 ('Gain', {'Instance': 'Mix', 'Channel': 2}, -5)], key=repr))
+        # status is held by the store, not the driver's nested status dicts
+        self.assertEqual(self.Commands['Gain']['Status'], {})
+
+    def test_StatusStore_Version(self):
+        qual = {'Instance': 'Mix', 'Channel': 1}
+        self.assertEqual(self.TestStore.Version('Power'), 0)
+
+        self.TestStore.Write('Power', 'On')
+        self.TestStore.Write('Gain', -10, qual)
+        since = self.TestStore.Version('Gain', qual)
+        self.TestStore.Write('Gain', -10, qual)
+        self.assertEqual(self.TestStore.Version('Gain', qual), since)
+
+        self.TestStore.Write('Power', 'Off')
+        self.assertGreater(self.TestStore.Version('Power'), since)
+        self.assertEqual(self.TestStore.LastVersion, 3)
+
+    def test_StatusStore_ChangeHook(self):
+        changes = []
+        self.TestStore.ChangeHook = lambda command, qualifier, old, new: changes.append((command, qualifier, old, new))
+        qual = {'Instance': 'Mix', 'Channel': 1}
+        self.TestStore.Write('Gain', -10, qual)
+        self.TestStore.Write('Gain', -10, qual)
+        self.TestStore.Write('Gain', -5, qual)
+        self.assertEqual(changes, [('Gain', qual, None, -10), ('Gain', qual, -10, -5)])
+
+    def test_StatusStore_Notify(self):
+        exactCalls = []
+        self.TestStore.Subscribe('Gain', None, self.Callback)
+        self.TestStore.Subscribe('Gain', {'Instance': 'Mix', 'Channel': 1},
+                                 lambda *args: exactCalls.append(args))
+        self.assertFalse(self.TestStore.Subscribe('Gain', {'Channel': 1}, self.Callback))
+
+        self.TestStore.Notify('Gain', -10, {'Instance': 'Mix', 'Channel': 1})
+        # unsubscribed qualifiers fall back to the nearest subscribed level on their path
+        self.TestStore.Notify('Gain', -5, {'Instance': 'Other', 'Channel': 1})
+        self.TestStore.Notify('Gain', -5, {'Instance': 'Mix', 'Channel': 2})
+        self.TestStore.Notify('Gain', -5, {'Channel': 2})
+        self.TestStore.Notify('Power', 'On', None)
+
+        self.assertEqual(exactCalls, [('Gain', -10, {'Instance': 'Mix', 'Channel': 1})])
+        self.assertEqual(self.Calls, [('Gain', -5, {'Instance': 'Other', 'Channel': 1}),
+                                      ('Gain', -5, {'Instance': 'Mix', 'Channel': 2}),
+                                      ('Gain', -5, {'Channel': 2})])
+
+        # without a root subscription siblings of the exact qualifier go nowhere
+        store = StatusStore(self.Commands)
+        store.Subscribe('Gain', {'Instance': 'Mix', 'Channel': 1}, self.Callback)
+        self.assertIsNone(store.Target('Gain', {'Instance': 'Mix', 'Channel': 2}))
+
+    def test_StatusStore_Validate(self):
+        self.assertTrue(self.TestStore.Validate('Gain', {'Instance': 'Mix', 'Channel': 1, 'Other': 1}))
+        self.assertFalse(self.TestStore.Validate('Gain', {'Channel': 1}))
+        # no qualifier, commands without parameters and unlisted commands
+        self.assertTrue(self.TestStore.Validate('Gain', None))
+        self.assertTrue(self.TestStore.Validate('Power', {'Channel': 1}))
+        self.assertTrue(self.TestStore.Validate('NotACommand', {'Channel': 1}))
+
+class CommandMethods_TestClass(unittest.TestCase): # rename for module to be tested
+    def setUp(self) -> None:
+        self.TestDriver = TesiraClass(None, '127.0.0.1', 22, Credentials=('admin', 'password'))
+        return super().setUp()
+
+    def test_CommandMethods_Table(self):
+        self.assertIs(TesiraDeviceClass.SetMethods['LevelControl'], TesiraDeviceClass.SetLevelControl)
+        self.assertIs(TesiraDeviceClass.UpdateMethods['LevelControl'], TesiraDeviceClass.UpdateLevelControl)
+        # built once, shared by every driver class and instance
+        self.assertIs(self.TestDriver.SetMethods, TesiraDeviceClass.SetMethods)
+        self.assertNotIn('', TesiraDeviceClass.SetMethods)
+
+        class Driver:
+            def SetPower(self, value, qualifier): pass
+            def Set(self, command, value, qualifier=None): pass
+        class SubDriver(Driver):
+            def SetPower(self, value, qualifier): pass
+        self.assertEqual(list(CommandMethods(Driver).SetMethods), ['Power'])
+        self.assertIs(CommandMethods(SubDriver).SetMethods['Power'], SubDriver.SetPower)
+
+    def test_CommandMethods_SetUpdate(self):
+        qual = {'Instance Tag': 'Prog', 'Channel': '1'}
+        with mock_patch.object(self.TestDriver, '_DeviceClass__SetHelper') as setHelper:
+            self.TestDriver.Set('LevelControl', -10, qual)
+            setHelper.assert_called_once_with('LevelControl', 'Prog set level 1 -10\n', -10, qual)
+
+            with self.assertRaises(KeyError):
+                self.TestDriver.Set('LevelControl', -10, {'Instance Tag': 'Prog'})
+            self.assertEqual(setHelper.call_count, 1)
+
+        with self.assertRaises(AttributeError):
+            self.TestDriver.Set('NotACommand', 1)
+        with self.assertRaises(AttributeError):
+            self.TestDriver.Update('NotACommand')
+
+    def test_CommandMethods_Alias(self):
+        decoder = N2300Class(None, '127.0.0.1', 50002, Model='NMX-DEC-N2322')
+        encoder = N2300Class(None, '127.0.0.1', 50002, Model='NMX-ENC-N2312')
+
+        self.assertIs(decoder.UpdateMethods['Stream'], N2300DeviceClass.UpdateDeviceStatus)
+        self.assertNotIn('Stream', encoder.UpdateMethods)
+        # aliases are held by the instance, the class table is unchanged
+        self.assertNotIn('Mute', N2300DeviceClass.UpdateMethods)
+        self.assertEqual(decoder.UpdateStream, decoder.UpdateDeviceStatus)
+
+        with mock_patch.object(decoder, '_DeviceClass__UpdateHelper') as updateHelper:
+            decoder.Update('Mute')
+        updateHelper.assert_called_once_with('DeviceStatus', 'getStatus\n', None, None)
+        with self.assertRaises(AttributeError):
+            encoder.Update('Stream')
+
+    def test_CommandMethods_SharedBase(self):
+        ethernet = NECClass(None, '127.0.0.1', 7142)
+        serial = NECSerialClass('127.0.0.1', 4999)
+
+        self.assertIs(ethernet.SetMethods['Power'], NECDeviceClass.SetPower)
+        self.assertIs(serial.SetMethods['Power'], NECDeviceClass.SetPower)
+        self.assertNotIn('ClosedCaption', ethernet.UpdateMethods)
+        self.assertIn('ClosedCaption', serial.UpdateMethods)
+
+        # the same body frames the message for each destination ID
+        with mock_patch.object(ethernet, 'SendAndWait', return_value=None) as sendAndWait:
+            ethernet.Set('Power', 'On')
+        self.assertEqual(sendAndWait.call_args[0][0][:4], b'\x010A0')
+        with mock_patch.object(serial, 'SendAndWait', return_value=None) as sendAndWait, \
+             mock_patch.object(serial, 'Send') as send:
+            serial.Set('Power', 'On', {'Device ID': '3'})
+            self.assertEqual(sendAndWait.call_args[0][0][:4], b'\x010C0')
+            # broadcasts are sent without waiting for a reply
+            serial.Set('Power', 'On', {'Device ID': 'Broadcast'})
+            self.assertEqual(send.call_args[0][0][:4], b'\x010*0')
+            self.assertEqual(sendAndWait.call_count, 1)
+
+class CommandMethods_Benchmark(unittest.TestCase):
+    # compares Set and Update against resolving 'Set%s' % command with
+    # getattr on every call, as the drivers did previously. The send
+    # helpers do nothing, so only the dispatch is timed.
+    Iterations = 5000
+
+    def Noop(self, *args):
+        pass
+
+    def OldSet(self, driver, command, value, qualifier=None):
+        method = getattr(driver, 'Set%s' % command, None)
+        if method is not None and callable(method):
+            method(value, qualifier)
+
+    def OldUpdate(self, driver, command, qualifier=None):
+        method = getattr(driver, 'Update%s' % command, None)
+        if method is not None and callable(method):
+            method(None, qualifier)
+
+    def Compare(self, driver, helpers, command, value, qualifier=None):
+        for helper in helpers:
+            setattr(driver, helper, self.Noop)
+        def Old():
+            self.OldSet(driver, command, value, qualifier)
+            self.OldUpdate(driver, command, qualifier)
+        def New():
+            driver.Set(command, value, qualifier)
+            driver.Update(command, qualifier)
+
+        # interleaved, so load on the machine slows both alike
+        old = new = float('inf')
+        for i in range(7):
+            old = min(old, timeit.timeit(Old, number=self.Iterations))
+            new = min(new, timeit.timeit(New, number=self.Iterations))
+        self.assertLess(new, old)
+        # generous bound, well under a millisecond per Set and Update
+        self.assertLess(new / self.Iterations, 0.001)
+
+    def test_CommandMethods_Benchmark_Tesira(self):
+        self.Compare(TesiraClass(None, '127.0.0.1', 22, Credentials=('admin', 'password')),
+                     ['_DeviceClass__SetHelper', '_UpdateSubscribeHelper'],
+                     'LevelControl', -10, {'Instance Tag': 'Prog', 'Channel': '1'})
+
+    def test_CommandMethods_Benchmark_Shure(self):
+        self.Compare(ShureClass(None, '127.0.0.1', 2202, Model='MXA910'),
+                     ['_DeviceClass__SetHelper', '_DeviceClass__UpdateHelper'],
+                     'RingLEDPower', 'On')
+
+    def test_CommandMethods_Benchmark_NEC(self):
+        self.Compare(NECClass(None, '127.0.0.1', 7142),
+                     ['_SetHelper', '_UpdateHelper'],
+                     'Volume', 50)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,6 +26,7 @@ sys.path.append(".\\tests\\reqs")
 from uofi_gui import GUIController, ExProcessorDevice
 from uofi_gui.uiObjects import ExUIDevice
 from uofi_gui.systemHardware import SystemPollingController, SystemHardwareController
+from uofi_gui.settingsModel import SettingsError
 
 import test_settings as settings
 import test_settings as settings_no_primary
@@ -298,5 +299,86 @@ class GUIController_TestClass(unittest.TestCase):
                 except Exception as inst:
                     self.fail("ShutdownActions ({}) raised {} unexpectedly!".format(i, type(inst)))
     
+    def test_GUIController_ReloadSettings_NoChange(self):
+        self.InitializeController()
+        hardware = dict(self.TestController.Hardware)
+        polling = list(self.TestController.PollCtl.Polling)
+        
+        importlib.reload(settings)
+        diff = self.TestController.ReloadSettings(settings)
+        
+        self.assertEqual(diff.RestartRequired, [])
+        self.assertEqual(self.TestController.Hardware, hardware)
+        for hwId in hardware:
+            self.assertIs(self.TestController.Hardware[hwId], hardware[hwId])
+        self.assertEqual(self.TestController.PollCtl.Polling, polling)
+    
+    def test_GUIController_ReloadSettings_Hardware(self):
+        self.InitializeController()
+        unchanged = self.TestController.Hardware['WPD002']
+        removed = self.TestController.Hardware['WPD003']
+        retuned = self.TestController.Hardware['WPD001']
+        
+        importlib.reload(settings)
+        hardware = {hw['Id']: hw for hw in settings.hardware}
+        hardware['WPD001']['Polling'][0]['active_int'] = 20
+        hardware['WPD003']['Id'] = 'WPD004'
+        
+        diff = self.TestController.ReloadSettings(settings)
+        
+        self.assertEqual(diff.HardwareAdded, ['WPD004'])
+        self.assertEqual(diff.HardwareRemoved, ['WPD003'])
+        self.assertEqual(diff.HardwareUpdated, ['WPD001'])
+        
+        self.assertIs(self.TestController.Hardware['WPD002'], unchanged)
+        self.assertIs(self.TestController.Hardware['WPD001'], retuned)
+        self.assertNotIn('WPD003', self.TestController.Hardware)
+        self.assertIsInstance(self.TestController.Hardware['WPD004'], SystemHardwareController)
+        
+        polls = self.TestController.PollCtl.Polling
+        self.assertEqual([p for p in polls if p['interface'] is removed.interface], [])
+        self.assertEqual([p['active_duration'] for p in polls if p['interface'] is retuned.interface], [20])
+        self.assertEqual(len([p for p in polls if p['interface'] is self.TestController.Hardware['WPD004'].interface]), 1)
+        self.assertIn(self.TestController.Hardware['WPD004'], self.TestController.TP_Main.StatusCtl.Hardware)
+    
+    def test_GUIController_ReloadSettings_Sources(self):
+        self.InitializeController()
+        
+        importlib.reload(settings)
+        settings.sources[0]['name'] = 'Lectern PC'
+        settings.roomName = 'Other Room'
+        
+        diff = self.TestController.ReloadSettings(settings)
+        
+        self.assertEqual(diff.SourceNames, {'PC001': 'Lectern PC'})
+        for tp in self.TestController.TPs:
+            self.assertEqual(tp.SrcCtl.GetSource(id='PC001').Name, 'Lectern PC')
+        self.assertEqual(self.TestController.RoomName, 'Other Room')
+        self.assertEqual(self.TestController.Config.RoomName, 'Other Room')
+    
+    def test_GUIController_ReloadSettings_RestartRequired(self):
+        self.InitializeController()
+        display = self.TestController.Hardware['MON001']
+        
+        importlib.reload(settings)
+        hardware = {hw['Id']: hw for hw in settings.hardware}
+        hardware['MON001']['Interface']['interface_configuration']['Hostname'] = 'mon999'
+        
+        diff = self.TestController.ReloadSettings(settings)
+        
+        self.assertEqual(diff.RestartRequired, ['hardware (MON001)'])
+        self.assertIs(self.TestController.Hardware['MON001'], display)
+    
+    def test_GUIController_ReloadSettings_Invalid(self):
+        self.InitializeController()
+        config = self.TestController.Config
+        
+        importlib.reload(settings)
+        settings.defaultSource = 'PC999'
+        
+        with self.assertRaises(SettingsError):
+            self.TestController.ReloadSettings(settings)
+        self.assertIs(self.TestController.Config, config)
+    
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -33,6 +33,7 @@ import test_settings as settings
 from extronlib.device import UIDevice
 from extronlib.ui import Button, Label
 from extronlib.system import Timer
+from uofi_gui.timerService import ServiceTimer
 
 ## -----------------------------------------------------------------------------
 
@@ -137,7 +138,7 @@ class KeyboardController_TestClass(unittest.TestCase): # rename for module to be
         
         # __CursorTimer
         with self.subTest(param='__CursorTimer'):
-            self.assertIsInstance(self.TestKeyboardController._KeyboardController__CursorTimer, Timer)
+            self.assertIsInstance(self.TestKeyboardController._KeyboardController__CursorTimer, ServiceTimer)
     
     def test_KeyboardController_EventHandler_CharBtnHandler(self):
         btnList = self.TestKeyboardController._KeyboardController__CharBtns
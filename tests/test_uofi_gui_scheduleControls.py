@@ -16,6 +16,7 @@
 
 import unittest
 import importlib
+from datetime import date, datetime
 
 import sys
 sys.path.append(".\\src")
@@ -25,11 +26,13 @@ sys.path.append(".\\tests\\reqs")
 
 ## test imports ----------------------------------------------------------------
 import os
+from types import SimpleNamespace
 from uofi_gui import GUIController
 from uofi_gui.activityControls import ActivityController
 from uofi_gui.uiObjects import ExUIDevice
-from uofi_gui.scheduleControls import AutoScheduleController
+from uofi_gui.scheduleControls import AutoScheduleController, ScheduleEngine, ExceptionCalendar, CalendarException
 import test_settings as settings
+from uofi_gui.stateStore import States
 
 from extronlib.ui import Button, Label
 from extronlib.system import MESet, Clock, File
@@ -44,9 +47,11 @@ class ScheduleController_TestClass(unittest.TestCase): # rename for module to be
         self.TestGUIController.Initialize()
         self.TestUIController = self.TestGUIController.TP_Main
         self.TestScheduleController = self.TestUIController.SchedCtl
+        self.TestEngine = self.TestGUIController.SchedEngine
         return super().setUp()
     
     def tearDown(self):
+        States.Release()
         if os.path.exists('./tests/reqs/emFS/SFTP/user/states/room_schedule.json'):
             os.remove('./tests/reqs/emFS/SFTP/user/states/room_schedule.json')
     
@@ -69,13 +74,14 @@ class ScheduleController_TestClass(unittest.TestCase): # rename for module to be
         # AutoShutdown
         with self.subTest(prop='AutoShutdown'):
             self.assertIsInstance(self.TestScheduleController.AutoShutdown, bool)
+            
+        # Engine
+        with self.subTest(prop='Engine'):
+            self.assertIs(self.TestScheduleController.Engine, self.TestEngine)
+            self.assertIn(self.TestScheduleController, self.TestEngine.Views)
         
     def test_ScheduleController_PRIV_Properties(self):
         
-        # __default_pattern
-        with self.subTest(prop='__default_pattern'):
-            self.assertIsInstance(self.TestScheduleController._AutoScheduleController__default_pattern, dict)
-        
         # __inactivityHandlers
         with self.subTest(prop='__inactivityHandlers'):
             self.assertIsInstance(self.TestScheduleController._AutoScheduleController__inactivityHandlers, dict)
@@ -84,11 +90,6 @@ class ScheduleController_TestClass(unittest.TestCase): # rename for module to be
                     self.assertIsInstance(key, int)
                     self.assertTrue(callable(value))
         
-        # __scheduleFilePath
-        with self.subTest(prop='__scheduleFilePath'):
-            self.assertIsInstance(self.TestScheduleController._AutoScheduleController__scheduleFilePath, str)
-            self.assertIn('/user/states/', self.TestScheduleController._AutoScheduleController__scheduleFilePath)
-        
         # __toggle_start
         with self.subTest(prop='__toggle_start'):
             self.assertIsInstance(self.TestScheduleController._AutoScheduleController__toggle_start, Button)
@@ -191,17 +192,9 @@ class ScheduleController_TestClass(unittest.TestCase): # rename for module to be
             self.assertTrue(hasattr(self.TestScheduleController._AutoScheduleController__editor_pattern, 'Mode'))
             self.assertTrue(hasattr(self.TestScheduleController._AutoScheduleController__editor_pattern, 'Pattern'))
         
-        # __AutoStartClock
-        with self.subTest(prop='__AutoStartClock'):
-            self.assertIsInstance(self.TestScheduleController._AutoScheduleController__AutoStartClock, Clock)
-        
-        # __AutoShutdownClock
-        with self.subTest(prop='__AutoShutdownClock'):
-            self.assertIsInstance(self.TestScheduleController._AutoScheduleController__AutoShutdownClock, Clock)
-        
     def test_ScheduleController_PRIV_UpdatePattern(self):
-        self.TestScheduleController._AutoScheduleController__pattern_start.Pattern = self.TestScheduleController._AutoScheduleController__default_pattern
-        self.TestScheduleController._AutoScheduleController__pattern_shutdown.Pattern = self.TestScheduleController._AutoScheduleController__default_pattern
+        self.TestScheduleController._AutoScheduleController__pattern_start.Pattern = self.TestEngine._ScheduleEngine__default_pattern
+        self.TestScheduleController._AutoScheduleController__pattern_shutdown.Pattern = self.TestEngine._ScheduleEngine__default_pattern
 
         # exec method
         ## test Mode == None
@@ -310,8 +303,8 @@ class ScheduleController_TestClass(unittest.TestCase): # rename for module to be
         import shutil
         
         with self.subTest(con='Save - No Existing Schedule'):
-            if File.Exists(self.TestScheduleController._AutoScheduleController__scheduleFilePath):
-                File.DeleteFile(self.TestScheduleController._AutoScheduleController__scheduleFilePath)
+            if File.Exists(self.TestEngine._ScheduleEngine__scheduleFilePath):
+                File.DeleteFile(self.TestEngine._ScheduleEngine__scheduleFilePath)
             try:
                 self.TestScheduleController.SaveSchedule()
             except Exception as inst:
@@ -319,11 +312,12 @@ class ScheduleController_TestClass(unittest.TestCase): # rename for module to be
                 
         with self.subTest(con='Save - Existing Schedule'):
             shutil.copyfile('./tests/reqs/emFS/SFTP/user/states/test_states/test_room_schedule.json', './tests/reqs/emFS/SFTP/user/states/test_room_schedule_write.json')
-            self.TestScheduleController._AutoScheduleController__scheduleFilePath = '/user/states/test_room_schedule_write.json'
+            self.TestEngine._ScheduleEngine__scheduleFilePath = '/user/states/test_room_schedule_write.json'
             try:
                 self.TestScheduleController.SaveSchedule()
             except Exception as inst:
                 self.fail("__SaveSchedule() raised {} unexpectedly!".format(type(inst)))
+            States.Release('/user/states/test_room_schedule_write.json')
             os.remove('./tests/reqs/emFS/SFTP/user/states/test_room_schedule_write.json')
     
     def test_ScheduleController_LoadSchedule_NoFile(self):
@@ -353,7 +347,7 @@ class ScheduleController_TestClass(unittest.TestCase): # rename for module to be
                 }
             ]
         
-        self.TestScheduleController._AutoScheduleController__scheduleFilePath = '/user/states/test_states/test_room_schedule.json'
+        self.TestEngine._ScheduleEngine__scheduleFilePath = '/user/states/test_states/test_room_schedule.json'
         
         for con in context:
             with self.subTest(i=con):
@@ -395,80 +389,6 @@ class ScheduleController_TestClass(unittest.TestCase): # rename for module to be
         
         self.assertEqual(self.TestScheduleController._AutoScheduleController__btns_ampm.GetCurrent().Value, testPattern['Time']['ampm'])
     
-    def test_ScheduleController_PRIV_ScheduleShutdownHandler(self):
-        context = ['off', 'share', 'adv_share', 'group_work']
-        
-        # exec method
-        for con in context:
-            with self.subTest(i=con):
-                self.TestScheduleController.GUIHost.ActCtl.CurrentActivity = con
-                try:
-                    self.TestScheduleController._AutoScheduleController__ScheduleShutdownHandler(Clock=None, Time=None)
-                except Exception as inst:
-                    self.fail("__ScheduleShutdownHandler() raised {} unexpectedly!".format(type(inst)))
-    
-    def test_ScheduleController_PRIV_ScheduleStartHandler(self):
-        context = ['off', 'share', 'adv_share', 'group_work']
-        
-        # exec method
-        for con in context:
-            with self.subTest(i=con):
-                self.TestScheduleController.GUIHost.ActCtl.CurrentActivity = con
-                for tp in self.TestGUIController.TPs:
-                    tp.SrcCtl.PrimaryDestination.AssignSource(self.TestGUIController.SrcCtl.Sources[0])
-                try:
-                    self.TestScheduleController._AutoScheduleController__ScheduleStartHandler(Clock=None, Time=None)
-                except Exception as inst:
-                    self.fail("__ScheduleStartHandler() raised {} unexpectedly!".format(type(inst)))
-    
-    def test_ScheduleController_PRIV_ClockTime(self):
-        # setup for test
-        testTimes = \
-            [
-                {
-                    'hr': '4',
-                    'min': '15',
-                    'ampm': 'PM'
-                },
-                {
-                    'hr': '12',
-                    'min': '00',
-                    'ampm': 'PM'
-                },
-                {
-                    'hr': '12',
-                    'min': '00',
-                    'ampm': 'AM'
-                },
-                {
-                    'hr': '6',
-                    'min': '37',
-                    'ampm': 'AM'
-                }
-            ]
-        
-        expectedValues = \
-            [
-                '16:15:00',
-                '12:00:00',
-                '00:00:00',
-                '06:37:00'
-            ]
-            
-        # exec method
-        for i in range(len(testTimes)):
-            with self.subTest(i=i):
-                clockTime = None
-                try:
-                    clockTime = self.TestScheduleController._AutoScheduleController__ClockTime(testTimes[i])
-                except Exception as inst:
-                    self.fail("List sorting ({}) raised {} unexpectedly!".format(testTimes[i], type(inst)))
-                    
-                # test outcomes
-                self.assertIsNotNone(clockTime)
-                
-                self.assertEqual(clockTime, expectedValues[i])
-    
     def test_ScheduleController_PRIV_PopoverInactivityHandler(self):
         # exec method
         try:
@@ -488,13 +408,6 @@ class ScheduleController_TestClass(unittest.TestCase): # rename for module to be
                 except Exception as inst:
                     self.fail("__TechPageInactivityHandler raised {} unexpectedly!".format(type(inst)))
     
-    def test_ScheduleController_PRIV_SystemInactivityHandler(self):
-        # exec method
-        try:
-            self.TestScheduleController._AutoScheduleController__SystemInactivityHandler()
-        except Exception as inst:
-            self.fail("__SystemInactivityHandler raised {} unexpectedly!".format(type(inst)))
-            
     def test_ScheduleController_EventHandlers_InactivityMethodHandler(self):
         # exec method
         for key in self.TestScheduleController._AutoScheduleController__inactivityHandlers.keys():
@@ -583,7 +496,7 @@ class ScheduleController_TestClass(unittest.TestCase): # rename for module to be
         # gather context
         context = [{'button': obj, 'action': 'Pressed'} for obj in self.TestScheduleController._AutoScheduleController__btns_days.values()]
         
-        self.TestScheduleController._AutoScheduleController__editor_pattern.Pattern = self.TestScheduleController._AutoScheduleController__default_pattern
+        self.TestScheduleController._AutoScheduleController__editor_pattern.Pattern = self.TestEngine._ScheduleEngine__default_pattern
         
         # exec method
         for item in context:
@@ -614,7 +527,7 @@ class ScheduleController_TestClass(unittest.TestCase): # rename for module to be
                 }
             ]
         
-        self.TestScheduleController._AutoScheduleController__editor_pattern.Pattern = self.TestScheduleController._AutoScheduleController__default_pattern
+        self.TestScheduleController._AutoScheduleController__editor_pattern.Pattern = self.TestEngine._ScheduleEngine__default_pattern
         
         # exec method
         for item in context:
@@ -638,7 +551,7 @@ class ScheduleController_TestClass(unittest.TestCase): # rename for module to be
                 }
             ]
         
-        self.TestScheduleController._AutoScheduleController__editor_pattern.Pattern = self.TestScheduleController._AutoScheduleController__default_pattern
+        self.TestScheduleController._AutoScheduleController__editor_pattern.Pattern = self.TestEngine._ScheduleEngine__default_pattern
         
         # exec method
         for item in context:
@@ -653,7 +566,7 @@ class ScheduleController_TestClass(unittest.TestCase): # rename for module to be
         context = [{'button': obj, 'action': 'Pressed'} for obj in self.TestScheduleController._AutoScheduleController__btns_time]
         context.extend([{'button': obj, 'action': 'Released'} for obj in self.TestScheduleController._AutoScheduleController__btns_time])
         print(context)
-        self.TestScheduleController._AutoScheduleController__editor_pattern.Pattern = self.TestScheduleController._AutoScheduleController__default_pattern
+        self.TestScheduleController._AutoScheduleController__editor_pattern.Pattern = self.TestEngine._ScheduleEngine__default_pattern
         
         # exec method
         for item in context:
@@ -685,7 +598,7 @@ class ScheduleController_TestClass(unittest.TestCase): # rename for module to be
         # gather context
         context = [{'button': obj, 'action': 'Pressed'} for obj in self.TestScheduleController._AutoScheduleController__btns_ampm.Objects]
         
-        self.TestScheduleController._AutoScheduleController__editor_pattern.Pattern = self.TestScheduleController._AutoScheduleController__default_pattern
+        self.TestScheduleController._AutoScheduleController__editor_pattern.Pattern = self.TestEngine._ScheduleEngine__default_pattern
         
         # exec method
         for item in context:
@@ -709,7 +622,7 @@ class ScheduleController_TestClass(unittest.TestCase): # rename for module to be
                 }
             ]
             
-        self.TestScheduleController._AutoScheduleController__editor_pattern.Pattern = self.TestScheduleController._AutoScheduleController__default_pattern
+        self.TestScheduleController._AutoScheduleController__editor_pattern.Pattern = self.TestEngine._ScheduleEngine__default_pattern
         
         # exec method
         for item in context:
@@ -748,5 +661,279 @@ class ScheduleController_TestClass(unittest.TestCase): # rename for module to be
                 except Exception as inst:
                     self.fail("__EventHandlers EditorCancelHandler raised {} unexpectedly!".format(type(inst)))
     
+class ScheduleEngine_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.TestCtls = ['CTL001']
+        self.TestTPs = ['TP001']
+        importlib.reload(settings)
+        self.TestGUIController = GUIController(settings, self.TestCtls, self.TestTPs)
+        self.TestGUIController.Initialize()
+        self.TestEngine = self.TestGUIController.SchedEngine
+        return super().setUp()
+    
+    def tearDown(self):
+        States.Release()
+        if os.path.exists('./tests/reqs/emFS/SFTP/user/states/room_schedule.json'):
+            os.remove('./tests/reqs/emFS/SFTP/user/states/room_schedule.json')
+    
+    def test_ScheduleEngine_Type(self):
+        self.assertIsInstance(self.TestEngine, ScheduleEngine)
+    
+    def test_ScheduleEngine_Properties(self):
+        # GUIHost
+        with self.subTest(prop='GUIHost'):
+            self.assertIsInstance(self.TestEngine.GUIHost, GUIController)
+        
+        # Views
+        with self.subTest(prop='Views'):
+            self.assertEqual(self.TestEngine.Views, [tp.SchedCtl for tp in self.TestGUIController.TPs])
+        
+        # StartPattern
+        with self.subTest(prop='StartPattern'):
+            self.assertIsInstance(self.TestEngine.StartPattern, dict)
+        
+        # ShutdownPattern
+        with self.subTest(prop='ShutdownPattern'):
+            self.assertIsInstance(self.TestEngine.ShutdownPattern, dict)
+    
+    def test_ScheduleEngine_PRIV_Properties(self):
+        # __default_pattern
+        with self.subTest(prop='__default_pattern'):
+            self.assertIsInstance(self.TestEngine._ScheduleEngine__default_pattern, dict)
+        
+        # __scheduleFilePath
+        with self.subTest(prop='__scheduleFilePath'):
+            self.assertIsInstance(self.TestEngine._ScheduleEngine__scheduleFilePath, str)
+            self.assertIn('/user/states/', self.TestEngine._ScheduleEngine__scheduleFilePath)
+        
+        # __AutoStartClock
+        with self.subTest(prop='__AutoStartClock'):
+            self.assertIsInstance(self.TestEngine._ScheduleEngine__AutoStartClock, Clock)
+        
+        # __AutoShutdownClock
+        with self.subTest(prop='__AutoShutdownClock'):
+            self.assertIsInstance(self.TestEngine._ScheduleEngine__AutoShutdownClock, Clock)
+    
+    def test_ScheduleEngine_PRIV_ScheduleShutdownHandler(self):
+        context = ['off', 'share', 'adv_share', 'group_work']
+        
+        # exec method
+        for con in context:
+            with self.subTest(i=con):
+                self.TestGUIController.ActCtl.CurrentActivity = con
+                try:
+                    self.TestEngine._ScheduleEngine__ScheduleShutdownHandler(Clock=None, Time=None)
+                except Exception as inst:
+                    self.fail("__ScheduleShutdownHandler() raised {} unexpectedly!".format(type(inst)))
+    
+    def test_ScheduleEngine_PRIV_ScheduleStartHandler(self):
+        context = ['off', 'share', 'adv_share', 'group_work']
+        
+        # exec method
+        for con in context:
+            with self.subTest(i=con):
+                self.TestGUIController.ActCtl.CurrentActivity = con
+                for tp in self.TestGUIController.TPs:
+                    tp.SrcCtl.PrimaryDestination.AssignSource(self.TestGUIController.SrcCtl.Sources[0])
+                try:
+                    self.TestEngine._ScheduleEngine__ScheduleStartHandler(Clock=None, Time=None)
+                except Exception as inst:
+                    self.fail("__ScheduleStartHandler() raised {} unexpectedly!".format(type(inst)))
+    
+    def test_ScheduleEngine_PRIV_ClockTime(self):
+        # setup for test
+        testTimes = \
+            [
+                {
+                    'hr': '4',
+                    'min': '15',
+                    'ampm': 'PM'
+                },
+                {
+                    'hr': '12',
+                    'min': '00',
+                    'ampm': 'PM'
+                },
+                {
+                    'hr': '12',
+                    'min': '00',
+                    'ampm': 'AM'
+                },
+                {
+                    'hr': '6',
+                    'min': '37',
+                    'ampm': 'AM'
+                }
+            ]
+        
+        expectedValues = \
+            [
+                '16:15:00',
+                '12:00:00',
+                '00:00:00',
+                '06:37:00'
+            ]
+            
+        # exec method
+        for i in range(len(testTimes)):
+            with self.subTest(i=i):
+                clockTime = None
+                try:
+                    clockTime = self.TestEngine._ScheduleEngine__ClockTime(testTimes[i])
+                except Exception as inst:
+                    self.fail("List sorting ({}) raised {} unexpectedly!".format(testTimes[i], type(inst)))
+                    
+                # test outcomes
+                self.assertIsNotNone(clockTime)
+                
+                self.assertEqual(clockTime, expectedValues[i])
+    
+    def test_ScheduleEngine_SaveSchedule_UpdatesViews(self):
+        view = self.TestGUIController.TP_Main.SchedCtl
+        self.TestEngine.AutoStart = True
+        self.TestEngine.StartActivity = 'adv_share'
+        self.TestEngine.SaveSchedule()
+        
+        self.assertEqual(view._AutoScheduleController__toggle_start.State, 1)
+        self.assertEqual(view._AutoScheduleController__pattern_start.Activity, 'adv_share')
+        self.assertEqual(States.Get(self.TestEngine._ScheduleEngine__scheduleFilePath)['auto_start']['mode'], 'adv_share')
+        # views hold a copy of the room schedule for editing
+        self.assertIsNot(view._AutoScheduleController__pattern_start.Pattern, self.TestEngine.StartPattern)
+    
+    def test_ScheduleEngine_PanelInactivity(self):
+        calls = []
+        self.TestGUIController.ActCtl.StartShutdownConfirmation = lambda click=False: calls.append(click)
+        panel = self.TestGUIController.TP_Main
+        
+        with self.subTest(con='Below system inactivity time'):
+            self.TestEngine.PanelInactivity(panel, 300)
+            self.assertEqual(calls, [])
+        
+        with self.subTest(con='Repeated system inactivity'):
+            self.TestEngine.PanelInactivity(panel, self.TestEngine.SystemInactivityTime)
+            self.TestEngine.PanelInactivity(panel, self.TestEngine.SystemInactivityTime)
+            self.assertEqual(calls, [True])
+        
+        with self.subTest(con='After panel activity'):
+            self.TestEngine.PanelInactivity(panel, 180)
+            self.TestEngine.PanelInactivity(panel, self.TestEngine.SystemInactivityTime)
+            self.assertEqual(calls, [True, True])
+    
+    def test_ScheduleEngine_PanelInactivity_MultiplePanels(self):
+        calls = []
+        self.TestGUIController.ActCtl.StartShutdownConfirmation = lambda click=False: calls.append(click)
+        panel = self.TestGUIController.TP_Main
+        otherView = SimpleNamespace(UIHost=object(), UpdateView=lambda: None)
+        self.TestEngine.AddView(otherView)
+        
+        with self.subTest(con='Other panel not reported'):
+            # a panel which has not reported does not hold off shutdown
+            self.TestEngine.PanelInactivity(panel, self.TestEngine.SystemInactivityTime)
+            self.assertEqual(calls, [True])
+        
+        with self.subTest(con='Other panel in use'):
+            self.TestEngine.PanelInactivity(otherView.UIHost, 300)
+            self.TestEngine.PanelInactivity(panel, self.TestEngine.SystemInactivityTime)
+            self.assertEqual(calls, [True])
+        
+        with self.subTest(con='Both panels inactive'):
+            self.TestEngine.PanelInactivity(otherView.UIHost, self.TestEngine.SystemInactivityTime)
+            self.assertEqual(calls, [True, True])
+    
+    def test_ScheduleEngine_IsScheduledDay(self):
+        pattern = {'Days': ['Monday', 'Tuesday'], 'Time': {'hr': '8', 'min': '00', 'ampm': 'AM'}}
+        self.TestEngine.Calendar.Load(
+            [
+                {'start': '2023-12-22', 'end': '2024-01-02', 'type': 'closed', 'name': 'Winter Break'},
+                {'start': '2024-01-06', 'type': 'open', 'name': 'Saturday Event'}
+            ])
+        
+        context = \
+            [
+                (date(2024, 1, 8), True),   # Monday
+                (date(2024, 1, 10), False), # Wednesday
+                (date(2024, 1, 1), False),  # Monday, closed
+                (date(2024, 1, 6), True)    # Saturday, open
+            ]
+        for day, expected in context:
+            with self.subTest(day=day):
+                self.assertEqual(self.TestEngine.IsScheduledDay(pattern, day), expected)
+    
+    def test_ScheduleEngine_ScheduleStartHandler_Exception(self):
+        calls = []
+        self.TestGUIController.ActCtl.CurrentActivity = 'off'
+        self.TestGUIController.ActCtl.SystemStart = lambda activity: calls.append(activity)
+        self.TestEngine.StartPattern = {'Days': ['Monday'], 'Time': {'hr': '8', 'min': '00', 'ampm': 'AM'}}
+        self.TestEngine.Calendar.Add('2024-01-01', Name='New Year')
+        
+        self.TestEngine._ScheduleEngine__ScheduleStartHandler(None, datetime(2024, 1, 1, 8))
+        self.assertEqual(calls, [])
+        self.TestEngine._ScheduleEngine__ScheduleStartHandler(None, datetime(2024, 1, 8, 8))
+        self.assertEqual(calls, [self.TestEngine.StartActivity])
+    
+    def test_ScheduleEngine_Exceptions_Saved(self):
+        self.TestEngine.AddException(date.today(), Name='Closure')
+        scheduleObj = States.Get(self.TestEngine._ScheduleEngine__scheduleFilePath)
+        self.assertEqual(len(scheduleObj['exceptions']), 1)
+        self.assertEqual(scheduleObj['exceptions'][0]['type'], 'closed')
+        
+        self.TestEngine.Calendar.Load([])
+        self.TestEngine.LoadSchedule()
+        self.assertIsNotNone(self.TestEngine.Calendar.Lookup(date.today()))
+        
+        self.TestEngine.RemoveException(date.today())
+        self.assertEqual(States.Get(self.TestEngine._ScheduleEngine__scheduleFilePath)['exceptions'], [])
+    
+class ExceptionCalendar_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.TestCalendar = ExceptionCalendar(
+            [
+                {'start': '2023-11-20', 'end': '2023-11-24', 'type': 'closed', 'name': 'Fall Break'},
+                {'start': '2023-11-22', 'type': 'open', 'name': 'Exam Review'},
+                {'start': '2023-12-01', 'type': 'open', 'name': 'Open House'}
+            ])
+        return super().setUp()
+    
+    def test_ExceptionCalendar_Lookup(self):
+        context = \
+            [
+                ('2023-11-19', None),
+                ('2023-11-20', 'Fall Break'),
+                ('2023-11-22', 'Fall Break'), # closed takes precedence
+                ('2023-11-24', 'Fall Break'),
+                ('2023-11-25', None),
+                ('2023-12-01', 'Open House'),
+                (date(2023, 12, 2), None)
+            ]
+        for day, expected in context:
+            with self.subTest(day=day):
+                exc = self.TestCalendar.Lookup(day)
+                if expected is None:
+                    self.assertIsNone(exc)
+                else:
+                    self.assertIsInstance(exc, CalendarException)
+                    self.assertEqual(exc.Name, expected)
+    
+    def test_ExceptionCalendar_Add_Invalid(self):
+        with self.subTest(con='Type'):
+            with self.assertRaises(ValueError):
+                self.TestCalendar.Add('2023-12-05', Type='maybe')
+        with self.subTest(con='Range'):
+            with self.assertRaises(ValueError):
+                self.TestCalendar.Add('2023-12-05', '2023-12-04')
+        with self.subTest(con='Date'):
+            with self.assertRaises(TypeError):
+                self.TestCalendar.Add(20231205)
+    
+    def test_ExceptionCalendar_Prune(self):
+        self.TestCalendar.Prune('2023-11-25')
+        self.assertEqual([e['name'] for e in self.TestCalendar.Export()], ['Open House'])
+        self.assertIsNone(self.TestCalendar.Lookup('2023-11-21'))
+    
+    def test_ExceptionCalendar_Export(self):
+        exported = self.TestCalendar.Export()
+        self.assertEqual(exported[0], {'start': '2023-11-20', 'end': '2023-11-24', 'type': 'closed', 'name': 'Fall Break'})
+        self.assertEqual(ExceptionCalendar(exported).Export(), exported)
+    
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,129 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+import importlib
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from uofi_gui.settingsModel import CompileSettings, CompiledSettings, SettingsError, DiffSettings
+import test_settings as settings
+## -----------------------------------------------------------------------------
+
+class SettingsModel_TestClass(unittest.TestCase): # rename for module to be tested
+    def setUp(self) -> None:
+        importlib.reload(settings)
+        return super().setUp()
+    
+    def tearDown(self) -> None:
+        importlib.reload(settings)
+        return super().tearDown()
+    
+    def test_CompileSettings_Type(self):
+        self.assertIsInstance(CompileSettings(settings), CompiledSettings)
+    
+    def test_CompileSettings_Indexes(self):
+        config = CompileSettings(settings)
+        
+        with self.subTest(index='HardwareById'):
+            self.assertIs(config.HardwareById['MON001'], [hw for hw in settings.hardware if hw['Id'] == 'MON001'][0])
+        with self.subTest(index='SourceByInput'):
+            self.assertEqual(config.SourceByInput[3]['id'], 'PC001')
+        with self.subTest(index='DestinationByOutput'):
+            self.assertEqual(config.DestinationByOutput[3]['id'], 'PRJ001')
+        with self.subTest(index='MicrophoneByNumber'):
+            self.assertEqual(config.MicrophoneByNumber[1]['Id'], 'RF001')
+        with self.subTest(index='HardwareByMatrixIO'):
+            self.assertEqual(config.HardwareByMatrixIO[('VMX001', 'Input', 6)]['Options']['MatrixInput'], 6)
+        with self.subTest(index='HardwareByGroup'):
+            self.assertIn(config.HardwareByMatrixIO[('VMX001', 'Input', 6)], config.HardwareByGroup['VMX001'])
+        with self.subTest(index='SubscriptionsByTag'):
+            self.assertIn(('mics', '1'), config.SubscriptionsByTag)
+    
+    def test_CompileSettings_ReadOnly(self):
+        config = CompileSettings(settings)
+        with self.assertRaises(AttributeError):
+            config.RoomName = 'Other Room'
+        with self.assertRaises(TypeError):
+            config.SourceById['PC002'] = {}
+        self.assertIsInstance(config.Sources, tuple)
+    
+    def test_CompileSettings_Errors(self):
+        settings.activityMode = 4
+        settings.defaultSource = 'PC999'
+        settings.destinations[0]['groupWrkSrc'] = 'WPD999'
+        settings.destinations[1]['output'] = settings.destinations[2]['output']
+        settings.microphones[0]['Control']['level']['HwId'] = 'DSP999'
+        del settings.techPIN
+        
+        with self.assertRaises(SettingsError) as context:
+            CompileSettings(settings)
+        
+        # every error is reported together
+        self.assertEqual(len(context.exception.Errors), 6)
+        for text in ['activityMode', 'defaultSource', 'WPD999', 'already assigned', 'DSP999', 'techPIN']:
+            with self.subTest(text=text):
+                self.assertTrue(any([text in e for e in context.exception.Errors]))
+    
+    def test_DiffSettings_NoChange(self):
+        running = CompileSettings(settings)
+        importlib.reload(settings)
+        diff = DiffSettings(running, CompileSettings(settings))
+        
+        for field in diff._fields:
+            with self.subTest(field=field):
+                self.assertFalse(diff._asdict()[field])
+    
+    def test_DiffSettings_Changes(self):
+        running = CompileSettings(settings)
+        importlib.reload(settings)
+        hardware = {hw['Id']: hw for hw in settings.hardware}
+        hardware['WPD001']['Polling'][0]['active_int'] = 20
+        hardware['WPD002']['Interface']['interface_configuration']['host'] = 'wpd999'
+        hardware['MON001']['Interface']['interface_configuration']['Hostname'] = 'mon999'
+        settings.hardware.remove(hardware['WPD003'])
+        settings.sources[0]['name'] = 'Lectern PC'
+        settings.roomName = 'Other Room'
+        settings.startupTimer = 30
+        
+        diff = DiffSettings(running, CompileSettings(settings))
+        
+        self.assertEqual(diff.HardwareUpdated, ['WPD001'])
+        self.assertEqual(diff.HardwareReplaced, ['WPD002'])
+        self.assertEqual(diff.HardwareRemoved, ['WPD003'])
+        self.assertEqual(diff.HardwareAdded, [])
+        self.assertEqual(diff.SourceNames, {'PC001': 'Lectern PC'})
+        self.assertEqual(diff.RoomName, 'Other Room')
+        # displays are held by the display controller
+        self.assertIn('hardware (MON001)', diff.RestartRequired)
+        self.assertIn('Timers', diff.RestartRequired)
+    
+    def test_DiffSettings_SourceInputChange(self):
+        running = CompileSettings(settings)
+        importlib.reload(settings)
+        settings.sources[0]['input'], settings.sources[1]['input'] = settings.sources[1]['input'], settings.sources[0]['input']
+        
+        diff = DiffSettings(running, CompileSettings(settings))
+        
+        self.assertEqual(diff.SourceNames, {})
+        self.assertIn('sources', diff.RestartRequired)
+
+if __name__ == '__main__':
+    unittest.main()
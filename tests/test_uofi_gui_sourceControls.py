@@ -24,12 +24,17 @@ sys.path.append(".\\tests\\reqs")
 
 from typing import Dict, Tuple, List, Callable, Union, cast
 import random
+import time
+from concurrent.futures import Future
+from unittest.mock import patch as mock_patch
 
 ## test imports ----------------------------------------------------------------
 from uofi_gui import GUIController
 from uofi_gui.activityControls import ActivityController
 from uofi_gui.uiObjects import ExUIDevice
 from uofi_gui.sourceControls import SourceController, Source, Destination, MatrixController, MatrixRow, LayoutTuple, RelayTuple, MatrixTuple
+from uofi_gui.sourceControls.presets import PresetController, RoutingPreset, PresetChangeTuple
+from uofi_gui.sourceControls.sources import AlertWheel
 from uofi_gui.systemHardware import SystemHardwareController
 import test_settings as settings
 
@@ -487,6 +492,7 @@ class SourceController_TestClass(unittest.TestCase): # rename for module to be t
                     self.fail('GetDestinationByOutput raised {} unexpectedly!'.format(type(inst)))
                 
                 self.assertIsInstance(rtnVal, Destination)
+                self.assertEqual(rtnVal.Output, i)
     
     def test_SourceController_GetDestinationByOutput_BadOutput(self):
         with self.assertRaises(LookupError):
@@ -564,6 +570,7 @@ class SourceController_TestClass(unittest.TestCase): # rename for module to be t
                     self.fail('GetSourceByInput raised {} unexpectedly!'.format(type(inst)))
                 
                 self.assertIsInstance(rtnVal, Source)
+                self.assertEqual(rtnVal.Input, i)
     
     def test_SourceController_GetSourceByInput_BadInput(self):
         with self.assertRaises(LookupError):
@@ -865,19 +872,15 @@ class Source_TestClass(unittest.TestCase): # rename for module to be tested
         with self.subTest(param='__DefaultAlert'):
             self.assertIsInstance(self.TestSource._Source__DefaultAlert, str)
         
-        # __AlertTimer
-        with self.subTest(param='__AlertTimer'):
-            self.assertIsInstance(self.TestSource._Source__AlertTimer, Timer)
-    
-    def test_Source_PRIV_AlertTimerHandler(self):
-        class testTimer:
-            def __init__(self):
-                self.Running = True
-            def Stop(self):
-                self.Running = False
-            
-        timer = testTimer()
+        # __AlertList
+        with self.subTest(param='__AlertList'):
+            self.assertIsInstance(self.TestSource._Source__AlertList, list)
         
+        # __AlertBlock
+        with self.subTest(param='__AlertBlock'):
+            self.assertIsInstance(self.TestSource._Source__AlertBlock, str)
+    
+    def test_Source_AlertWheel_Expire(self):
         alertList = \
             [
                 ('Alert Text 1', 5),
@@ -885,29 +888,34 @@ class Source_TestClass(unittest.TestCase): # rename for module to be tested
                 ('Alert Text 3', 25),
                 ('Alert Text 4', 0)
             ]
+        start = time.monotonic()
         for alert in alertList:
             self.TestSource.AppendAlert(alert[0], alert[1])
             
         for i in range(1,31):
             with self.subTest(count=i):
                 try:
-                    self.TestSource._Source__AlertTimerHandler(timer, i)
+                    AlertWheel.Expire(start + i)
                 except Exception as inst:
-                    self.fail('__AlertTimerHandler (dynamic property) raised {} unexpectedly!'.format(type(inst)))
+                    self.fail('AlertWheel.Expire raised {} unexpectedly!'.format(type(inst)))
                 
-                if i <= 5:
+                if i < 5:
                     self.assertEqual(self.TestSource.Alerts, 4)
-                elif i > 5 and i <= 15:
+                elif i > 5 and i < 15:
                     self.assertEqual(self.TestSource.Alerts, 3)
-                elif i > 15 and i <= 25:
+                elif i > 15 and i < 25:
                     self.assertEqual(self.TestSource.Alerts, 2)
                 elif i > 25:
                     self.assertEqual(self.TestSource.Alerts, 1)
+    
+    def test_Source_AlertWheel_Cleared(self):
+        start = time.monotonic()
+        self.TestSource.AppendAlert('Alert Text 1', 5)
+        self.TestSource.ClearAlert('Alert Text 1')
+        self.TestSource.AppendAlert('Alert Text 1')
         
-        with self.subTest(count='clear'):
-            self.TestSource.ResetAlert()
-            self.TestSource._Source__AlertTimerHandler(timer, 31)
-            self.assertFalse(timer.Running)
+        self.assertEqual(AlertWheel.Expire(start + 10), 0)
+        self.assertEqual(self.TestSource.Alerts, 1)
     
     def test_Source_CycleAlert(self):
         alertList = \
@@ -1692,5 +1700,111 @@ class MatrixRow_TestClass(unittest.TestCase):
                         self.TestMatrixRow.MakeTie(src, mode)
 
 
+class PresetController_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.TestCtls = ['CTL001']
+        self.TestTPs = ['TP001']
+        importlib.reload(settings)
+        self.TestGUIController = GUIController(settings, self.TestCtls, self.TestTPs)
+        self.TestGUIController.Initialize()
+        self.TestUIController = self.TestGUIController.TP_Main
+        self.TestSourceController = self.TestUIController.SrcCtl
+        self.TestPresetController = self.TestSourceController.PresetCtl
+    
+    def test_PresetController_Type(self):
+        self.assertIsInstance(self.TestPresetController, PresetController)
+    
+    def test_PresetController_Presets(self):
+        self.assertEqual(len(self.TestPresetController.Presets), len(settings.routingPresets))
+        for preset in self.TestPresetController.Presets.values():
+            with self.subTest(preset=preset.Id):
+                self.assertIsInstance(preset, RoutingPreset)
+                for dest, src in preset.Video.items():
+                    self.assertIsInstance(dest, Destination)
+                    self.assertIsInstance(src, Source)
+    
+    def test_PresetController_GetPreset(self):
+        preset = self.TestPresetController.Presets['lecture']
+        with self.subTest(input='Id'):
+            self.assertIs(self.TestPresetController.GetPreset('lecture'), preset)
+        with self.subTest(input='Name'):
+            self.assertIs(self.TestPresetController.GetPreset('Lecture'), preset)
+        with self.subTest(input='Object'):
+            self.assertIs(self.TestPresetController.GetPreset(preset), preset)
+    
+    def test_PresetController_GetPreset_BadInput(self):
+        with self.subTest(input='Unknown'):
+            with self.assertRaises(LookupError):
+                self.TestPresetController.GetPreset('not a preset')
+        with self.subTest(input='Type'):
+            with self.assertRaises(TypeError):
+                self.TestPresetController.GetPreset(1)
+    
+    def test_PresetController_BadPreset(self):
+        badPresets = \
+            [
+                {'id': 'bad', 'name': 'Bad Dest', 'video': {'NOPE01': 'PC001'}},
+                {'id': 'bad', 'name': 'Bad Source', 'video': {'PRJ001': 'NOPE01'}},
+                {'id': 'bad', 'name': 'Bad Power', 'displays': {'PRJ001': {'power': 'Maybe'}}},
+                {'id': 'bad', 'name': 'Bad Screen', 'screens': {'MON001': 'down'}}
+            ]
+        for preset in badPresets:
+            with self.subTest(preset=preset['name']):
+                with self.assertRaises((LookupError, ValueError)):
+                    PresetController(self.TestSourceController, [preset])
+    
+    def test_PresetController_Diff(self):
+        changes = self.TestPresetController.Diff('lecture')
+        self.assertIsInstance(changes, list)
+        for change in changes:
+            with self.subTest(change=change.Type):
+                self.assertIsInstance(change, PresetChangeTuple)
+    
+    def test_PresetController_RecallPreset_NoRepeat(self):
+        matrix = self.TestSourceController.MatrixHardware.interface
+        
+        def MatrixFeedback(command, value=None, qualifier=None):
+            # stand in for the matrix confirming each tie it is sent
+            if command == 'MatrixTieCommand':
+                tieTypes = ['Video', 'Audio'] if qualifier['Tie Type'] == 'Audio/Video' else [qualifier['Tie Type']]
+                for tieType in tieTypes:
+                    matrix.WriteStatus('OutputTieStatus', qualifier['Input'], {'Output': qualifier['Output'], 'Tie Type': tieType})
+        
+        with mock_patch.object(matrix, 'Set', side_effect=MatrixFeedback) as matrixSet:
+            changes = self.TestPresetController.RecallPreset('discussion')
+            videoChanges = [c for c in changes if c.Type in ['Video', 'Audio/Video']]
+            self.assertGreater(len(videoChanges), 0)
+            tieOutputs = {call.kwargs['qualifier']['Output'] for call in matrixSet.call_args_list
+                          if call.args[0] == 'MatrixTieCommand'}
+            for change in videoChanges:
+                self.assertIn(change.Destination.Output, tieOutputs)
+            
+            matrixSet.reset_mock()
+            changes = self.TestPresetController.RecallPreset('discussion')
+            self.assertEqual([c for c in changes if c.Type in ['Video', 'Audio/Video']], [])
+            matrixSet.assert_not_called()
+    
+    def test_PresetController_ShowPreset(self):
+        matrix = self.TestSourceController.MatrixHardware.interface
+        preset = self.TestPresetController.Presets['discussion']
+        
+        with mock_patch.object(matrix, 'Set') as matrixSet:
+            self.TestSourceController.ShowPreset(preset)
+        matrixSet.assert_not_called()
+        
+        self.assertIs(self.TestSourceController.SystemAudioFollowDestination, preset.AudioFollow)
+        for dest, src in preset.Video.items():
+            with self.subTest(dest=dest.Id):
+                self.assertIs(dest.AssignedSource.Vid, src)
+    
+    def test_PresetController_RecallPreset_Future(self):
+        with mock_patch.object(self.TestSourceController.MatrixHardware.interface, 'Set'):
+            future = self.TestSourceController.RecallPreset('discussion')
+            self.assertIsInstance(future, Future)
+            changes = future.result(timeout=5)
+        self.assertIsInstance(changes, list)
+        self.assertIs(self.TestPresetController.LastPreset, self.TestPresetController.Presets['discussion'])
+        
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
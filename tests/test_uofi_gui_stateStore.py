@@ -0,0 +1,151 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+from unittest.mock import patch as mock_patch
+import json
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from uofi_gui.stateStore import StateStore, States
+from extronlib.system import File
+## -----------------------------------------------------------------------------
+
+class StateStore_TestClass(unittest.TestCase): # rename for module to be tested
+    def setUp(self) -> None:
+        # long debounce keeps the flush timer from writing during the test
+        self.TestStore = StateStore(Debounce=100, MaxDelay=100)
+        self.TestPath = '/user/states/test_state_store.json'
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.TestStore.Release()
+        for path in [self.TestPath, self.TestPath + '.tmp']:
+            if File.Exists(path):
+                File.DeleteFile(path)
+        return super().tearDown()
+
+    def WriteFile(self, path, content):
+        testFile = File(path, 'wt')
+        testFile.write(content)
+        testFile.close()
+
+    def ReadFile(self, path):
+        testFile = File(path, 'rt')
+        content = json.loads(testFile.read())
+        testFile.close()
+        return content
+
+    def test_StateStore_Type(self):
+        self.assertIsInstance(States, StateStore)
+
+    def test_StateStore_Get_NoFile(self):
+        self.assertFalse(self.TestStore.Exists(self.TestPath))
+        self.assertIsNone(self.TestStore.Get(self.TestPath))
+        self.assertEqual(self.TestStore.Get(self.TestPath, {}), {})
+
+    def test_StateStore_Update_Merge(self):
+        self.TestStore.Update(self.TestPath, {'a': {'enabled': 1, 'pattern': {'Days': ['Monday']}}})
+        self.TestStore.Update(self.TestPath, {'a': {'mode': 'share'}, 'b': {1: None}})
+
+        self.assertEqual(self.TestStore.Get(self.TestPath),
+                         {'a': {'enabled': 1, 'pattern': {'Days': ['Monday']}, 'mode': 'share'},
+                          'b': {'1': None}})
+        # nothing is written until flushed
+        self.assertFalse(File.Exists(self.TestPath))
+        self.assertEqual(self.TestStore.Stats()['Pending'], 1)
+
+    def test_StateStore_Update_Detached(self):
+        values = {'a': {'Days': ['Monday']}}
+        self.TestStore.Update(self.TestPath, values)
+        values['a']['Days'].append('Tuesday')
+
+        document = self.TestStore.Get(self.TestPath)
+        document['a']['Days'].append('Friday')
+        self.assertEqual(self.TestStore.Get(self.TestPath), {'a': {'Days': ['Monday']}})
+
+    def test_StateStore_Flush(self):
+        for i in range(10):
+            self.TestStore.Update(self.TestPath, {'count': i})
+        self.TestStore.Flush()
+
+        self.assertEqual(self.ReadFile(self.TestPath), {'count': 9})
+        self.assertFalse(File.Exists(self.TestPath + '.tmp'))
+        self.assertEqual(self.TestStore.Stats()['Writes'], 1)
+        self.assertEqual(self.TestStore.Stats()['Pending'], 0)
+
+    def test_StateStore_Flush_Replace(self):
+        self.WriteFile(self.TestPath, json.dumps({'count': 1}))
+        self.TestStore.Update(self.TestPath, {'count': 2})
+        with mock_patch.object(File, 'DeleteFile') as deleteFile:
+            self.TestStore.Flush()
+        # renamed over the original rather than deleting it first
+        deleteFile.assert_not_called()
+        self.assertEqual(self.ReadFile(self.TestPath), {'count': 2})
+        self.assertFalse(File.Exists(self.TestPath + '.tmp'))
+
+    def test_StateStore_Flush_Retry(self):
+        self.TestStore.Update(self.TestPath, {'count': 1})
+        timer = self.TestStore._StateStore__FlushTimer
+        with mock_patch.object(File, 'RenameFile', side_effect=OSError('Test failure')):
+            self.TestStore.Flush()
+        self.assertEqual(self.TestStore.Stats()['Failures'], 1)
+        self.assertEqual(self.TestStore.Stats()['Pending'], 1)
+        # the flush timer is armed again to retry the write
+        self.assertEqual(timer.State, 'Running')
+        self.assertEqual(timer.Interval, self.TestStore.Debounce)
+
+        self.TestStore.Flush()
+        self.assertEqual(self.ReadFile(self.TestPath), {'count': 1})
+        self.assertEqual(timer.State, 'Stopped')
+
+    def test_StateStore_Release_Failed(self):
+        self.TestStore.Update(self.TestPath, {'count': 1})
+        with mock_patch.object(File, 'RenameFile', side_effect=OSError('Test failure')):
+            self.TestStore.Release(self.TestPath)
+            self.TestStore.Release()
+        # the pending update is kept until it has been written
+        self.assertEqual(self.TestStore.Stats()['Documents'], 1)
+        self.assertEqual(self.TestStore.Stats()['Pending'], 1)
+        self.assertEqual(self.TestStore.Get(self.TestPath), {'count': 1})
+
+        self.TestStore.Flush()
+        self.assertEqual(self.TestStore.Stats()['Failures'], 2)
+        self.assertEqual(self.ReadFile(self.TestPath), {'count': 1})
+        self.TestStore.Release(self.TestPath)
+        self.assertEqual(self.TestStore.Stats()['Documents'], 0)
+
+    def test_StateStore_Recover(self):
+        # interrupted after the original was removed, before the rename
+        self.WriteFile(self.TestPath + '.tmp', json.dumps({'count': 1}))
+        self.assertEqual(self.TestStore.Get(self.TestPath), {'count': 1})
+        self.assertTrue(File.Exists(self.TestPath))
+        self.assertFalse(File.Exists(self.TestPath + '.tmp'))
+        self.assertEqual(self.TestStore.Stats()['Recoveries'], 1)
+
+    def test_StateStore_Recover_PartialTemp(self):
+        # interrupted while writing the temp file, the original is kept
+        self.WriteFile(self.TestPath, json.dumps({'count': 1}))
+        self.WriteFile(self.TestPath + '.tmp', '{"count": ')
+        self.assertEqual(self.TestStore.Get(self.TestPath), {'count': 1})
+        self.assertFalse(File.Exists(self.TestPath + '.tmp'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+import importlib
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from uofi_gui import GUIController
+from uofi_gui.statusJournal import StatusJournal, JournalEntry
+import test_settings as settings
+
+from threading import Thread
+## -----------------------------------------------------------------------------
+
+class StatusJournal_TestClass(unittest.TestCase): # rename for module to be tested
+    def setUp(self) -> None:
+        self.TestCtls = ['CTL001']
+        self.TestTPs = ['TP001']
+        importlib.reload(settings)
+        self.TestGUIController = GUIController(settings, self.TestCtls, self.TestTPs)
+        self.TestGUIController.Initialize()
+        self.TestJournal = StatusJournal(self.TestGUIController, Size=4)
+        return super().setUp()
+
+    def test_StatusJournal_Type(self):
+        self.assertIsInstance(self.TestJournal, StatusJournal)
+        self.assertIsInstance(self.TestGUIController.Journal, StatusJournal)
+
+    def test_StatusJournal_Since(self):
+        qual = {'Input': 1}
+        self.assertEqual(self.TestJournal.Record('MON001', 'Power', None, None, 'On'), 1)
+        self.TestJournal.Record('MON001', 'Input', qual, 'HDMI 1', 'HDMI 2')
+        qual['Input'] = 2
+
+        entries = self.TestJournal.Since(0)
+        self.assertEqual([entry.Seq for entry in entries], [1, 2])
+        self.assertIsInstance(entries[1], JournalEntry)
+        self.assertEqual(entries[1][2:], ('MON001', 'Input', {'Input': 1}, 'HDMI 1', 'HDMI 2'))
+        self.assertEqual(self.TestJournal.Since(1), [entries[1]])
+        self.assertEqual(self.TestJournal.Since(2), [])
+
+        for i in range(3):
+            self.TestJournal.Record('MON001', 'Volume', None, i, i + 1)
+        # only the last 4 changes are held
+        self.assertIsNone(self.TestJournal.Since(0))
+        self.assertEqual([entry.Seq for entry in self.TestJournal.Since(1)], [2, 3, 4, 5])
+
+    def test_StatusJournal_Changes(self):
+        self.TestJournal.Record('MON001', 'Power', None, None, 'On')
+        self.assertEqual(self.TestJournal.Changes(0), (1, self.TestJournal.Since(0), None))
+
+        for i in range(4):
+            self.TestJournal.Record('MON001', 'Volume', None, i, i + 1)
+        seq, entries, tables = self.TestJournal.Changes(0)
+        self.assertEqual(seq, 5)
+        self.assertEqual(entries, [])
+        self.assertIn('MON001', tables)
+
+    def test_StatusJournal_Threads(self):
+        journal = StatusJournal(self.TestGUIController, Size=4000)
+        def Writer(hwId):
+            for i in range(1000):
+                journal.Record(hwId, 'Volume', None, i, i + 1)
+        threads = [Thread(target=Writer, args=('MON00{}'.format(i),)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(journal.LastSeq, 4000)
+        self.assertEqual([entry.Seq for entry in journal.Since(0)], list(range(1, 4001)))
+
+    def test_StatusJournal_DriverWrites(self):
+        hw = self.TestGUIController.Hardware['MON001']
+        journal = self.TestGUIController.Journal
+        since = journal.LastSeq
+
+        hw.interface.StatusStore.Write('Power', 'On')
+        hw.interface.StatusStore.Write('Power', 'On')
+        hw.interface.StatusStore.Write('Power', 'Off')
+
+        entries = journal.Since(since)
+        self.assertEqual([entry[2:] for entry in entries],
+                         [('MON001', 'Power', None, None, 'On'),
+                          ('MON001', 'Power', None, 'On', 'Off')])
+        self.assertIn(['Power', None, 'Off'], journal.Snapshot()[1]['MON001'])
+
+        hw.Release()
+        hw.interface.StatusStore.Write('Power', 'On')
+        self.assertEqual(journal.LastSeq, entries[-1].Seq)
+
+if __name__ == '__main__':
+    unittest.main()
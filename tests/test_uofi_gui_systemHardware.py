@@ -26,17 +26,20 @@ sys.path.append(".\\tests\\reqs")
 ## test imports ----------------------------------------------------------------
 from uofi_gui import GUIController
 from uofi_gui.uiObjects import ExUIDevice
-from uofi_gui.systemHardware import SystemHardwareController, VirtualDeviceInterface, SystemPollingController, SystemStatusController
+from uofi_gui.systemHardware import SystemHardwareController, VirtualDeviceInterface, SystemPollingController, SystemStatusController, SubscriptionRegistry
 import test_settings as settings
 from ConnectionHandler import ConnectionHandler
 
 from extronlib.device import UIDevice
 from extronlib.ui import Button, Label
 from extronlib.system import Timer
+from uofi_gui.timerService import ServiceTimer
 from extronlib.interface import SerialInterface, EthernetClientInterface, ContactInterface, DanteInterface, DigitalInputInterface, DigitalIOInterface, FlexIOInterface, IRInterface, PoEInterface, RelayInterface
 
 from datetime import datetime
 from types import ModuleType
+from threading import Event
+import time
 ## -----------------------------------------------------------------------------
 
 class VirtualDeviceInterface_TestClass(unittest.TestCase):
@@ -431,6 +434,117 @@ class SystemHardwareController_TestClass(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.TestHardware.AddSubscription(testItem, None)
     
+    def test_SystemHardwareController_StatusTable(self):
+        hw = self.TestGUIController.Hardware['MON001']
+        hw.interface.StatusStore.Write('Power', 'On')
+        
+        table = hw.StatusTable()
+        self.assertIn(['Power', None, 'On'], table)
+        self.assertNotIn('ConnectionStatus', [entry[0] for entry in table])
+    
+    def test_SystemHardwareController_RestoreStatus(self):
+        hw = self.TestGUIController.Hardware['MON001']
+        calls = []
+        hw.interface.NewStatus = lambda command, value, qualifier: calls.append((command, value, qualifier))
+        
+        hw.RestoreStatus([['Power', None, 'On'], ['NotACommand', None, 1]])
+        self.assertEqual(calls, [('Power', 'On', None)])
+        self.assertTrue(hw.IsStale('Power'))
+        self.assertEqual(hw.GetStatus('Power'), 'On')
+        # provisional status is not written to the driver
+        self.assertIsNone(hw.interface.ReadStatus('Power', None))
+        self.assertIn(['Power', None, 'On'], hw.StatusTable())
+        
+        hw.interface.StatusStore.Write('Power', 'Off')
+        self.assertEqual(hw.GetStatus('Power'), 'Off')
+        self.assertFalse(hw.IsStale())
+    
+    def test_SystemHardwareController_AddSubscription_Listeners(self):
+        hw = self.TestGUIController.Hardware['MON001']
+        calls = []
+        def FirstCallback(command, value, qualifier, hardware=None, tag=None):
+            calls.append(('first', value, hardware.Id, tag))
+        def SecondCallback(command, value, qualifier, hardware=None):
+            calls.append(('second', value, hardware.Id))
+        
+        # every panel may subscribe the same status, identical listeners are only called once
+        hw.AddSubscription({'command': 'Power', 'callback': FirstCallback, 'tag': 'tag here'}, None)
+        hw.AddSubscription({'command': 'Power', 'callback': FirstCallback, 'tag': 'tag here'}, None)
+        hw.AddSubscription({'command': 'Power', 'callback': SecondCallback}, None)
+        
+        hw.interface.NewStatus('Power', 'On', None)
+        self.assertEqual(calls, [('first', 'On', 'MON001', 'tag here'), ('second', 'On', 'MON001')])
+        
+        hw.Release()
+        calls.clear()
+        hw.interface.NewStatus('Power', 'Off', None)
+        self.assertEqual(calls, [])
+
+    def test_SystemHardwareController_AddSubscription_WildcardAndExact(self):
+        hw = self.TestGUIController.Hardware['DSP001']
+        calls = []
+        def ExactCallback(command, value, qualifier, hardware=None):
+            calls.append(('exact', value, qualifier['Channel']))
+        def WildcardCallback(command, value, qualifier, hardware=None):
+            calls.append(('wildcard', value, qualifier['Channel']))
+
+        hw.AddSubscription({'command': 'AECEnable', 'callback': ExactCallback}, {'Instance Tag': 'Mic', 'Channel': '1'})
+        hw.AddSubscription({'command': 'AECEnable', 'callback': WildcardCallback}, None)
+
+        hw.interface.WriteStatus('AECEnable', 'On', {'Instance Tag': 'Mic', 'Channel': '1'})
+        hw.interface.WriteStatus('AECEnable', 'On', {'Instance Tag': 'Mic', 'Channel': '2'})
+        hw.interface.WriteStatus('AECEnable', 'Off', {'Instance Tag': 'Other', 'Channel': '1'})
+        self.assertEqual(calls, [('exact', 'On', '1'), ('wildcard', 'On', '1'),
+                                 ('wildcard', 'On', '2'),
+                                 ('wildcard', 'Off', '1')])
+
+class SubscriptionRegistry_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.TestRegistry = SubscriptionRegistry()
+        return super().setUp()
+    
+    def Callback(self, *args, **kwargs):
+        pass
+    
+    def OtherCallback(self, *args, **kwargs):
+        pass
+    
+    def test_SubscriptionRegistry_Add(self):
+        self.assertTrue(self.TestRegistry.Add('DSP001', 'Gain', ('Mix', '1'), self.Callback))
+        self.assertFalse(self.TestRegistry.Add('DSP001', 'Gain', ('Mix', '1'), self.Callback))
+        self.assertTrue(self.TestRegistry.Add('DSP001', 'Gain', ('Mix', '1'), self.Callback, 'tag'))
+        self.assertTrue(self.TestRegistry.Add('DSP001', 'Gain', ('Mix', '1'), self.OtherCallback))
+        
+        self.assertEqual(self.TestRegistry.Listeners('DSP001', 'Gain', ('Mix', '1')),
+                         ((self.Callback, None), (self.Callback, 'tag'), (self.OtherCallback, None)))
+        self.assertEqual(self.TestRegistry.Listeners('DSP001', 'Gain', ('Mix', '2')), ())
+        self.assertEqual(self.TestRegistry.Listeners('DSP002', 'Gain', ('Mix', '1')), ())
+    
+    def test_SubscriptionRegistry_Wildcard(self):
+        wc = SubscriptionRegistry.Wildcard
+        self.TestRegistry.Add('DSP001', 'Gain', ('Mix', '1'), self.Callback)
+        self.assertEqual(self.TestRegistry.Listeners('DSP001', 'Gain', ('Mix', '2')), ())
+        
+        self.TestRegistry.Add('DSP001', 'Gain', ('Mix', wc), self.OtherCallback)
+        self.TestRegistry.Add('DSP001', 'Gain', (wc, wc), self.Callback)
+        
+        self.assertEqual(self.TestRegistry.Listeners('DSP001', 'Gain', ('Mix', '1')),
+                         ((self.Callback, None), (self.OtherCallback, None)))
+        self.assertEqual(self.TestRegistry.Listeners('DSP001', 'Gain', ('Mix', '2')),
+                         ((self.OtherCallback, None), (self.Callback, None)))
+        self.assertEqual(self.TestRegistry.Listeners('DSP001', 'Gain', ('Aux', '2')),
+                         ((self.Callback, None),))
+    
+    def test_SubscriptionRegistry_RemoveHardware(self):
+        self.TestRegistry.Add('DSP001', 'Gain', ('Mix', '1'), self.Callback)
+        self.TestRegistry.Add('DSP001', 'Gain', ('Mix', SubscriptionRegistry.Wildcard), self.Callback)
+        self.TestRegistry.Add('DSP002', 'Gain', ('Mix', '1'), self.Callback)
+        self.TestRegistry.Listeners('DSP001', 'Gain', ('Mix', '1'))
+        
+        self.assertEqual(self.TestRegistry.RemoveHardware('DSP001'), 2)
+        self.assertEqual(self.TestRegistry.Listeners('DSP001', 'Gain', ('Mix', '1')), ())
+        self.assertEqual(self.TestRegistry.Listeners('DSP002', 'Gain', ('Mix', '1')), ((self.Callback, None),))
+    
 class SystemPollingController_TestClass(unittest.TestCase):
     def setUp(self) -> None:
         self.TestCtls = ['CTL001']
@@ -465,11 +579,11 @@ class SystemPollingController_TestClass(unittest.TestCase):
         
         # __InactivePolling
         with self.subTest(param='__InactivePolling'):
-            self.assertIsInstance(self.TestPollController._SystemPollingController__InactivePolling, Timer)
+            self.assertIsInstance(self.TestPollController._SystemPollingController__InactivePolling, ServiceTimer)
         
         # __ActivePolling
         with self.subTest(param='__ActivePolling'):
-            self.assertIsInstance(self.TestPollController._SystemPollingController__ActivePolling, Timer)
+            self.assertIsInstance(self.TestPollController._SystemPollingController__ActivePolling, ServiceTimer)
     
     def test_SystemPollingController_EventHandler_ActivePollingHandler(self):
         for i in range(121):
@@ -487,6 +601,37 @@ class SystemPollingController_TestClass(unittest.TestCase):
                 except Exception as inst:
                     self.fail("ActivePollingHandler raised {} unexpectedly!".format(type(inst)))
     
+    def test_SystemPollingController_EventHandler_Dispatch(self):
+        class BlockingInterface:
+            def __init__(self):
+                self.Release = Event()
+                self.Polled = []
+            def Update(self, command, qualifier=None):
+                self.Polled.append(command)
+                self.Release.wait(5)
+        
+        pollCtl = SystemPollingController(active_duration=1)
+        slow = BlockingInterface()
+        pollCtl.AddPolling(slow, 'Power')
+        pollCtl.AddPolling(slow, 'Input')
+        handler = pollCtl._SystemPollingController__ActivePollingHandler
+        timer = pollCtl._SystemPollingController__ActivePolling
+        
+        # the handler hands the blocking Update to the poll workers
+        start = time.monotonic()
+        handler(timer, 1)
+        self.assertLess(time.monotonic() - start, 1)
+        
+        # the interface is still busy, so this interval is skipped
+        handler(timer, 2)
+        self.assertEqual(pollCtl.Skipped, 1)
+        
+        slow.Release.set()
+        deadline = time.monotonic() + 5
+        while pollCtl.PollPool.Stats()['Completed'] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(slow.Polled, ['Power', 'Input'])
+    
     # def test_SystemPollingController_PRIV_PollInterface(self):
     #     # this is going to be a difficult one to properly simulate in testing
     #     pass
@@ -640,6 +785,34 @@ class SystemPollingController_TestClass(unittest.TestCase):
             
         self.assertEqual(self.TestPollController.Polling[0], {'interface': TestHardware.interface, 'command': 'AutoImage', 'qualifier': {'Input': 1}, 'active_duration': 10, 'inactive_duration': 15})
 
+    def test_SystemPollingController_RemoveInterface(self):
+        TestHardware = self.TestGUIController.Hardware['MON001']
+        OtherHardware = self.TestGUIController.Hardware['MON002']
+        self.TestPollController.Polling = []
+        for cmd in ['Power', 'AudioMute']:
+            self.TestPollController.AddPolling(TestHardware.interface, cmd)
+        self.TestPollController.AddPolling(OtherHardware.interface, 'Power')
+        
+        self.assertEqual(self.TestPollController.RemoveInterface(TestHardware.interface), 2)
+        self.assertEqual(len(self.TestPollController.Polling), 1)
+        self.assertIs(self.TestPollController.Polling[0]['interface'], OtherHardware.interface)
+    
+    def test_SystemPollingController_RetunePolling(self):
+        TestHardware = self.TestGUIController.Hardware['MON001']
+        self.TestPollController.Polling = []
+        self.TestPollController.AddPolling(TestHardware.interface, 'AutoImage', {'Input': 1}, 5, 10)
+        self.TestPollController.AddPolling(TestHardware.interface, 'AutoImage', {'Input': 2}, 5, 10)
+        
+        self.assertEqual(self.TestPollController.RetunePolling(TestHardware.interface, 'AutoImage', {'Input': 2}, 20, 30), 1)
+        self.assertEqual([(p['active_duration'], p['inactive_duration']) for p in self.TestPollController.Polling],
+                         [(5, 10), (20, 30)])
+        
+        # missing intervals return to the defaults
+        self.assertEqual(self.TestPollController.RetunePolling(TestHardware.interface, 'AutoImage', {'Input': 1}), 1)
+        self.assertEqual(self.TestPollController.Polling[0]['active_duration'],
+                         self.TestPollController._SystemPollingController__DefaultActiveDur)
+        self.assertEqual(self.TestPollController.RetunePolling(TestHardware.interface, 'AutoImage', {'Input': 1}), 0)
+
 class SystemStatusController_TestClass(unittest.TestCase):
     def setUp(self) -> None:
         self.TestCtls = ['CTL001']
@@ -672,7 +845,7 @@ class SystemStatusController_TestClass(unittest.TestCase):
         
         # UpdateTimer
         with self.subTest(param='UpdateTimer'):
-            self.assertIsInstance(self.TestStatusController.UpdateTimer, Timer)
+            self.assertIsInstance(self.TestStatusController.UpdateTimer, ServiceTimer)
     
     def test_SystemStatusController_PRIV_Properties(self):
         # __StatusIcons
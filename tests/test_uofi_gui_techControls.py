@@ -27,11 +27,12 @@ sys.path.append(".\\tests\\reqs")
 from uofi_gui import GUIController
 from uofi_gui.uiObjects import ExUIDevice
 from uofi_gui.techControls import TechMenuController
+from uofi_gui.timerService import ServiceTimer
 import test_settings as settings
 
 from extronlib.device import UIDevice
 from extronlib.ui import Button, Label, Slider
-from extronlib.system import Timer, MESet
+from extronlib.system import MESet
 ## -----------------------------------------------------------------------------
 
 class TechMenuController_TestClass(unittest.TestCase):
@@ -73,7 +74,7 @@ class TechMenuController_TestClass(unittest.TestCase):
     def test_TechMenuController_PRIV_Properties(self):
         # __AboutUpdateTimer
         with self.subTest(param='__AboutUpdateTimer'):
-            self.assertIsInstance(self.TestTechController._TechMenuController__AboutUpdateTimer, Timer)
+            self.assertIsInstance(self.TestTechController._TechMenuController__AboutUpdateTimer, ServiceTimer)
         
         # __AboutLabels
         with self.subTest(param='__AboutLabels'):
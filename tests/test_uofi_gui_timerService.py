@@ -0,0 +1,100 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+import time
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from uofi_gui.timerService import TimerService, ServiceTimer, Scheduler
+## -----------------------------------------------------------------------------
+
+class TimerService_TestClass(unittest.TestCase): # rename for module to be tested
+    def setUp(self) -> None:
+        # long intervals keep the scheduler thread from firing during the test,
+        # timers are dispatched with RunPending instead
+        self.TestService = TimerService()
+        self.Calls = []
+        self.TestTimer = ServiceTimer(100, self.Handler, Service=self.TestService)
+        return super().setUp()
+
+    def Handler(self, timer: 'ServiceTimer', count: int):
+        self.Calls.append(count)
+
+    def test_TimerService_Type(self):
+        self.assertIsInstance(Scheduler, TimerService)
+        self.assertIsInstance(self.TestTimer, ServiceTimer)
+
+    def test_ServiceTimer_Running(self):
+        self.assertEqual(self.TestTimer.State, 'Running')
+        self.assertEqual(self.TestService.RunPending(time.monotonic() + 100.5), 1)
+        self.assertEqual(self.Calls, [1])
+        self.assertEqual(self.TestService.RunPending(time.monotonic() + 200.5), 1)
+        self.assertEqual(self.Calls, [1, 2])
+
+    def test_ServiceTimer_Stop(self):
+        self.TestTimer.Stop()
+        self.assertEqual(self.TestTimer.State, 'Stopped')
+        self.assertEqual(self.TestService.RunPending(time.monotonic() + 100.5), 0)
+        self.assertEqual(self.Calls, [])
+
+    def test_ServiceTimer_PauseResume(self):
+        self.TestTimer.Pause()
+        self.assertEqual(self.TestTimer.State, 'Paused')
+        self.assertEqual(self.TestService.RunPending(time.monotonic() + 100.5), 0)
+
+        self.TestTimer.Resume()
+        self.assertEqual(self.TestTimer.State, 'Running')
+        self.assertEqual(self.TestService.RunPending(time.monotonic() + 100.5), 1)
+        self.assertEqual(self.Calls, [1])
+
+    def test_ServiceTimer_Restart(self):
+        self.TestService.RunPending(time.monotonic() + 100.5)
+        self.TestTimer.Restart()
+        self.assertEqual(self.TestTimer.Count, 0)
+        self.TestService.RunPending(time.monotonic() + 100.5)
+        self.assertEqual(self.Calls, [1, 1])
+
+    def test_ServiceTimer_OneShot(self):
+        oneShot = ServiceTimer(100, self.Handler, OneShot=True, Service=self.TestService)
+        self.TestTimer.Stop()
+
+        self.assertEqual(self.TestService.RunPending(time.monotonic() + 100.5), 1)
+        self.assertEqual(oneShot.State, 'Stopped')
+        self.assertEqual(self.TestService.RunPending(time.monotonic() + 200.5), 0)
+
+    def test_ServiceTimer_StateChanged(self):
+        states = []
+        self.TestTimer.StateChanged = lambda timer, state: states.append(state)
+        self.TestTimer.Pause()
+        self.TestTimer.Resume()
+        self.TestTimer.Stop()
+        self.assertEqual(states, ['Paused', 'Running', 'Stopped'])
+
+    def test_TimerService_Stats(self):
+        stats = self.TestService.Stats()
+        for key in ['Threads', 'Timers', 'Running', 'Queued', 'Wakeups', 'WakeupsPerMinute', 'Dispatched']:
+            with self.subTest(key=key):
+                self.assertIn(key, stats)
+        self.assertLessEqual(stats['Threads'], 1)
+        self.assertEqual(stats['Timers'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -34,7 +34,7 @@ from uofi_gui.headerControls import HeaderController
 from uofi_gui.techControls import TechMenuController
 from uofi_gui.systemHardware import SystemStatusController
 from uofi_gui.deviceControl import CameraController, DisplayController, AudioController
-from uofi_gui.scheduleControls import AutoScheduleController
+from uofi_gui.scheduleControls import AutoScheduleController, ScheduleEngine
 from uofi_gui.keyboardControl import KeyboardController
 from uofi_gui.pinControl import PINController
 import test_settings as settings
@@ -140,6 +140,7 @@ class ExUIDevice_TestClass(unittest.TestCase):
         self.init_TP()
         self.TestUIController.BuildAll(jsonPath=self.TestGUIController.CtlJSON)
         self.TestGUIController.ActCtl = ActivityController(self.TestGUIController)
+        self.TestGUIController.SchedEngine = ScheduleEngine(self.TestGUIController)
         
         try:
             self.TestUIController.InitializeUIControllers()